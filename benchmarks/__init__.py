@@ -0,0 +1,22 @@
+"""
+Performance benchmarks for zipline, run with `asv
+<https://asv.readthedocs.io>`_.
+
+From the root of the repository::
+
+    # Benchmark the latest commit of master.
+    $ asv run
+
+    # Compare HEAD against master, failing on regressions of 10% or more.
+    $ asv continuous -f 1.1 master HEAD
+
+    # Run every benchmark once in the current environment.
+    $ asv dev
+
+Every benchmark is parameterized by the number of assets it works on. The
+data are generated from the synthetic builders in ``zipline.testing`` and
+``zipline.pipeline.loaders.synthetic`` the first time a benchmark class is
+set up, so no network access or ingested bundle is needed. ``time_*``
+benchmarks record wall time and ``peakmem_*`` benchmarks record the peak
+resident memory of the process.
+"""
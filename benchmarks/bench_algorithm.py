@@ -0,0 +1,92 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks of full simulations.
+"""
+from functools import partial
+
+import pandas as pd
+
+from zipline.algorithm import TradingAlgorithm
+from zipline.finance.trading import SimulationParameters
+from zipline.utils.events import date_rules, time_rules
+
+from .datasets import (
+    Dataset,
+    END_DATE,
+    MINUTE_END_DATE,
+    MINUTE_START_DATE,
+    UNIVERSE_SIZES,
+    WithDataset,
+)
+
+
+def initialize(context, sids):
+    context.assets = [context.sid(sid) for sid in sids]
+    context.schedule_function(
+        rebalance,
+        date_rules.every_day(),
+        time_rules.market_open(minutes=30),
+    )
+
+
+def rebalance(context, data):
+    """
+    Hold the assets trading above their 20 day average, equally weighted.
+    """
+    assets = context.assets
+    prices = data.history(assets, 'price', 20, '1d')
+    above_average = prices.iloc[-1] > prices.mean()
+    weight = 1.0 / max(above_average.sum(), 1)
+    for asset in assets:
+        context.order_target_percent(
+            asset,
+            weight if above_average[asset] else 0.0,
+        )
+
+
+def handle_data(context, data):
+    context.record(price=data.current(context.assets, 'price').mean())
+
+
+class AlgorithmRun(WithDataset):
+    params = [UNIVERSE_SIZES, ['daily', 'minute']]
+    param_names = ['universe_size', 'data_frequency']
+
+    def setup(self, root, universe_size, data_frequency):
+        self.dataset = dataset = Dataset(root)
+        if data_frequency == 'daily':
+            start, end = pd.Timestamp('2015-01-02', tz='UTC'), END_DATE
+        else:
+            start, end = MINUTE_START_DATE, MINUTE_END_DATE
+        self.sim_params = SimulationParameters(
+            period_start=start,
+            period_end=end,
+            capital_base=10e6,
+            data_frequency=data_frequency,
+            env=dataset.env,
+        )
+        self.sids = dataset.sids(universe_size)
+
+    def time_run(self, root, universe_size, data_frequency):
+        TradingAlgorithm(
+            initialize=partial(initialize, sids=self.sids),
+            handle_data=handle_data,
+            sim_params=self.sim_params,
+            env=self.dataset.env,
+        ).run(self.dataset.data_portal())
+
+    def peakmem_run(self, root, universe_size, data_frequency):
+        self.time_run(root, universe_size, data_frequency)
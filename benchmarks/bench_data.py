@@ -0,0 +1,138 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks of the bar readers, the DataPortal and BarData.
+"""
+import pandas as pd
+
+from zipline._protocol import BarData
+from zipline.pipeline.data import USEquityPricing
+
+from .datasets import (
+    Dataset,
+    END_DATE,
+    MINUTE_END_DATE,
+    MINUTE_START_DATE,
+    UNIVERSE_SIZES,
+    WithDataset,
+)
+
+OHLCV = ['open', 'high', 'low', 'close', 'volume']
+
+
+class DailyBarReader(WithDataset):
+
+    def setup(self, root, universe_size):
+        dataset = Dataset(root)
+        self.reader = dataset.daily_bar_reader
+        self.sids = dataset.sids(universe_size)
+        self.start_date = pd.Timestamp('2015-01-02', tz='UTC')
+
+    def time_load_raw_arrays(self, root, universe_size):
+        self.reader.load_raw_arrays(
+            USEquityPricing.columns,
+            self.start_date,
+            END_DATE,
+            self.sids,
+        )
+
+    def peakmem_load_raw_arrays(self, root, universe_size):
+        self.time_load_raw_arrays(root, universe_size)
+
+
+class MinuteBarReader(WithDataset):
+
+    def setup(self, root, universe_size):
+        dataset = Dataset(root)
+        self.reader = dataset.minute_bar_reader
+        self.sids = dataset.sids(universe_size)
+        minutes = dataset.env.minutes_for_days_in_range(
+            MINUTE_START_DATE,
+            MINUTE_END_DATE,
+        )
+        self.start_dt = minutes[0]
+        self.end_dt = minutes[-1]
+
+    def time_unadjusted_window(self, root, universe_size):
+        self.reader.unadjusted_window(
+            OHLCV,
+            self.start_dt,
+            self.end_dt,
+            self.sids,
+        )
+
+    def peakmem_unadjusted_window(self, root, universe_size):
+        self.time_unadjusted_window(root, universe_size)
+
+
+class HistoryWindow(WithDataset):
+    params = [UNIVERSE_SIZES, ['1d', '1m']]
+    param_names = ['universe_size', 'frequency']
+
+    def setup(self, root, universe_size, frequency):
+        dataset = Dataset(root)
+        self.assets = dataset.assets(universe_size)
+        self.end_dt = dataset.env.get_open_and_close(MINUTE_END_DATE)[1]
+        self.dataset = dataset
+        self.data_portal = dataset.data_portal()
+
+    def time_get_history_window(self, root, universe_size, frequency):
+        # A new portal for each call, so that its caches start out empty.
+        self.dataset.data_portal().get_history_window(
+            self.assets,
+            self.end_dt,
+            20 if frequency == '1d' else 390,
+            frequency,
+            'close',
+        )
+
+    def time_get_history_window_cached(self, root, universe_size, frequency):
+        # The same window again, as requested by a running simulation.
+        self.data_portal.get_history_window(
+            self.assets,
+            self.end_dt,
+            20 if frequency == '1d' else 390,
+            frequency,
+            'close',
+        )
+
+
+class CurrentPrices(WithDataset):
+    params = [UNIVERSE_SIZES, ['daily', 'minute']]
+    param_names = ['universe_size', 'data_frequency']
+
+    def setup(self, root, universe_size, data_frequency):
+        dataset = Dataset(root)
+        self.assets = dataset.assets(universe_size)
+        env = dataset.env
+        if data_frequency == 'daily':
+            # Daily simulations are at the market close of each day.
+            days = env.days_in_range(MINUTE_START_DATE, MINUTE_END_DATE)
+            self.dts = list(env.open_and_closes.market_close.loc[days])
+        else:
+            self.dts = env.minutes_for_days_in_range(
+                MINUTE_START_DATE,
+                MINUTE_END_DATE,
+            )[::30]
+        self.dataset = dataset
+
+    def time_current(self, root, universe_size, data_frequency):
+        bar_data = BarData(
+            self.dataset.data_portal(),
+            lambda: self.current_dt,
+            data_frequency,
+        )
+        for self.current_dt in self.dts:
+            bar_data.current(self.assets, ['price', 'volume'])
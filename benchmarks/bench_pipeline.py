@@ -0,0 +1,84 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks of the pipeline engine.
+"""
+import pandas as pd
+
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import (
+    AverageDollarVolume,
+    RSI,
+    Returns,
+    SimpleMovingAverage,
+    VWAP,
+)
+from zipline.pipeline.loaders.synthetic import SeededRandomLoader
+
+from .datasets import (
+    Dataset,
+    END_DATE,
+    SEED,
+    START_DATE,
+    WithDataset,
+)
+
+
+def make_pipeline():
+    """
+    A pipeline of commonly used factors over USEquityPricing.
+    """
+    close = USEquityPricing.close
+    dollar_volume = AverageDollarVolume(window_length=20)
+    liquid = dollar_volume.percentile_between(10, 100)
+    returns = Returns(window_length=20, mask=liquid)
+    return Pipeline(
+        columns={
+            'sma_10': SimpleMovingAverage(inputs=[close], window_length=10),
+            'sma_50': SimpleMovingAverage(inputs=[close], window_length=50),
+            'rsi': RSI(),
+            'vwap': VWAP(window_length=20),
+            'returns_rank': returns.rank(mask=liquid),
+            'returns_zscore': returns.zscore(mask=liquid),
+            'top_dollar_volume': dollar_volume.top(50),
+        },
+        screen=liquid,
+    )
+
+
+class RunPipeline(WithDataset):
+
+    def setup(self, root, universe_size):
+        dataset = Dataset(root)
+        days = dataset.env.days_in_range(START_DATE, END_DATE)
+        sids = dataset.sids(universe_size)
+        # The engine is benchmarked on its own; the bar readers have their
+        # own benchmarks.
+        loader = SeededRandomLoader(SEED, USEquityPricing.columns, days, sids)
+        self.engine = SimplePipelineEngine(
+            lambda column: loader,
+            days,
+            dataset.env.asset_finder,
+        )
+        self.pipeline = make_pipeline()
+        self.start_date = pd.Timestamp('2015-01-02', tz='UTC')
+
+    def time_run_pipeline(self, root, universe_size):
+        self.engine.run_pipeline(self.pipeline, self.start_date, END_DATE)
+
+    def peakmem_run_pipeline(self, root, universe_size):
+        self.time_run_pipeline(root, universe_size)
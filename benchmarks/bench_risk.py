@@ -0,0 +1,58 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks of the cumulative risk metrics.
+"""
+import numpy as np
+import pandas as pd
+
+from zipline.finance.risk import RiskMetricsCumulative
+from zipline.finance.trading import SimulationParameters, TradingEnvironment
+
+from .datasets import SEED, synthetic_market_data
+
+
+class RiskMetricsCumulativeUpdate(object):
+    # The risk metrics do not depend on the universe, only on the number of
+    # days they are updated with.
+    params = [1, 5]
+    param_names = ['years']
+
+    def setup(self, years):
+        self.env = env = TradingEnvironment(load=synthetic_market_data)
+        end_date = pd.Timestamp('2015-12-31', tz='UTC')
+        self.sim_params = SimulationParameters(
+            period_start=pd.Timestamp(
+                '%d-01-01' % (end_date.year - years + 1),
+                tz='UTC',
+            ),
+            period_end=end_date,
+            env=env,
+        )
+        self.days = self.sim_params.trading_days
+        self.algorithm_returns = np.random.RandomState(SEED).normal(
+            0.0005,
+            0.015,
+            len(self.days),
+        )
+        self.benchmark_returns = env.benchmark_returns.loc[self.days].values
+
+    def time_update(self, years):
+        metrics = RiskMetricsCumulative(self.sim_params, self.env)
+        for dt, algorithm_return, benchmark_return in zip(
+                self.days,
+                self.algorithm_returns,
+                self.benchmark_returns):
+            metrics.update(dt, algorithm_return, benchmark_return, 1.0)
@@ -0,0 +1,81 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks of parameter sweeps.
+"""
+import os
+
+import pandas as pd
+
+from zipline.utils.sweep import SweepData, parameter_grid, run_sweep
+
+from .datasets import (
+    ADJUSTMENTS,
+    ASSETS,
+    DAILY_BARS,
+    END_DATE,
+    WithDataset,
+    synthetic_market_data,
+)
+
+#: The sids traded by every variant.
+SWEEP_SIDS = list(range(1, 101))
+
+#: The variants run by each sweep.
+VARIANTS = parameter_grid(window=[5, 10, 20, 40], weight=[0.5, 1.0])
+
+
+def initialize(context, window, weight):
+    context.assets = [context.sid(sid) for sid in SWEEP_SIDS]
+    context.window = window
+    context.weight = weight
+
+
+def handle_data(context, data):
+    assets = context.assets
+    prices = data.history(assets, 'price', context.window, '1d')
+    above_average = prices.iloc[-1] > prices.mean()
+    weight = context.weight / max(above_average.sum(), 1)
+    for asset in assets:
+        context.order_target_percent(
+            asset,
+            weight if above_average[asset] else 0.0,
+        )
+
+
+class Sweep(WithDataset):
+    # ``None`` runs the variants one after another in the benchmark process.
+    params = [None, 2, 4]
+    param_names = ['processes']
+
+    def setup(self, root, processes):
+        self.data = SweepData.from_paths(
+            os.path.join(root, ASSETS),
+            daily_bars=os.path.join(root, DAILY_BARS),
+            adjustments=os.path.join(root, ADJUSTMENTS),
+            load=synthetic_market_data,
+        )
+        self.data.preload()
+
+    def time_sweep(self, root, processes):
+        run_sweep(
+            self.data,
+            VARIANTS,
+            pd.Timestamp('2015-07-01', tz='UTC'),
+            END_DATE,
+            initialize=initialize,
+            handle_data=handle_data,
+            processes=processes,
+        )
@@ -0,0 +1,218 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The synthetic dataset shared by the benchmarks.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+from six import iteritems
+
+from zipline.assets.synthetic import make_simple_equity_info
+from zipline.data.data_portal import DataPortal
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+    SQLiteAdjustmentReader,
+    SQLiteAdjustmentWriter,
+)
+from zipline.finance.trading import TradingEnvironment
+from zipline.pipeline.loaders.synthetic import make_daily_bar_data
+from zipline.testing import create_minute_bar_data
+
+#: The numbers of assets the benchmarks are parameterized by.
+UNIVERSE_SIZES = [10, 100, 1000]
+
+#: The sids of the dataset. A universe of size n is the first n sids.
+SIDS = np.arange(1, max(UNIVERSE_SIZES) + 1)
+
+#: The days with daily bars.
+START_DATE = pd.Timestamp('2014-01-02', tz='UTC')
+END_DATE = pd.Timestamp('2015-12-31', tz='UTC')
+
+#: The days with minute bars.
+MINUTE_START_DATE = pd.Timestamp('2015-12-01', tz='UTC')
+MINUTE_END_DATE = pd.Timestamp('2015-12-07', tz='UTC')
+
+#: Every ``SPLIT_EVERY``th sid has a 2:1 split on ``SPLIT_DATE``.
+SPLIT_EVERY = 10
+SPLIT_DATE = pd.Timestamp('2015-06-01', tz='UTC')
+
+SEED = 1234
+
+TREASURY_DURATIONS = [
+    '1month', '3month', '6month',
+    '1year', '2year', '3year', '5year', '7year', '10year', '20year', '30year',
+]
+
+ASSETS = 'assets.sqlite'
+DAILY_BARS = 'daily_equities.bcolz'
+MINUTE_BARS = 'minute_equities'
+ADJUSTMENTS = 'adjustments.sqlite'
+
+
+def synthetic_market_data(trading_day, trading_days, bm_symbol):
+    """
+    A ``TradingEnvironment`` load function returning seeded random benchmark
+    returns and flat treasury curves, so that no market data is downloaded.
+    """
+    benchmark_returns = pd.Series(
+        np.random.RandomState(SEED).normal(0.0003, 0.01, len(trading_days)),
+        index=trading_days,
+    )
+    treasury_curves = pd.DataFrame(
+        0.02,
+        index=trading_days,
+        columns=TREASURY_DURATIONS,
+    )
+    return benchmark_returns, treasury_curves
+
+
+def make_trading_environment(root):
+    return TradingEnvironment(
+        load=synthetic_market_data,
+        asset_db_path=os.path.join(root, ASSETS),
+    )
+
+
+def write_dataset(root):
+    """
+    Write the assets, daily and minute bars and adjustments of ``SIDS`` to
+    the directory ``root``.
+
+    Parameters
+    ----------
+    root : str
+        The directory to write to. It is created if it does not exist.
+
+    Returns
+    -------
+    root : str
+        The absolute path of the directory, to be passed to ``Dataset``.
+    """
+    root = os.path.abspath(root)
+    if not os.path.isdir(root):
+        os.makedirs(root)
+
+    env = make_trading_environment(root)
+    equity_info = make_simple_equity_info(
+        SIDS,
+        START_DATE,
+        END_DATE,
+        symbols=['S%d' % sid for sid in SIDS],
+    )
+    env.write_data(equities=equity_info)
+
+    days = env.days_in_range(START_DATE, END_DATE)
+    daily_path = os.path.join(root, DAILY_BARS)
+    BcolzDailyBarWriter(daily_path, days).write(
+        make_daily_bar_data(equity_info, days),
+    )
+
+    minute_days = env.days_in_range(MINUTE_START_DATE, MINUTE_END_DATE)
+    BcolzMinuteBarWriter(
+        minute_days[0],
+        os.path.join(root, MINUTE_BARS),
+        env.open_and_closes.market_open.loc[minute_days],
+        env.open_and_closes.market_close.loc[minute_days],
+        US_EQUITIES_MINUTES_PER_DAY,
+    ).write_sids(
+        iteritems(create_minute_bar_data(
+            env.minutes_for_days_in_range(MINUTE_START_DATE, MINUTE_END_DATE),
+            SIDS,
+        )),
+    )
+
+    split_sids = SIDS[::SPLIT_EVERY]
+    SQLiteAdjustmentWriter(
+        os.path.join(root, ADJUSTMENTS),
+        BcolzDailyBarReader(daily_path),
+        days,
+        overwrite=True,
+    ).write(
+        splits=pd.DataFrame({
+            'sid': split_sids,
+            'effective_date': np.full(
+                len(split_sids),
+                SPLIT_DATE.value // 10 ** 9,
+                dtype=np.int64,
+            ),
+            'ratio': np.full(len(split_sids), 0.5),
+        }),
+    )
+    return root
+
+
+class Dataset(object):
+    """
+    The readers of a dataset written by ``write_dataset``.
+
+    Parameters
+    ----------
+    root : str
+        The directory the dataset was written to.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.env = make_trading_environment(root)
+        self.daily_bar_reader = BcolzDailyBarReader(
+            os.path.join(root, DAILY_BARS),
+        )
+        self.minute_bar_reader = BcolzMinuteBarReader(
+            os.path.join(root, MINUTE_BARS),
+        )
+        self.adjustment_reader = SQLiteAdjustmentReader(
+            os.path.join(root, ADJUSTMENTS),
+        )
+
+    @staticmethod
+    def sids(universe_size):
+        return SIDS[:universe_size]
+
+    def assets(self, universe_size):
+        return self.env.asset_finder.retrieve_all(self.sids(universe_size))
+
+    def data_portal(self):
+        """
+        A new DataPortal over the daily and minute bars, with empty caches.
+        """
+        return DataPortal(
+            self.env,
+            equity_daily_reader=self.daily_bar_reader,
+            equity_minute_reader=self.minute_bar_reader,
+            adjustment_reader=self.adjustment_reader,
+        )
+
+
+class WithDataset(object):
+    """
+    Mixin for benchmark classes that read the shared dataset.
+
+    asv runs ``setup_cache`` once per environment, in a directory that is
+    kept for the whole run, and passes its result to ``setup`` and to every
+    benchmark.
+    """
+    params = UNIVERSE_SIZES
+    param_names = ['universe_size']
+    timeout = 600
+
+    def setup_cache(self):
+        return write_dataset('dataset')
@@ -264,7 +264,7 @@ setup(
     author_email='opensource@quantopian.com',
     packages=find_packages('.', include=['zipline', 'zipline.*']),
     ext_modules=ext_modules,
-    scripts=['scripts/run_algo.py'],
+    scripts=['scripts/run_algo.py', 'scripts/run_sweep.py'],
     include_package_data=True,
     license='Apache 2.0',
     classifiers=[
@@ -0,0 +1,96 @@
+"""
+Tests for zipline.data.extra_sources.
+"""
+from unittest import TestCase
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pandas as pd
+
+from zipline.assets import Equity
+from zipline.data.extra_sources import ExtraSource
+
+
+class ExtraSourceTestCase(TestCase):
+
+    def setUp(self):
+        self.aapl = Equity(1, symbol='AAPL')
+        self.msft = Equity(2, symbol='MSFT')
+        self.days = pd.date_range('2016-01-04', '2016-01-08', tz='UTC')
+
+        source_index = pd.DatetimeIndex(
+            [
+                '2016-01-01',  # Before the simulation.
+                '2016-01-05',
+                '2016-01-05',  # A second row on the same day.
+                '2016-01-06',
+                '2016-01-07',
+            ],
+            tz='UTC',
+        )
+        self.source = pd.DataFrame(
+            {
+                'sid': [self.aapl, self.msft, self.msft, 'palladium',
+                        self.aapl],
+                'signal': [1.0, 2.0, np.nan, 3.0, np.nan],
+                'label': ['a', 'b', 'c', 'd', 'e'],
+            },
+            index=source_index,
+        )
+        self.extra_source = ExtraSource(self.source, self.days)
+
+    def test_forward_fill(self):
+        extra_source = self.extra_source
+        expected = {
+            # The value from before the simulation is carried forward until
+            # the next row, whose NaN is not filled.
+            self.aapl: [1.0, 1.0, 1.0, np.nan, np.nan],
+            # The last non-null value of the day is used.
+            self.msft: [np.nan, 2.0, 2.0, 2.0, 2.0],
+            'palladium': [np.nan, np.nan, 3.0, 3.0, 3.0],
+        }
+        for identifier, values in expected.items():
+            assert_array_equal(
+                [
+                    extra_source.get_value(identifier, 'signal', day)
+                    for day in self.days
+                ],
+                values,
+            )
+        self.assertEqual(
+            extra_source.get_value(self.msft, 'label', self.days[1]),
+            'c',
+        )
+        self.assertEqual(
+            extra_source.start_dates['palladium'],
+            pd.Timestamp('2016-01-06', tz='UTC'),
+        )
+
+        with self.assertRaises(KeyError):
+            extra_source.get_value(
+                self.aapl, 'signal', pd.Timestamp('2016-01-11', tz='UTC'),
+            )
+        with self.assertRaises(KeyError):
+            extra_source.get_value('gold', 'signal', self.days[0])
+
+    def test_get_values(self):
+        assert_array_equal(
+            self.extra_source.get_values(
+                [self.msft, 'palladium', self.aapl], 'signal', self.days[2],
+            ),
+            [2.0, 3.0, 1.0],
+        )
+
+    def test_assets_on(self):
+        self.assertEqual(
+            self.extra_source.assets_on(self.days[0]),
+            [self.aapl],
+        )
+        self.assertEqual(
+            set(self.extra_source.assets_on(self.days[-1])),
+            {self.aapl, self.msft},
+        )
+        self.assertEqual(
+            self.extra_source.assets_on(pd.Timestamp('2016-01-09', tz='UTC')),
+            [],
+        )
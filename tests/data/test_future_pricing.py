@@ -0,0 +1,118 @@
+"""
+Tests for zipline.data.future_pricing.
+"""
+from unittest import TestCase
+
+import bcolz
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+import pandas as pd
+from testfixtures import TempDirectory
+
+from zipline.data.future_pricing import FutureMinuteReader
+
+
+class FutureMinuteReaderTestCase(TestCase):
+
+    def setUp(self):
+        self.tempdir = TempDirectory()
+        self.sid = 1
+        self.start_date = pd.Timestamp('2016-01-04', tz='UTC')
+
+        # Three days of 1440 bars, with trades only on every fifth minute.
+        n = 3 * 1440
+        traded = np.arange(n) % 5 == 0
+        close = np.where(traded, np.arange(n) + 1000, 0).astype(np.uint32)
+        volume = np.where(traded, 10, 0).astype(np.uint32)
+        bcolz.ctable(
+            columns=[close, close, close, close, volume],
+            names=['open', 'high', 'low', 'close', 'volume'],
+            rootdir=self.tempdir.getpath('%d.bcolz' % self.sid),
+            mode='w',
+        ).flush()
+        self.reader = FutureMinuteReader(self.tempdir.path)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def minute(self, offset):
+        return self.start_date + pd.Timedelta(minutes=offset)
+
+    def test_get_value(self):
+        reader = self.reader
+        for offset, expected in [(0, 1.0), (3, 1.0), (5, 1.005),
+                                 (1441, 2.44)]:
+            self.assertAlmostEqual(
+                reader.get_value(
+                    self.sid, self.start_date, self.minute(offset), 'close',
+                ),
+                expected,
+            )
+        self.assertEqual(
+            reader.get_value(
+                self.sid, self.start_date, self.minute(-1), 'close',
+            ),
+            0.0,
+        )
+        self.assertEqual(
+            reader.get_value(
+                self.sid, self.start_date, self.minute(7), 'volume',
+            ),
+            10,
+        )
+
+        # Columns are only read once.
+        counts = reader.stats.snapshot().counts
+        self.assertEqual(counts['column_reads'], 2)
+        self.assertEqual(counts['spot_reads'], 6)
+
+    def test_load_window(self):
+        minutes = pd.date_range(self.minute(-2), self.minute(12), freq='T')
+        result = self.reader.load_window(
+            self.sid, self.start_date, minutes, 'close',
+        )
+        expected = np.array(
+            [0.0, 0.0] + [1.0] * 5 + [1.005] * 5 + [1.010] * 3,
+        )
+        assert_allclose(result, expected)
+
+        # The window matches spot reads minute by minute.
+        minutes = pd.date_range(self.minute(1000), self.minute(1500), freq='T')
+        assert_array_equal(
+            self.reader.load_window(
+                self.sid, self.start_date, minutes, 'volume',
+            ),
+            [
+                self.reader.get_value(
+                    self.sid, self.start_date, minute, 'volume',
+                )
+                for minute in minutes
+            ],
+        )
+
+    def test_get_last_traded_dt(self):
+        reader = self.reader
+        self.assertEqual(
+            reader.get_last_traded_dt(
+                self.sid, self.start_date, self.minute(8),
+            ),
+            self.minute(5),
+        )
+        self.assertIs(
+            reader.get_last_traded_dt(
+                self.sid, self.start_date, self.minute(-1),
+            ),
+            pd.NaT,
+        )
+
+    def test_column_cache_size(self):
+        reader = FutureMinuteReader(self.tempdir.path, column_cache_size=1)
+        for field in 'close', 'volume', 'close':
+            reader.get_value(
+                self.sid, self.start_date, self.minute(7), field,
+            )
+
+        # Reading volume evicted close, so close was read twice.
+        self.assertEqual(reader.stats.snapshot().counts['column_reads'], 3)
+        self.assertEqual(len(reader._columns), 1)
+        self.assertEqual(reader._column(self.sid, 'close')[1].dtype, np.int32)
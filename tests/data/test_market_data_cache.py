@@ -0,0 +1,92 @@
+"""
+Tests for zipline.data.market_data_cache and the local market data loader.
+"""
+import os
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal, assert_series_equal
+from testfixtures import TempDirectory
+
+from zipline.data.loader import (
+    get_benchmark_filename,
+    local_market_data_loader,
+)
+from zipline.data.market_data_cache import (
+    market_data_cache_path,
+    read_csv_cached,
+    read_market_data_cache,
+    write_market_data_cache,
+)
+from zipline.errors import MarketDataNotFound
+
+
+class MarketDataCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.tempdir = TempDirectory()
+        # Drop the frequency, which isn't stored in the cache.
+        self.dates = pd.DatetimeIndex(
+            list(pd.date_range('2014-01-02', periods=5, tz='UTC')),
+        )
+        self.returns = pd.Series(np.linspace(-0.02, 0.02, 5), index=self.dates)
+        self.curves = pd.DataFrame(
+            np.arange(10, dtype=float).reshape(5, 2),
+            index=self.dates,
+            columns=['1month', '3month'],
+        )
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_round_trip(self):
+        for data in self.returns, self.curves:
+            path = self.tempdir.getpath(type(data).__name__)
+            write_market_data_cache(path, data)
+            result = read_market_data_cache(path)
+            if isinstance(data, pd.DataFrame):
+                assert_frame_equal(result, data)
+            else:
+                assert_series_equal(result, data)
+
+            # The arrays are copy-on-write, so writing to the result should
+            # not change the cache.
+            result.iloc[0] = 100.0
+            self.assertEqual(
+                np.asarray(read_market_data_cache(path)).flat[0],
+                np.asarray(data).flat[0],
+            )
+
+    def test_stale_cache(self):
+        csv_path = self.tempdir.getpath('curves.csv')
+        self.curves.tz_localize(None).to_csv(csv_path)
+
+        assert_frame_equal(read_csv_cached(csv_path, 'frame'), self.curves)
+        cache_path = market_data_cache_path(csv_path)
+        self.assertIsNotNone(
+            read_market_data_cache(cache_path, source=csv_path),
+        )
+
+        # Rewriting the CSV invalidates the cache.
+        (self.curves * 2).tz_localize(None).to_csv(csv_path)
+        stat = os.stat(csv_path)
+        os.utime(csv_path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertIsNone(read_market_data_cache(cache_path, source=csv_path))
+        assert_frame_equal(read_csv_cached(csv_path, 'frame'),
+                           self.curves * 2)
+
+    def test_local_loader(self):
+        self.returns.tz_localize(None).to_csv(
+            self.tempdir.getpath(get_benchmark_filename('^GSPC')),
+        )
+        load = local_market_data_loader(self.tempdir.path)
+        with self.assertRaises(MarketDataNotFound):
+            load(trading_days=self.dates)
+
+        self.curves.tz_localize(None).to_csv(
+            self.tempdir.getpath('treasury_curves.csv'),
+        )
+        returns, curves = load(trading_days=self.dates[1:-1])
+        assert_series_equal(returns, self.returns[1:-1])
+        assert_frame_equal(curves, self.curves[1:-1])
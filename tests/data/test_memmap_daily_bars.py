@@ -0,0 +1,151 @@
+"""
+Tests for zipline.data.memmap_daily_bars.
+"""
+from numpy import uint32
+from numpy.testing import assert_array_equal
+from pandas import Timestamp
+
+from zipline.data.memmap_daily_bars import (
+    MemmapDailyBarReader,
+    MemmapDailyBarWriter,
+    convert_bcolz_daily_bars,
+)
+from zipline.data.us_equity_pricing import NoDataOnDate
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.loaders.synthetic import make_daily_bar_data
+from zipline.testing.fixtures import (
+    WithBcolzDailyBarReader,
+    ZiplineTestCase,
+)
+from .test_us_equity_pricing import (
+    EQUITY_INFO,
+    TEST_CALENDAR_START,
+    TEST_CALENDAR_STOP,
+    TEST_QUERY_START,
+    TEST_QUERY_STOP,
+)
+
+
+class MemmapDailyBarTestCase(WithBcolzDailyBarReader, ZiplineTestCase):
+    BCOLZ_DAILY_BAR_START_DATE = TEST_CALENDAR_START
+    BCOLZ_DAILY_BAR_END_DATE = TEST_CALENDAR_STOP
+
+    @classmethod
+    def make_equity_info(cls):
+        return EQUITY_INFO
+
+    @classmethod
+    def make_daily_bar_data(cls):
+        return make_daily_bar_data(
+            EQUITY_INFO,
+            cls.bcolz_daily_bar_days,
+        )
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MemmapDailyBarTestCase, cls).init_class_fixtures()
+        cls.reader = convert_bcolz_daily_bars(
+            cls.bcolz_daily_bar_ctable,
+            cls.tmpdir.getpath('memmap_daily_bars'),
+        )
+
+    def test_load_raw_arrays(self):
+        bcolz_reader = self.bcolz_daily_bar_reader
+        days = bcolz_reader._calendar
+        assets_cases = [
+            EQUITY_INFO.index,
+            EQUITY_INFO.index[[4, 0, 2]],
+            EQUITY_INFO.index[1:3],
+        ]
+        date_cases = [
+            (TEST_QUERY_START, TEST_QUERY_STOP),
+            (days[0], days[-1]),
+            (days[3], days[3]),
+        ]
+        for assets in assets_cases:
+            for start, end in date_cases:
+                expected = bcolz_reader.load_raw_arrays(
+                    USEquityPricing.columns, start, end, assets,
+                )
+                result = self.reader.load_raw_arrays(
+                    USEquityPricing.columns, start, end, assets,
+                )
+                for e, r in zip(expected, result):
+                    self.assertEqual(e.dtype, r.dtype)
+                    assert_array_equal(e, r)
+
+    def test_volume_is_a_view(self):
+        volume, = self.reader.load_raw_arrays(
+            [USEquityPricing.volume],
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+            EQUITY_INFO.index,
+        )
+        self.assertEqual(volume.dtype, uint32)
+        self.assertFalse(volume.flags.owndata)
+        self.assertFalse(volume.flags.writeable)
+
+    def test_spot_price(self):
+        bcolz_reader = self.bcolz_daily_bar_reader
+        for sid in EQUITY_INFO.index:
+            for day in bcolz_reader._calendar:
+                for column in 'open', 'close', 'volume':
+                    try:
+                        expected = bcolz_reader.spot_price(sid, day, column)
+                    except NoDataOnDate:
+                        with self.assertRaises(NoDataOnDate):
+                            self.reader.spot_price(sid, day, column)
+                    else:
+                        self.assertEqual(
+                            self.reader.spot_price(sid, day, column),
+                            expected,
+                        )
+
+    def test_spot_prices(self):
+        bcolz_reader = self.bcolz_daily_bar_reader
+        sids = []
+        days = []
+        for sid in EQUITY_INFO.index:
+            for day in bcolz_reader._calendar:
+                sids.append(sid)
+                days.append(day.asm8)
+        for column in 'open', 'volume':
+            assert_array_equal(
+                self.reader.spot_prices(sids, days, column),
+                bcolz_reader.spot_prices(sids, days, column),
+            )
+
+    def test_get_last_traded_dt(self):
+        bcolz_reader = self.bcolz_daily_bar_reader
+        for asset in self.asset_finder.retrieve_all(EQUITY_INFO.index):
+            for day in bcolz_reader._calendar:
+                self.assertEqual(
+                    self.reader.get_last_traded_dt(asset, day),
+                    bcolz_reader.get_last_traded_dt(asset, day),
+                )
+
+    def test_write(self):
+        path = self.tmpdir.getpath('memmap_daily_bars_written')
+        reader = MemmapDailyBarWriter(
+            path,
+            self.bcolz_daily_bar_reader._calendar,
+        ).write(self.make_daily_bar_data())
+        self.assertIsInstance(reader, MemmapDailyBarReader)
+        self.assertEqual(
+            reader.first_trading_day,
+            Timestamp('2015-06-01', tz='UTC'),
+        )
+        for expected, result in zip(
+                self.reader.load_raw_arrays(
+                    USEquityPricing.columns,
+                    TEST_QUERY_START,
+                    TEST_QUERY_STOP,
+                    EQUITY_INFO.index,
+                ),
+                reader.load_raw_arrays(
+                    USEquityPricing.columns,
+                    TEST_QUERY_START,
+                    TEST_QUERY_STOP,
+                    EQUITY_INFO.index,
+                )):
+            assert_array_equal(expected, result)
@@ -42,7 +42,8 @@ from zipline.data.minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteOverlappingData,
     US_EQUITIES_MINUTES_PER_DAY,
-    BcolzMinuteWriterColumnMismatch
+    BcolzMinuteWriterColumnMismatch,
+    MinuteBarIngestionSummary,
 )
 from zipline.finance.trading import TradingEnvironment
 
@@ -612,6 +613,54 @@ class BcolzMinuteBarTestCase(TestCase):
         with self.assertRaises(BcolzMinuteWriterColumnMismatch):
             self.writer.write_cols(sid, dts, cols)
 
+    def test_write_sids(self):
+        day = self.market_opens.index[2]
+        minutes = date_range(self.market_opens[day], periods=3, freq='min')
+        frames = {
+            sid: DataFrame(
+                {
+                    'open': [sid + 1.0, sid + 2.0, sid + 3.0],
+                    'high': [sid + 1.5, sid + 2.5, sid + 3.5],
+                    'low': [sid + 0.5, sid + 1.5, sid + 2.5],
+                    'close': [sid + 1.0, nan, sid + 3.0],
+                    'volume': [100.0, 0.0, 300.0],
+                },
+                index=minutes,
+            )
+            for sid in (1, 2, 3)
+        }
+        csv_dir = self.dir_.makedir('csvs')
+        frames[3].to_csv(os.path.join(csv_dir, '3.csv'))
+        # Files which aren't named after a sid are ignored.
+        frames[3].to_csv(os.path.join(csv_dir, 'other.csv'))
+
+        summary = self.writer.write_sids(
+            [(1, frames[1]), (2, frames[2])],
+            processes=2,
+        )
+        self.assertIsInstance(summary, MinuteBarIngestionSummary)
+        self.assertEqual(summary.sids, 2)
+        self.assertEqual(summary.bars, 6)
+
+        summary = self.writer.write_csv_folder(csv_dir)
+        self.assertEqual(summary.sids, 1)
+        self.assertEqual(summary.bars, 3)
+
+        for sid, frame in frames.items():
+            # The days before the data are zero-filled.
+            self.assertEqual(
+                self.writer.last_date_in_output_for_sid(sid),
+                day,
+            )
+            for field in 'open', 'high', 'low', 'close', 'volume':
+                assert_almost_equal(
+                    [
+                        self.reader.get_value(sid, minute, field)
+                        for minute in minutes
+                    ],
+                    frame[field].values,
+                )
+
     def test_unadjusted_minutes(self):
         """
         Test unadjusted minutes.
@@ -656,6 +705,43 @@ class BcolzMinuteBarTestCase(TestCase):
             for j, sid in enumerate(sids):
                 assert_almost_equal(data[sid][col], arrays[i][j])
 
+    def test_preload(self):
+        start_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = [start_minute,
+                   start_minute + Timedelta('1 min'),
+                   start_minute + Timedelta('2 min')]
+        data = DataFrame(
+            data={
+                'open': [15.0, nan, 15.1],
+                'high': [17.0, nan, 17.1],
+                'low': [11.0, nan, 11.1],
+                'close': [14.0, nan, 14.1],
+                'volume': [1000, 0, 1001]
+            },
+            index=minutes)
+        self.writer.write(1, data)
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        expected = self.reader.unadjusted_window(
+            columns, minutes[0], minutes[-1], [1])
+
+        reader = BcolzMinuteBarReader(self.dest)
+        # Sid 2 has no minute bars, so it is skipped.
+        reader.preload([1, 2])
+        counts = reader.stats.snapshot().counts
+        self.assertEqual(counts['carray_opens'], len(columns))
+
+        arrays = reader.unadjusted_window(
+            columns, minutes[0], minutes[-1], [1])
+        for result, expected_array in zip(arrays, expected):
+            assert_almost_equal(result, expected_array)
+        self.assertEqual(reader.get_value(1, minutes[-1], 'close'), 14.1)
+        # The reads do not reopen the carrays.
+        self.assertEqual(
+            reader.stats.snapshot().counts['carray_opens'],
+            len(columns),
+        )
+
     def test_unadjusted_minutes_early_close(self):
         """
         Test unadjusted minute window, ensuring that early closes are filtered
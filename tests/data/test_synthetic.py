@@ -0,0 +1,190 @@
+"""
+Tests for zipline.data.synthetic.
+"""
+from unittest import TestCase
+
+from numpy.testing import assert_array_equal, assert_allclose
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+from testfixtures import TempDirectory
+
+from zipline.assets import AssetFinder
+from zipline.data.minute_bars import BcolzMinuteBarReader
+from zipline.data.synthetic import SyntheticEquityData
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    SQLiteAdjustmentReader,
+)
+from zipline.pipeline.data import USEquityPricing
+
+
+class SyntheticEquityDataTestCase(TestCase):
+
+    def setUp(self):
+        self.tempdir = TempDirectory()
+        self.data = self.make_data(seed=5)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def make_data(self, seed):
+        # The range has the early closes after Thanksgiving and on Christmas
+        # Eve.
+        return SyntheticEquityData(
+            num_assets=6,
+            start_date=pd.Timestamp('2015-11-02', tz='UTC'),
+            end_date=pd.Timestamp('2016-01-29', tz='UTC'),
+            seed=seed,
+            listing_fraction=0.5,
+            delisting_fraction=0.5,
+            splits_per_year=8,
+            dividend_payer_fraction=1.0,
+            halts_per_year=8,
+            volume_sparsity=0.6,
+            minute_chunk_days=20,
+        )
+
+    def minute_bars(self, sid):
+        return pd.concat(list(self.data.minute_bars(sid)))
+
+    def test_deterministic(self):
+        other = self.make_data(seed=5)
+        for sid in self.data.sids:
+            assert_frame_equal(
+                self.data.daily_bars(sid),
+                other.daily_bars(sid),
+            )
+        assert_frame_equal(self.minute_bars(3), pd.concat(
+            list(other.minute_bars(3)),
+        ))
+
+        other = self.make_data(seed=6)
+        self.assertFalse(
+            self.data.daily_bars(3)['close'].equals(
+                other.daily_bars(3)['close'],
+            ),
+        )
+
+    def test_lifetimes(self):
+        info = self.data.equity_info()
+        for sid in self.data.sids:
+            days = self.data.daily_bars(sid).index
+            self.assertEqual(days[0], info.loc[sid, 'start_date'])
+            self.assertEqual(days[-1], info.loc[sid, 'end_date'])
+        self.assertEqual(info['symbol'].nunique(), len(info))
+
+    def test_minute_bars_match_daily_bars(self):
+        early_close = pd.Timestamp('2015-11-27', tz='UTC')
+        for sid in self.data.sids:
+            daily = self.data.daily_bars(sid)
+            minutes = self.minute_bars(sid)
+
+            # Halted days have no bars.
+            traded_days = daily[daily['volume'] > 0]
+            sessions = minutes.groupby(minutes.index.normalize())
+            assert_array_equal(sessions.size().index, traded_days.index)
+            if early_close in traded_days.index:
+                self.assertEqual(sessions.size()[early_close], 210)
+
+            traded = minutes[minutes['volume'] > 0]
+            by_day = traded.groupby(traded.index.normalize())
+            assert_allclose(by_day['open'].first(), traded_days['open'])
+            assert_allclose(by_day['high'].max(), traded_days['high'])
+            assert_allclose(by_day['low'].min(), traded_days['low'])
+            assert_allclose(by_day['close'].last(), traded_days['close'])
+            assert_array_equal(
+                by_day['volume'].sum(),
+                traded_days['volume'],
+            )
+
+            # Minutes without trades are zero.
+            untraded = minutes[minutes['volume'] == 0]
+            self.assertTrue((untraded.values == 0).all())
+
+    def test_dividends_follow_traded_days(self):
+        for sid in self.data.sids:
+            daily = self.data.daily_bars(sid)
+            _, dividends = self.data.adjustments(sid)
+            for ex_date, amount in zip(
+                    dividends['ex_date'],
+                    dividends['amount']):
+                prior_close = daily['close'].iloc[
+                    daily.index.get_loc(pd.Timestamp(ex_date, tz='UTC')) - 1
+                ]
+                self.assertGreater(prior_close, amount)
+
+    def test_write(self):
+        paths = self.data.write(self.tempdir.getpath('serial'))
+
+        finder = AssetFinder(paths.assets)
+        info = self.data.equity_info()
+        for equity in finder.retrieve_all(self.data.sids):
+            self.assertEqual(equity.start_date, info.loc[equity.sid,
+                                                         'start_date'])
+            self.assertEqual(equity.end_date, info.loc[equity.sid,
+                                                       'end_date'])
+
+        daily_reader = BcolzDailyBarReader(paths.daily_bars)
+        minute_reader = BcolzMinuteBarReader(paths.minute_bars)
+        for sid in self.data.sids:
+            daily = self.data.daily_bars(sid)
+            day = daily.index[daily['volume'].values.argmax()]
+            self.assertAlmostEqual(
+                daily_reader.spot_price(sid, day, 'close'),
+                daily.loc[day, 'close'],
+                places=2,
+            )
+            minutes = self.minute_bars(sid)
+            last_minute = minutes.index[minutes.index.normalize() == day][-1]
+            self.assertAlmostEqual(
+                minute_reader.get_value(sid, last_minute, 'close'),
+                daily.loc[day, 'close'],
+                places=2,
+            )
+
+        adjustments = SQLiteAdjustmentReader(paths.adjustments)
+        splits = pd.concat(
+            [self.data.adjustments(sid)[0] for sid in self.data.sids],
+        )
+        self.assertEqual(
+            adjustments.conn.execute('SELECT COUNT(*) FROM splits').fetchone(),
+            (len(splits),),
+        )
+        # Every dividend's ratio is computed from a traded close.
+        ratios = adjustments.conn.execute(
+            'SELECT ratio FROM dividends',
+        ).fetchall()
+        self.assertTrue(ratios)
+        for ratio, in ratios:
+            self.assertGreater(ratio, 0.0)
+            self.assertLess(ratio, 1.0)
+
+        # The data does not depend on the number of processes.
+        parallel_paths = self.data.write(
+            self.tempdir.getpath('parallel'),
+            processes=2,
+        )
+        parallel_reader = BcolzMinuteBarReader(parallel_paths.minute_bars)
+        first_minute = self.data.open_and_closes['market_open'].iloc[0]
+        last_minute = self.data.open_and_closes['market_close'].iloc[-1]
+        fields = ['open', 'high', 'low', 'close', 'volume']
+        for serial, parallel in zip(
+                minute_reader.unadjusted_window(
+                    fields, first_minute, last_minute, self.data.sids,
+                ),
+                parallel_reader.unadjusted_window(
+                    fields, first_minute, last_minute, self.data.sids,
+                )):
+            assert_array_equal(serial, parallel)
+        days = self.data.days
+        parallel_daily_reader = BcolzDailyBarReader(parallel_paths.daily_bars)
+        for serial, parallel in zip(
+                daily_reader.load_raw_arrays(
+                    USEquityPricing.columns, days[0], days[-1],
+                    self.data.sids,
+                ),
+                parallel_daily_reader.load_raw_arrays(
+                    USEquityPricing.columns, days[0], days[-1],
+                    self.data.sids,
+                )):
+            assert_array_equal(serial, parallel)
@@ -12,10 +12,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import sqlite3
+
+from mock import patch
 from nose_parameterized import parameterized
 from numpy import (
     arange,
+    array,
     datetime64,
+    float64,
+    int64,
+    nan,
 )
 from numpy.testing import (
     assert_array_equal,
@@ -29,7 +37,11 @@ from pandas.util.testing import assert_index_equal
 
 from zipline.data.us_equity_pricing import (
     BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+    CURRENT_VERSION_FILE,
     NoDataOnDate,
+    SQLiteAdjustmentWriter,
+    US_EQUITY_PRICING_BCOLZ_COLUMNS,
 )
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.loaders.synthetic import (
@@ -185,6 +197,210 @@ class BcolzDailyBarTestCase(WithBcolzDailyBarReader, ZiplineTestCase):
             DatetimeIndex(result.attrs['calendar'], tz='UTC'),
         )
 
+    def test_write_with_processes(self):
+        expected = self.bcolz_daily_bar_ctable
+        result = BcolzDailyBarWriter(
+            self.tmpdir.getpath('daily_bars_with_processes'),
+            self.bcolz_daily_bar_days,
+        ).write(
+            self.make_daily_bar_data(),
+            assets=set(self.assets),
+            processes=2,
+        )
+        for column in US_EQUITY_PRICING_BCOLZ_COLUMNS:
+            assert_array_equal(result[column][:], expected[column][:])
+        for attr in 'first_row', 'last_row', 'calendar_offset', 'calendar':
+            self.assertEqual(result.attrs[attr], expected.attrs[attr])
+
+    def test_append(self):
+        # Sid 2 starts on the cutoff, so it is added by the append.
+        cutoff = Timestamp('2015-06-22', tz='UTC')
+        path = self.tmpdir.getpath('daily_bars_appended')
+        writer = BcolzDailyBarWriter(path, self.bcolz_daily_bar_days)
+        writer.write(
+            (sid, frame[frame.index < cutoff])
+            for sid, frame in self.make_daily_bar_data()
+        )
+        result = writer.append(
+            (sid, frame[frame.index >= cutoff])
+            for sid, frame in self.make_daily_bar_data()
+        )
+        self.assertEqual(len(result), len(self.bcolz_daily_bar_ctable))
+
+        expected = self.bcolz_daily_bar_reader.load_raw_arrays(
+            USEquityPricing.columns,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            self.assets,
+        )
+        appended = BcolzDailyBarReader(path).load_raw_arrays(
+            USEquityPricing.columns,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            self.assets,
+        )
+        for e, a in zip(expected, appended):
+            assert_array_equal(e, a)
+
+        # The same days can't be appended twice, and a failed append leaves
+        # the table as it was.
+        with self.assertRaises(ValueError):
+            writer.append(
+                (sid, frame[frame.index >= cutoff])
+                for sid, frame in self.make_daily_bar_data()
+            )
+        self.assertEqual(
+            BcolzDailyBarReader(path)._table.attrs['last_row'],
+            result.attrs['last_row'],
+        )
+
+    def test_append_interrupted(self):
+        cutoff = Timestamp('2015-06-22', tz='UTC')
+        path = self.tmpdir.getpath('daily_bars_interrupted')
+        writer = BcolzDailyBarWriter(path, self.bcolz_daily_bar_days)
+        before = writer.write(
+            (sid, frame[frame.index < cutoff])
+            for sid, frame in self.make_daily_bar_data()
+        )
+
+        def append():
+            return writer.append(
+                (sid, frame[frame.index >= cutoff])
+                for sid, frame in self.make_daily_bar_data()
+            )
+
+        # If switching to the new version fails, the old table is still
+        # current.
+        with patch(
+                'zipline.data.us_equity_pricing.atomic_write_file',
+                side_effect=OSError('interrupted')), \
+                self.assertRaises(OSError):
+            append()
+        self.assertEqual(
+            BcolzDailyBarReader(path)._table.attrs['last_row'],
+            before.attrs['last_row'],
+        )
+
+        # A table opened before an append can still be read after it.
+        old = BcolzDailyBarReader(path)._table
+        after = append()
+        self.assertEqual(len(after), len(self.bcolz_daily_bar_ctable))
+        assert_array_equal(old['close'][:], before['close'][:])
+
+        # The next append removes the versions before the previous one.
+        result = writer.append([])
+        self.assertEqual(result.attrs['last_row'], after.attrs['last_row'])
+        self.assertEqual(
+            sorted(os.listdir(path)),
+            sorted([
+                CURRENT_VERSION_FILE,
+                os.path.basename(after.rootdir),
+                os.path.basename(result.rootdir),
+            ]),
+        )
+        assert_array_equal(after['close'][:], result['close'][:])
+
+    def test_append_adjustments(self):
+        writer = SQLiteAdjustmentWriter(
+            self.tmpdir.getpath('adjustments_appended.sqlite'),
+            self.bcolz_daily_bar_reader,
+            self.bcolz_daily_bar_days,
+        )
+        splits = DataFrame({
+            'sid': array([1, 3], dtype=int64),
+            'effective_date': array([1433721600, 1434067200], dtype=int64),
+            'ratio': array([0.5, 0.25], dtype=float64),
+        })
+        writer.write(splits=splits.iloc[:1])
+        writer.append(
+            splits=splits.iloc[1:],
+            dividends=DataFrame({
+                'sid': array([3], dtype=int64),
+                'ex_date': array(['2015-06-10'], dtype='datetime64[ns]'),
+                'declared_date': array(['2015-06-01'], dtype='datetime64[ns]'),
+                'record_date': array(['2015-06-11'], dtype='datetime64[ns]'),
+                'pay_date': array(['2015-06-15'], dtype='datetime64[ns]'),
+                'amount': array([1.0], dtype=float64),
+            }),
+        )
+
+        def rows(table, columns):
+            return writer.conn.execute(
+                'SELECT %s FROM %s ORDER BY sid' % (columns, table),
+            ).fetchall()
+
+        self.assertEqual(
+            rows('splits', 'sid, effective_date, ratio'),
+            [(1, 1433721600, 0.5), (3, 1434067200, 0.25)],
+        )
+        self.assertEqual(rows('dividend_payouts', 'sid, ex_date'),
+                         [(3, 1433894400)])
+        self.assertEqual(rows('dividends', 'sid, effective_date'),
+                         [(3, 1433894400)])
+
+        # Existing adjustments are refused, and nothing else is inserted.
+        with self.assertRaises(ValueError):
+            writer.append(
+                mergers=splits.iloc[:1],
+                splits=splits,
+            )
+        self.assertEqual(len(rows('splits', 'sid')), 2)
+        self.assertEqual(rows('mergers', 'sid'), [])
+
+        with self.assertRaises(ValueError):
+            SQLiteAdjustmentWriter(
+                sqlite3.connect(':memory:'),
+                self.bcolz_daily_bar_reader,
+                self.bcolz_daily_bar_days,
+            ).append(splits=splits)
+
+    def test_write_restores_journal_settings(self):
+        conn = sqlite3.connect(
+            self.tmpdir.getpath('adjustments_journal.sqlite'),
+        )
+        conn.execute('PRAGMA journal_mode=TRUNCATE')
+        conn.execute('PRAGMA synchronous=OFF')
+        writer = SQLiteAdjustmentWriter(
+            conn,
+            self.bcolz_daily_bar_reader,
+            self.bcolz_daily_bar_days,
+        )
+        splits = DataFrame({
+            'sid': array([1], dtype=int64),
+            'effective_date': array([1433721600], dtype=int64),
+            'ratio': array([0.5], dtype=float64),
+        })
+        writer.write(splits=splits)
+        self.assertEqual(
+            conn.execute('PRAGMA journal_mode').fetchone(),
+            ('truncate',),
+        )
+        self.assertEqual(conn.execute('PRAGMA synchronous').fetchone(), (0,))
+
+        # Leaving WAL mode fails without an error, so the returned mode is
+        # checked.
+        class StuckInWAL(object):
+            def __init__(self, conn):
+                self._conn = conn
+
+            def execute(self, statement, *args):
+                if statement.startswith('PRAGMA journal_mode='):
+                    statement = 'PRAGMA journal_mode=WAL'
+                return self._conn.execute(statement, *args)
+
+            def __enter__(self):
+                return self._conn.__enter__()
+
+            def __exit__(self, *exc_info):
+                return self._conn.__exit__(*exc_info)
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        writer.conn = StuckInWAL(conn)
+        with self.assertRaises(ValueError):
+            writer.append(splits=splits.assign(effective_date=1434067200))
+
     def _check_read_results(self, columns, assets, start_date, end_date):
         results = self.bcolz_daily_bar_reader.load_raw_arrays(
             columns,
@@ -273,6 +489,43 @@ class BcolzDailyBarTestCase(WithBcolzDailyBarReader, ZiplineTestCase):
                 end_date=self.asset_end(asset),
             )
 
+    def test_read_stats(self):
+        reader = BcolzDailyBarReader(self.bcolz_daily_bar_ctable)
+        reader.load_raw_arrays(
+            [USEquityPricing.close],
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+            self.assets,
+        )
+        num_days = len(
+            self.trading_days_between(TEST_QUERY_START, TEST_QUERY_STOP),
+        )
+        counts = reader.stats.snapshot().counts
+        self.assertEqual(counts['raw_array_reads'], 1)
+        self.assertEqual(
+            counts['raw_array_cells'],
+            num_days * len(self.assets),
+        )
+        # Only the rows of assets alive during the query are read:
+        # 8 rows for asset 3, 4 for asset 4, 5 for asset 5 and 5 for asset 6.
+        self.assertEqual(counts['bytes_decompressed'], 22 * 4)
+
+        before = reader.stats.snapshot()
+        day = Timestamp('2015-06-02', tz='UTC')
+        reader.spot_price(1, day, 'close')
+        reader.spot_price(1, day, 'close')
+        delta = (reader.stats.snapshot() - before).counts
+        self.assertEqual(delta['spot_reads'], 2)
+        # The column is only read into memory once.
+        self.assertEqual(delta['column_reads'], 1)
+        self.assertEqual(
+            delta['bytes_decompressed'],
+            len(self.bcolz_daily_bar_ctable) * 4,
+        )
+
+        reader.stats.reset()
+        self.assertEqual(reader.stats.snapshot().counts, {})
+
     def test_unadjusted_spot_price(self):
         reader = self.bcolz_daily_bar_reader
         # At beginning
@@ -300,6 +553,41 @@ class BcolzDailyBarTestCase(WithBcolzDailyBarReader, ZiplineTestCase):
                                    'volume')
         self.assertEqual(109631, volume)
 
+    def test_spot_prices(self):
+        reader = BcolzDailyBarReader(self.bcolz_daily_bar_ctable)
+        sids = []
+        days = []
+        for sid in self.assets:
+            for day in self.trading_days:
+                sids.append(sid)
+                days.append(day.asm8)
+
+        for column in 'close', 'volume':
+            expected = []
+            for sid, day in zip(sids, days):
+                try:
+                    expected.append(reader.spot_price(
+                        sid,
+                        Timestamp(day, tz='UTC'),
+                        column,
+                    ))
+                except NoDataOnDate:
+                    expected.append(nan)
+            assert_array_equal(
+                reader.spot_prices(sids, days, column),
+                expected,
+            )
+
+        # Days outside of the calendar have no data.
+        assert_array_equal(
+            reader.spot_prices(
+                [1],
+                [datetime64('2015-06-06', 'ns')],
+                'close',
+            ),
+            [nan],
+        )
+
     def test_unadjusted_spot_price_no_data(self):
         table = self.bcolz_daily_bar_ctable
         reader = BcolzDailyBarReader(table)
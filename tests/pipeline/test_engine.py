@@ -219,6 +219,132 @@ class ConstantInputTestCase(WithTradingEnvironment, ZiplineTestCase):
         result = engine.run_pipeline(p, self.dates[1], self.dates[1])
         self.assertEqual(result['f'][0], 1.0)
 
+    def test_profile(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        factor = AssetID()
+        screen = factor <= self.asset_ids[1]
+        p = Pipeline(columns={'f': factor}, screen=screen)
+
+        engine.run_pipeline(p, self.dates[5], self.dates[9])
+        self.assertIsNone(engine.last_profile)
+
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+            profile=True,
+        )
+        engine.run_pipeline(p, self.dates[5], self.dates[9])
+        profile = engine.last_profile
+
+        self.assertEqual(
+            set(profile.terms),
+            {USEquityPricing.close, factor, screen},
+        )
+        self.assertEqual(
+            list(profile.stages),
+            ['graph', 'root_mask', 'compute_chunk', 'to_narrow'],
+        )
+        # AssetID has a window_length of 1, so no extra rows are needed.
+        self.assertEqual(profile.shape, (5, len(self.asset_ids)))
+
+        close = profile.terms[USEquityPricing.close]
+        self.assertEqual(close.kind, 'load')
+        self.assertEqual(close.loader_group,
+                         'PrecomputedLoader[extra_rows=0]')
+        self.assertEqual(close.extra_rows, 0)
+
+        computed = profile.terms[factor]
+        self.assertEqual(computed.kind, 'compute')
+        self.assertIsNone(computed.loader_group)
+        # 5 days x 4 assets of float64.
+        self.assertEqual(computed.nbytes, 5 * 4 * 8)
+
+        frame = profile.to_frame()
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(
+            list(frame.seconds),
+            sorted(frame.seconds, reverse=True),
+        )
+        self.assertEqual(profile.nbytes, frame.nbytes.sum())
+
+    def test_reuse_graph(self):
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        loader_calls = []
+
+        def get_loader(column):
+            loader_calls.append(column)
+            return loader
+
+        engine = SimplePipelineEngine(
+            get_loader, self.dates, self.asset_finder, cache_loaders=True,
+        )
+        factor = AssetID()
+        screen = factor <= self.asset_ids[1]
+
+        first = engine.run_pipeline(
+            Pipeline(columns={'f': factor}, screen=screen),
+            self.dates[5],
+            self.dates[9],
+        )
+        self.assertEqual(loader_calls, [USEquityPricing.close])
+
+        # A different Pipeline with the same terms and screen should reuse the
+        # compiled graph and loader groups.
+        second = engine.run_pipeline(
+            Pipeline(columns={'f': factor}, screen=screen),
+            self.dates[10],
+            self.dates[14],
+        )
+        self.assertEqual(loader_calls, [USEquityPricing.close])
+        self.assertEqual(len(loader.load_calls), 2)
+        assert_frame_equal(
+            first.reset_index(level=0, drop=True),
+            second.reset_index(level=0, drop=True),
+        )
+
+        # Changing the screen compiles a new graph.
+        engine.run_pipeline(
+            Pipeline(columns={'f': factor}),
+            self.dates[5],
+            self.dates[9],
+        )
+        self.assertEqual(
+            loader_calls,
+            [USEquityPricing.close, USEquityPricing.close],
+        )
+
+    def test_reuse_graph_without_cached_loaders(self):
+        loader_calls = []
+
+        def get_loader(column):
+            loader_calls.append(column)
+            return self.loader
+
+        engine = SimplePipelineEngine(
+            get_loader, self.dates, self.asset_finder,
+        )
+        factor = AssetID()
+
+        # By default the graph is reused, but get_loader is still called for
+        # every run.
+        for start, end in (5, 9), (10, 14):
+            engine.run_pipeline(
+                Pipeline(columns={'f': factor}),
+                self.dates[start],
+                self.dates[end],
+            )
+        self.assertEqual(len(engine._graph_cache), 1)
+        self.assertEqual(
+            loader_calls,
+            [USEquityPricing.close, USEquityPricing.close],
+        )
+
     def test_screen(self):
         loader = self.loader
         finder = self.asset_finder
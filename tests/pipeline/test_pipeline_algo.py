@@ -6,6 +6,7 @@ from os.path import (
     join,
     realpath,
 )
+from threading import current_thread
 
 from nose_parameterized import parameterized
 from numpy import (
@@ -34,6 +35,7 @@ from zipline.api import (
     pipeline_output,
     get_datetime,
 )
+from zipline.data.us_equity_pricing import SQLiteAdjustmentReader
 from zipline.errors import (
     AttachPipelineAfterInitialize,
     PipelineOutputDuringInitialize,
@@ -328,6 +330,82 @@ class ClosesOnly(WithDataPortal, ZiplineTestCase):
         # Run for a week in the middle of our data.
         algo.run(self.data_portal)
 
+    @parameterized.expand([('start', 1e-9), ('half', 0.5), ('end', 1.0)])
+    def test_prefetch_pipeline_chunks(self, test_name, prefetch):
+        """
+        Assert that results computed ahead of time in the background match
+        results computed synchronously.
+        """
+        def initialize(context):
+            p = attach_pipeline(
+                Pipeline(), 'test', chunksize=2, prefetch=prefetch,
+            )
+            p.add(USEquityPricing.close.latest, 'close')
+
+        def handle_data(context, data):
+            results = pipeline_output('test')
+            date = get_datetime().normalize()
+            for asset in self.assets:
+                exists_today = self.exists(date, asset)
+                existed_yesterday = self.exists(date - trading_day, asset)
+                if exists_today and existed_yesterday:
+                    latest = results.loc[asset, 'close']
+                    self.assertEqual(latest, self.expected_close(date, asset))
+                else:
+                    self.assertNotIn(asset, results.index)
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+        )
+        algo.run(self.data_portal)
+
+    def test_prefetch_pipeline_error(self):
+        """
+        Assert that errors raised while computing a chunk in the background
+        are raised from pipeline_output.
+        """
+        class SomeError(Exception):
+            pass
+
+        pipeline_loader = self.pipeline_loader
+        simulation_thread = current_thread()
+
+        def get_loader(column):
+            if current_thread() is not simulation_thread:
+                raise SomeError()
+            return pipeline_loader
+
+        def initialize(context):
+            p = attach_pipeline(Pipeline(), 'test', chunksize=2, prefetch=0.5)
+            p.add(USEquityPricing.close.latest, 'close')
+
+        def handle_data(context, data):
+            pipeline_output('test')
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=get_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+        )
+        with self.assertRaises(SomeError):
+            algo.run(self.data_portal)
+
+    def test_prefetch_out_of_bounds(self):
+        for prefetch in (0, -0.5, 1.5):
+            algo = TradingAlgorithm(env=self.env)
+            with self.assertRaises(ValueError):
+                algo.attach_pipeline(Pipeline(), 'test', prefetch=prefetch)
+
 
 class MockDailyBarSpotReader(object):
     """
@@ -482,6 +560,31 @@ class PipelineAlgorithmTestCase(WithBcolzDailyBarReaderFromCSVs,
         (False,),
     ])
     def test_handle_adjustment(self, set_screen):
+        self.check_adjustments(self.pipeline_loader, set_screen)
+
+    def test_prefetch_with_adjustments(self):
+        """
+        Assert that a pipeline prefetched on a background thread can read
+        the bars and adjustments through the stock pricing loader, whose
+        adjustment reader opened its own connection.
+        """
+        path = self.tmpdir.getpath('adjustments.sqlite')
+        self.make_adjustment_writer(path).write(
+            splits=self.make_splits_data(),
+            mergers=self.make_mergers_data(),
+            dividends=self.make_dividends_data(),
+        )
+        loader = USEquityPricingLoader(
+            self.bcolz_daily_bar_reader,
+            SQLiteAdjustmentReader(path),
+        )
+        self.check_adjustments(loader, True, chunksize=5, prefetch=0.5)
+
+    def check_adjustments(self,
+                          pipeline_loader,
+                          set_screen,
+                          chunksize=None,
+                          prefetch=None):
         AAPL, MSFT, BRK_A = assets = self.AAPL, self.MSFT, self.BRK_A
 
         window_lengths = [1, 2, 5, 10]
@@ -504,7 +607,12 @@ class PipelineAlgorithmTestCase(WithBcolzDailyBarReaderFromCSVs,
             if set_screen:
                 pipeline.set_screen(filter_)
 
-            attach_pipeline(pipeline, 'test')
+            attach_pipeline(
+                pipeline,
+                'test',
+                chunksize=chunksize,
+                prefetch=prefetch,
+            )
 
         def handle_data(context, data):
             today = get_datetime()
@@ -537,7 +645,7 @@ class PipelineAlgorithmTestCase(WithBcolzDailyBarReaderFromCSVs,
             handle_data=handle_data,
             before_trading_start=before_trading_start,
             data_frequency='daily',
-            get_pipeline_loader=lambda column: self.pipeline_loader,
+            get_pipeline_loader=lambda column: pipeline_loader,
             start=self.dates[max(window_lengths)],
             end=self.dates[-1],
             env=self.env,
@@ -0,0 +1,111 @@
+"""
+Tests for zipline.pipeline.results.
+"""
+from unittest import TestCase
+
+from numpy import arange, array, int64
+from numpy.testing import assert_array_equal
+from pandas import DataFrame, date_range, MultiIndex
+from pandas.util.testing import assert_frame_equal
+
+from zipline.pipeline.engine import PipelineEngine
+from zipline.pipeline.results import PipelineChunk
+
+
+class PipelineChunkTestCase(TestCase):
+
+    def setUp(self):
+        self.dates = date_range('2014-01-02', periods=3, tz='UTC')
+        self.assets = array(['A', 'B', 'C'], dtype=object)
+        self.mask = array([[True, False, True],
+                           [False, False, False],
+                           [True, True, True]])
+        self.data = {
+            'b': arange(9, dtype=float).reshape(3, 3),
+            'a': arange(9, dtype=int64).reshape(3, 3) * 10,
+        }
+        self.chunk = PipelineChunk.from_mask(
+            self.data, self.mask, self.dates, self.assets,
+        )
+
+    def test_offsets(self):
+        assert_array_equal(self.chunk.offsets, [0, 2, 2, 5])
+        assert_array_equal(self.chunk.assets, ['A', 'C', 'A', 'B', 'C'])
+        self.assertEqual(len(self.chunk), 5)
+
+    def test_for_date(self):
+        assert_frame_equal(
+            self.chunk.for_date(self.dates[0]),
+            DataFrame(
+                {'a': array([0, 20]), 'b': [0.0, 2.0]},
+                index=array(['A', 'C'], dtype=object),
+                columns=['a', 'b'],
+            ),
+        )
+        assert_frame_equal(
+            self.chunk.for_date(self.dates[2]),
+            DataFrame(
+                {'a': array([60, 70, 80]), 'b': [6.0, 7.0, 8.0]},
+                index=array(['A', 'B', 'C'], dtype=object),
+                columns=['a', 'b'],
+            ),
+        )
+
+        empty = self.chunk.for_date(self.dates[1])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(list(empty.columns), ['a', 'b'])
+        self.assertEqual(empty['a'].dtype, int64)
+
+        with self.assertRaises(KeyError):
+            self.chunk.for_date(self.dates[-1] + self.dates.freq)
+
+    def test_to_frame(self):
+        expected_dates = self.dates[[0, 0, 2, 2, 2]]
+        expected = DataFrame(
+            {'a': array([0, 20, 60, 70, 80]), 'b': [0., 2., 6., 7., 8.]},
+            index=MultiIndex.from_arrays(
+                [expected_dates, ['A', 'C', 'A', 'B', 'C']],
+            ),
+            columns=['a', 'b'],
+        )
+        result = self.chunk.to_frame()
+        assert_frame_equal(result, expected)
+        for date in self.dates[[0, 2]]:
+            assert_frame_equal(result.loc[date], self.chunk.for_date(date))
+
+    def test_empty(self):
+        chunk = PipelineChunk.empty(date_range('2014-01-02', periods=2),
+                                    ['x'])
+        self.assertEqual(str(chunk.dates.tz), 'UTC')
+        self.assertEqual(len(chunk.for_date(chunk.dates[1])), 0)
+        self.assertEqual(len(chunk.to_frame()), 0)
+
+    def test_from_frame(self):
+        chunk = PipelineChunk.from_frame(
+            self.chunk.to_frame(), self.dates[0], self.dates[-1],
+        )
+        assert_array_equal(chunk.dates, self.dates)
+        assert_array_equal(chunk.offsets, self.chunk.offsets)
+        assert_array_equal(chunk.assets, self.chunk.assets)
+        for date in chunk.dates:
+            assert_frame_equal(chunk.for_date(date),
+                               self.chunk.for_date(date))
+
+    def test_default_run_pipeline_chunk(self):
+        frame = self.chunk.to_frame()
+
+        class FrameEngine(PipelineEngine):
+            # Third-party engines may only implement run_pipeline.
+            def run_pipeline(self, pipeline, start_date, end_date):
+                return frame
+
+        chunk = FrameEngine().run_pipeline_chunk(
+            None, self.dates[0], self.dates[-1],
+        )
+        assert_frame_equal(chunk.to_frame(), frame)
+
+        # The screen filtered out every asset on the second day, so it has
+        # no rows in the frame, but it still has (empty) results.
+        empty = chunk.for_date(self.dates[1])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(list(empty.columns), ['a', 'b'])
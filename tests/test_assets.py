@@ -25,9 +25,11 @@ from unittest import TestCase
 import uuid
 import warnings
 
+from mock import patch
 from nose.tools import raises
 from nose_parameterized import parameterized
-from numpy import full, int32, int64
+from numpy import array, full, int32, int64
+from numpy.testing import assert_array_equal
 import pandas as pd
 from pandas.util.testing import assert_frame_equal
 from six import PY2
@@ -56,10 +58,13 @@ from zipline.assets.futures import (
 )
 from zipline.assets.asset_writer import (
     check_version_info,
+    split_delimited_symbol,
+    split_delimited_symbols,
     write_version_info,
     _futures_defaults,
 )
 from zipline.assets.asset_db_schema import ASSET_DB_VERSION
+from zipline.assets.asset_table import AssetTable
 from zipline.assets.asset_db_migrations import (
     downgrade
 )
@@ -81,6 +86,7 @@ from zipline.testing import (
 from zipline.testing.predicates import assert_equal
 from zipline.testing.fixtures import (
     WithAssetFinder,
+    WithInstanceTmpDir,
     ZiplineTestCase,
 )
 from zipline.utils.tradingcalendar import trading_day
@@ -396,7 +402,7 @@ class TestFuture(WithAssetFinder, ZiplineTestCase):
             TestFuture.asset_finder.lookup_future_symbol('XXX99')
 
 
-class AssetFinderTestCase(ZiplineTestCase):
+class AssetFinderTestCase(WithInstanceTmpDir, ZiplineTestCase):
     asset_finder_type = AssetFinder
 
     def write_assets(self, **kwargs):
@@ -485,6 +491,63 @@ class AssetFinderTestCase(ZiplineTestCase):
         self.assertEqual(2, finder.lookup_symbol('BRK_A', None, fuzzy=True))
         self.assertEqual(2, finder.lookup_symbol('BRK_A', dt, fuzzy=True))
 
+    def test_lookup_symbols(self):
+        dates = pd.date_range('2013-01-01', freq='2D', periods=4, tz='UTC')
+        records = [
+            # A symbol held by a different asset every two days.
+            {
+                'symbol': 'EXISTING',
+                'start_date': date.value,
+                'end_date': (date + timedelta(days=1)).value,
+            }
+            for date in dates
+        ]
+        records.extend([
+            {'symbol': 'BRK_A'},
+            {'symbol': 'BRKA'},
+            {'symbol': 'PRTY_HRD'},
+        ])
+        self.write_assets(
+            equities=pd.DataFrame.from_records(records).fillna({
+                'start_date': dates[0].value,
+                'end_date': dates[-1].value,
+            }),
+        )
+        finder = self.asset_finder
+
+        # Each symbol's sid on each of 8 consecutive days.
+        expected = {
+            'EXISTING': [0, 0, 1, 1, 2, 2, 3, 3],
+            'BRK.A': [4] * 8,
+            'BRKA': [5] * 8,
+            'PRTY-HRD': [6] * 8,
+        }
+        as_of_dates = pd.date_range(dates[0], periods=8, tz='UTC')
+        for fuzzy in False, True:
+            expected['PRTYHRD'] = [6 if fuzzy else None] * 8
+            for symbol, sids in expected.items():
+                result = finder.lookup_symbols(
+                    [symbol] * len(as_of_dates),
+                    as_of_dates,
+                    fuzzy=fuzzy,
+                    default_none=True,
+                )
+                self.assertEqual(
+                    [None if asset is None else asset.sid for asset in result],
+                    sids,
+                )
+
+        # A single date applies to every symbol.
+        self.assertEqual(
+            finder.lookup_symbols(['BRKA', 'EXISTING'], dates[1]),
+            [finder.lookup_symbol('BRKA', dates[1]),
+             finder.lookup_symbol('EXISTING', dates[1])],
+        )
+        with self.assertRaises(SymbolNotFound):
+            finder.lookup_symbols(['BRKA', 'PRTYHRD'], dates[1])
+        with self.assertRaises(MultipleSymbolsFound):
+            finder.lookup_symbols(['EXISTING'], None)
+
     def test_lookup_symbol(self):
 
         # Incrementing by two so that start and end dates for each
@@ -832,6 +895,206 @@ class AssetFinderTestCase(ZiplineTestCase):
             result = finder.lifetimes(dates, include_start_date=False)
             assert_frame_equal(result, expected_no_start)
 
+    def test_lifetimes_in_window(self):
+        first_start = pd.Timestamp('2015-04-01', tz='UTC')
+        frame = make_rotating_equity_info(
+            num_assets=6,
+            first_start=first_start,
+            frequency=trading_day,
+            periods_between_starts=3,
+            asset_lifetime=5
+        )
+        self.write_assets(equities=frame)
+        finder = self.asset_finder
+
+        all_dates = pd.date_range(
+            start=first_start - 2 * trading_day,
+            end=frame.end_date.max() + 2 * trading_day,
+            freq=trading_day,
+        )
+        for dates in all_subindices(all_dates):
+            for include_start_date in True, False:
+                lifetimes = finder.lifetimes(dates, include_start_date)
+                for window_start in {0, len(dates) // 2, len(dates) - 1}:
+                    existed = lifetimes.iloc[window_start:].any()
+                    assert_frame_equal(
+                        finder.lifetimes_in_window(
+                            dates,
+                            include_start_date,
+                            window_start,
+                        ),
+                        lifetimes.loc[:, existed],
+                    )
+
+    def test_asset_table_queries(self):
+        dates = pd.date_range('2014-01-01', periods=4, tz='UTC')
+        equities = pd.DataFrame.from_records(
+            [
+                # Two assets share a symbol at different times.
+                {'symbol': 'A', 'start_date': dates[0], 'end_date': dates[1]},
+                {'symbol': 'A', 'start_date': dates[2], 'end_date': dates[3]},
+                {'symbol': 'B', 'start_date': dates[0], 'end_date': dates[3]},
+            ],
+            index=[5, 1, 3],
+        )
+        futures = make_commodity_future_info(
+            first_sid=10,
+            root_symbols=['CL'],
+            years=[2014],
+        )
+        self.write_assets(equities=equities, futures=futures)
+        finder = self.asset_finder
+
+        assert_array_equal(
+            finder.asset_table.asset_types_for([1, 10, 99]),
+            array(['equity', 'future', None], dtype=object),
+        )
+        assert_array_equal(finder.sids_alive_on(dates[0]), [3, 5])
+        assert_array_equal(
+            finder.sids_alive_on(dates[2], include_start_date=False),
+            [3],
+        )
+        assert_array_equal(
+            finder.sids_for_symbols(['A', 'B', 'C'], dates[0]),
+            [5, 3, -1],
+        )
+        assert_array_equal(
+            finder.sids_for_symbols(['B', 'A'], dates[3]),
+            [3, 1],
+        )
+
+        # Results match the object lookups.
+        for date in dates:
+            for symbol, sid in zip(['A', 'B'],
+                                   finder.sids_for_symbols(['A', 'B'], date)):
+                if sid == -1:
+                    continue
+                self.assertEqual(finder.lookup_symbol(symbol, date).sid, sid)
+
+    def assert_asset_tables_equal(self, expected, result):
+        assert_array_equal(expected.sids, result.sids)
+        assert_array_equal(expected.asset_types, result.asset_types)
+        for name, column in expected.dates.items():
+            assert_array_equal(column, result.dates[name])
+        for name, column in expected.strings.items():
+            assert_array_equal(column.codes, result.strings[name].codes)
+            assert_array_equal(
+                column.categories,
+                result.strings[name].categories,
+            )
+
+    def test_bulk_write(self):
+        equities = make_rotating_equity_info(
+            num_assets=20,
+            first_start=pd.Timestamp('2014-01-01', tz='UTC'),
+            frequency=trading_day,
+            periods_between_starts=2,
+            asset_lifetime=5,
+        )
+        equities['symbol'] = [
+            'S%d%s' % (i, '.A' if i % 3 == 0 else '')
+            for i in range(len(equities))
+        ]
+        futures = make_commodity_future_info(
+            first_sid=100,
+            root_symbols=['CL', 'NG'],
+            years=[2014],
+        )
+        self.write_assets(equities=equities, futures=futures)
+
+        bulk_engine = sa.create_engine('sqlite:///:memory:')
+        bulk_table_path = self.instance_tmpdir.getpath('bulk_asset_table')
+        AssetDBWriter(bulk_engine).write(
+            equities=equities,
+            futures=futures,
+            bulk=True,
+            asset_table_path=bulk_table_path,
+        )
+        bulk_finder = AssetFinder(bulk_engine)
+
+        for name in ('equities', 'futures_contracts', 'asset_router'):
+            assert_frame_equal(
+                pd.read_sql_table(name, bulk_engine),
+                pd.read_sql_table(name, self.asset_finder.engine),
+            )
+        # The deferred indexes are created once the data is in.
+        for name in ('equities', 'futures_contracts', 'asset_router'):
+            self.assertEqual(
+                sorted(
+                    index['name']
+                    for index in sa.inspect(bulk_engine).get_indexes(name)
+                ),
+                sorted(
+                    index['name']
+                    for index in sa.inspect(
+                        self.asset_finder.engine,
+                    ).get_indexes(name)
+                ),
+            )
+        self.assertEqual(
+            bulk_finder.retrieve_all(bulk_finder.sids),
+            self.asset_finder.retrieve_all(self.asset_finder.sids),
+        )
+        self.assert_asset_tables_equal(
+            self.asset_finder.asset_table,
+            AssetTable.load(bulk_table_path),
+        )
+
+    def test_asset_table_snapshot(self):
+        equities = make_simple_equity_info(
+            [1, 2, 3],
+            pd.Timestamp('2014-01-02', tz='UTC'),
+            pd.Timestamp('2014-12-31', tz='UTC'),
+        )
+        path = self.instance_tmpdir.getpath('asset_table')
+        self.write_assets(equities=equities, asset_table_path=path)
+
+        engine = self.asset_finder.engine
+        with patch.object(AssetTable, 'read') as read:
+            finder = self.asset_finder_type(engine, asset_table_path=path)
+            self.assert_asset_tables_equal(
+                self.asset_finder.asset_table,
+                finder.asset_table,
+            )
+        self.assertEqual(read.call_count, 0)
+
+        # A snapshot of another database with as many assets is not used.
+        other_path = self.instance_tmpdir.getpath('other_asset_table')
+        AssetDBWriter(sa.create_engine('sqlite:///:memory:')).write(
+            equities=make_simple_equity_info(
+                [5, 6, 7],
+                pd.Timestamp('2014-01-02', tz='UTC'),
+                pd.Timestamp('2014-12-31', tz='UTC'),
+            ),
+            asset_table_path=other_path,
+        )
+        finder = self.asset_finder_type(engine, asset_table_path=other_path)
+        assert_array_equal(finder.asset_table.sids, [1, 2, 3])
+
+        # A write which doesn't save a snapshot invalidates the old one.
+        self.write_assets(
+            equities=make_simple_equity_info(
+                [4],
+                pd.Timestamp('2014-01-02', tz='UTC'),
+                pd.Timestamp('2014-12-31', tz='UTC'),
+            ),
+        )
+        finder = self.asset_finder_type(engine, asset_table_path=path)
+        assert_array_equal(finder.asset_table.sids, [1, 2, 3, 4])
+
+    def test_split_delimited_symbols(self):
+        symbols = pd.Series(
+            ['AAPL', 'BRK.A', 'BRK/B', 'A-B_C', 'X.', '.Y', '', None],
+            index=list('abcdefgh'),
+        )
+        result = split_delimited_symbols(symbols)
+        assert_array_equal(result.index, symbols.index)
+        for label, symbol in symbols.iteritems():
+            self.assertEqual(
+                tuple(result.loc[label]),
+                split_delimited_symbol(symbol),
+            )
+
     def test_sids(self):
         # Ensure that the sids property of the AssetFinder is functioning
         self.write_assets(equities=make_simple_equity_info(
@@ -1327,6 +1590,8 @@ class TestAssetDBVersioning(ZiplineTestCase):
                          metadata.tables['futures_contracts'].columns)
         self.assertTrue('contract_multiplier' in
                         metadata.tables['futures_contracts'].columns)
+        self.assertFalse('asset_table_fingerprint' in
+                         metadata.tables['version_info'].columns)
 
     def test_impossible_downgrade(self):
         # Attempt to downgrade a current assets db to a
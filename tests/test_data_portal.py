@@ -12,10 +12,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from numpy.testing import assert_array_equal
 from pandas.tslib import Timedelta
 
 from zipline.data.data_portal import DataPortal
-from zipline.testing.fixtures import WithTradingEnvironment, ZiplineTestCase
+from zipline.data.minute_bars import BcolzMinuteBarReader
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    SQLiteAdjustmentReader,
+)
+from zipline.finance.trading import SimulationParameters
+from zipline.pipeline.data import USEquityPricing
+from zipline.testing import str_to_seconds
+from zipline.testing.fixtures import (
+    WithDataPortal,
+    WithTradingEnvironment,
+    ZiplineTestCase,
+)
+from zipline.utils.instrumentation import EMPTY_SNAPSHOT
 import pandas as pd
 
 
@@ -71,3 +85,176 @@ class TestDataPortal(WithTradingEnvironment, ZiplineTestCase):
             390 + 390 + 210 + 31,
             self.data_portal._get_minute_count_for_transform(nov_30_dt, 4)
         )
+
+    def test_spot_values_from_several_extra_sources(self):
+        days = self.env.days_in_range(
+            start=pd.Timestamp('2015-07-06', tz='UTC'),
+            end=pd.Timestamp('2015-07-10', tz='UTC'),
+        )
+        sim_params = SimulationParameters(
+            period_start=days[0],
+            period_end=days[-1],
+            env=self.env,
+        )
+        portal = self.data_portal
+        portal.handle_extra_source(
+            pd.DataFrame(
+                {'sid': ['gold', 'palladium'], 'signal': [1.0, 2.0]},
+                index=days[[0, 0]],
+            ),
+            sim_params,
+        )
+        # The later source wins for palladium only.
+        portal.handle_extra_source(
+            pd.DataFrame(
+                {'sid': ['palladium'], 'signal': [3.0]},
+                index=days[[1]],
+            ),
+            sim_params,
+        )
+
+        identifiers = ['palladium', 'gold', 'palladium']
+        dt = days[-1]
+        expected = [
+            portal.get_spot_value(identifier, 'signal', dt, 'daily')
+            for identifier in identifiers
+        ]
+        self.assertEqual(expected, [3.0, 1.0, 3.0])
+        assert_array_equal(
+            portal.get_spot_values(identifiers, 'signal', dt, 'daily'),
+            expected,
+        )
+
+
+class TestDataAccessStats(WithDataPortal, ZiplineTestCase):
+    START_DATE = pd.Timestamp('2015-06-01', tz='UTC')
+    END_DATE = pd.Timestamp('2015-06-30', tz='UTC')
+    SPLIT_ASSET_SID = ord('A')
+
+    @classmethod
+    def make_splits_data(cls):
+        return pd.DataFrame([
+            {
+                'effective_date': str_to_seconds('2015-06-15'),
+                'ratio': 0.5,
+                'sid': cls.SPLIT_ASSET_SID,
+            },
+        ])
+
+    def make_data_portal(self):
+        # New readers, so that no test sees the columns and carrays opened
+        # by another.
+        return DataPortal(
+            self.env,
+            equity_daily_reader=BcolzDailyBarReader(
+                self.bcolz_daily_bar_path,
+            ),
+            equity_minute_reader=BcolzMinuteBarReader(
+                self.bcolz_minute_bar_path,
+            ),
+            adjustment_reader=SQLiteAdjustmentReader(
+                self.adjustment_reader.conn,
+            ),
+        )
+
+    def init_instance_fixtures(self):
+        super(TestDataAccessStats, self).init_instance_fixtures()
+        self.assets = self.asset_finder.retrieve_all(self.asset_finder.sids)
+
+    def history_delta(self, end_dt, frequency):
+        portal = self.data_portal
+        before = portal.data_access_stats()
+        portal.get_history_window(self.assets, end_dt, 10, frequency, 'close')
+        return (portal.data_access_stats() - before).counts
+
+    def test_daily_history(self):
+        end_dt = pd.Timestamp('2015-06-26', tz='UTC')
+        delta = self.history_delta(end_dt, '1d')
+        self.assertEqual(delta['portal.history_windows'], 1)
+        self.assertEqual(delta['portal.history_window_cells'], 30)
+        self.assertEqual(delta['equity_daily_history.history_windows'], 1)
+        self.assertEqual(delta['equity_daily_history.cache_misses'], 3)
+        self.assertEqual(delta['equity_daily_history.window_rebuilds'], 3)
+        self.assertEqual(delta['equity_daily_reader.raw_array_reads'], 1)
+        # The mergers, dividends and splits of each asset.
+        self.assertEqual(delta['adjustment_reader.sql_queries'], 9)
+
+        # The second window is served from the loader's cache.
+        delta = self.history_delta(end_dt, '1d')
+        self.assertEqual(delta['equity_daily_history.cache_hits'], 3)
+        self.assertNotIn('equity_daily_history.window_rebuilds', delta)
+        self.assertNotIn('equity_daily_reader.raw_array_reads', delta)
+        self.assertNotIn('adjustment_reader.sql_queries', delta)
+
+    def test_minute_history(self):
+        minutes = self.env.market_minutes_for_day(
+            pd.Timestamp('2015-06-26', tz='UTC'),
+        )
+        delta = self.history_delta(minutes[29], '1m')
+        self.assertEqual(delta['portal.history_windows'], 1)
+        self.assertEqual(delta['equity_minute_history.history_windows'], 1)
+        self.assertEqual(delta['equity_minute_history.cache_misses'], 3)
+        self.assertEqual(delta['equity_minute_history.window_rebuilds'], 3)
+        self.assertEqual(delta['equity_minute_reader.window_reads'], 1)
+        # Only the close carray of each asset is opened.
+        self.assertEqual(delta['equity_minute_reader.carray_opens'], 3)
+        self.assertGreater(delta['equity_minute_reader.bytes_decompressed'], 0)
+
+        delta = self.history_delta(minutes[30], '1m')
+        self.assertEqual(delta['equity_minute_history.cache_hits'], 3)
+        self.assertNotIn('equity_minute_reader.window_reads', delta)
+        self.assertNotIn('equity_minute_reader.carray_opens', delta)
+
+    def test_spot_value(self):
+        portal = self.data_portal
+        day = pd.Timestamp('2015-06-26', tz='UTC')
+        portal.get_spot_value(self.assets[0], 'close', day, 'daily')
+        portal.get_spot_value(self.assets[1], 'close', day, 'daily')
+        counts = portal.data_access_stats().counts
+        self.assertEqual(counts['portal.spot_lookups'], 2)
+        self.assertEqual(counts['equity_daily_reader.spot_reads'], 2)
+        # The close column is read once for both assets.
+        self.assertEqual(counts['equity_daily_reader.column_reads'], 1)
+
+    def test_splits_and_stock_dividends_queries(self):
+        portal = self.data_portal
+        before = portal.data_access_stats()
+        day = pd.Timestamp('2015-06-26', tz='UTC')
+        portal.get_splits([asset.sid for asset in self.assets], day)
+        portal.get_stock_dividends(
+            self.assets[0].sid,
+            self.env.days_in_range(self.START_DATE, day),
+        )
+        delta = (portal.data_access_stats() - before).counts
+        # Both go through the reader, which serializes access to its
+        # connection.
+        self.assertEqual(delta['adjustment_reader.sql_queries'], 2)
+        self.assertNotIn('portal.sql_queries', delta)
+
+    def test_reset(self):
+        portal = self.data_portal
+        portal.get_history_window(
+            self.assets,
+            pd.Timestamp('2015-06-26', tz='UTC'),
+            10,
+            '1d',
+            'close',
+        )
+        self.assertTrue(portal.data_access_stats().counts)
+        self.assertTrue(portal.data_access_stats().timings)
+
+        portal.reset_data_access_stats()
+        self.assertEqual(portal.data_access_stats(), EMPTY_SNAPSHOT)
+
+    def test_load_adjustments_queries(self):
+        reader = self.data_portal._adjustment_reader
+        reader.load_adjustments(
+            [USEquityPricing.close],
+            self.env.days_in_range(self.START_DATE, self.END_DATE),
+            pd.Int64Index(self.asset_finder.sids),
+        )
+        counts = reader.stats.snapshot().counts
+        # One query for the sids in each of the splits, mergers and dividends
+        # tables, and one for the adjustments of the only split sid.
+        self.assertEqual(counts['sql_queries'], 4)
+        self.assertEqual(counts['sql'], 1)
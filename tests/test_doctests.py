@@ -10,13 +10,17 @@ from zipline.pipeline import (
     expression,
 )
 from zipline.utils import (
+    background,
     cache,
     data,
     functional,
     input_validation,
+    instrumentation,
     memoize,
+    minute_index,
     numpy_utils,
     preprocess,
+    sweep,
 )
 
 
@@ -75,12 +79,24 @@ class DoctestTestCase(TestCase):
     def test_input_validation_docs(self):
         self._check_docs(input_validation)
 
+    def test_background_docs(self):
+        self._check_docs(background)
+
     def test_cache_docs(self):
         self._check_docs(cache)
 
+    def test_instrumentation_docs(self):
+        self._check_docs(instrumentation)
+
+    def test_minute_index_docs(self):
+        self._check_docs(minute_index)
+
     def test_numpy_utils_docs(self):
         self._check_docs(numpy_utils)
 
+    def test_sweep_docs(self):
+        self._check_docs(sweep)
+
     def test_data_docs(self):
         self._check_docs(data)
 
@@ -12,18 +12,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
 from nose_parameterized import parameterized
 
 import pandas as pd
 import numpy as np
 from mock import patch
+from pandas.util.testing import assert_series_equal
 
 from zipline import TradingAlgorithm
 from zipline.errors import UnsupportedOrderParameters
-from zipline.sources.requests_csv import mask_requests_args
+from zipline.sources.requests_csv import (
+    PandasCSV,
+    fetcher_cache_root,
+    mask_requests_args,
+    prune_fetcher_cache,
+)
 from zipline.utils import factory
 from zipline.testing import FetcherDataPortal
 from zipline.testing.fixtures import (
+    WithInstanceTmpDir,
     WithResponses,
     WithSimParams,
     ZiplineTestCase,
@@ -43,6 +52,7 @@ from .resources.fetcher_inputs.fetcher_test_data import (
 
 
 class FetcherTestCase(WithResponses,
+                      WithInstanceTmpDir,
                       WithSimParams,
                       ZiplineTestCase):
 
@@ -89,6 +99,16 @@ class FetcherTestCase(WithResponses,
             orient='index',
         )
 
+    def init_instance_fixtures(self):
+        super(FetcherTestCase, self).init_instance_fixtures()
+        # Keep parsed frames out of the user's cache.
+        self.enter_instance_context(
+            patch.dict(
+                os.environ,
+                {'ZIPLINE_ROOT': self.instance_tmpdir.path},
+            ),
+        )
+
     def run_algo(self, code, sim_params=None, data_frequency="daily"):
         if sim_params is None:
             sim_params = self.sim_params
@@ -188,6 +208,46 @@ def handle_data(context, data):
         self.assertEqual(5, results["ibm_signal"].iloc[-1])
         self.assertEqual(5, results["dell_signal"].iloc[-1])
 
+    def test_fetch_csv_cache(self):
+        self.responses.add(
+            self.responses.GET,
+            'https://fake.urls.com/multi_signal_csv_data.csv',
+            body=MULTI_SIGNAL_CSV_DATA,
+            content_type='text/csv',
+        )
+        code = """
+from zipline.api import fetch_csv, record, sid
+
+def initialize(context):
+    fetch_csv('https://fake.urls.com/multi_signal_csv_data.csv')
+
+def handle_data(context, data):
+    record(ibm_signal=data.current(sid(3766), "signal"))
+"""
+        expected = self.run_algo(code)["ibm_signal"]
+        self.assertEqual(len(os.listdir(fetcher_cache_root())), 1)
+
+        # The second run reads the parsed frame from the cache.
+        with patch.object(PandasCSV, '_parse_chunk') as parse_chunk:
+            result = self.run_algo(code)["ibm_signal"]
+        self.assertFalse(parse_chunk.called)
+        assert_series_equal(result, expected)
+
+    def test_prune_fetcher_cache(self):
+        root = self.instance_tmpdir.makedir('fetcher_cache')
+        for i in range(4):
+            path = os.path.join(root, '%d.pickle' % i)
+            open(path, 'w').close()
+            os.utime(path, (i, i))
+        open(os.path.join(root, 'other'), 'w').close()
+
+        # Only the most recently used frames are kept.
+        prune_fetcher_cache(root, size=2)
+        self.assertEqual(
+            sorted(os.listdir(root)),
+            ['2.pickle', '3.pickle', 'other'],
+        )
+
     def test_fetch_csv_with_pure_signal_file(self):
         self.responses.add(
             self.responses.GET,
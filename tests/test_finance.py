@@ -36,6 +36,7 @@ from zipline.data.us_equity_pricing import BcolzDailyBarReader
 from zipline.data.minute_bars import BcolzMinuteBarReader
 from zipline.data.data_portal import DataPortal
 from zipline.data.us_equity_pricing import BcolzDailyBarWriter
+from zipline.errors import NoFurtherDataError, SymbolNotFound
 from zipline.finance.slippage import FixedSlippage
 from zipline.protocol import BarData
 from zipline.testing import (
@@ -549,6 +550,95 @@ class TradingEnvironmentTestCase(WithLogger,
         self.assertTrue(all(friday == minutes[31:421]))
         self.assertTrue(all(thursday == minutes[421:]))
 
+    def test_market_minute_window_raw(self):
+        start = pd.Timestamp('2008-01-07 15:01', tz='UTC')
+        for step in (1, -1):
+            boxed = self.env.market_minute_window(start, 900, step=step)
+            raw = self.env.market_minute_window(start, 900, step=step,
+                                                box=False)
+            self.assertEqual(raw.dtype, np.dtype('M8[ns]'))
+            np.testing.assert_array_equal(raw, boxed.values)
+
+        with self.assertRaises(ValueError):
+            self.env.market_minute_window(
+                pd.Timestamp('2008-01-05 15:01', tz='UTC'), 10,
+            )
+        with self.assertRaises(NoFurtherDataError):
+            self.env.market_minute_window(self.env.market_minutes[-5], 10)
+        with self.assertRaises(NoFurtherDataError):
+            self.env.market_minute_window(
+                self.env.market_minutes[5], 10, step=-1,
+            )
+
+    def test_market_minutes(self):
+        # Every minute between each open and close, inclusive.
+        expected = np.concatenate([
+            pd.date_range(open_, close, freq='T').values
+            for open_, close in self.env.open_and_closes.values[-30:]
+        ])
+        minutes = self.env.market_minutes
+        self.assertEqual(len(minutes), len(self.env.minute_index))
+        np.testing.assert_array_equal(
+            minutes[-len(expected):].values, expected,
+        )
+
+        start, end = self.env.trading_days[[-30, -1]]
+        np.testing.assert_array_equal(
+            self.env.minutes_for_days_in_range(start, end).values,
+            expected,
+        )
+        np.testing.assert_array_equal(
+            self.env.minutes_for_days_in_range(start, end, box=False),
+            expected,
+        )
+
+    def test_next_previous_market_minute(self):
+        # Friday the 4th and Monday the 7th of January, 2008.
+        friday_close = pd.Timestamp('2008-01-04 21:00', tz='UTC')
+        monday_open = pd.Timestamp('2008-01-07 14:31', tz='UTC')
+        one_min = timedelta(minutes=1)
+
+        for dt in (friday_close,
+                   friday_close + one_min,
+                   pd.Timestamp('2008-01-05 12:00', tz='UTC'),
+                   monday_open - one_min):
+            self.assertEqual(self.env.next_market_minute(dt), monday_open)
+
+        for dt in (monday_open,
+                   monday_open - one_min,
+                   pd.Timestamp('2008-01-06 12:00', tz='UTC'),
+                   friday_close + one_min):
+            self.assertEqual(self.env.previous_market_minute(dt),
+                             friday_close)
+
+        self.assertEqual(self.env.next_market_minute(monday_open),
+                         monday_open + one_min)
+        self.assertEqual(self.env.previous_market_minute(friday_close),
+                         friday_close - one_min)
+
+        with self.assertRaises(NoFurtherDataError):
+            self.env.next_market_minute(self.env.market_minutes[-1])
+        with self.assertRaises(NoFurtherDataError):
+            self.env.previous_market_minute(self.env.market_minutes[0])
+
+    def test_write_data_after_lookup(self):
+        finder = self.env.asset_finder
+        as_of = pd.Timestamp('2015-01-05', tz='UTC')
+        with self.assertRaises(SymbolNotFound):
+            finder.lookup_symbol('NEWCO', as_of)
+
+        self.env.write_data(equities=make_simple_equity_info(
+            [1000],
+            pd.Timestamp('2015-01-02', tz='UTC'),
+            pd.Timestamp('2015-12-31', tz='UTC'),
+            symbols=['NEWCO'],
+        ))
+
+        # Both single and bulk lookups see the new asset.
+        asset = finder.lookup_symbol('NEWCO', as_of)
+        self.assertEqual(asset.sid, 1000)
+        self.assertEqual(finder.lookup_symbols(['NEWCO'], as_of), [asset])
+
     def test_min_date(self):
         min_date = pd.Timestamp('2016-03-04', tz='UTC')
         env = TradingEnvironment(min_date=min_date)
@@ -0,0 +1,107 @@
+"""
+Tests for the cost of importing zipline.
+"""
+import json
+import os
+import subprocess
+import sys
+from textwrap import dedent
+from unittest import TestCase
+
+#: Maximum number of seconds ``import zipline`` may take in a fresh
+#: interpreter. Override with $ZIPLINE_IMPORT_TIME_BUDGET on slow machines.
+IMPORT_TIME_BUDGET = float(os.environ.get('ZIPLINE_IMPORT_TIME_BUDGET', 1.0))
+
+#: Modules that should not be loaded by a bare ``import zipline``.
+HEAVY_MODULES = (
+    'bcolz',
+    'networkx',
+    'pandas',
+    'sqlalchemy',
+    'zipline.algorithm',
+    'zipline.data',
+    'zipline.finance',
+    'zipline.gens',
+    'zipline.pipeline',
+    'zipline.utils.cli',
+    'zipline.utils.tradingcalendar',
+)
+
+
+def run_python(code, stderr=None):
+    """
+    Run ``code`` in a fresh interpreter and return its stdout parsed as JSON.
+    """
+    return json.loads(
+        subprocess.check_output(
+            [sys.executable, '-c', dedent(code)],
+            stderr=stderr,
+        ).decode(),
+    )
+
+
+class ImportTestCase(TestCase):
+
+    def test_import_is_lazy(self):
+        modules = run_python(
+            """
+            import json, sys
+            import zipline
+            print(json.dumps(sorted(sys.modules)))
+            """
+        )
+        loaded = set(HEAVY_MODULES) & set(modules)
+        self.assertFalse(
+            loaded,
+            "import zipline loaded %s" % sorted(loaded),
+        )
+
+    def test_import_time_budget(self):
+        # Take the best of a few runs to reduce noise from the machine.
+        timings = [
+            run_python(
+                """
+                import json
+                from timeit import default_timer
+                start = default_timer()
+                import zipline
+                print(json.dumps(default_timer() - start))
+                """
+            )
+            for _ in range(3)
+        ]
+        self.assertLess(
+            min(timings),
+            IMPORT_TIME_BUDGET,
+            "import zipline took %.3fs, budget is %.3fs" % (
+                min(timings), IMPORT_TIME_BUDGET,
+            ),
+        )
+
+    def test_lazy_attributes(self):
+        result = run_python(
+            """
+            import json
+            import zipline
+            from zipline.algorithm import TradingAlgorithm
+            from zipline.api import order, attach_pipeline
+            from zipline.utils import parse_args
+            print(json.dumps([
+                zipline.TradingAlgorithm is TradingAlgorithm,
+                zipline.api.order is order,
+                callable(parse_args),
+                'TradingAlgorithm' in dir(zipline),
+            ]))
+            """
+        )
+        self.assertEqual(result, [True, True, True, True])
+
+        with open(os.devnull, 'w') as devnull, \
+                self.assertRaises(subprocess.CalledProcessError):
+            run_python(
+                """
+                import zipline
+                zipline.not_an_attribute
+                """,
+                stderr=devnull,
+            )
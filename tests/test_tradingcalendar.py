@@ -20,7 +20,22 @@ from zipline.utils import tradingcalendar_tse
 from zipline.utils import tradingcalendar_bmf
 import pytz
 import datetime
+import os
+from os.path import join
+
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
 from zipline.finance.trading import TradingEnvironment
+from zipline.testing import tmp_dir
+from zipline.utils.calendar_cache import (
+    calendar_cache_root,
+    calendar_horizon,
+    prune_calendar_cache,
+    read_calendar,
+    truncate_calendar,
+    write_calendar,
+)
 from nose.tools import nottest
 
 
@@ -263,3 +278,74 @@ If NYE falls on a weekend, {0} the Tuesday after is the first trading day.
         friday_after = datetime.datetime(2013, 7, 5, tzinfo=pytz.utc)
         self.assertIn(wednesday_before, early_closes)
         self.assertNotIn(friday_after, early_closes)
+
+    def test_calendar_cache_round_trip(self):
+        calendar = {
+            name: getattr(tradingcalendar, name)
+            for name in (
+                'non_trading_days',
+                'trading_day',
+                'trading_days',
+                'early_closes',
+                'open_and_closes',
+            )
+        }
+        calendar['lse_non_trading_days'] = \
+            tradingcalendar_lse.non_trading_days
+
+        with tmp_dir() as d:
+            path = join(d.path, 'nyse')
+            write_calendar(path, calendar)
+            # Writing the same calendar again is a no-op.
+            write_calendar(path, calendar)
+            result = read_calendar(path)
+
+        self.assertNotIn('trading_day', result)
+        for name in 'non_trading_days', 'trading_days', 'early_closes':
+            self.assertTrue(result[name].equals(calendar[name]))
+        assert_frame_equal(
+            result['open_and_closes'],
+            calendar['open_and_closes'],
+        )
+        self.assertEqual(
+            result['lse_non_trading_days'],
+            calendar['lse_non_trading_days'],
+        )
+
+    def test_calendar_horizon_truncation(self):
+        start = pd.Timestamp('2010-01-01', tz='UTC')
+        end = pd.Timestamp('2013-06-14 15:30', tz='UTC')
+        horizon = calendar_horizon(end)
+        self.assertEqual(horizon, pd.Timestamp('2013-12-31', tz='UTC'))
+
+        for module in tradingcalendar, tradingcalendar_lse:
+            expected = module._build_calendar(start, end)
+            expected.pop('trading_day', None)
+            result = truncate_calendar(
+                module._build_calendar(start, horizon),
+                end,
+            )
+            self.assertEqual(set(result), set(expected))
+            for name, value in expected.items():
+                if isinstance(value, list):
+                    self.assertEqual(result[name], value)
+                elif name == 'open_and_closes':
+                    assert_frame_equal(result[name], value)
+                else:
+                    self.assertTrue(result[name].equals(value))
+
+    def test_prune_calendar_cache(self):
+        with tmp_dir() as d:
+            for entry in ('nyse-v1-a', 'nyse-v1-b', 'lse-v1-a', 'tmpabc'):
+                os.mkdir(join(d.path, entry))
+            prune_calendar_cache(join(d.path, 'nyse-v1-b'))
+            self.assertEqual(
+                sorted(os.listdir(d.path)),
+                ['lse-v1-a', 'nyse-v1-b', 'tmpabc'],
+            )
+
+    def test_calendar_cache_root(self):
+        self.assertEqual(
+            calendar_cache_root({'ZIPLINE_ROOT': '/zipline'}),
+            join('/zipline', 'data', 'calendars'),
+        )
@@ -0,0 +1,63 @@
+"""
+Tests for zipline.utils.atomic_write.
+"""
+import os
+from os.path import exists, join
+from unittest import TestCase
+
+from testfixtures import TempDirectory
+
+from zipline.utils.atomic_write import (
+    atomic_write_directory,
+    atomic_write_file,
+)
+
+
+class AtomicWriteTestCase(TestCase):
+
+    def setUp(self):
+        self.tempdir = TempDirectory()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def write(self, path, contents):
+        with open(path, 'w') as f:
+            f.write(contents)
+
+    def test_file(self):
+        path = self.tempdir.getpath('sub/file.txt')
+        with atomic_write_file(path) as tmp:
+            self.write(tmp, 'new')
+            self.assertFalse(exists(path))
+        self.assertEqual(self.read(path), 'new')
+
+        # A failed write leaves the old file and no temporary file behind.
+        with self.assertRaises(ValueError):
+            with atomic_write_file(path) as tmp:
+                self.write(tmp, 'partial')
+                raise ValueError()
+        self.assertEqual(self.read(path), 'new')
+        self.assertEqual(os.listdir(self.tempdir.getpath('sub')), ['file.txt'])
+
+    def test_directory(self):
+        path = self.tempdir.getpath('dir')
+        for contents in 'first', 'second':
+            with atomic_write_directory(path) as tmp:
+                self.write(join(tmp, 'a'), contents)
+            self.assertEqual(self.read(join(path, 'a')), contents)
+
+        # Without overwrite, an existing directory is kept.
+        with atomic_write_directory(path, overwrite=False) as tmp:
+            self.write(join(tmp, 'a'), 'third')
+        self.assertEqual(self.read(join(path, 'a')), 'second')
+
+        with self.assertRaises(ValueError):
+            with atomic_write_directory(path) as tmp:
+                raise ValueError()
+        self.assertEqual(self.read(join(path, 'a')), 'second')
+        self.assertEqual(os.listdir(self.tempdir.path), ['dir'])
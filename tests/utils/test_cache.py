@@ -3,6 +3,7 @@ from unittest import TestCase
 from pandas import Timestamp, Timedelta
 
 from zipline.utils.cache import CachedObject, Expired, ExpiringCache
+from zipline.utils.instrumentation import DataAccessStats
 
 
 class CachedObjectTestCase(TestCase):
@@ -58,3 +59,24 @@ class ExpiringCacheTestCase(TestCase):
         with self.assertRaises(KeyError) as e:
             self.assertEqual(cache.get('baz', expiry_3))
         self.assertEqual(e.exception.args, ('baz',))
+
+    def test_expiring_cache_stats(self):
+        expiry = Timestamp('2014')
+        before = expiry - Timedelta('1 minute')
+        after = expiry + Timedelta('1 minute')
+
+        stats = DataAccessStats()
+        cache = ExpiringCache(stats=stats)
+        cache.set('foo', 1, expiry)
+
+        self.assertEqual(cache.get('foo', before), 1)
+        self.assertEqual(cache.get('foo', expiry), 1)
+        with self.assertRaises(KeyError):
+            cache.get('foo', after)
+        with self.assertRaises(KeyError):
+            cache.get('foo', before)
+
+        self.assertEqual(
+            stats.snapshot().counts,
+            {'cache_hits': 2, 'cache_expirations': 1, 'cache_misses': 1},
+        )
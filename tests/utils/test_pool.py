@@ -0,0 +1,40 @@
+"""
+Tests for zipline.utils.pool.
+"""
+from multiprocessing.pool import ThreadPool
+from unittest import TestCase
+
+from zipline.utils.pool import imap_bounded
+
+
+class ImapBoundedTestCase(TestCase):
+
+    def setUp(self):
+        self.pool = ThreadPool(2)
+
+    def tearDown(self):
+        self.pool.terminate()
+        self.pool.join()
+
+    def test_results_in_order(self):
+        self.assertEqual(
+            list(imap_bounded(self.pool, abs, range(0, -10, -1), 3)),
+            list(range(10)),
+        )
+        self.assertEqual(list(imap_bounded(self.pool, abs, [], 3)), [])
+
+    def test_bounded_consumption(self):
+        pulled = []
+
+        def items():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        results = imap_bounded(self.pool, abs, items(), 5)
+        for i in range(5):
+            self.assertEqual(next(results), i)
+            # Only the current batch and the next one have been pulled.
+            self.assertEqual(len(pulled), 10)
+        self.assertEqual(next(results), 5)
+        self.assertEqual(len(pulled), 15)
@@ -0,0 +1,170 @@
+import os
+import sqlite3
+from unittest import TestCase
+
+from testfixtures import TempDirectory
+
+from zipline.data.us_equity_pricing import (
+    ADJUSTMENT_INDEXES,
+    SQLiteAdjustmentReader,
+    ensure_adjustment_indexes,
+)
+from zipline.utils import sqlite_utils
+from zipline.utils.sqlite_utils import connect_sqlite, sqlite_engine
+
+
+class ConnectSQLiteTestCase(TestCase):
+
+    def setUp(self):
+        self.tempdir = TempDirectory()
+        self.path = self.tempdir.getpath('test.sqlite')
+        conn = sqlite3.connect(self.path)
+        conn.execute('CREATE TABLE t (a INTEGER)')
+        conn.executemany('INSERT INTO t VALUES (?)', [(1,), (2,), (3,)])
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _values(self, conn):
+        return [row[0] for row in conn.execute('SELECT a FROM t ORDER BY a')]
+
+    def test_modes(self):
+        for mode in 'file', 'memory', 'immutable':
+            self.assertEqual(
+                self._values(connect_sqlite(self.path, mode)),
+                [1, 2, 3],
+            )
+
+        with self.assertRaises(ValueError):
+            connect_sqlite(self.path, 'network')
+
+    def test_memory_connections_are_independent(self):
+        first = connect_sqlite(self.path, 'memory')
+        second = connect_sqlite(self.path, 'memory')
+        self.assertIsNot(second, first)
+
+        # Closing one connection doesn't affect the others.
+        first.close()
+        self.assertEqual(self._values(second), [1, 2, 3])
+
+        # Changing the file makes a new snapshot.
+        conn = sqlite3.connect(self.path)
+        conn.execute('INSERT INTO t VALUES (4)')
+        conn.commit()
+        conn.close()
+        stat = os.stat(self.path)
+        os.utime(self.path, (stat.st_atime, stat.st_mtime + 10))
+
+        third = connect_sqlite(self.path, 'memory')
+        self.assertEqual(self._values(third), [1, 2, 3, 4])
+        self.assertEqual(self._values(second), [1, 2, 3])
+
+        # Only the latest snapshot of the file is kept.
+        self.assertEqual(
+            [key for key in sqlite_utils._memory_snapshots
+             if key[1] == os.path.abspath(self.path)],
+            [(os.getpid(), os.path.abspath(self.path))],
+        )
+
+    def test_memory_connections_share_snapshot(self):
+        first = connect_sqlite(self.path, 'memory')
+        second = connect_sqlite(self.path, 'memory')
+
+        # Changes made through one connection are seen by the other, which
+        # means the data is not copied per connection.  The file is not
+        # changed.
+        first.execute('INSERT INTO t VALUES (4)')
+        first.commit()
+        self.assertEqual(self._values(second), [1, 2, 3, 4])
+        self.assertEqual(self._values(sqlite3.connect(self.path)), [1, 2, 3])
+
+    def test_memory_prepare(self):
+        calls = []
+
+        def prepare(conn):
+            calls.append(conn)
+            conn.execute('CREATE INDEX t_a ON t(a)')
+            conn.commit()
+
+        for _ in range(2):
+            conn = connect_sqlite(self.path, 'memory', prepare=prepare)
+            self.assertEqual(
+                [row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'",
+                )],
+                ['t_a'],
+            )
+        self.assertEqual(len(calls), 1)
+
+    def test_engine(self):
+        for mode in 'file', 'memory', 'immutable':
+            engine = sqlite_engine(self.path, mode)
+            self.assertEqual(
+                [row[0] for row in engine.execute('SELECT a FROM t')],
+                [1, 2, 3],
+            )
+
+    def _write_adjustment_tables(self):
+        conn = sqlite3.connect(self.path)
+        for table in ('splits', 'mergers', 'dividends'):
+            conn.execute(
+                'CREATE TABLE %s (effective_date INTEGER, ratio FLOAT, '
+                'sid INTEGER)' % table,
+            )
+        conn.execute(
+            'CREATE TABLE dividend_payouts (sid INTEGER, ex_date INTEGER, '
+            'declared_date INTEGER, record_date INTEGER, pay_date INTEGER, '
+            'amount FLOAT)',
+        )
+        conn.execute(
+            'CREATE TABLE stock_dividend_payouts (sid INTEGER, '
+            'ex_date INTEGER, declared_date INTEGER, record_date INTEGER, '
+            'pay_date INTEGER, payment_sid INTEGER, ratio FLOAT)',
+        )
+        conn.commit()
+        conn.close()
+
+    def test_adjustment_reader_indexes(self):
+        self._write_adjustment_tables()
+
+        def indexes(conn):
+            return {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'",
+                )
+            }
+
+        # Readers never write to the database.
+        stat = os.stat(self.path)
+        reader = SQLiteAdjustmentReader(self.path)
+        self.assertEqual(
+            reader.get_adjustments_for_sid('splits', 1),
+            [],
+        )
+        self.assertEqual(indexes(reader.conn), set())
+        self.assertEqual(os.stat(self.path).st_mtime, stat.st_mtime)
+
+        # Migrating the database adds the indexes.
+        conn = sqlite3.connect(self.path)
+        ensure_adjustment_indexes(conn)
+        conn.close()
+        self.assertEqual(
+            indexes(reader.conn),
+            {name for name, _, _ in ADJUSTMENT_INDEXES},
+        )
+
+    def test_memory_adjustment_reader_indexes(self):
+        self._write_adjustment_tables()
+        stat = os.stat(self.path)
+
+        # The in-memory snapshot is indexed, but the file is not touched.
+        reader = SQLiteAdjustmentReader(self.path, mode='memory')
+        query = "SELECT name FROM sqlite_master WHERE type = 'index'"
+        self.assertEqual(
+            {row[0] for row in reader.conn.execute(query)},
+            {name for name, _, _ in ADJUSTMENT_INDEXES},
+        )
+        self.assertEqual(list(sqlite3.connect(self.path).execute(query)), [])
+        self.assertEqual(os.stat(self.path).st_mtime, stat.st_mtime)
@@ -0,0 +1,220 @@
+"""
+Tests for zipline.utils.sweep.
+"""
+from functools import partial
+
+import pandas as pd
+from pandas.util.testing import assert_series_equal
+
+from zipline.algorithm import TradingAlgorithm
+from zipline.data.synthetic import SyntheticEquityData
+from zipline.finance.trading import SimulationParameters
+from zipline.testing.fixtures import WithTmpDir, ZiplineTestCase
+from zipline.utils.sweep import (
+    SweepData,
+    parameter_grid,
+    parse_sweep_args,
+    results_frame,
+    run_sweep,
+    summarize_performance,
+)
+
+START_DATE = pd.Timestamp('2015-01-02', tz='UTC')
+END_DATE = pd.Timestamp('2015-06-30', tz='UTC')
+SIM_START_DATE = pd.Timestamp('2015-03-02', tz='UTC')
+
+SCRIPT = """
+from zipline.api import order_target_percent, sid
+
+def initialize(context, window, weight=1.0):
+    context.asset = sid(1)
+    context.window = window
+    context.weight = weight
+
+def handle_data(context, data):
+    prices = data.history(context.asset, 'price', context.window, '1d')
+    order_target_percent(
+        context.asset,
+        context.weight if prices.iloc[-1] > prices.mean() else 0.0,
+    )
+"""
+
+
+def initialize(context, window, weight=1.0):
+    context.asset = context.sid(1)
+    context.window = window
+    context.weight = weight
+
+
+def handle_data(context, data):
+    prices = data.history(context.asset, 'price', context.window, '1d')
+    context.order_target_percent(
+        context.asset,
+        context.weight if prices.iloc[-1] > prices.mean() else 0.0,
+    )
+
+
+class SweepTestCase(WithTmpDir, ZiplineTestCase):
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(SweepTestCase, cls).init_class_fixtures()
+        cls.paths = SyntheticEquityData(
+            num_assets=3,
+            start_date=START_DATE,
+            end_date=END_DATE,
+            seed=3,
+            listing_fraction=0.0,
+            delisting_fraction=0.0,
+            halts_per_year=0.0,
+        ).write(cls.tmpdir.getpath('data'), minute=False)
+        cls.variants = parameter_grid(window=[5, 20], weight=[0.5, 1.0])
+
+    def init_instance_fixtures(self):
+        super(SweepTestCase, self).init_instance_fixtures()
+        self.data = SweepData.from_paths(
+            self.paths.assets,
+            daily_bars=self.paths.daily_bars,
+            adjustments=self.paths.adjustments,
+        )
+
+    def run_sweep(self, data, **kwargs):
+        kwargs.setdefault('initialize', initialize)
+        kwargs.setdefault('handle_data', handle_data)
+        return run_sweep(
+            data,
+            self.variants,
+            SIM_START_DATE,
+            END_DATE,
+            **kwargs
+        )
+
+    def assert_results_equal(self, results, expected):
+        self.assertEqual(len(results), len(expected))
+        for result, expected_result in zip(results, expected):
+            self.assertEqual(result.params, expected_result.params)
+            self.assertEqual(result.summary, expected_result.summary)
+            assert_series_equal(result.returns, expected_result.returns)
+
+    def test_matches_algorithm_run(self):
+        results = self.run_sweep(self.data)
+        self.assertEqual([r.params for r in results], self.variants)
+
+        sim_params = SimulationParameters(
+            period_start=SIM_START_DATE,
+            period_end=END_DATE,
+            capital_base=10e6,
+            env=self.data.env,
+        )
+        for result in results:
+            perf = TradingAlgorithm(
+                initialize=partial(initialize, **result.params),
+                handle_data=handle_data,
+                sim_params=sim_params,
+                env=self.data.env,
+            ).run(self.data.data_portal())
+            self.assertEqual(result.summary, summarize_performance(perf))
+            assert_series_equal(result.returns, perf['returns'])
+
+        # Different parameters lead to different results.
+        self.assertEqual(
+            len(set(r.summary['portfolio_value'] for r in results)),
+            len(results),
+        )
+
+        frame = results_frame(results)
+        self.assertEqual(len(frame), len(results))
+        self.assertEqual(
+            frame['window'].tolist(),
+            [params['window'] for params in self.variants],
+        )
+
+    def test_processes(self):
+        expected = self.run_sweep(self.data)
+
+        # Converting to memory-mapped daily bars and preloading do not
+        # change the results.
+        data = SweepData.from_paths(
+            self.paths.assets,
+            daily_bars=self.paths.daily_bars,
+            adjustments=self.paths.adjustments,
+            memmap_daily_bars=self.tmpdir.getpath('memmap_daily_bars'),
+        )
+        data.preload([1])
+        self.assert_results_equal(
+            self.run_sweep(data, processes=2),
+            expected,
+        )
+
+        self.assert_results_equal(
+            self.run_sweep(self.data, processes=2, summarize=len),
+            [
+                result._replace(summary=len(result.returns))
+                for result in expected
+            ],
+        )
+
+    def test_script(self):
+        self.assert_results_equal(
+            self.run_sweep(
+                self.data,
+                initialize=None,
+                handle_data=None,
+                script=SCRIPT,
+            ),
+            self.run_sweep(self.data),
+        )
+
+    def test_script_globals_per_run(self):
+        script = """
+from zipline.api import record
+
+runs = []
+
+def initialize(context, window, weight=1.0):
+    runs.append(window)
+
+def handle_data(context, data):
+    record(runs=len(runs))
+"""
+        results = self.run_sweep(
+            self.data,
+            initialize=None,
+            handle_data=None,
+            script=script,
+            summarize=lambda perf: perf['runs'].iloc[-1],
+        )
+        self.assertEqual([result.summary for result in results],
+                         [1] * len(self.variants))
+
+    def test_bad_algorithm(self):
+        with self.assertRaises(ValueError):
+            self.run_sweep(self.data, initialize=None)
+        with self.assertRaises(ValueError):
+            self.run_sweep(self.data, script=SCRIPT)
+        with self.assertRaises(ValueError):
+            self.run_sweep(
+                self.data,
+                initialize=None,
+                handle_data=None,
+                script='x = 1',
+            )
+
+    def test_parse_sweep_args(self):
+        args = parse_sweep_args([
+            '-f', 'algo.py',
+            '-s', '2015-01-02',
+            '-e', '2015-06-30',
+            '--assets', 'assets.sqlite',
+            '-P', 'window=10,20',
+            '-P', 'weight=0.5',
+            '-P', 'mode=fast,slow',
+            '-j', '4',
+        ])
+        self.assertEqual(args['processes'], 4)
+        self.assertEqual(args['data_frequency'], 'daily')
+        self.assertEqual(args['variants'], parameter_grid(
+            window=[10, 20],
+            weight=[0.5],
+            mode=['fast', 'slow'],
+        ))
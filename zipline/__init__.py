@@ -16,24 +16,28 @@
 
 # This is *not* a place to dump arbitrary classes/modules for convenience,
 # it is a place to expose the public interfaces.
-from . import data
-from . import finance
-from . import gens
-from . import utils
+#
+# The public subpackages are imported the first time they are accessed, so
+# that ``import zipline`` stays cheap for tools and worker processes which
+# only need part of zipline.
 from ._version import get_versions
-# These need to happen after the other imports.
-from . algorithm import TradingAlgorithm
-from . import api
+from .utils.lazy_module import install_lazy_imports
 
 __version__ = get_versions()['version']
 del get_versions
 
+
+def _parse_cell_magic(line, cell):
+    from .utils.cli import parse_cell_magic
+    return parse_cell_magic(line, cell)
+
+
 try:
     ip = get_ipython()  # flake8: noqa
 except NameError:
     pass
 else:
-    ip.register_magic_function(utils.parse_cell_magic, "line_cell", "zipline")
+    ip.register_magic_function(_parse_cell_magic, "line_cell", "zipline")
     del ip
 
 __all__ = [
@@ -44,3 +48,12 @@ __all__ = [
     'api',
     'TradingAlgorithm',
 ]
+
+install_lazy_imports(__name__, {
+    'data': '.data',
+    'finance': '.finance',
+    'gens': '.gens',
+    'utils': '.utils',
+    'api': '.api',
+    'TradingAlgorithm': '.algorithm:TradingAlgorithm',
+})
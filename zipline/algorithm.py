@@ -89,6 +89,7 @@ from zipline.utils.api_support import (
     ZiplineAPI,
 )
 from zipline.utils.input_validation import ensure_upper_case
+from zipline.utils.background import BackgroundCall
 from zipline.utils.cache import CachedObject, Expired
 import zipline.utils.events
 from zipline.utils.events import (
@@ -291,6 +292,10 @@ class TradingAlgorithm(object):
         # Create an always-expired cache so that we compute the first time data
         # is requested.
         self._pipeline_cache = CachedObject(None, pd.Timestamp(0, tz='UTC'))
+        # First day covered by the cached pipeline chunk, and the next chunk
+        # being computed in the background, if any.
+        self._pipeline_chunk_start = None
+        self._pipeline_prefetch = None
 
         self.blotter = kwargs.pop('blotter', None)
         self.cancel_policy = kwargs.pop('cancel_policy', NeverCancel())
@@ -827,7 +832,21 @@ class TradingAlgorithm(object):
         Default symbols lookup for any source that directly maps the
         symbol to the Asset (e.g. yahoo finance).
         """
-        return [self.symbol(identifier) for identifier in args]
+        for identifier in args:
+            if not isinstance(identifier, string_types):
+                raise TypeError(
+                    "symbols() expected only strings, but got {0}"
+                    " instead.".format(identifier),
+                )
+
+        _lookup_date = self._symbol_lookup_date \
+            if self._symbol_lookup_date is not None \
+            else self.sim_params.period_end
+
+        return self.asset_finder.lookup_symbols(
+            [identifier.upper() for identifier in args],
+            as_of_dates=_lookup_date,
+        )
 
     @api_method
     def sid(self, a_sid):
@@ -1476,9 +1495,33 @@ class TradingAlgorithm(object):
     ##############
     @api_method
     @require_not_initialized(AttachPipelineAfterInitialize())
-    def attach_pipeline(self, pipeline, name, chunksize=None):
+    def attach_pipeline(self, pipeline, name, chunksize=None, prefetch=None):
         """
         Register a pipeline to be computed at the start of each day.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to have computed.
+        name : str
+            The name of the pipeline.
+        chunksize : int, optional
+            The number of days to compute pipeline results for. By default the
+            first chunk is one week and every following chunk is half a year.
+        prefetch : float, optional
+            If provided, start computing the next chunk on a background
+            thread once this fraction of the current chunk's days have
+            elapsed, so that the simulation does not stall when the current
+            chunk expires. Must be in (0, 1]. Any error raised while
+            computing the next chunk is raised from ``pipeline_output`` on the
+            first day of that chunk. Pipeline loaders must be safe to call
+            from a thread other than the simulation thread. By default,
+            chunks are computed synchronously when they are needed.
+
+        Returns
+        -------
+        pipeline : Pipeline
+            Returns the pipeline that was attached unchanged.
         """
         if self._pipelines:
             raise NotImplementedError("Multiple pipelines are not supported.")
@@ -1488,7 +1531,11 @@ class TradingAlgorithm(object):
             chunks = iter(chain([5], repeat(126)))
         else:
             chunks = iter(repeat(int(chunksize)))
-        self._pipelines[name] = pipeline, chunks
+        if prefetch is not None and not 0 < prefetch <= 1:
+            raise ValueError(
+                "prefetch must be in (0, 1], got %r" % (prefetch,),
+            )
+        self._pipelines[name] = pipeline, chunks, prefetch
 
         # Return the pipeline to allow expressions like
         # p = attach_pipeline(Pipeline(), 'name')
@@ -1523,15 +1570,15 @@ class TradingAlgorithm(object):
         # NOTE: We don't currently support multiple pipelines, but we plan to
         # in the future.
         try:
-            p, chunks = self._pipelines[name]
+            p, chunks, prefetch = self._pipelines[name]
         except KeyError:
             raise NoSuchPipeline(
                 name=name,
                 valid=list(self._pipelines.keys()),
             )
-        return self._pipeline_output(p, chunks)
+        return self._pipeline_output(p, chunks, prefetch)
 
-    def _pipeline_output(self, pipeline, chunks):
+    def _pipeline_output(self, pipeline, chunks, prefetch=None):
         """
         Internal implementation of `pipeline_output`.
         """
@@ -1539,18 +1586,56 @@ class TradingAlgorithm(object):
         try:
             data = self._pipeline_cache.unwrap(today)
         except Expired:
-            data, valid_until = self._run_pipeline(
-                pipeline, today, next(chunks),
+            data, valid_until = self._next_pipeline_chunk(
+                pipeline, today, chunks,
             )
             self._pipeline_cache = CachedObject(data, valid_until)
+            self._pipeline_chunk_start = today
 
-        # Now that we have a cached result, try to return the data for today.
-        try:
-            return data.loc[today]
-        except KeyError:
-            # This happens if no assets passed the pipeline screen on a given
-            # day.
-            return pd.DataFrame(index=[], columns=data.columns)
+        if prefetch is not None:
+            self._maybe_prefetch_pipeline(pipeline, today, chunks, prefetch)
+
+        # Now that we have a cached result, return the data for today.
+        return data.for_date(today)
+
+    def _next_pipeline_chunk(self, pipeline, today, chunks):
+        """
+        Get the pipeline chunk starting on `today`, either from a finished
+        (or still running) background computation or by computing it now.
+        """
+        pending, self._pipeline_prefetch = self._pipeline_prefetch, None
+        if pending is not None:
+            start_date, call = pending
+            # Re-raises any error from the background computation.
+            data, valid_until = call.result()
+            if start_date <= today <= valid_until:
+                return data, valid_until
+        return self._run_pipeline(pipeline, today, next(chunks))
+
+    def _maybe_prefetch_pipeline(self, pipeline, today, chunks, prefetch):
+        """
+        Start computing the chunk after the cached one in the background once
+        `prefetch` of the cached chunk's days have elapsed.
+        """
+        if self._pipeline_prefetch is not None:
+            return
+
+        days = self.trading_environment.trading_days
+        sim_end = self.sim_params.last_close.normalize()
+        expires = self._pipeline_cache.expires
+        if expires >= sim_end:
+            return
+
+        start_loc = days.get_loc(self._pipeline_chunk_start)
+        end_loc = days.get_loc(expires)
+        elapsed = days.get_loc(today) - start_loc + 1
+        if elapsed < prefetch * (end_loc - start_loc + 1):
+            return
+
+        next_start = days[end_loc + 1]
+        self._pipeline_prefetch = next_start, BackgroundCall(
+            self._run_pipeline, pipeline, next_start, next(chunks),
+        )
 
     def _run_pipeline(self, pipeline, start_date, chunksize):
         """
@@ -1564,11 +1649,11 @@ class TradingAlgorithm(object):
 
         Returns
         -------
-        (data, valid_until) : tuple (pd.DataFrame, pd.Timestamp)
+        (data, valid_until) : tuple (PipelineChunk, pd.Timestamp)
 
         See Also
         --------
-        PipelineEngine.run_pipeline
+        PipelineEngine.run_pipeline_chunk
         """
         days = self.trading_environment.trading_days
 
@@ -1581,8 +1666,10 @@ class TradingAlgorithm(object):
         end_loc = min(start_date_loc + chunksize, days.get_loc(sim_end))
         end_date = days[end_loc]
 
-        return \
-            self.engine.run_pipeline(pipeline, start_date, end_date), end_date
+        return (
+            self.engine.run_pipeline_chunk(pipeline, start_date, end_date),
+            end_date,
+        )
 
     ##################
     # End Pipeline API
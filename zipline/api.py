@@ -48,3 +48,7 @@ __all__ = [
     'date_rules',
     'time_rules'
 ]
+
+# TradingAlgorithm adds its API methods to this module when it is defined.
+import zipline.algorithm  # noqa
+del zipline
@@ -206,3 +206,12 @@ def _downgrade_v3(op):
         'equities',
         ['fuzzy_symbol'],
     )
+
+
+@downgrades(4)
+def _downgrade_v4(op):
+    """
+    Downgrade assets db by removing the 'asset_table_fingerprint' column.
+    """
+    with op.batch_alter_table('version_info') as batch_op:
+        batch_op.drop_column('asset_table_fingerprint')
@@ -6,7 +6,7 @@ import sqlalchemy as sa
 # assets database
 # NOTE: When upgrading this remember to add a downgrade in:
 # .asset_db_migrations
-ASSET_DB_VERSION = 3
+ASSET_DB_VERSION = 4
 
 
 def generate_asset_db_metadata(bind=None):
@@ -166,6 +166,9 @@ def _version_table_schema(metadata):
             unique=True,
             nullable=False,
         ),
+        # The fingerprint of the AssetTable saved with the database by its
+        # last write, if any.
+        sa.Column('asset_table_fingerprint', sa.Text),
         # This constraint ensures a single entry in this table
         sa.CheckConstraint('id <= 1'),
     )
@@ -0,0 +1,715 @@
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Columnar, in-memory copy of the metadata in an asset database.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+from pandas.tslib import iNaT
+from six import iteritems
+import sqlalchemy as sa
+
+from zipline.utils.atomic_write import atomic_write_file
+from zipline.utils.memoize import lazyval
+from .asset_writer import split_delimited_symbol
+
+#: Codes used for the ``asset_types`` column of an AssetTable.
+EQUITY = 0
+FUTURE = 1
+
+ASSET_TYPE_NAMES = ('equity', 'future')
+
+#: The int64 date columns of an AssetTable. Missing dates are stored as NaT.
+DATE_COLUMNS = (
+    'start_date',
+    'end_date',
+    'first_traded',
+    'auto_close_date',
+)
+
+#: The string columns of an AssetTable, with the asset type that has them.
+STRING_COLUMNS = (
+    ('symbol', None),
+    ('exchange', None),
+    ('company_symbol', EQUITY),
+    ('share_class_symbol', EQUITY),
+    ('fuzzy_symbol', EQUITY),
+    ('root_symbol', FUTURE),
+)
+
+_MAX_DATE = np.iinfo(np.int64).max
+
+#: Bump this whenever the layout written by ``AssetTable.save`` changes.
+ASSET_TABLE_VERSION = 2
+
+
+class CodedColumn(object):
+    """
+    A column of strings stored as integer codes into an array of unique
+    values.  Missing values have the code -1.
+
+    Parameters
+    ----------
+    codes : np.ndarray[int64]
+    categories : np.ndarray[object]
+    """
+    __slots__ = ('codes', 'categories', '_category_index')
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+        self._category_index = pd.Index(categories)
+
+    @classmethod
+    def from_values(cls, values):
+        codes, categories = pd.factorize(np.asarray(values, dtype=object))
+        return cls(
+            codes.astype(np.int64),
+            np.asarray(categories, dtype=object),
+        )
+
+    def codes_for(self, values):
+        """
+        The codes of ``values``, with -1 for values not in the column.
+        """
+        return self._category_index.get_indexer(
+            np.asarray(values, dtype=object),
+        ).astype(np.int64)
+
+    def take(self, indexer):
+        return type(self)(self.codes[indexer], self.categories)
+
+    def __getitem__(self, position):
+        code = self.codes[position]
+        return None if code == -1 else self.categories[code]
+
+
+class AssetTable(object):
+    """
+    The metadata of every asset in an asset database, stored as one array per
+    field and sorted by sid.
+
+    Dates are stored as int64 nanoseconds since the epoch and strings as
+    :class:`CodedColumn`, so that queries over many assets can be answered
+    with array operations instead of SQL or per-asset Python objects.
+
+    Parameters
+    ----------
+    sids : np.ndarray[int64]
+        The sids of the assets, in ascending order.
+    asset_types : np.ndarray[int8]
+        The type code of each asset, either ``EQUITY`` or ``FUTURE``.
+    dates : dict[str -> np.ndarray[int64]]
+        The columns named in ``DATE_COLUMNS``.
+    strings : dict[str -> CodedColumn]
+        The columns named in ``STRING_COLUMNS``.
+    fingerprint : str, optional
+        The ``fingerprint`` of the table, if it is already known.
+    """
+    def __init__(self, sids, asset_types, dates, strings, fingerprint=None):
+        self.sids = sids
+        self.asset_types = asset_types
+        self.dates = dates
+        self.strings = strings
+        self._fingerprint = fingerprint
+
+    @classmethod
+    def read(cls, equities, futures_contracts):
+        """
+        Load an AssetTable from the ``equities`` and ``futures_contracts``
+        tables of an asset database.
+
+        Parameters
+        ----------
+        equities : sa.Table
+        futures_contracts : sa.Table
+
+        Returns
+        -------
+        table : AssetTable
+        """
+        sids = []
+        asset_types = []
+        dates = {name: [] for name in DATE_COLUMNS}
+        strings = {name: [] for name, _ in STRING_COLUMNS}
+
+        tables = (EQUITY, equities), (FUTURE, futures_contracts)
+        for asset_type, tbl in tables:
+            columns = [tbl.c.sid]
+            columns.extend(tbl.c[name] for name in DATE_COLUMNS)
+            string_names = [
+                name for name, type_ in STRING_COLUMNS
+                if type_ is None or type_ == asset_type
+            ]
+            columns.extend(tbl.c[name] for name in string_names)
+
+            rows = sa.select(columns).execute().fetchall()
+            sids.extend(row[0] for row in rows)
+            asset_types.extend([asset_type] * len(rows))
+            for name in DATE_COLUMNS:
+                dates[name].extend(
+                    iNaT if row[name] is None else row[name] for row in rows
+                )
+            for name, _ in STRING_COLUMNS:
+                if name in string_names:
+                    strings[name].extend(row[name] for row in rows)
+                else:
+                    strings[name].extend([None] * len(rows))
+
+        sids = np.array(sids, dtype=np.int64)
+        order = sids.argsort(kind='mergesort')
+        return cls(
+            sids=sids[order],
+            asset_types=np.array(asset_types, dtype=np.int8)[order],
+            dates={
+                name: np.array(values, dtype=np.int64)[order]
+                for name, values in iteritems(dates)
+            },
+            strings={
+                name: CodedColumn.from_values(values).take(order)
+                for name, values in iteritems(strings)
+            },
+        )
+
+    def __len__(self):
+        return len(self.sids)
+
+    def save(self, path):
+        """
+        Save the table to ``path`` as an ``.npz`` archive, for ``load``,
+        with ``atomic_write_file``.
+        """
+        arrays = {
+            'version': np.array(ASSET_TABLE_VERSION),
+            'fingerprint': np.array(self.fingerprint),
+            'sids': self.sids,
+            'asset_types': self.asset_types,
+        }
+        for name in DATE_COLUMNS:
+            arrays['date_' + name] = self.dates[name]
+        for name, _ in STRING_COLUMNS:
+            column = self.strings[name]
+            arrays['codes_' + name] = column.codes
+            arrays['categories_' + name] = column.categories
+
+        with atomic_write_file(path) as tmp, open(tmp, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a table written by ``save``.
+
+        Raises
+        ------
+        ValueError
+            If the file was written by an incompatible version.
+        """
+        with np.load(path) as arrays:
+            version = int(arrays['version'])
+            if version != ASSET_TABLE_VERSION:
+                raise ValueError(
+                    'asset table %s has version %d, expected %d' % (
+                        path,
+                        version,
+                        ASSET_TABLE_VERSION,
+                    ),
+                )
+            return cls(
+                sids=arrays['sids'],
+                asset_types=arrays['asset_types'],
+                dates={
+                    name: arrays['date_' + name] for name in DATE_COLUMNS
+                },
+                strings={
+                    name: CodedColumn(
+                        arrays['codes_' + name],
+                        arrays['categories_' + name],
+                    )
+                    for name, _ in STRING_COLUMNS
+                },
+                fingerprint=str(arrays['fingerprint']),
+            )
+
+    @property
+    def fingerprint(self):
+        """
+        A hex digest of every field of every asset in this table, for keying
+        caches of data derived from the asset database.
+
+        ``save`` stores the digest along with the table, and
+        ``AssetDBWriter.write`` stores it in the database it was read from,
+        so that a saved table can be matched with its database without
+        reading either in full.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = self._compute_fingerprint()
+        return self._fingerprint
+
+    def _compute_fingerprint(self):
+        digest = hashlib.md5()
+        digest.update(self.sids.tobytes())
+        digest.update(self.asset_types.tobytes())
+        for name in DATE_COLUMNS:
+            digest.update(self.dates[name].tobytes())
+        for name, _ in STRING_COLUMNS:
+            column = self.strings[name]
+            digest.update(column.codes.tobytes())
+            digest.update(
+                u'\0'.join(map(u'{}'.format, column.categories)).encode(
+                    'utf-8',
+                ),
+            )
+        return digest.hexdigest()
+
+    @lazyval
+    def symbol_index(self):
+        """
+        A :class:`SymbolIndex` over the equities in this table.
+        """
+        return SymbolIndex(self)
+
+    @lazyval
+    def equity_lifetimes(self):
+        """
+        :class:`LifetimeIntervals` of the equities in this table.
+        """
+        rows = self.rows_of_type(EQUITY)
+        return LifetimeIntervals(
+            self.sids[rows],
+            self.dates['start_date'][rows],
+            self._end_dates(rows),
+        )
+
+    def positions(self, sids):
+        """
+        The rows of ``sids`` in the table, with -1 for unknown sids.
+        """
+        sids = np.asarray(sids, dtype=np.int64)
+        positions = self.sids.searchsorted(sids)
+        positions[positions == len(self.sids)] = 0
+        found = self.sids[positions] == sids if len(self.sids) else \
+            np.zeros(len(sids), dtype=bool)
+        return np.where(found, positions, -1)
+
+    def asset_types_for(self, sids):
+        """
+        The asset type of each sid in ``sids``.
+
+        Returns
+        -------
+        types : np.ndarray[object]
+            'equity', 'future' or None for each sid.
+        """
+        names = np.array(ASSET_TYPE_NAMES + (None,), dtype=object)
+        if not len(self):
+            return names[np.full(len(sids), -1, dtype=np.int64)]
+        positions = self.positions(sids)
+        return names[np.where(
+            positions == -1,
+            len(ASSET_TYPE_NAMES),
+            self.asset_types[positions],
+        )]
+
+    def rows_of_type(self, asset_type):
+        """
+        The rows of the table holding assets of ``asset_type``.
+        """
+        return np.flatnonzero(self.asset_types == asset_type)
+
+    def _end_dates(self, rows):
+        # Assets without an end date are alive indefinitely.
+        end = self.dates['end_date'][rows]
+        return np.where(end == iNaT, _MAX_DATE, end)
+
+    def alive(self, dates, include_start_date=True, rows=None):
+        """
+        Compute which assets were alive on each of ``dates``.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            The dates to check.
+        include_start_date : bool, optional
+            Whether an asset counts as alive on its start date.
+        rows : np.ndarray[int], optional
+            The rows to check. Defaults to every row.
+
+        Returns
+        -------
+        mask : np.ndarray[bool]
+            Array of shape ``(len(dates), len(rows))``.
+        """
+        if rows is None:
+            rows = slice(None)
+        raw_dates = dates.asi8[:, None]
+        start = self.dates['start_date'][rows]
+        if include_start_date:
+            mask = start <= raw_dates
+        else:
+            mask = start < raw_dates
+        mask &= raw_dates <= self._end_dates(rows)
+        return mask
+
+    def sids_alive_on(self, date, include_start_date=True):
+        """
+        The sids of the assets alive on ``date``.
+        """
+        return self.sids[
+            self.alive(pd.DatetimeIndex([date]), include_start_date)[0]
+        ]
+
+    def sids_for_symbols(self, symbols, as_of_date, field='symbol'):
+        """
+        Find the sid of each of ``symbols`` as of ``as_of_date``.
+
+        When several assets with the same symbol are alive on
+        ``as_of_date``, the one with the latest start date, and then the
+        latest end date, is used.
+
+        Parameters
+        ----------
+        symbols : iterable[str]
+            The symbols to look up.
+        as_of_date : pd.Timestamp
+            The date on which the symbols are resolved.
+        field : str, optional
+            The string column to match ``symbols`` against.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+            The sid for each symbol, or -1 where no alive asset has it.
+        """
+        column = self.strings[field]
+        query = column.codes_for(list(symbols))
+        ad_value = pd.Timestamp(as_of_date).value
+
+        rows = np.flatnonzero(
+            (column.codes != -1) &
+            (self.dates['start_date'] <= ad_value) &
+            (ad_value <= self._end_dates(slice(None)))
+        )
+        codes = column.codes[rows]
+        # Sort candidates by (code, start, end) so that the best candidate is
+        # the last row for each code.
+        order = np.lexsort((
+            self._end_dates(rows),
+            self.dates['start_date'][rows],
+            codes,
+        ))
+        rows, codes = rows[order], codes[order]
+        last = np.ones(len(codes), dtype=bool)
+        last[:-1] = codes[1:] != codes[:-1]
+
+        # The extra entry at the end is what unknown symbols, which have code
+        # -1, map to.
+        best = np.full(len(column.categories) + 1, -1, dtype=np.int64)
+        best[codes[last]] = self.sids[rows[last]]
+        return best[query]
+
+
+class LifetimeIntervals(object):
+    """
+    The lifetimes of a set of assets as (start, end) intervals sorted by start
+    date.
+
+    Parameters
+    ----------
+    sids : np.ndarray[int64]
+    starts : np.ndarray[int64]
+        The start date of each asset, as nanoseconds since the epoch.
+    ends : np.ndarray[int64]
+        The end date of each asset, as nanoseconds since the epoch.
+    """
+    def __init__(self, sids, starts, ends):
+        order = np.lexsort((sids, starts))
+        self.sids = sids[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+
+    def __len__(self):
+        return len(self.sids)
+
+    def mask(self, dates, include_start_date, window_start=0):
+        """
+        Compute which assets were alive on each of ``dates``, for only the
+        assets alive on at least one of ``dates[window_start:]``.
+
+        Only the intervals starting before the last date are examined, and
+        the mask is only built for the assets that survive the window check,
+        so the cost is proportional to the number of assets alive in the
+        window rather than to the number of assets.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            The dates to check.
+        include_start_date : bool
+            Whether an asset counts as alive on its start date.
+        window_start : int, optional
+            The index of the first date of the window in which an asset must
+            be alive to be included.
+
+        Returns
+        -------
+        mask : np.ndarray[bool]
+            Array of shape ``(len(dates), len(sids))``.
+        sids : np.ndarray[int64]
+            The sids of the columns of ``mask``, in ascending order.
+        """
+        raw_dates = dates.asi8
+        if window_start >= len(raw_dates):
+            return (
+                np.zeros((len(raw_dates), 0), dtype=bool),
+                np.array([], dtype=np.int64),
+            )
+
+        # Asset i is alive on date d iff starts[i] < d <= ends[i], or
+        # starts[i] <= d <= ends[i] if include_start_date is True.
+        starts_side, dates_side = (
+            ('right', 'left') if include_start_date else ('left', 'right')
+        )
+        started = self.starts.searchsorted(raw_dates[-1], side=starts_side)
+        starts = self.starts[:started]
+        ends = self.ends[:started]
+        sids = self.sids[:started]
+
+        # The first date in the window on which each asset is alive, if it is
+        # alive at all.
+        first_alive = np.maximum(
+            raw_dates.searchsorted(starts, side=dates_side),
+            window_start,
+        )
+        in_window = first_alive < len(raw_dates)
+        in_window[in_window] = (
+            raw_dates[first_alive[in_window]] <= ends[in_window]
+        )
+
+        order = sids[in_window].argsort()
+        starts = starts[in_window][order]
+        ends = ends[in_window][order]
+        sids = sids[in_window][order]
+
+        raw_dates = raw_dates[:, None]
+        if include_start_date:
+            mask = starts <= raw_dates
+        else:
+            mask = starts < raw_dates
+        mask &= raw_dates <= ends
+        return mask, sids
+
+
+def _last_in_group(groups, *keys):
+    """
+    Find the row with the largest ``keys`` in each group.
+
+    Parameters
+    ----------
+    groups : np.ndarray[int64]
+        The group of each row.
+    *keys : np.ndarray
+        Sort keys, most significant first.
+
+    Returns
+    -------
+    groups : np.ndarray[int64]
+        The unique groups.
+    indices : np.ndarray[int64]
+        The index of the chosen row of each group.
+    """
+    order = np.lexsort(keys[::-1] + (groups,))
+    sorted_groups = groups[order]
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = sorted_groups[1:] != sorted_groups[:-1]
+    return sorted_groups[last], order[last]
+
+
+class Intervals(object):
+    """
+    The (start, end, sid) lifetimes of assets grouped by an integer key and
+    sorted by key, start, end and sid.
+
+    Parameters
+    ----------
+    keys : np.ndarray[int64]
+    starts : np.ndarray[int64]
+    ends : np.ndarray[int64]
+    sids : np.ndarray[int64]
+    """
+    def __init__(self, keys, starts, ends, sids):
+        order = np.lexsort((sids, ends, starts, keys))
+        self.keys = keys[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.sids = sids[order]
+
+    def pairs(self, query_keys):
+        """
+        Expand each query key into the intervals with that key.
+
+        Parameters
+        ----------
+        query_keys : np.ndarray[int64]
+
+        Returns
+        -------
+        queries : np.ndarray[int64]
+            The index into ``query_keys`` of each pair.
+        positions : np.ndarray[int64]
+            The index into the intervals of each pair.
+        """
+        lo = self.keys.searchsorted(query_keys, side='left')
+        counts = self.keys.searchsorted(query_keys, side='right') - lo
+        queries = np.arange(len(query_keys)).repeat(counts)
+        first_pair = np.cumsum(counts) - counts
+        positions = lo.repeat(counts) + (
+            np.arange(counts.sum()) - first_pair.repeat(counts)
+        )
+        return queries, positions
+
+
+class SymbolIndex(object):
+    """
+    Interval index from equity symbols to the (start, end, sid) lifetimes of
+    the equities which held them, used to resolve many symbols at once.
+
+    Equities are indexed both by their (company symbol, share class symbol)
+    pair and by their fuzzy symbol.
+
+    Parameters
+    ----------
+    table : AssetTable
+        The table to index.
+    """
+    def __init__(self, table):
+        rows = table.rows_of_type(EQUITY)
+        self._company = company = table.strings['company_symbol']
+        self._share_class = share_class = table.strings['share_class_symbol']
+        self._fuzzy = fuzzy = table.strings['fuzzy_symbol']
+
+        starts = table.dates['start_date'][rows]
+        ends = table._end_dates(rows)
+        sids = table.sids[rows]
+
+        split_keys = self._split_keys(
+            company.codes[rows],
+            share_class.codes[rows],
+        )
+        has_split = split_keys != -1
+        self.split = Intervals(
+            split_keys[has_split],
+            starts[has_split],
+            ends[has_split],
+            sids[has_split],
+        )
+
+        fuzzy_keys = fuzzy.codes[rows]
+        has_fuzzy = fuzzy_keys != -1
+        self.fuzzy = Intervals(
+            fuzzy_keys[has_fuzzy],
+            starts[has_fuzzy],
+            ends[has_fuzzy],
+            sids[has_fuzzy],
+        )
+
+    def _split_keys(self, company_codes, share_class_codes):
+        keys = company_codes * (len(self._share_class.categories) + 1) + (
+            share_class_codes + 1
+        )
+        keys[company_codes == -1] = -1
+        return keys
+
+    def lookup(self, symbols, as_of_dates, fuzzy=False):
+        """
+        Resolve many symbols at once.
+
+        Each symbol resolves the same way as
+        :meth:`~zipline.assets.AssetFinder.lookup_symbol` with an
+        ``as_of_date``:
+
+        1. If ``fuzzy`` is True and exactly one equity whose fuzzy symbol
+           matches was alive on the date, use it.
+        2. Otherwise, of the equities with a matching company and share class
+           symbol alive on the date, use the one with the latest start date,
+           and then the latest end date.
+        3. Otherwise, of the matching equities which started on or before the
+           date, use the one with the latest end date.
+
+        Parameters
+        ----------
+        symbols : sequence[str]
+            The symbols to resolve.
+        as_of_dates : np.ndarray[int64]
+            The date on which to resolve each symbol, as nanoseconds since
+            the epoch.
+        fuzzy : bool, optional
+            Whether to try fuzzy matches first.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+            The sid for each symbol, or -1 where no equity matched.
+        """
+        split = [split_delimited_symbol(symbol) for symbol in symbols]
+        company, share_class, fuzzy_symbols = (
+            [parts[i] for parts in split] for i in range(3)
+        )
+        as_of_dates = np.asarray(as_of_dates, dtype=np.int64)
+        result = np.full(len(split), -1, dtype=np.int64)
+
+        share_class_codes = self._share_class.codes_for(share_class)
+        query_keys = self._split_keys(
+            self._company.codes_for(company),
+            share_class_codes,
+        )
+        # Symbols whose share class isn't in the table can't match anything.
+        query_keys[share_class_codes == -1] = -1
+        queries, positions = self.split.pairs(query_keys)
+        starts = self.split.starts[positions]
+        ends = self.split.ends[positions]
+        dates = as_of_dates[queries]
+
+        # Rule 3 first so that rule 2 overwrites it where it applies.
+        started = starts <= dates
+        groups, chosen = _last_in_group(
+            queries[started],
+            ends[started],
+        )
+        result[groups] = self.split.sids[positions[started][chosen]]
+
+        alive = started & (dates <= ends)
+        groups, chosen = _last_in_group(
+            queries[alive],
+            starts[alive],
+            ends[alive],
+        )
+        result[groups] = self.split.sids[positions[alive][chosen]]
+
+        if fuzzy:
+            queries, positions = self.fuzzy.pairs(
+                self._fuzzy.codes_for(fuzzy_symbols),
+            )
+            dates = as_of_dates[queries]
+            alive = (
+                (self.fuzzy.starts[positions] <= dates) &
+                (dates <= self.fuzzy.ends[positions])
+            )
+            queries, positions = queries[alive], positions[alive]
+            unique = np.bincount(queries, minlength=len(split))[queries] == 1
+            result[queries[unique]] = self.fuzzy.sids[positions[unique]]
+
+        return result
@@ -118,6 +118,49 @@ def split_delimited_symbol(symbol):
     return (company_symbol, share_class_symbol, fuzzy_symbol)
 
 
+_split_symbol_regex = r'(?s)^([^./\-_]*)(?:[./\-_](.*))?$'
+
+
+def split_delimited_symbols(symbols):
+    """
+    Vectorized ``split_delimited_symbol``.
+
+    Parameters
+    ----------
+    symbols : pd.Series
+        The possibly-delimited symbols to be split.
+
+    Returns
+    -------
+    DataFrame
+        A frame with the same index as ``symbols`` and the columns
+        'company_symbol', 'share_class_symbol' and 'fuzzy_symbol'.
+    """
+    columns = ['company_symbol', 'share_class_symbol', 'fuzzy_symbol']
+    if not len(symbols):
+        return pd.DataFrame(
+            {name: np.array([], dtype=object) for name in columns},
+            index=symbols.index,
+            columns=columns,
+        )
+
+    # Blank strings stand in for any bad symbols, like NaN or None.
+    text = symbols.where(symbols.notnull(), '').astype(object)
+    parts = text.str.extract(_split_symbol_regex)
+    return pd.DataFrame(
+        {
+            'company_symbol': parts[0].fillna(''),
+            'share_class_symbol': parts[1].fillna(''),
+            'fuzzy_symbol': text.str.replace(
+                _delimited_symbol_delimiter_regex,
+                '',
+            ).fillna(''),
+        },
+        index=symbols.index,
+        columns=columns,
+    )
+
+
 def _generate_output_dataframe(data_subset, defaults):
     """
     Generates an output dataframe from the given subset of user-provided
@@ -179,7 +222,15 @@ def _dt_to_epoch_ns(dt_series):
     idx : pd.Int64Index
         The index converted to nanoseconds since the epoch.
     """
-    index = pd.to_datetime(dt_series.values)
+    values = dt_series.values
+    if values.dtype.kind == 'M':
+        # datetime64 values are already UTC, with naive values read as UTC.
+        return values.astype('datetime64[ns]').view(np.int64)
+    if values.dtype.kind in 'iu':
+        # Integers are already nanoseconds since the epoch.
+        return values.astype(np.int64)
+
+    index = pd.to_datetime(values)
     if index.tzinfo is None:
         index = index.tz_localize('UTC')
     else:
@@ -232,6 +283,18 @@ def write_version_info(version_table, version_value):
     sa.insert(version_table, values={'version': version_value}).execute()
 
 
+def _sql_values(values):
+    """
+    Convert an array to a list of values that the DB-API can bind, with None
+    in place of missing values, as ``DataFrame.to_sql`` writes them.
+    """
+    if values.dtype.kind in 'iub':
+        return values.tolist()
+    out = values.astype(object)
+    out[pd.isnull(values)] = None
+    return out.tolist()
+
+
 class _empty(object):
     columns = ()
 
@@ -256,11 +319,40 @@ class AssetDBWriter(object):
               futures=None,
               exchanges=None,
               root_symbols=None,
-              chunk_size=DEFAULT_CHUNK_SIZE):
+              chunk_size=DEFAULT_CHUNK_SIZE,
+              bulk=False,
+              asset_table_path=None):
+        """Write asset metadata to the database.
 
+        Parameters
+        ----------
+        equities, futures, exchanges, root_symbols : pd.DataFrame, optional
+            The metadata to write.
+        chunk_size : int, optional
+            The number of rows inserted per statement by ``DataFrame.to_sql``.
+        bulk : bool, optional
+            Insert the rows with the DB-API ``executemany`` rather than
+            ``DataFrame.to_sql``, and, when the database is new, create its
+            indexes after the rows are loaded. Everything is written in one
+            transaction either way.
+        asset_table_path : str, optional
+            If given, also save the
+            :class:`~zipline.assets.asset_table.AssetTable` of the database
+            to this path, so that an ``AssetFinder`` can load it instead of
+            reading every asset at startup. The table's fingerprint is
+            stored in the ``version_info`` table, and cleared by writes
+            which don't save a table.
+        """
         with self.engine.begin() as txn:
             # Create SQL tables if they do not exist.
-            metadata = self.init_db(txn)
+            metadata, deferred_indexes = self._init_db(
+                txn,
+                defer_indexes=bulk,
+            )
+            if bulk and txn.dialect.paramstyle == 'qmark':
+                write_df_to_table = self._bulk_write_df_to_table
+            else:
+                write_df_to_table = self._write_df_to_table
 
             # Get the data to add to SQL.
             data = self._load_data(
@@ -271,13 +363,13 @@ class AssetDBWriter(object):
             )
 
             # Write the data to SQL.
-            self._write_df_to_table(
+            write_df_to_table(
                 metadata.tables['futures_exchanges'],
                 data.exchanges,
                 txn,
                 chunk_size,
             )
-            self._write_df_to_table(
+            write_df_to_table(
                 metadata.tables['futures_root_symbols'],
                 data.root_symbols,
                 txn,
@@ -291,6 +383,7 @@ class AssetDBWriter(object):
                 data.futures,
                 txn,
                 chunk_size,
+                write_df_to_table,
             )
             self._write_assets(
                 asset_router,
@@ -299,35 +392,82 @@ class AssetDBWriter(object):
                 data.equities,
                 txn,
                 chunk_size,
+                write_df_to_table,
             )
 
-    def _write_df_to_table(self, tbl, df, txn, chunk_size):
+            for index in deferred_indexes:
+                index.create(bind=txn)
+
+            if asset_table_path is not None:
+                # Imported here because asset_table imports this module.
+                from zipline.assets.asset_table import AssetTable
+                asset_table = AssetTable.read(
+                    metadata.tables['equities'],
+                    metadata.tables['futures_contracts'],
+                )
+                asset_table.save(asset_table_path)
+                fingerprint = asset_table.fingerprint
+            else:
+                # No saved AssetTable matches the database anymore.
+                fingerprint = None
+            metadata.tables['version_info'].update().values(
+                asset_table_fingerprint=fingerprint,
+            ).execute()
+
+    def _write_df_to_table(self, tbl, df, txn, chunk_size, index=True):
         df.to_sql(
             tbl.name,
             txn.connection,
-            index_label=first(tbl.primary_key.columns).name,
+            index=index,
+            index_label=first(tbl.primary_key.columns).name if index else None,
             if_exists='append',
             chunksize=chunk_size,
         )
 
+    def _bulk_write_df_to_table(self, tbl, df, txn, chunk_size, index=True):
+        """
+        ``_write_df_to_table`` with one DB-API ``executemany`` call.
+        ``chunk_size`` is ignored.
+        """
+        if df.empty:
+            return
+
+        names = list(df.columns)
+        values = [df[name].values for name in names]
+        if index:
+            names.insert(0, first(tbl.primary_key.columns).name)
+            values.insert(0, df.index.values)
+
+        txn.connection.cursor().executemany(
+            'INSERT INTO %s (%s) VALUES (%s)' % (
+                tbl.name,
+                ', '.join('"%s"' % name for name in names),
+                ', '.join('?' * len(names)),
+            ),
+            zip(*map(_sql_values, values)),
+        )
+
     def _write_assets(self,
                       asset_router,
                       tbl,
                       asset_type,
                       assets,
                       txn,
-                      chunk_size):
-        self._write_df_to_table(tbl, assets, txn, chunk_size)
-
-        pd.DataFrame({
-            asset_router.c.sid.name: assets.index.values,
-            asset_router.c.asset_type.name: asset_type,
-        }).to_sql(
-            asset_router.name,
-            txn.connection,
-            if_exists='append',
+                      chunk_size,
+                      write_df_to_table=None):
+        if write_df_to_table is None:
+            write_df_to_table = self._write_df_to_table
+
+        write_df_to_table(tbl, assets, txn, chunk_size)
+        write_df_to_table(
+            asset_router,
+            pd.DataFrame({
+                asset_router.c.sid.name: assets.index.values,
+                asset_router.c.asset_type.name: asset_type,
+            }),
+            txn,
+            chunk_size,
             index=False,
-            chunksize=chunk_size
         )
 
     def _all_tables_present(self, txn):
@@ -367,20 +507,44 @@ class AssetDBWriter(object):
         with ExitStack() as stack:
             if txn is None:
                 txn = stack.enter_context(self.engine.begin())
+            return self._init_db(txn)[0]
 
-            tables_already_exist = self._all_tables_present(txn)
-            metadata = generate_asset_db_metadata(bind=txn)
+    def _init_db(self, txn, defer_indexes=False):
+        """Implementation of ``init_db``.
 
-            # Create the SQL tables if they do not already exist.
-            metadata.create_all(checkfirst=True)
+        Parameters
+        ----------
+        txn : sa.engine.Connection
+            The transaction to execute in.
+        defer_indexes : bool, optional
+            If the tables are created, create them without their indexes.
 
-            version_info = metadata.tables['version_info']
-            if tables_already_exist:
-                check_version_info(version_info, ASSET_DB_VERSION)
-            else:
-                write_version_info(version_info, ASSET_DB_VERSION)
+        Returns
+        -------
+        metadata : sa.MetaData
+            The metadata that describes the new assets db.
+        deferred_indexes : list[sa.Index]
+            The indexes that were not created.
+        """
+        tables_already_exist = self._all_tables_present(txn)
+        metadata = generate_asset_db_metadata(bind=txn)
+
+        deferred_indexes = []
+        if defer_indexes and not tables_already_exist:
+            for tbl in metadata.sorted_tables:
+                deferred_indexes.extend(tbl.indexes)
+                tbl.indexes.clear()
+
+        # Create the SQL tables if they do not already exist.
+        metadata.create_all(checkfirst=True)
+
+        version_info = metadata.tables['version_info']
+        if tables_already_exist:
+            check_version_info(version_info, ASSET_DB_VERSION)
+        else:
+            write_version_info(version_info, ASSET_DB_VERSION)
 
-            return metadata
+        return metadata, deferred_indexes
 
     def _normalize_equities(self, equities):
         # HACK: If 'company_name' is provided, map it to asset_name
@@ -398,13 +562,9 @@ class AssetDBWriter(object):
         )
 
         # Split symbols to company_symbols and share_class_symbols
-        tuple_series = equities_output['symbol'].apply(split_delimited_symbol)
-        split_symbols = pd.DataFrame(
-            tuple_series.tolist(),
-            columns=['company_symbol', 'share_class_symbol', 'fuzzy_symbol'],
-            index=tuple_series.index
+        equities_output = equities_output.join(
+            split_delimited_symbols(equities_output['symbol']),
         )
-        equities_output = equities_output.join(split_symbols)
 
         # Upper-case all symbol data
         for col in ('symbol',
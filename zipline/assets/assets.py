@@ -13,8 +13,10 @@
 # limitations under the License.
 
 from abc import ABCMeta
+from datetime import datetime
 from numbers import Integral
 from operator import itemgetter
+import os
 
 from logbook import Logger
 import numpy as np
@@ -36,6 +38,7 @@ from zipline.errors import (
 from zipline.assets import (
     Asset, Equity, Future,
 )
+from zipline.assets.asset_table import AssetTable, EQUITY
 from zipline.assets.asset_writer import (
     check_version_info,
     split_delimited_symbol,
@@ -91,6 +94,11 @@ class AssetFinder(object):
     engine : str or SQLAlchemy.engine
         An engine with a connection to the asset database to use, or a string
         that can be parsed by SQLAlchemy as a URI.
+    asset_table_path : str, optional
+        The path of an :class:`~zipline.assets.asset_table.AssetTable` saved
+        for this database by ``AssetDBWriter.write``. If it exists and its
+        fingerprint is the one stored in the database by the last write,
+        ``asset_table`` is loaded from it instead of from the database.
 
     See Also
     --------
@@ -100,7 +108,7 @@ class AssetFinder(object):
     # reference to an AssetFinder.
     PERSISTENT_TOKEN = "<AssetFinder>"
 
-    def __init__(self, engine):
+    def __init__(self, engine, asset_table_path=None):
         if isinstance(engine, str):
             engine = sa.create_engine('sqlite:///' + engine)
 
@@ -123,8 +131,9 @@ class AssetFinder(object):
         # retrieve_asset will populate the cache on first retrieval.
         self._caches = (self._asset_cache, self._asset_type_cache) = {}, {}
 
-        # Populated on first call to `lifetimes`.
-        self._asset_lifetimes = None
+        # Populated on first access of `asset_table`.
+        self._asset_table = None
+        self._asset_table_path = asset_table_path
 
     def _reset_caches(self):
         """
@@ -133,10 +142,88 @@ class AssetFinder(object):
         You probably shouldn't call this method.
         """
         # This method exists as a workaround for the in-place mutating behavior
-        # of `TradingAlgorithm._write_and_map_id_index_to_sids`.  No one else
-        # should be calling this.
+        # of `TradingAlgorithm._write_and_map_id_index_to_sids` and
+        # `TradingEnvironment.write_data`.  No one else should be calling
+        # this.
         for cache in self._caches:
             cache.clear()
+        self._asset_table = None
+
+    @property
+    def asset_table(self):
+        """
+        An :class:`~zipline.assets.asset_table.AssetTable` holding the
+        metadata of every asset in the database as arrays.
+
+        The table is read the first time it is used. Assets written to the
+        database after that are not visible until ``_reset_caches`` is called.
+        """
+        if self._asset_table is None:
+            self._asset_table = self._load_asset_table()
+        return self._asset_table
+
+    def _load_asset_table(self):
+        path = self._asset_table_path
+        if path is not None and os.path.exists(path):
+            try:
+                table = AssetTable.load(path)
+            except (IOError, KeyError, ValueError) as e:
+                log.warn('Ignoring asset table {}: {}', path, e)
+            else:
+                fingerprint = sa.select(
+                    [self.version_info.c.asset_table_fingerprint],
+                ).scalar()
+                if table.fingerprint == fingerprint:
+                    return table
+                log.warn(
+                    'Ignoring asset table {} with fingerprint {}, the'
+                    ' database was written with {}',
+                    path,
+                    table.fingerprint,
+                    fingerprint,
+                )
+        return AssetTable.read(self.equities, self.futures_contracts)
+
+    def sids_alive_on(self, date, include_start_date=True):
+        """
+        Find the sids of the assets alive on ``date``.
+
+        Parameters
+        ----------
+        date : pd.Timestamp
+            The date to check.
+        include_start_date : bool, optional
+            Whether an asset counts as alive on its start date.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+            The sids alive on ``date``, in ascending order.
+        """
+        return self.asset_table.sids_alive_on(date, include_start_date)
+
+    def sids_for_symbols(self, symbols, as_of_date):
+        """
+        Find the sids of many exactly matching symbols at once, without
+        building Asset objects.
+
+        When several assets with the same symbol are alive on ``as_of_date``,
+        the one with the latest start date, and then the latest end date, is
+        used.
+
+        Parameters
+        ----------
+        symbols : iterable[str]
+            The symbols to look up.
+        as_of_date : pd.Timestamp
+            The date on which the symbols are resolved.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+            The sid for each symbol, or -1 for symbols which weren't found.
+        """
+        return self.asset_table.sids_for_symbols(symbols, as_of_date)
 
     def lookup_asset_types(self, sids):
         """
@@ -384,40 +471,6 @@ class AssetFinder(object):
         ).execute().fetchall()
         return candidates
 
-    def _get_fuzzy_candidates_in_range(self, fuzzy_symbol, ad_value):
-        candidates = sa.select(
-            (self.equities.c.sid,)
-        ).where(
-            sa.and_(
-                self.equities.c.fuzzy_symbol == fuzzy_symbol,
-                self.equities.c.start_date <= ad_value,
-                self.equities.c.end_date >= ad_value
-            )
-        ).order_by(
-            self.equities.c.start_date.desc(),
-            self.equities.c.end_date.desc(),
-        ).execute().fetchall()
-        return candidates
-
-    def _get_split_candidates_in_range(self,
-                                       company_symbol,
-                                       share_class_symbol,
-                                       ad_value):
-        candidates = sa.select(
-            (self.equities.c.sid,)
-        ).where(
-            sa.and_(
-                self.equities.c.company_symbol == company_symbol,
-                self.equities.c.share_class_symbol == share_class_symbol,
-                self.equities.c.start_date <= ad_value,
-                self.equities.c.end_date >= ad_value
-            )
-        ).order_by(
-            self.equities.c.start_date.desc(),
-            self.equities.c.end_date.desc(),
-        ).execute().fetchall()
-        return candidates
-
     def _get_split_candidates(self, company_symbol, share_class_symbol):
         candidates = sa.select(
             (self.equities.c.sid,)
@@ -432,21 +485,6 @@ class AssetFinder(object):
         ).execute().fetchall()
         return candidates
 
-    def _resolve_no_matching_candidates(self,
-                                        company_symbol,
-                                        share_class_symbol,
-                                        ad_value):
-        candidates = sa.select((self.equities.c.sid,)).where(
-            sa.and_(
-                self.equities.c.company_symbol == company_symbol,
-                self.equities.c.share_class_symbol ==
-                share_class_symbol,
-                self.equities.c.start_date <= ad_value),
-        ).order_by(
-            self.equities.c.end_date.desc(),
-        ).execute().fetchall()
-        return candidates
-
     def _get_best_candidate(self, candidates):
         return self._retrieve_equity(candidates[0]['sid'])
 
@@ -464,68 +502,105 @@ class AssetFinder(object):
 
         If no Equity was active at as_of_date raises SymbolNotFound.
         """
+        if as_of_date:
+            # Resolve dated lookups from the asset table, like
+            # ``lookup_symbols``, so that both agree on which assets exist
+            # and when they are alive.
+            return self.lookup_symbols(
+                [symbol],
+                pd.Timestamp(as_of_date),
+                fuzzy,
+            )[0]
+
         company_symbol, share_class_symbol, fuzzy_symbol = \
             split_delimited_symbol(symbol)
-        if as_of_date:
-            # Format inputs
-            as_of_date = pd.Timestamp(as_of_date).normalize()
-            ad_value = as_of_date.value
-
-            if fuzzy:
-                # Search for a single exact match on the fuzzy column
-                candidates = self._get_fuzzy_candidates_in_range(fuzzy_symbol,
-                                                                 ad_value)
-
-                # If exactly one SID exists for fuzzy_symbol, return that sid
-                if len(candidates) == 1:
-                    return self._get_best_candidate(candidates)
-
-            # Search for exact matches of the split-up company_symbol and
-            # share_class_symbol
-            candidates = self._get_split_candidates_in_range(
-                company_symbol,
-                share_class_symbol,
-                ad_value
+        # If this is a fuzzy look-up, check if there is exactly one match
+        # for the fuzzy symbol
+        if fuzzy:
+            candidates = self._get_fuzzy_candidates(fuzzy_symbol)
+            if len(candidates) == 1:
+                return self._get_best_candidate(candidates)
+
+        candidates = self._get_split_candidates(company_symbol,
+                                                share_class_symbol)
+        if len(candidates) == 1:
+            return self._get_best_candidate(candidates)
+        elif not candidates:
+            raise SymbolNotFound(symbol=symbol)
+        else:
+            raise MultipleSymbolsFound(
+                symbol=symbol,
+                options=self._get_equities_from_candidates(candidates)
             )
 
-            # If exactly one SID exists for symbol, return that symbol
-            # If multiple SIDs exist for symbol, return latest start_date with
-            # end_date as a tie-breaker
-            if candidates:
-                return self._get_best_candidate(candidates)
+    def lookup_symbols(self,
+                       symbols,
+                       as_of_dates,
+                       fuzzy=False,
+                       default_none=False):
+        """
+        Look up many equities by symbol at once.
 
-            # If no SID exists for symbol, return SID with the
-            # highest-but-not-over end_date
-            elif not candidates:
-                candidates = self._resolve_no_matching_candidates(
-                    company_symbol,
-                    share_class_symbol,
-                    ad_value
-                )
-                if candidates:
-                    return self._get_best_candidate(candidates)
+        Symbols are resolved in one vectorized pass over the asset table's
+        :class:`~zipline.assets.asset_table.SymbolIndex`, following the same
+        rules as ``lookup_symbol`` with an ``as_of_date``.
 
-            raise SymbolNotFound(symbol=symbol)
+        Parameters
+        ----------
+        symbols : sequence[str]
+            The symbols to look up.
+        as_of_dates : pd.Timestamp or sequence[pd.Timestamp] or None
+            The date on which to resolve each symbol, or a single date for all
+            of them. If None, each symbol must be unique in the database, and
+            the symbols are looked up one at a time with ``lookup_symbol``.
+        fuzzy : bool, optional
+            Whether to try fuzzy matches first, as in ``lookup_symbol``.
+        default_none : bool, optional
+            If True, return None for symbols which weren't found.
+            If False, raise ``SymbolNotFound``.
 
-        else:
-            # If this is a fuzzy look-up, check if there is exactly one match
-            # for the fuzzy symbol
-            if fuzzy:
-                candidates = self._get_fuzzy_candidates(fuzzy_symbol)
-                if len(candidates) == 1:
-                    return self._get_best_candidate(candidates)
-
-            candidates = self._get_split_candidates(company_symbol,
-                                                    share_class_symbol)
-            if len(candidates) == 1:
-                return self._get_best_candidate(candidates)
-            elif not candidates:
-                raise SymbolNotFound(symbol=symbol)
-            else:
-                raise MultipleSymbolsFound(
-                    symbol=symbol,
-                    options=self._get_equities_from_candidates(candidates)
-                )
+        Returns
+        -------
+        equities : list[Equity or None]
+            The equity for each symbol.
+
+        Raises
+        ------
+        SymbolNotFound
+            When a symbol is not found and ``default_none`` is False.
+        MultipleSymbolsFound
+            When ``as_of_dates`` is None and a symbol is not unique.
+        """
+        symbols = list(symbols)
+        if as_of_dates is None:
+            results = []
+            for symbol in symbols:
+                try:
+                    results.append(self.lookup_symbol(symbol, None, fuzzy))
+                except SymbolNotFound:
+                    if not default_none:
+                        raise
+                    results.append(None)
+            return results
+
+        if isinstance(as_of_dates, (datetime,) + string_types):
+            as_of_dates = [as_of_dates] * len(symbols)
+        as_of_dates = pd.DatetimeIndex(as_of_dates).normalize().asi8
+
+        sids = self.asset_table.symbol_index.lookup(
+            symbols,
+            as_of_dates,
+            fuzzy=fuzzy,
+        )
+        found = sids != -1
+        if not default_none and not found.all():
+            raise SymbolNotFound(symbol=symbols[np.argmin(found)])
+
+        results = [None] * len(symbols)
+        for i, asset in zip(np.flatnonzero(found),
+                            self.retrieve_all(sids[found].tolist())):
+            results[i] = asset
+        return results
 
     def lookup_future_symbol(self, symbol):
         """ Return the Future object for a given symbol.
@@ -828,12 +903,33 @@ class AssetFinder(object):
         if isinstance(first_identifier, Integral):
             return index
 
-        # Look up all Assets for mapping
+        # Resolve all the symbols in one pass, and everything else one at a
+        # time.
+        if as_of_date:
+            symbols = [
+                identifier for identifier in index
+                if isinstance(identifier, string_types)
+            ]
+            resolved = dict(zip(symbols, self.lookup_symbols(
+                symbols,
+                as_of_date,
+                default_none=True,
+            )))
+        else:
+            resolved = {}
+
         matches = []
         missing = []
         for identifier in index:
-            self._lookup_generic_scalar(identifier, as_of_date,
-                                        matches, missing)
+            if identifier in resolved:
+                asset = resolved[identifier]
+                if asset is None:
+                    missing.append(identifier)
+                else:
+                    matches.append(asset)
+            else:
+                self._lookup_generic_scalar(identifier, as_of_date,
+                                            matches, missing)
 
         if missing:
             raise ValueError("Missing assets for identifiers: %s" % missing)
@@ -841,40 +937,6 @@ class AssetFinder(object):
         # Return a list of the sids of the found assets
         return [asset.sid for asset in matches]
 
-    def _compute_asset_lifetimes(self):
-        """
-        Compute and cache a recarry of asset lifetimes.
-        """
-        equities_cols = self.equities.c
-        buf = np.array(
-            tuple(
-                sa.select((
-                    equities_cols.sid,
-                    equities_cols.start_date,
-                    equities_cols.end_date,
-                )).execute(),
-            ), dtype='<f8',  # use doubles so we get NaNs
-        )
-        lifetimes = np.recarray(
-            buf=buf,
-            shape=(len(buf),),
-            dtype=[
-                ('sid', '<f8'),
-                ('start', '<f8'),
-                ('end', '<f8')
-            ],
-        )
-        start = lifetimes.start
-        end = lifetimes.end
-        start[np.isnan(start)] = 0  # convert missing starts to 0
-        end[np.isnan(end)] = np.iinfo(int).max  # convert missing end to INTMAX
-        # Cast the results back down to int.
-        return lifetimes.astype([
-            ('sid', '<i8'),
-            ('start', '<i8'),
-            ('end', '<i8'),
-        ])
-
     def lifetimes(self, dates, include_start_date):
         """
         Compute a DataFrame representing asset lifetimes for the specified date
@@ -907,22 +969,55 @@ class AssetFinder(object):
         numpy.putmask
         zipline.pipeline.engine.SimplePipelineEngine._compute_root_mask
         """
-        # This is a less than ideal place to do this, because if someone adds
-        # assets to the finder after we've touched lifetimes we won't have
-        # those new assets available.  Mutability is not my favorite
-        # programming feature.
-        if self._asset_lifetimes is None:
-            self._asset_lifetimes = self._compute_asset_lifetimes()
-        lifetimes = self._asset_lifetimes
-
-        raw_dates = dates.asi8[:, None]
-        if include_start_date:
-            mask = lifetimes.start <= raw_dates
-        else:
-            mask = lifetimes.start < raw_dates
-        mask &= (raw_dates <= lifetimes.end)
+        # If someone adds assets to the finder after we've loaded the asset
+        # table we won't have those new assets available.  Mutability is not
+        # my favorite programming feature.
+        table = self.asset_table
+        equities = table.rows_of_type(EQUITY)
+        return pd.DataFrame(
+            table.alive(dates, include_start_date, rows=equities),
+            index=dates,
+            columns=pd.Int64Index(table.sids[equities]),
+        )
+
+    def lifetimes_in_window(self, dates, include_start_date, window_start=0):
+        """
+        Compute a DataFrame of asset lifetimes, like ``lifetimes``, containing
+        only the assets alive on at least one of ``dates[window_start:]``.
+
+        The mask is computed from the equities' (start, end) intervals, which
+        are sorted by start date and cached on the asset table, so that the
+        work done is proportional to the number of assets alive in the window
+        rather than to the number of assets in the database.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            The dates for which to compute lifetimes.
+        include_start_date : bool
+            Whether or not to count the asset as alive on its start_date.
+        window_start : int, optional
+            Index of the first date in ``dates`` on which an asset must be
+            alive to be included.  Earlier dates, such as the extra rows
+            needed by windowed pipeline terms, are still filled in for the
+            included assets.
 
-        return pd.DataFrame(mask, index=dates, columns=lifetimes.sid)
+        Returns
+        -------
+        lifetimes : pd.DataFrame
+            A frame of dtype bool with ``dates`` as index and an Int64Index of
+            the included assets as columns.
+
+        See Also
+        --------
+        zipline.assets.asset_table.LifetimeIntervals.mask
+        """
+        mask, sids = self.asset_table.equity_lifetimes.mask(
+            dates,
+            include_start_date,
+            window_start,
+        )
+        return pd.DataFrame(mask, index=dates, columns=pd.Int64Index(sids))
 
 
 class AssetConvertible(with_metaclass(ABCMeta)):
@@ -948,15 +1043,19 @@ class NotAssetConvertible(ValueError):
 
 class AssetFinderCachedEquities(AssetFinder):
     """
-    An extension to AssetFinder that preloads all equities from equities table
-    into memory and does lookups from there.
+    An extension to AssetFinder that preloads the symbols and lifetimes of
+    all equities from the asset table into memory and does lookups from
+    there.  Equity objects are only built for the results of lookups.
 
     To have any changes in the underlying assets db reflected by this asset
     finder one must manually call the ``rehash_equities`` method.
     """
 
-    def __init__(self, engine):
-        super(AssetFinderCachedEquities, self).__init__(engine)
+    def __init__(self, engine, asset_table_path=None):
+        super(AssetFinderCachedEquities, self).__init__(
+            engine,
+            asset_table_path=asset_table_path,
+        )
         self._fuzzy_symbol_cache = {}
         self._company_share_class_cache = {}
 
@@ -965,79 +1064,80 @@ class AssetFinderCachedEquities(AssetFinder):
     def rehash_equities(self):
         """Reload the underlying assets db into the in memory cache.
         """
-        for equity in sa.select(self.equities.c).execute().fetchall():
-            company_symbol = equity['company_symbol']
-            share_class_symbol = equity['share_class_symbol']
-            fuzzy_symbol = equity['fuzzy_symbol']
-            asset = self._convert_row_to_equity(equity)
-            self._company_share_class_cache.setdefault(
-                (company_symbol, share_class_symbol),
-                []
-            ).append(asset)
-            self._fuzzy_symbol_cache.setdefault(
-                fuzzy_symbol,
-                [],
-            ).append(asset)
-
-    def _convert_row_to_equity(self, row):
-        """
-        Converts a SQLAlchemy equity row to an Equity object.
-        """
-        return Equity(**_convert_asset_timestamp_fields(dict(row)))
+        self._reset_caches()
+        table = self.asset_table
+        strings = table.strings
+        self._company_share_class_cache = _group_rows(
+            table.rows_of_type(EQUITY),
+            strings['company_symbol'],
+            strings['share_class_symbol'],
+        )
+        self._fuzzy_symbol_cache = _group_rows(
+            table.rows_of_type(EQUITY),
+            strings['fuzzy_symbol'],
+        )
 
-    def _get_fuzzy_candidates(self, fuzzy_symbol):
-        return self._fuzzy_symbol_cache.get(fuzzy_symbol, ())
+    def _sids(self, rows):
+        return self.asset_table.sids[rows].tolist()
 
-    def _get_fuzzy_candidates_in_range(self, fuzzy_symbol, ad_value):
-        return only_active_assets(
-            ad_value,
-            self._get_fuzzy_candidates(fuzzy_symbol),
-        )
+    def _get_fuzzy_candidates(self, fuzzy_symbol):
+        return self._sids(self._fuzzy_symbol_cache.get(fuzzy_symbol, _NO_ROWS))
 
-    def _get_split_candidates(self, company_symbol, share_class_symbol):
+    def _get_split_candidate_rows(self, company_symbol, share_class_symbol):
         return self._company_share_class_cache.get(
             (company_symbol, share_class_symbol),
-            (),
-        )
-
-    def _get_split_candidates_in_range(self,
-                                       company_symbol,
-                                       share_class_symbol,
-                                       ad_value):
-        return sorted(
-            only_active_assets(
-                ad_value,
-                self._get_split_candidates(company_symbol, share_class_symbol),
-            ),
-            key=lambda x: (x.start_date, x.end_date),
-            reverse=True,
+            _NO_ROWS,
         )
 
-    def _resolve_no_matching_candidates(self,
-                                        company_symbol,
-                                        share_class_symbol,
-                                        ad_value):
-        equities = self._get_split_candidates(
-            company_symbol,
-            share_class_symbol
+    def _get_split_candidates(self, company_symbol, share_class_symbol):
+        return self._sids(
+            self._get_split_candidate_rows(company_symbol, share_class_symbol),
         )
-        partial_candidates = []
-        for equity in equities:
-            if equity.start_date.value <= ad_value:
-                partial_candidates.append(equity)
-        if partial_candidates:
-            partial_candidates = sorted(
-                partial_candidates,
-                key=lambda x: x.end_date,
-                reverse=True
-            )
-        return partial_candidates
 
     def _get_best_candidate(self, candidates):
-        return candidates[0]
+        return self._retrieve_equity(candidates[0])
 
     def _get_equities_from_candidates(self, candidates):
-        return candidates
+        results = self.retrieve_equities(candidates)
+        return [results[sid] for sid in candidates]
+
+
+_NO_ROWS = np.array([], dtype=np.int64)
+
+
+def _group_rows(rows, *columns):
+    """
+    Group the rows of an AssetTable by the values in ``columns``.
+
+    Parameters
+    ----------
+    rows : np.ndarray[int64]
+        The rows to group.
+    *columns : CodedColumn
+        The columns whose values make up the key of each group.
+
+    Returns
+    -------
+    groups : dict[object -> np.ndarray[int64]]
+        Map from value, or tuple of values if there are several columns, to
+        the rows with that value in ascending order.
+    """
+    keys = np.column_stack([column.codes[rows] for column in columns])
+    groups = {}
+    for row, key in zip(rows, imap(tuple, keys)):
+        groups.setdefault(key, []).append(row)
+
+    def decode(key):
+        values = tuple(
+            None if code == -1 else column.categories[code]
+            for column, code in zip(columns, key)
+        )
+        return values if len(values) > 1 else values[0]
+
+    return {
+        decode(key): np.array(group, dtype=np.int64)
+        for key, group in groups.items()
+    }
 
 
 def was_active(reference_date_value, asset):
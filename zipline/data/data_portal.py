@@ -14,16 +14,15 @@
 # limitations under the License.
 from operator import mul
 
-import bcolz
 from logbook import Logger
 
 import numpy as np
 import pandas as pd
 from pandas.tslib import normalize_date
-from six import iteritems
 from six.moves import reduce
 
 from zipline.assets import Asset, Future, Equity
+from zipline.data.extra_sources import ExtraSource
 from zipline.data.us_equity_pricing import NoDataOnDate
 from zipline.data.us_equity_loader import (
     USEquityDailyHistoryLoader,
@@ -31,6 +30,7 @@ from zipline.data.us_equity_loader import (
 )
 
 from zipline.utils import tradingcalendar
+from zipline.utils.instrumentation import DataAccessStats, EMPTY_SNAPSHOT
 from zipline.utils.math_utils import (
     nansum,
     nanmean,
@@ -427,6 +427,14 @@ class DailyHistoryAggregator(object):
 
 
 class DataPortal(object):
+    """
+    Interface to all of the data that a zipline simulation needs.
+
+    Data access performed by the portal itself is recorded in ``stats``, and
+    ``data_access_stats`` combines it with the stats recorded by the portal's
+    readers and history loaders into a single snapshot which can be diffed
+    between simulation dates.
+    """
     def __init__(self,
                  env,
                  equity_daily_reader=None,
@@ -435,20 +443,12 @@ class DataPortal(object):
                  future_minute_reader=None,
                  adjustment_reader=None):
         self.env = env
+        self.stats = DataAccessStats()
 
         self.views = {}
 
         self._asset_finder = env.asset_finder
 
-        self._carrays = {
-            'open': {},
-            'high': {},
-            'low': {},
-            'close': {},
-            'volume': {},
-            'sid': {},
-        }
-
         self._adjustment_reader = adjustment_reader
 
         # caches of sid -> adjustment list
@@ -461,8 +461,7 @@ class DataPortal(object):
         self._asset_end_dates = {}
 
         # Handle extra sources, like Fetcher.
-        self._augmented_sources_map = {}
-        self._extra_source_df = None
+        self._extra_sources = []
 
         self._equity_daily_reader = equity_daily_reader
         if self._equity_daily_reader is not None:
@@ -497,8 +496,66 @@ class DataPortal(object):
             self._first_trading_day = \
                 self._equity_minute_reader.first_trading_day
 
-    def _reindex_extra_source(self, df, source_date_index):
-        return df.reindex(index=source_date_index, method='ffill')
+    def _data_access_components(self):
+        """
+        Pairs of (prefix, component) for every object whose stats are
+        included in ``data_access_stats``.
+        """
+        return (
+            ('portal.', self),
+            ('equity_daily_reader.', self._equity_daily_reader),
+            ('equity_minute_reader.', self._equity_minute_reader),
+            ('future_daily_reader.', self._future_daily_reader),
+            ('future_minute_reader.', self._future_minute_reader),
+            ('adjustment_reader.', self._adjustment_reader),
+            ('equity_daily_history.',
+             getattr(self, '_equity_history_loader', None)),
+            ('equity_minute_history.',
+             getattr(self, '_equity_minute_history_loader', None)),
+        )
+
+    def data_access_stats(self):
+        """
+        Capture the I/O, decompression and caching counters of this portal
+        and of the readers and history loaders it uses.
+
+        Returns
+        -------
+        snapshot : zipline.utils.instrumentation.StatsSnapshot
+            The combined counters and timers. Each entry is prefixed with the
+            name of the component that recorded it, e.g.
+            ``'equity_minute_reader.carray_opens'``.
+
+        Notes
+        -----
+        Snapshots can be subtracted from one another to find the activity
+        that occurred between them, e.g. during a single simulation day::
+
+            before = data_portal.data_access_stats()
+            ...
+            delta = data_portal.data_access_stats() - before
+        """
+        snapshot = EMPTY_SNAPSHOT
+        seen = set()
+        for prefix, component in self._data_access_components():
+            stats = getattr(component, 'stats', None)
+            # Readers may be shared between slots, e.g. the same minute
+            # reader for equities and futures; only count them once.
+            if stats is None or id(stats) in seen:
+                continue
+            seen.add(id(stats))
+            snapshot += stats.snapshot().prefixed(prefix)
+        return snapshot
+
+    def reset_data_access_stats(self):
+        """
+        Zero the counters and timers of this portal and of the readers and
+        history loaders it uses.
+        """
+        for _, component in self._data_access_components():
+            stats = getattr(component, 'stats', None)
+            if stats is not None:
+                stats.reset()
 
     def handle_extra_source(self, source_df, sim_params):
         """
@@ -517,113 +574,45 @@ class DataPortal(object):
         # (such as sid(24)) or of assets we don't know about (such as
         # palladium).
         #
-        # In both cases, we break up the dataframe into individual dfs
-        # that only contain a single asset's information.  ie, if source_df
-        # has data for PALLADIUM and GOLD, we split source_df into two
-        # dataframes, one for each. (same applies if source_df has data for
-        # AAPL and IBM).
-        #
-        # We then take each child df and reindex it to the simulation's date
-        # range by forward-filling missing values. this makes reads simpler.
-        #
-        # Finally, we store the data. For each column, we store a mapping in
-        # self.augmented_sources_map from the column to a dictionary of
-        # asset -> df.  In other words,
-        # self.augmented_sources_map['days_to_cover']['AAPL'] gives us the df
-        # holding that data.
+        # Each column of source_df is expanded into a (day x identifier)
+        # array over the simulation's date range by forward-filling each
+        # identifier's values. Each fetch_csv call adds an ExtraSource;
+        # lookups use the latest one that has the identifier and column.
         source_date_index = self.env.days_in_range(
             start=sim_params.period_start,
             end=sim_params.period_end
         )
+        extra_source = ExtraSource(source_df, source_date_index)
 
-        # Break the source_df up into one dataframe per sid.  This lets
-        # us (more easily) calculate accurate start/end dates for each sid,
-        # de-dup data, and expand the data to fit the backtest start/end date.
-        grouped_by_sid = source_df.groupby(["sid"])
-        group_names = grouped_by_sid.groups.keys()
-        group_dict = {}
-        for group_name in group_names:
-            group_dict[group_name] = grouped_by_sid.get_group(group_name)
-
-        # This will be the dataframe which we query to get fetcher assets at
-        # any given time. Get's overwritten every time there's a new fetcher
-        # call
-        extra_source_df = pd.DataFrame()
-
-        for identifier, df in iteritems(group_dict):
-            # Before reindexing, save the earliest and latest dates
-            earliest_date = df.index[0]
-            latest_date = df.index[-1]
-
-            # Since we know this df only contains a single sid, we can safely
-            # de-dupe by the index (dt). If minute granularity, will take the
-            # last data point on any given day
-            df = df.groupby(level=0).last()
-
-            # Reindex the dataframe based on the backtest start/end date.
-            # This makes reads easier during the backtest.
-            df = self._reindex_extra_source(df, source_date_index)
-
+        for identifier in extra_source.identifiers:
             if not isinstance(identifier, Asset):
                 # for fake assets we need to store a start/end date
-                self._asset_start_dates[identifier] = earliest_date
-                self._asset_end_dates[identifier] = latest_date
-
-            for col_name in df.columns.difference(['sid']):
-                if col_name not in self._augmented_sources_map:
-                    self._augmented_sources_map[col_name] = {}
-
-                self._augmented_sources_map[col_name][identifier] = df
+                self._asset_start_dates[identifier] = \
+                    extra_source.start_dates[identifier]
+                self._asset_end_dates[identifier] = \
+                    extra_source.end_dates[identifier]
 
-            # Append to extra_source_df the reindexed dataframe for the single
-            # sid
-            extra_source_df = extra_source_df.append(df)
+        self._extra_sources.append(extra_source)
 
-        self._extra_source_df = extra_source_df
-
-    def _open_minute_file(self, field, asset):
-        sid_str = str(int(asset))
-
-        try:
-            carray = self._carrays[field][sid_str]
-        except KeyError:
-            carray = self._carrays[field][sid_str] = \
-                self._get_ctable(asset)[field]
-
-        return carray
-
-    def _get_ctable(self, asset):
-        sid = int(asset)
-
-        if isinstance(asset, Future):
-            if self._future_minute_reader.sid_path_func is not None:
-                path = self._future_minute_reader.sid_path_func(
-                    self._future_minute_reader.rootdir, sid
-                )
-            else:
-                path = "{0}/{1}.bcolz".format(
-                    self._future_minute_reader.rootdir, sid)
-        elif isinstance(asset, Equity):
-            if self._equity_minute_reader.sid_path_func is not None:
-                path = self._equity_minute_reader.sid_path_func(
-                    self._equity_minute_reader.rootdir, sid
-                )
-            else:
-                path = "{0}/{1}.bcolz".format(
-                    self._equity_minute_reader.rootdir, sid)
-
-        else:
-            # TODO: Figure out if assets should be allowed if neither, and
-            # why this code path is being hit.
-            if self._equity_minute_reader.sid_path_func is not None:
-                path = self._equity_minute_reader.sid_path_func(
-                    self._equity_minute_reader.rootdir, sid
-                )
-            else:
-                path = "{0}/{1}.bcolz".format(
-                    self._equity_minute_reader.rootdir, sid)
+    def _extra_source_for(self, asset, column):
+        """
+        The latest extra source with ``column`` for ``asset``, or None.
+        """
+        for extra_source in reversed(self._extra_sources):
+            if extra_source.contains(asset, column):
+                return extra_source
+        return None
 
-        return bcolz.open(path, mode='r')
+    def _is_extra_source_column(self, asset, column):
+        # If we have an extra source with a column called "price", only look
+        # at it if it's on something like palladium and not AAPL (since our
+        # own price data always wins when dealing with assets).
+        if column in BASE_FIELDS and isinstance(asset, Asset):
+            return False
+        return any(
+            column in extra_source.columns
+            for extra_source in self._extra_sources
+        )
 
     def get_last_traded_dt(self, asset, dt, data_frequency):
         """
@@ -638,20 +627,16 @@ class DataPortal(object):
             return self._equity_daily_reader.get_last_traded_dt(asset, dt)
 
     def _check_extra_sources(self, asset, column, dt):
-        # If we have an extra source with a column called "price", only look
-        # at it if it's on something like palladium and not AAPL (since our
-        # own price data always wins when dealing with assets).
-        look_in_augmented_sources = column in self._augmented_sources_map and \
-            not (column in BASE_FIELDS and isinstance(asset, Asset))
-
-        if look_in_augmented_sources:
+        if self._is_extra_source_column(asset, column):
             day = normalize_date(dt)
 
             # we're being asked for a field in an extra source
             try:
-                return self._augmented_sources_map[column][asset].\
-                    loc[day, column]
-            except:
+                extra_source = self._extra_source_for(asset, column)
+                if extra_source is None:
+                    raise KeyError(asset)
+                return extra_source.get_value(asset, column, day)
+            except KeyError:
                 log.error(
                     "Could not find value for asset={0}, day={1},"
                     "column={2}".format(
@@ -686,6 +671,7 @@ class DataPortal(object):
         -------
         The value of the desired field at the desired time.
         """
+        self.stats.incr('spot_lookups')
         extra_source_val = self._check_extra_sources(asset, field, dt)
 
         if extra_source_val is not None:
@@ -722,6 +708,77 @@ class DataPortal(object):
                 else:
                     return self._get_minute_spot_value(asset, field, dt)
 
+    def get_spot_values(self, assets, field, dt, data_frequency):
+        """
+        The values of ``field`` for each of ``assets`` at ``dt``, as returned
+        by ``get_spot_value``.
+
+        Fields that come from fetcher sources for every asset are read with
+        one vectorized lookup per source.
+
+        Returns
+        -------
+        values : np.ndarray or list
+            The value for each asset, in the order of ``assets``.
+        """
+        assets = list(assets)
+        sources = None
+        if assets and all(
+                self._is_extra_source_column(asset, field)
+                for asset in assets):
+            # Each asset's value comes from the latest source holding it, as
+            # in ``_check_extra_sources``.
+            sources = [
+                self._extra_source_for(asset, field) for asset in assets
+            ]
+            if any(source is None for source in sources):
+                sources = None
+
+        if sources is not None:
+            try:
+                values = self._get_extra_source_values(
+                    assets, sources, field, normalize_date(dt),
+                )
+            except KeyError:
+                # Not every asset has a value on this day: look them up one
+                # by one, which reports the missing asset.
+                pass
+            else:
+                self.stats.incr('spot_lookups', len(assets))
+                return values
+
+        return [
+            self.get_spot_value(asset, field, dt, data_frequency)
+            for asset in assets
+        ]
+
+    @staticmethod
+    def _get_extra_source_values(assets, sources, field, day):
+        """
+        The values of ``field`` on ``day`` for each of ``assets``, reading
+        each asset from the corresponding entry of ``sources``.
+        """
+        first = sources[0]
+        if all(source is first for source in sources):
+            return first.get_values(assets, field, day)
+
+        # Batch the assets by source, then put the values back in order.
+        groups = {}
+        for position, source in enumerate(sources):
+            groups.setdefault(id(source), (source, []))[1].append(position)
+
+        positions = []
+        batches = []
+        for source, group in groups.values():
+            positions.extend(group)
+            batches.append(
+                source.get_values([assets[i] for i in group], field, day),
+            )
+        batched = np.concatenate(batches)
+        values = np.empty_like(batched)
+        values[positions] = batched
+        return values
+
     def get_adjustments(self, assets, field, dt, perspective_dt):
         """
         Returns a list of adjustments between the dt and perspective_dt for the
@@ -835,35 +892,19 @@ class DataPortal(object):
         return spot_value
 
     def _get_minute_spot_value_future(self, asset, column, dt):
-        # Futures bcolz files have 1440 bars per day (24 hours), 7 days a week.
-        # The file attributes contain the "start_dt" and "last_dt" fields,
-        # which represent the time period for this bcolz file.
-
-        # The start_dt is midnight of the first day that this future started
-        # trading.
-
-        # figure out the # of minutes between dt and this asset's start_dt
+        # Futures have 1440 bars per day (24 hours), 7 days a week, starting
+        # at midnight of the first day that the future traded. Missing bars
+        # are filled with the last traded value.
         start_date = self._get_asset_start_date(asset)
-        minute_offset = int((dt - start_date).total_seconds() / 60)
-
-        if minute_offset < 0:
-            # asking for a date that is before the asset's start date, no dice
-            return 0.0
-
-        # then just index into the bcolz carray at that offset
-        carray = self._open_minute_file(column, asset)
-        result = carray[minute_offset]
-
-        # if there's missing data, go backwards until we run out of file
-        while result == 0 and minute_offset > 0:
-            minute_offset -= 1
-            result = carray[minute_offset]
-
-        if column != 'volume':
-            # FIXME switch to a futures reader
-            return result * 0.001
-        else:
-            return result
+        if column == 'last_traded':
+            return self._future_minute_reader.get_last_traded_dt(
+                asset, start_date, dt,
+            )
+        if column == 'price':
+            column = 'close'
+        return self._future_minute_reader.get_value(
+            asset, start_date, dt, column,
+        )
 
     def _get_minute_spot_value(self, asset, column, dt, ffill=False):
         result = self._equity_minute_reader.get_value(
@@ -1003,41 +1044,32 @@ class DataPortal(object):
         # Since we don't have daily bcolz files for futures (yet), use minute
         # bars to calculate the daily values.
         data = []
-        data_groups = []
 
         # get all the minutes for the days NOT including today
-        for day in days_for_window[:-1]:
-            minutes = self.env.market_minutes_for_day(day)
-
-            values_for_day = np.zeros(len(minutes), dtype=np.float64)
-
-            for idx, minute in enumerate(minutes):
-                minute_val = self._get_minute_spot_value_future(
-                    asset, column, minute
-                )
-
-                values_for_day[idx] = minute_val
-
-            data_groups.append(values_for_day)
+        minute_groups = [
+            self.env.market_minutes_for_day(day)
+            for day in days_for_window[:-1]
+        ]
 
         # get the minutes for today
-        last_day_minutes = pd.date_range(
+        minute_groups.append(pd.date_range(
             start=self.env.get_open_and_close(end_dt)[0],
             end=end_dt,
             freq="T"
+        ))
+
+        # Read every minute in one call and split the values back into days.
+        values = self._future_minute_reader.load_window(
+            asset,
+            self._get_asset_start_date(asset),
+            np.concatenate([minutes.asi8 for minutes in minute_groups]),
+            column,
+        ).astype(np.float64)
+        data_groups = np.split(
+            values,
+            np.cumsum([len(minutes) for minutes in minute_groups])[:-1],
         )
 
-        values_for_last_day = np.zeros(len(last_day_minutes), dtype=np.float64)
-
-        for idx, minute in enumerate(last_day_minutes):
-            minute_val = self._get_minute_spot_value_future(
-                asset, column, minute
-            )
-
-            values_for_last_day[idx] = minute_val
-
-        data_groups.append(values_for_last_day)
-
         for group in data_groups:
             if len(group) == 0:
                 continue
@@ -1161,6 +1193,14 @@ class DataPortal(object):
         if field not in OHLCVP_FIELDS:
             raise ValueError("Invalid field: {0}".format(field))
 
+        self.stats.incr('history_window_cells', bar_count * len(assets))
+        with self.stats.timer('history_windows'):
+            return self._get_history_window(
+                assets, end_dt, bar_count, frequency, field,
+            )
+
+    def _get_history_window(self, assets, end_dt, bar_count, frequency,
+                            field):
         if frequency == "1d":
             if field == "price":
                 df = self._get_history_daily_window(assets, end_dt, bar_count,
@@ -1243,7 +1283,7 @@ class DataPortal(object):
         A numpy array with requested values.
         """
         if isinstance(assets, Future):
-            return self._get_minute_window_for_future([assets], field,
+            return self._get_minute_window_for_future(assets, field,
                                                       minutes_for_window)
         else:
             # TODO: Make caller accept assets.
@@ -1252,23 +1292,13 @@ class DataPortal(object):
             return window
 
     def _get_minute_window_for_future(self, asset, field, minutes_for_window):
-        # THIS IS TEMPORARY.  For now, we are only exposing futures within
-        # equity trading hours (9:30 am to 4pm, Eastern).  The easiest way to
-        # do this is to simply do a spot lookup for each desired minute.
-        return_data = np.zeros(len(minutes_for_window), dtype=np.float64)
-        for idx, minute in enumerate(minutes_for_window):
-            return_data[idx] = \
-                self._get_minute_spot_value_future(asset, field, minute)
-
-        # Note: an improvement could be to find the consecutive runs within
-        # minutes_for_window, and use them to read the underlying ctable
-        # more efficiently.
-
-        # Once futures are on 24-hour clock, then we can just grab all the
-        # requested minutes in one shot from the ctable.
-
         # no adjustments for futures, yay.
-        return return_data
+        return self._future_minute_reader.load_window(
+            asset,
+            self._get_asset_start_date(asset),
+            minutes_for_window,
+            field,
+        ).astype(np.float64)
 
     def _get_minute_window_for_equities(
             self, assets, field, minutes_for_window):
@@ -1526,17 +1556,10 @@ class DataPortal(object):
         if self._adjustment_reader is None or not sids:
             return {}
 
-        # convert dt to # of seconds since epoch, because that's what we use
-        # in the adjustments db
-        seconds = int(dt.value / 1e9)
-
-        splits = self._adjustment_reader.conn.execute(
-            "SELECT sid, ratio FROM SPLITS WHERE effective_date = ?",
-            (seconds,)).fetchall()
-
-        splits = [split for split in splits if split[0] in sids]
-
-        return splits
+        return self._adjustment_reader.get_splits_with_effective_date(
+            sids,
+            dt,
+        )
 
     def get_stock_dividends(self, sid, trading_days):
         """
@@ -1563,13 +1586,11 @@ class DataPortal(object):
         if len(trading_days) == 0:
             return []
 
-        start_dt = trading_days[0].value / 1e9
-        end_dt = trading_days[-1].value / 1e9
-
-        dividends = self._adjustment_reader.conn.execute(
-            "SELECT * FROM stock_dividend_payouts WHERE sid = ? AND "
-            "ex_date > ? AND pay_date < ?", (int(sid), start_dt, end_dt,)).\
-            fetchall()
+        dividends = self._adjustment_reader.get_stock_dividend_payouts(
+            sid,
+            trading_days[0],
+            trading_days[-1],
+        )
 
         dividend_info = []
         for dividend_tuple in dividends:
@@ -1587,8 +1608,7 @@ class DataPortal(object):
 
     def contains(self, asset, field):
         return field in BASE_FIELDS or \
-            (field in self._augmented_sources_map and
-             asset in self._augmented_sources_map[field])
+            self._extra_source_for(asset, field) is not None
 
     def get_fetcher_assets(self, dt):
         """
@@ -1600,21 +1620,11 @@ class DataPortal(object):
         list: a list of Asset objects.
         """
         # return a list of assets for the current date, as defined by the
-        # fetcher source
-        if self._extra_source_df is None:
-            return []
-
-        day = normalize_date(dt)
-
-        if day in self._extra_source_df.index:
-            assets = self._extra_source_df.loc[day]['sid']
-        else:
+        # latest fetcher source
+        if not self._extra_sources:
             return []
 
-        if isinstance(assets, pd.Series):
-            return [x for x in assets if isinstance(x, Asset)]
-        else:
-            return [assets] if isinstance(assets, Asset) else []
+        return self._extra_sources[-1].assets_on(normalize_date(dt))
 
     @weak_lru_cache(20)
     def _get_minute_count_for_transform(self, ending_minute, days_count):
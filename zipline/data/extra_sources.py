@@ -0,0 +1,168 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+from zipline.assets import Asset
+
+
+class ExtraSource(object):
+    """
+    The data of one ``fetch_csv`` call, expanded to the days of a simulation.
+
+    Each column of the source is stored as a dense (day x identifier) array.
+    The value for an identifier on a day is that of the latest source day on
+    or before it with a row for the identifier. If a source day has several
+    rows, the last non-null value of each column is used. This is the data
+    that ``DataFrame.reindex(days, method='ffill')`` produces for each
+    identifier's rows, but it is computed once for all identifiers and read
+    with integer indexing.
+
+    Parameters
+    ----------
+    source_df : pd.DataFrame
+        The fetched data, indexed by normalized dates, with a 'sid' column of
+        Assets or other identifiers, such as strings.
+    days : pd.DatetimeIndex
+        The days of the simulation.
+
+    Attributes
+    ----------
+    identifiers : list
+        The distinct values of the 'sid' column, in order of first
+        appearance.
+    start_dates, end_dates : dict
+        Map from identifier to the first and last day of its source rows.
+    """
+    def __init__(self, source_df, days):
+        self.days = days
+        self._day_values = days.asi8
+
+        codes, identifiers = pd.factorize(source_df['sid'].values)
+        self.identifiers = list(identifiers)
+        self._positions = {
+            identifier: i for i, identifier in enumerate(self.identifiers)
+        }
+
+        source_days = source_df.index.asi8
+        frame = source_df.drop('sid', axis=1)
+        frame.index = np.arange(len(frame))
+
+        # One row per (identifier, day), sorted by identifier then day.
+        grouped = frame.groupby([codes, source_days]).last()
+        row_codes = grouped.index.get_level_values(0).values
+        row_days = grouped.index.get_level_values(1).values
+
+        first_dates = pd.Series(source_days).groupby(codes).min()
+        last_dates = pd.Series(source_days).groupby(codes).max()
+        self.start_dates = {
+            identifier: pd.Timestamp(first_dates[i], tz='UTC')
+            for identifier, i in self._positions.items()
+        }
+        self.end_dates = {
+            identifier: pd.Timestamp(last_dates[i], tz='UTC')
+            for identifier, i in self._positions.items()
+        }
+
+        # For every (day, identifier), the row of ``grouped`` to read, or -1
+        # before the identifier's first row.
+        rows = np.full((len(days), len(identifiers)), -1, dtype=np.int64)
+        bounds = row_codes.searchsorted(np.arange(len(identifiers) + 1))
+        for i in range(len(identifiers)):
+            start, stop = bounds[i], bounds[i + 1]
+            rows[:, i] = start + row_days[start:stop].searchsorted(
+                self._day_values,
+                side='right',
+            ) - 1
+            rows[rows[:, i] < start, i] = -1
+
+        missing = rows == -1
+        self._columns = {
+            name: self._expand(grouped[name].values, rows, missing)
+            for name in grouped.columns
+        }
+
+        # The Assets with data on each day.
+        is_asset = np.array(
+            [isinstance(identifier, Asset) for identifier in identifiers],
+            dtype=bool,
+        )
+        self._asset_mask = ~missing & is_asset
+
+    @staticmethod
+    def _expand(values, rows, missing):
+        block = values[rows.clip(0)]
+        if not missing.any():
+            return block
+
+        kind = block.dtype.kind
+        if kind in 'iu':
+            block = block.astype(np.float64)
+        elif kind not in 'fcMm':
+            block = block.astype(object)
+
+        if kind in 'Mm':
+            block[missing] = block.dtype.type('NaT')
+        else:
+            block[missing] = np.nan
+        return block
+
+    @property
+    def columns(self):
+        return set(self._columns)
+
+    def contains(self, identifier, column):
+        return column in self._columns and identifier in self._positions
+
+    def _day_loc(self, day):
+        day_value = pd.Timestamp(day).value
+        loc = self._day_values.searchsorted(day_value)
+        if loc == len(self._day_values) or \
+                self._day_values[loc] != day_value:
+            raise KeyError(day)
+        return loc
+
+    def get_value(self, identifier, column, day):
+        """
+        The value of ``column`` for ``identifier`` on ``day``.
+
+        Raises KeyError if the identifier, column or day is unknown.
+        """
+        return self._columns[column][
+            self._day_loc(day),
+            self._positions[identifier],
+        ]
+
+    def get_values(self, identifiers, column, day):
+        """
+        The values of ``column`` for each of ``identifiers`` on ``day``.
+
+        Raises KeyError if any identifier, the column or the day is unknown.
+        """
+        positions = [self._positions[i] for i in identifiers]
+        return self._columns[column][self._day_loc(day), positions]
+
+    def assets_on(self, day):
+        """
+        The Assets with data on or before ``day``.
+        """
+        try:
+            loc = self._day_loc(day)
+        except KeyError:
+            return []
+        return [
+            self.identifiers[i]
+            for i in np.flatnonzero(self._asset_mask[loc])
+        ]
@@ -11,6 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bcolz
+from cachetools import LRUCache
+import numpy as np
+import pandas as pd
+
+from zipline.utils.instrumentation import DataAccessStats
+from zipline.utils.minute_index import NANOS_IN_MINUTE
 
 
 class FutureDailyReader(object):
@@ -21,7 +28,172 @@ class FutureDailyReader(object):
 
 
 class FutureMinuteReader(object):
+    """
+    Reader for futures minute bars.
+
+    Each future's bars are a bcolz ctable with 'open', 'high', 'low', 'close'
+    and 'volume' columns, stored at ``sid_path_func(rootdir, sid)`` or at
+    ``<rootdir>/<sid>.bcolz`` by default. The table has 1440 bars a day,
+    seven days a week, starting at midnight of the first day the future
+    traded. Prices are stored as 1000 * the traded price, and minutes without
+    a trade are stored as 0.
 
-    def __init__(self, rootdir, sid_path_func=None):
+    Reads fill each missing bar with the last non-zero bar at or before it.
+    The first time a column of a future is read, the whole column is
+    decompressed along with an index of the position of the last non-zero bar
+    at or before every minute, so spot reads and windows are array lookups.
+    The ``column_cache_size`` most recently read columns are kept.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory holding the futures' tables.
+    sid_path_func : callable, optional
+        A function of (rootdir, sid) returning the path of a future's table.
+    column_cache_size : int, optional
+        The number of (sid, field) columns to keep in memory. Default is 100.
+
+    Attributes
+    ----------
+    stats : zipline.utils.instrumentation.DataAccessStats
+        ``column_reads`` counts the columns read into memory and
+        ``bytes_decompressed`` their size, ``spot_reads`` counts calls to
+        ``get_value`` and ``window_reads`` and ``window_cells`` count calls to
+        ``load_window`` and the values they return.
+    """
+    PRICE_ADJUSTMENT_FACTOR = 0.001
+
+    def __init__(self, rootdir, sid_path_func=None, column_cache_size=100):
         self.rootdir = rootdir
         self.sid_path_func = sid_path_func
+        self.stats = DataAccessStats()
+
+        # Map from (sid, field) to the fully read column and the index of its
+        # last non-zero bars.
+        self._columns = LRUCache(maxsize=column_cache_size)
+
+    def _path(self, sid):
+        if self.sid_path_func is not None:
+            return self.sid_path_func(self.rootdir, sid)
+        return "{0}/{1}.bcolz".format(self.rootdir, sid)
+
+    def _column(self, sid, field):
+        """
+        The bars of ``field`` for ``sid``, and for every bar the position of
+        the last non-zero bar at or before it, or -1 if there is none.
+        """
+        key = int(sid), field
+        try:
+            return self._columns[key]
+        except KeyError:
+            pass
+
+        values = bcolz.open(self._path(key[0]), mode='r')[field][:]
+        self.stats.incr('column_reads')
+        self.stats.incr('bytes_decompressed', values.nbytes)
+
+        # int32 positions cover over 4000 years of minutes.
+        positions = np.where(
+            values != 0,
+            np.arange(len(values), dtype=np.int32),
+            np.int32(-1),
+        )
+        np.maximum.accumulate(positions, out=positions)
+        self._columns[key] = values, positions
+        return values, positions
+
+    def _filled_positions(self, sid, start_date, dts_ns, field):
+        """
+        The positions of the bars to report for the minutes ``dts_ns``, given
+        as int64 nanoseconds, or -1 where there is no bar at or before the
+        minute.
+        """
+        positions = self._column(sid, field)[1]
+        offsets = (dts_ns - start_date.value) // NANOS_IN_MINUTE
+        filled = positions[offsets.clip(0, len(positions) - 1)]
+        filled[offsets < 0] = -1
+        return filled
+
+    def _values(self, sid, positions, field):
+        values = self._column(sid, field)[0][positions.clip(0)]
+        if field == 'volume':
+            values[positions < 0] = 0
+            return values
+
+        values = values * self.PRICE_ADJUSTMENT_FACTOR
+        values[positions < 0] = 0.0
+        return values
+
+    def get_value(self, sid, start_date, dt, field):
+        """
+        Retrieve the bar of ``field`` for ``sid`` at ``dt``, filled forward.
+
+        Parameters
+        ----------
+        sid : int
+            The future's identifier.
+        start_date : pd.Timestamp
+            Midnight of the first day in the future's table.
+        dt : pd.Timestamp
+            The minute to read.
+        field : {'open', 'high', 'low', 'close', 'volume'}
+            The field to read.
+
+        Returns
+        -------
+        value : float or int
+            The value of the last non-zero bar at or before ``dt``, or 0 if
+            there is none.
+        """
+        self.stats.incr('spot_reads')
+        return self._values(
+            sid,
+            self._filled_positions(
+                sid, start_date, np.array([dt.value]), field,
+            ),
+            field,
+        )[0]
+
+    def load_window(self, sid, start_date, dts, field):
+        """
+        Retrieve the bars of ``field`` for ``sid`` at each of ``dts``, filled
+        forward.
+
+        Parameters
+        ----------
+        sid : int
+            The future's identifier.
+        start_date : pd.Timestamp
+            Midnight of the first day in the future's table.
+        dts : pd.DatetimeIndex
+            The minutes to read.
+        field : {'open', 'high', 'low', 'close', 'volume'}
+            The field to read.
+
+        Returns
+        -------
+        values : np.ndarray
+            The value of the last non-zero bar at or before each minute, or 0
+            where there is none.
+        """
+        self.stats.incr('window_reads')
+        self.stats.incr('window_cells', len(dts))
+        return self._values(
+            sid,
+            self._filled_positions(
+                sid, start_date, pd.DatetimeIndex(dts).asi8, field,
+            ),
+            field,
+        )
+
+    def get_last_traded_dt(self, sid, start_date, dt):
+        """
+        The minute of the last bar with non-zero volume at or before ``dt``,
+        or NaT if there is none.
+        """
+        position = self._filled_positions(
+            sid, start_date, np.array([dt.value]), 'volume',
+        )[0]
+        if position < 0:
+            return pd.NaT
+        return start_date + pd.Timedelta(minutes=int(position))
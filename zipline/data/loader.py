@@ -26,15 +26,14 @@ from six.moves.urllib_error import HTTPError
 
 from . benchmarks import get_benchmark_returns
 from . import treasuries, treasuries_can
+from .market_data_cache import read_csv_cached
 from .paths import (
     cache_root,
     data_root,
 )
 
-from zipline.utils.tradingcalendar import (
-    trading_day as trading_day_nyse,
-    trading_days as trading_days_nyse,
-)
+from zipline.errors import MarketDataNotFound
+from zipline.utils import tradingcalendar
 
 logger = logbook.Logger('Loader')
 
@@ -96,8 +95,8 @@ def has_data_for_dates(series_or_df, first_date, last_date):
     return (first <= first_date) and (last >= last_date)
 
 
-def load_market_data(trading_day=trading_day_nyse,
-                     trading_days=trading_days_nyse,
+def load_market_data(trading_day=None,
+                     trading_days=None,
                      bm_symbol='^GSPC'):
     """
     Load benchmark returns and treasury yield curves for the given calendar and
@@ -137,6 +136,11 @@ def load_market_data(trading_day=trading_day_nyse,
     '1month', '3month', '6month',
     '1year','2year','3year','5year','7year','10year','20year','30year'
     """
+    if trading_day is None:
+        trading_day = tradingcalendar.trading_day
+    if trading_days is None:
+        trading_days = tradingcalendar.trading_days
+
     first_date = trading_days[0]
     now = pd.Timestamp.utcnow()
 
@@ -176,6 +180,55 @@ def load_market_data(trading_day=trading_day_nyse,
     return benchmark_returns, treasury_curves
 
 
+def local_market_data_loader(directory=None):
+    """
+    Make a loader which reads benchmark returns and treasury curves from
+    files in ``directory`` and never downloads anything.
+
+    The result can be passed as the ``load`` argument of
+    :class:`~zipline.finance.trading.TradingEnvironment` to run fully
+    offline.  It reads the same files, and binary caches, that
+    ``load_market_data`` writes.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The directory to read from. Defaults to the zipline data root.
+
+    Returns
+    -------
+    load : callable
+        A function with the same signature as ``load_market_data``.
+    """
+    def load(trading_day=None, trading_days=None, bm_symbol='^GSPC'):
+        if trading_days is None:
+            trading_days = tradingcalendar.trading_days
+        root = data_root() if directory is None else directory
+        first_date, last_date = trading_days[[0, -1]]
+
+        _, treasury_filename, _ = INDEX_MAPPING.get(
+            bm_symbol, INDEX_MAPPING['^GSPC'],
+        )
+        results = []
+        for kind, filename, structure in (
+                ('benchmark', get_benchmark_filename(bm_symbol), 'series'),
+                ('treasury', treasury_filename, 'frame')):
+            path = os.path.join(root, filename)
+            if not os.path.exists(path):
+                raise MarketDataNotFound(
+                    kind=kind,
+                    symbol=bm_symbol,
+                    path=path,
+                )
+            data = read_csv_cached(path, structure)
+            results.append(
+                data[data.index.slice_indexer(first_date, last_date)],
+            )
+        return tuple(results)
+
+    return load
+
+
 def ensure_benchmark_data(symbol, first_date, last_date, now, trading_day):
     """
     Ensure we have benchmark data for `symbol` from `first_date` to `last_date`
@@ -211,7 +264,7 @@ def ensure_benchmark_data(symbol, first_date, last_date, now, trading_day):
     # yet, so don't try to read from 'path'.
     if os.path.exists(path):
         try:
-            data = pd.Series.from_csv(path).tz_localize('UTC')
+            data = read_csv_cached(path, 'series')
             if has_data_for_dates(data, first_date, last_date):
                 return data
 
@@ -293,7 +346,7 @@ def ensure_treasury_data(bm_symbol, first_date, last_date, now):
     # yet, so don't try to read from 'path'.
     if os.path.exists(path):
         try:
-            data = pd.DataFrame.from_csv(path).tz_localize('UTC')
+            data = read_csv_cached(path, 'frame')
             if has_data_for_dates(data, first_date, last_date):
                 return data
 
@@ -0,0 +1,152 @@
+"""
+Binary caches of the benchmark returns and treasury curves.
+
+``load_market_data`` keeps its benchmark returns and treasury curves as CSVs
+in the zipline data root. Parsing those CSVs dominates the construction of a
+TradingEnvironment, so the parsed values are also written next to each CSV as
+``.npy`` arrays which later loads memory-map. A cache is stale, and is
+rebuilt from the CSV, whenever the CSV's size or modification time differs
+from the one recorded when the cache was written.
+"""
+import json
+import os
+from os.path import exists, join
+
+import numpy as np
+import pandas as pd
+
+from zipline.utils.atomic_write import atomic_write_directory
+
+#: Bump this whenever the on-disk layout changes so that old caches are
+#: rebuilt.
+MARKET_DATA_CACHE_VERSION = 1
+
+_MANIFEST = 'manifest.json'
+
+
+def market_data_cache_path(csv_path):
+    """
+    The directory holding the binary cache for ``csv_path``.
+    """
+    return csv_path + '.cache'
+
+
+def _source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return [stat.st_size, stat.st_mtime]
+
+
+def write_market_data_cache(path, data, source=None):
+    """
+    Write a Series or DataFrame of floats to a binary cache at ``path``,
+    with ``atomic_write_directory``.
+
+    Parameters
+    ----------
+    path : str
+        The directory to write.
+    data : pd.Series or pd.DataFrame
+        The data to cache. Must have a DatetimeIndex in UTC.
+    source : str, optional
+        The CSV the data was read from. If given, the cache is only valid
+        while the CSV is unchanged.
+    """
+    manifest = {
+        'version': MARKET_DATA_CACHE_VERSION,
+        'source': _source_stamp(source) if source is not None else None,
+    }
+    if isinstance(data, pd.DataFrame):
+        manifest['kind'] = 'frame'
+        manifest['columns'] = list(data.columns)
+    else:
+        manifest['kind'] = 'series'
+        manifest['name'] = data.name
+
+    with atomic_write_directory(path) as tmp:
+        np.save(join(tmp, 'index.npy'), pd.DatetimeIndex(data.index).asi8)
+        np.save(join(tmp, 'values.npy'), data.values.astype(np.float64))
+        with open(join(tmp, _MANIFEST), 'w') as f:
+            json.dump(manifest, f)
+
+
+def read_market_data_cache(path, source=None):
+    """
+    Read a cache written by ``write_market_data_cache``.
+
+    The arrays are memory-mapped copy-on-write, so the result can be modified
+    without changing the cache.
+
+    Parameters
+    ----------
+    path : str
+        The directory to read.
+    source : str, optional
+        The CSV the cache was built from. If given, the cache is treated as
+        stale when the CSV has changed since the cache was written.
+
+    Returns
+    -------
+    data : pd.Series or pd.DataFrame or None
+        The cached data, or None if the cache is missing or stale.
+    """
+    manifest_path = join(path, _MANIFEST)
+    if not exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    if manifest['version'] != MARKET_DATA_CACHE_VERSION:
+        return None
+    if source is not None and manifest['source'] != _source_stamp(source):
+        return None
+
+    index = pd.DatetimeIndex(
+        np.load(join(path, 'index.npy'), mmap_mode='c').view('M8[ns]'),
+    ).tz_localize('UTC')
+    values = np.load(join(path, 'values.npy'), mmap_mode='c')
+    if manifest['kind'] == 'frame':
+        return pd.DataFrame(
+            values,
+            index=index,
+            columns=manifest['columns'],
+            copy=False,
+        )
+    return pd.Series(values, index=index, name=manifest['name'], copy=False)
+
+
+def read_csv_cached(csv_path, kind):
+    """
+    Read a benchmark or treasury CSV written by ``load_market_data``, using
+    its binary cache if it is current and refreshing the cache otherwise.
+
+    Parameters
+    ----------
+    csv_path : str
+        The CSV to read.
+    kind : {'series', 'frame'}
+        Whether the CSV holds a Series or a DataFrame.
+
+    Returns
+    -------
+    data : pd.Series or pd.DataFrame
+        The data, indexed by UTC dates.
+    """
+    path = market_data_cache_path(csv_path)
+    try:
+        data = read_market_data_cache(path, source=csv_path)
+    except (OSError, IOError, ValueError, KeyError):
+        # The cache is an optimization: treat a corrupt cache as missing.
+        data = None
+    if data is not None:
+        return data
+
+    if kind == 'frame':
+        data = pd.DataFrame.from_csv(csv_path).tz_localize('UTC')
+    else:
+        data = pd.Series.from_csv(csv_path).tz_localize('UTC')
+
+    try:
+        write_market_data_cache(path, data, source=csv_path)
+    except (OSError, IOError, ValueError, TypeError):
+        pass
+    return data
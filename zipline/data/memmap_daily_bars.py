@@ -0,0 +1,497 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A daily bar format of dense, memory-mapped (day x sid) uint32 matrices.
+
+The bcolz daily bar table stores each asset's rows back to back in
+compressed columns, so every read decompresses the rows it needs. This
+format instead stores one uncompressed ``.npy`` matrix per OHLCV field with
+a row for every day of the calendar and a column for every sid, zero where
+the sid has no data. Readers memory-map the matrices, so windows and spot
+prices are read straight out of the page cache, which is shared by every
+process reading the same files.
+
+A directory in this format holds:
+
+- ``metadata.json``: the format version and first trading day.
+- ``calendar.npy``: the calendar as int64 nanoseconds since the epoch.
+- ``sids.npy``: the sids, sorted ascending, as int64.
+- ``start_days.npy`` and ``end_days.npy``: for each sid, the calendar
+  indices of its first and last rows of data.
+- ``open.npy``, ``high.npy``, ``low.npy``, ``close.npy``, ``volume.npy``: the
+  (day x sid) uint32 matrices, with prices stored as 1000 * the as-traded
+  dollar value, like the bcolz table.
+"""
+import json
+from os.path import join
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from pandas import DatetimeIndex, Timestamp
+from pandas.tslib import iNaT
+from six import iteritems, string_types
+
+from zipline.utils.atomic_write import atomic_write_directory
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.instrumentation import DataAccessStats
+from zipline.utils.memoize import lazyval
+from .us_equity_pricing import (
+    DailyBarReader,
+    NoDataOnDate,
+    OHLC,
+    day_locs,
+    open_daily_bar_table,
+    raw_to_spot_prices,
+    to_uint32_columns,
+)
+
+#: Bump this whenever the on-disk layout changes.
+MEMMAP_DAILY_BAR_VERSION = 1
+
+MEMMAP_DAILY_BAR_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+_METADATA = 'metadata.json'
+
+
+class MemmapDailyBarWriter(object):
+    """
+    Writer for the dense, memory-mapped daily bar format read by
+    ``MemmapDailyBarReader``.
+
+    Parameters
+    ----------
+    path : str
+        The directory to write. It is replaced if it already exists.
+    calendar : pandas.DatetimeIndex
+        The trading days of the matrices. Every asset's data must lie on a
+        contiguous run of these days.
+
+    See Also
+    --------
+    MemmapDailyBarReader : Consumer of the data written by this class.
+    convert_bcolz_daily_bars : Convert a bcolz daily bar table.
+    """
+    def __init__(self, path, calendar):
+        self._path = path
+        self._calendar = calendar
+
+    def write(self,
+              data,
+              assets=None,
+              show_progress=False,
+              invalid_data_behavior='warn'):
+        """
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame or bcolz.ctable]]
+            The data chunks to write, in the format accepted by
+            ``BcolzDailyBarWriter.write``.
+        assets : set[int], optional
+            The assets that should be in ``data``.
+        show_progress : bool
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}
+            What to do when data is encountered that is outside the range of
+            a uint32.
+
+        Returns
+        -------
+        reader : MemmapDailyBarReader
+            A reader of the newly-written data.
+        """
+        if assets is not None:
+            assets = set(assets)
+
+        sids = []
+        counts = []
+        start_days = []
+        columns = {name: [] for name in MEMMAP_DAILY_BAR_COLUMNS}
+        ctx = maybe_show_progress(
+            data,
+            show_progress=show_progress,
+            label='Merging asset files:',
+            length=len(assets) if assets is not None else None,
+        )
+        with ctx as it:
+            for sid, frame in it:
+                if assets is not None and sid not in assets:
+                    raise ValueError('unknown asset id %r' % sid)
+                table = to_uint32_columns(frame, invalid_data_behavior)
+                nrows = len(table['day'])
+                if not nrows:
+                    continue
+                sids.append(sid)
+                counts.append(nrows)
+                start_days.append(
+                    self._calendar.get_loc(
+                        Timestamp(table['day'][0], unit='s', tz='UTC'),
+                    ),
+                )
+                for name, chunks in iteritems(columns):
+                    chunks.append(table[name][:])
+
+        return self._write_tape(
+            np.array(sids, dtype=np.int64),
+            np.array(counts, dtype=np.int64),
+            np.array(start_days, dtype=np.int64),
+            lambda name: (
+                np.concatenate(columns[name])
+                if columns[name] else
+                np.array([], dtype=np.uint32)
+            ),
+        )
+
+    def write_from_bcolz(self, table):
+        """
+        Write the data of a bcolz daily bar table.
+
+        Parameters
+        ----------
+        table : bcolz.ctable
+            A table written by ``BcolzDailyBarWriter``.
+
+        Returns
+        -------
+        reader : MemmapDailyBarReader
+            A reader of the newly-written data.
+        """
+        attrs = table.attrs
+        first_rows = attrs['first_row']
+        sids = np.array(sorted(map(int, first_rows)), dtype=np.int64)
+        keys = [str(sid) for sid in sids]
+        starts = np.array([first_rows[k] for k in keys], dtype=np.int64)
+        ends = np.array([attrs['last_row'][k] for k in keys], dtype=np.int64)
+        start_days = np.array(
+            [attrs['calendar_offset'][k] for k in keys],
+            dtype=np.int64,
+        )
+
+        # The table stores each sid's rows back to back. Put the sids in
+        # the order of their rows so that the columns can be read whole.
+        order = np.argsort(starts, kind='mergesort')
+        return self._write_tape(
+            sids[order],
+            (ends - starts + 1)[order],
+            start_days[order],
+            lambda name: table[name][:],
+        )
+
+    def _write_tape(self, sids, counts, start_days, read_column):
+        """
+        Scatter rows stored back to back per sid, in the order of ``sids``,
+        into dense (day x sid) matrices.
+        """
+        calendar = self._calendar
+        order = np.argsort(sids, kind='mergesort')
+        if len(sids) and (np.diff(sids[order]) == 0).any():
+            raise ValueError('duplicate sids in daily bar data')
+
+        # The column of each sid in the sorted output, and the day and column
+        # of every row of the tape.
+        out_cols = np.empty(len(sids), dtype=np.int64)
+        out_cols[order] = np.arange(len(sids))
+        ends = np.cumsum(counts)
+        row_day = (
+            np.arange(ends[-1] if len(ends) else 0) -
+            np.repeat(ends - counts - start_days, counts)
+        )
+        row_col = np.repeat(out_cols, counts)
+        if len(row_day) and row_day.max() >= len(calendar):
+            raise ValueError('daily bar data extends past the calendar')
+
+        first_day = (
+            calendar[start_days.min()].value if len(start_days) else iNaT
+        )
+
+        with atomic_write_directory(self._path) as tmp:
+            np.save(join(tmp, 'calendar.npy'), calendar.asi8)
+            np.save(join(tmp, 'sids.npy'), sids[order])
+            np.save(join(tmp, 'start_days.npy'), start_days[order])
+            np.save(
+                join(tmp, 'end_days.npy'),
+                (start_days + counts - 1)[order],
+            )
+            for name in MEMMAP_DAILY_BAR_COLUMNS:
+                out = open_memmap(
+                    join(tmp, name + '.npy'),
+                    mode='w+',
+                    dtype=np.uint32,
+                    shape=(len(calendar), len(sids)),
+                )
+                out[row_day, row_col] = read_column(name)
+                out.flush()
+                del out
+            with open(join(tmp, _METADATA), 'w') as f:
+                json.dump(
+                    {
+                        'version': MEMMAP_DAILY_BAR_VERSION,
+                        'first_trading_day': int(first_day),
+                    },
+                    f,
+                )
+
+        return MemmapDailyBarReader(self._path)
+
+
+def convert_bcolz_daily_bars(table, path):
+    """
+    Convert a bcolz daily bar table to the dense, memory-mapped format.
+
+    Parameters
+    ----------
+    table : bcolz.ctable or str
+        A table written by ``BcolzDailyBarWriter``, or the path to one.
+    path : str
+        The directory to write.
+
+    Returns
+    -------
+    reader : MemmapDailyBarReader
+        A reader of the converted data.
+    """
+    if isinstance(table, string_types):
+        table = open_daily_bar_table(table)
+    calendar = DatetimeIndex(table.attrs['calendar'], tz='UTC')
+    return MemmapDailyBarWriter(path, calendar).write_from_bcolz(table)
+
+
+class MemmapDailyBarReader(DailyBarReader):
+    """
+    Reader for daily bars written by ``MemmapDailyBarWriter``.
+
+    ``load_raw_arrays`` and ``spot_price`` return the same values as
+    ``BcolzDailyBarReader`` does for the same data. Volume windows are
+    read-only views of the mapped file when the requested assets are
+    a contiguous run of the stored sids.
+
+    Parameters
+    ----------
+    path : str
+        The directory written by ``MemmapDailyBarWriter``.
+
+    Attributes
+    ----------
+    stats : zipline.utils.instrumentation.DataAccessStats
+        ``spot_reads`` counts calls to ``spot_price``, ``column_reads``
+        counts the matrices mapped, ``raw_array_reads`` counts and times
+        calls to ``load_raw_arrays`` and ``raw_array_cells`` counts the
+        (day, asset, column) values they return.
+    """
+    def __init__(self, path):
+        self._path = path
+        self._columns = {}
+        self.stats = DataAccessStats()
+        self.PRICE_ADJUSTMENT_FACTOR = 0.001
+
+        with open(join(path, _METADATA)) as f:
+            metadata = json.load(f)
+        if metadata['version'] != MEMMAP_DAILY_BAR_VERSION:
+            raise ValueError(
+                'unsupported daily bar version %r in %r' % (
+                    metadata['version'], path,
+                ),
+            )
+        self._metadata = metadata
+
+    def _load(self, name):
+        return np.load(join(self._path, name + '.npy'), mmap_mode='r')
+
+    @lazyval
+    def _calendar(self):
+        return DatetimeIndex(self._load('calendar'), tz='UTC')
+
+    @lazyval
+    def _sids(self):
+        return self._load('sids')
+
+    @lazyval
+    def _start_days(self):
+        return self._load('start_days')
+
+    @lazyval
+    def _end_days(self):
+        return self._load('end_days')
+
+    @lazyval
+    def first_trading_day(self):
+        first_day = self._metadata['first_trading_day']
+        if first_day == iNaT:
+            return None
+        return Timestamp(first_day, tz='UTC')
+
+    @property
+    def last_available_dt(self):
+        return self._calendar[-1]
+
+    def _column(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            col = self._columns[name] = self._load(name)
+            self.stats.incr('column_reads')
+            return col
+
+    def _sid_positions(self, assets):
+        """
+        The columns of ``assets`` in the matrices.
+
+        Returns a slice when the assets are a contiguous run of columns, so
+        that indexing the matrices with it makes a view.
+        """
+        sids = self._sids
+        assets = np.asarray(assets, dtype=np.int64)
+        positions = sids.searchsorted(assets)
+        found = positions < len(sids)
+        found[found] = sids[positions[found]] == assets[found]
+        if not found.all():
+            raise KeyError(assets[~found][0])
+
+        if len(positions) and (np.diff(positions) == 1).all():
+            return slice(positions[0], positions[-1] + 1)
+        return positions
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        stats = self.stats
+        with stats.timer('raw_array_reads'):
+            # Assumes that the given dates are actually in calendar.
+            start_idx = self._calendar.get_loc(start_date)
+            end_idx = self._calendar.get_loc(end_date)
+            positions = self._sid_positions(assets)
+            stats.incr(
+                'raw_array_cells',
+                (end_idx - start_idx + 1) * len(assets) * len(columns),
+            )
+
+            results = []
+            for column in columns:
+                raw = np.asarray(self._column(column.name))[
+                    start_idx:end_idx + 1,
+                    positions,
+                ]
+                if column.name in OHLC:
+                    out = raw * self.PRICE_ADJUSTMENT_FACTOR
+                    out[raw == 0] = np.nan
+                    results.append(out)
+                else:
+                    results.append(raw)
+            return results
+
+    def sid_day_index(self, sid, day):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        day : datetime64-like
+            Midnight of the day for which data is requested.
+
+        Returns
+        -------
+        (day_loc, sid_loc) : (int, int)
+            The row and column of the given sid and day in the matrices.
+            Raises a NoDataOnDate exception if the given day and sid is
+            before or after the date range of the equity.
+        """
+        try:
+            day_loc = self._calendar.get_loc(day)
+        except KeyError:
+            raise NoDataOnDate("day={0} is outside of calendar={1}".format(
+                day, self._calendar))
+        sid = int(sid)
+        sid_loc = self._sids.searchsorted(sid)
+        if sid_loc == len(self._sids) or self._sids[sid_loc] != sid:
+            raise KeyError(sid)
+        if day_loc < self._start_days[sid_loc]:
+            raise NoDataOnDate(
+                "No data on or before day={0} for sid={1}".format(
+                    day, sid))
+        if day_loc > self._end_days[sid_loc]:
+            raise NoDataOnDate(
+                "No data on or after day={0} for sid={1}".format(
+                    day, sid))
+        return day_loc, sid_loc
+
+    def spot_price(self, sid, day, colname):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        day : datetime64-like
+            Midnight of the day for which data is requested.
+        colname : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        float
+            The spot price for colname of the given sid on the given day.
+            Raises a NoDataOnDate exception if the given day and sid is
+            before or after the date range of the equity.
+            Returns -1 if the day is within the date range, but the price is
+            0.
+        """
+        self.stats.incr('spot_reads')
+        price = self._column(colname)[self.sid_day_index(sid, day)]
+        if price == 0:
+            return -1
+        if colname != 'volume':
+            return price * 0.001
+        else:
+            return price
+
+    def spot_prices(self, sids, days, colname):
+        self.stats.incr('spot_reads', len(sids))
+        sid_locs = self._sid_positions(sids)
+        if isinstance(sid_locs, slice):
+            sid_locs = np.arange(sid_locs.start, sid_locs.stop)
+        locs = day_locs(self._calendar, days)
+        valid = (
+            (locs != -1) &
+            (locs >= self._start_days[sid_locs]) &
+            (locs <= self._end_days[sid_locs])
+        )
+        out = np.full(len(sid_locs), np.nan)
+        out[valid] = raw_to_spot_prices(
+            np.asarray(self._column(colname))[locs[valid], sid_locs[valid]],
+            colname,
+        )
+        return out
+
+    def get_last_traded_dt(self, asset, day):
+        """
+        The last day on or before ``day`` with non-zero volume for ``asset``,
+        or None if there is no such day in the asset's data.
+        """
+        if day >= asset.end_date:
+            # go back to one day before the asset ended
+            search_day = self._calendar[
+                self._calendar.searchsorted(asset.end_date) - 1
+            ]
+        else:
+            search_day = day
+
+        try:
+            day_loc, sid_loc = self.sid_day_index(asset, search_day)
+        except NoDataOnDate:
+            return None
+
+        start = self._start_days[sid_loc]
+        traded = np.flatnonzero(
+            self._column('volume')[start:day_loc + 1, sid_loc],
+        )
+        if not len(traded):
+            return None
+        return self._calendar[start + traded[-1]]
@@ -11,16 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import namedtuple
+import errno
 import json
+from multiprocessing import Pool
 import os
 from os.path import join
 from textwrap import dedent
+from timeit import default_timer
 
 import bcolz
 from bcolz import ctable
 from intervaltree import IntervalTree
+import logbook
 import numpy as np
 import pandas as pd
+from six import string_types
 
 from zipline.data._minute_bar_internal import (
     minute_value,
@@ -29,7 +35,12 @@ from zipline.data._minute_bar_internal import (
 )
 
 from zipline.gens.sim_engine import NANOS_IN_MINUTE
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.instrumentation import DataAccessStats
 from zipline.utils.memoize import lazyval
+from zipline.utils.pool import imap_bounded
+
+logger = logbook.Logger('MinuteBars')
 
 US_EQUITIES_MINUTES_PER_DAY = 390
 
@@ -46,6 +57,81 @@ class BcolzMinuteWriterColumnMismatch(Exception):
     pass
 
 
+class MinuteBarIngestionSummary(namedtuple('MinuteBarIngestionSummary',
+                                           'sids bars seconds')):
+    """
+    The amount of data written by ``BcolzMinuteBarWriter.write_sids``.
+
+    Parameters
+    ----------
+    sids : int
+        The number of sids written.
+    bars : int
+        The number of input bars written.
+    seconds : float
+        The wall time taken to write them.
+    """
+    @property
+    def bars_per_second(self):
+        return self.bars / self.seconds if self.seconds else float('inf')
+
+    @property
+    def sids_per_second(self):
+        return self.sids / self.seconds if self.seconds else float('inf')
+
+
+def read_minute_csv(path):
+    """
+    Read the minute bars of one sid from a csv file whose first column holds
+    the UTC minute of each row.
+
+    Parameters
+    ----------
+    path : str
+        The path to the csv.
+
+    Returns
+    -------
+    df : pd.DataFrame
+        The open, high, low, close and volume columns, indexed by minute.
+    """
+    return pd.read_csv(path, index_col=0, parse_dates=True)
+
+
+def _minute_csv_folder_sids(folderpath):
+    """
+    The (sid, path) pairs of the files named ``<sid>.csv`` in ``folderpath``,
+    in sid order.
+    """
+    pairs = []
+    for name in os.listdir(folderpath):
+        stem, ext = os.path.splitext(name)
+        if ext != '.csv':
+            continue
+        try:
+            sid = int(stem)
+        except ValueError:
+            continue
+        pairs.append((sid, join(folderpath, name)))
+    return sorted(pairs)
+
+
+# The writer used by the worker processes of ``BcolzMinuteBarWriter.write``.
+# It is sent once per process by the pool initializer rather than once per
+# task.
+_ingestion_writer = None
+
+
+def _init_ingestion_worker(writer):
+    global _ingestion_writer
+    _ingestion_writer = writer
+
+
+def _ingest_sid(args):
+    sid, data = args
+    return sid, _ingestion_writer._ingest(sid, data)
+
+
 def _calc_minute_index(market_opens, minutes_per_day):
     minutes = np.zeros(len(market_opens) * minutes_per_day,
                        dtype='datetime64[ns]')
@@ -340,7 +426,7 @@ class BcolzMinuteBarWriter(object):
         with open(sizes_path, mode='r') as f:
             sizes = f.read()
         data = json.loads(sizes)
-        num_days = data['shape'][0] / self._minutes_per_day
+        num_days = data['shape'][0] // self._minutes_per_day
         if num_days == 0:
             # empty container
             return pd.NaT
@@ -359,9 +445,13 @@ class BcolzMinuteBarWriter(object):
         # This is not to be confused with the `.bcolz` directory, but is the
         # directory up one level from the `.bcolz` directories.
         sid_containing_dirname = os.path.dirname(path)
-        if not os.path.exists(sid_containing_dirname):
-            # Other sids may have already created the containing directory.
+        try:
             os.makedirs(sid_containing_dirname)
+        except OSError as e:
+            # Other sids, possibly in other processes, may have already
+            # created the containing directory.
+            if e.errno != errno.EEXIST:
+                raise
         initial_array = np.empty(0, np.uint32)
         table = ctable(
             rootdir=path,
@@ -504,6 +594,120 @@ class BcolzMinuteBarWriter(object):
                              for name in self.COL_NAMES)))
         self._write_cols(sid, dts, cols)
 
+    def write_sids(self, data, processes=None, show_progress=False):
+        """
+        Write the OHLCV data of many sids, optionally in parallel.
+
+        Each sid's ctable is independent of the others, so sids are converted,
+        validated and written by a pool of worker processes. The metadata is
+        shared by all sids and was written once when the writer was created.
+
+        Parameters
+        ----------
+        data : iterable[(int, pd.DataFrame or str)]
+            The sids to write with their data, in the format accepted by
+            ``write``, or the path of a csv file to read with
+            ``read_minute_csv``.
+        processes : int, optional
+            The number of worker processes to write with. By default, sids
+            are written in this process.
+        show_progress : bool, optional
+            Whether to show a progress bar.
+
+        Returns
+        -------
+        summary : MinuteBarIngestionSummary
+            The number of sids and bars written, and how long it took.
+        """
+        start = default_timer()
+        sids = bars = 0
+
+        if processes:
+            pool = Pool(
+                processes,
+                initializer=_init_ingestion_worker,
+                initargs=(self,),
+            )
+            # Only a few batches of ``data`` are pulled at once, so frames
+            # read lazily by ``data`` aren't all held in memory.
+            results = imap_bounded(
+                pool,
+                _ingest_sid,
+                data,
+                batch_size=4 * processes,
+            )
+        else:
+            pool = None
+            results = ((sid, self._ingest(sid, d)) for sid, d in data)
+
+        try:
+            with maybe_show_progress(
+                    results,
+                    show_progress,
+                    label='Writing minute bars:') as it:
+                for _, count in it:
+                    sids += 1
+                    bars += count
+            if pool is not None:
+                pool.close()
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+        summary = MinuteBarIngestionSummary(
+            sids,
+            bars,
+            default_timer() - start,
+        )
+        logger.info(
+            'Wrote {0.bars} minute bars for {0.sids} sids in '
+            '{0.seconds:.2f} seconds ({1:.0f} bars per second).',
+            summary,
+            summary.bars_per_second,
+        )
+        return summary
+
+    def write_csv_folder(self, folderpath, processes=None,
+                         show_progress=False):
+        """
+        Write the minute bars of every file named ``<sid>.csv`` in
+        ``folderpath``.
+
+        Files are read by the worker processes, see ``write_sids`` and
+        ``read_minute_csv``.
+
+        Parameters
+        ----------
+        folderpath : str
+            The directory holding the csv files.
+        processes : int, optional
+            The number of worker processes to write with.
+        show_progress : bool, optional
+            Whether to show a progress bar.
+
+        Returns
+        -------
+        summary : MinuteBarIngestionSummary
+        """
+        return self.write_sids(
+            _minute_csv_folder_sids(folderpath),
+            processes=processes,
+            show_progress=show_progress,
+        )
+
+    def _ingest(self, sid, data):
+        """
+        Write the data of one sid for ``write_sids``, and return the number of
+        bars written.
+        """
+        if isinstance(data, string_types):
+            data = read_minute_csv(data)
+        if not len(data):
+            return 0
+        self.write(sid, data)
+        return len(data)
+
     def _write_cols(self, sid, dts, cols):
         """
         Internal method for `write_cols` and `write`.
@@ -538,15 +742,18 @@ class BcolzMinuteBarWriter(object):
             Data with last_date={0} already includes input start={1} for
             sid={2}""".strip()).format(last_date, input_first_day, sid))
 
-        day_before_input = input_first_day - tds.freq
-
-        self.pad(sid, day_before_input)
-        table = self._ensure_ctable(sid)
+        # Zero-fill the days between the end of the existing output and the
+        # input in the same append as the input, rather than with ``pad``, so
+        # that the table is only appended to and flushed once.
+        days_written = len(table) // self._minutes_per_day
+        days_to_pad = max(tds.searchsorted(input_first_day) - days_written, 0)
+        pad_count = days_to_pad * self._minutes_per_day
 
         days_to_write = tds[tds.slice_indexer(start=input_first_day,
                                               end=input_last_day)]
 
-        minutes_count = len(days_to_write) * self._minutes_per_day
+        minutes_count = pad_count + \
+            len(days_to_write) * self._minutes_per_day
 
         all_minutes = self._minute_index
         indexer = all_minutes.slice_indexer(start=days_to_write[0])
@@ -558,8 +765,8 @@ class BcolzMinuteBarWriter(object):
         close_col = np.zeros(minutes_count, dtype=np.uint32)
         vol_col = np.zeros(minutes_count, dtype=np.uint32)
 
-        dt_ixs = np.searchsorted(all_minutes_in_window.values,
-                                 dts.astype('datetime64[ns]'))
+        dt_ixs = pad_count + np.searchsorted(all_minutes_in_window.values,
+                                             dts.astype('datetime64[ns]'))
 
         ohlc_ratio = self._ohlc_ratio
 
@@ -595,8 +802,16 @@ class BcolzMinuteBarReader(object):
         rootdir : string
             The root directory containing the metadata and asset bcolz
             directories.
+
+        Attributes:
+        -----------
+        stats : zipline.utils.instrumentation.DataAccessStats
+            Counters for carray opens, spot reads, window reads and their
+            sizes, and bytes decompressed, along with a timer for window
+            reads.
         """
         self._rootdir = rootdir
+        self.stats = DataAccessStats()
 
         metadata = self._get_metadata()
 
@@ -720,9 +935,34 @@ class BcolzMinuteBarReader(object):
             carray = self._carrays[field][sid] = \
                 bcolz.carray(rootdir=self._get_carray_path(sid, field),
                              mode='r')
+            self.stats.incr('carray_opens')
 
         return carray
 
+    def preload(self, sids, fields=('open', 'high', 'low', 'close', 'volume')):
+        """
+        Decompress the minute bars of ``sids`` into memory, so that later
+        reads of them are served from the in-memory arrays.
+
+        Processes forked after preloading share the arrays copy-on-write
+        instead of each decompressing the same carrays.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The sids to load. Sids without minute bars are skipped.
+        fields : iterable[str], optional
+            The fields to load.
+        """
+        for field in fields:
+            carrays = self._carrays[field]
+            for sid in sids:
+                sid = int(sid)
+                if not os.path.exists(self._get_carray_path(sid, field)):
+                    continue
+                values = carrays[sid] = self._open_minute_file(field, sid)[:]
+                self.stats.incr('bytes_decompressed', values.nbytes)
+
     def get_value(self, sid, dt, field):
         """
         Retrieve the pricing info for the given sid, dt, and field.
@@ -751,6 +991,7 @@ class BcolzMinuteBarReader(object):
             Returns the integer value of the volume.
             (A volume of 0 signifies no trades for the given dt.)
         """
+        self.stats.incr('spot_reads')
         if self._last_get_value_dt_value == dt.value:
             minute_pos = self._last_get_value_dt_position
         else:
@@ -846,6 +1087,11 @@ class BcolzMinuteBarReader(object):
             (sids, minutes in range) with a dtype of float64, containing the
             values for the respective field over start and end dt range.
         """
+        with self.stats.timer('window_reads'):
+            return self._unadjusted_window(fields, start_dt, end_dt, sids)
+
+    def _unadjusted_window(self, fields, start_dt, end_dt, sids):
+        stats = self.stats
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
 
@@ -861,6 +1107,7 @@ class BcolzMinuteBarReader(object):
                 num_minutes -= length
 
         shape = (len(sids), num_minutes)
+        stats.incr('window_cells', shape[0] * shape[1] * len(fields))
 
         for field in fields:
             if field != 'volume':
@@ -871,6 +1118,7 @@ class BcolzMinuteBarReader(object):
             for i, sid in enumerate(sids):
                 carray = self._open_minute_file(field, sid)
                 values = carray[start_idx:end_idx + 1]
+                stats.incr('bytes_decompressed', values.nbytes)
                 if indices_to_exclude is not None:
                     for excl_start, excl_stop in indices_to_exclude[::-1]:
                         excl_slice = np.s_[
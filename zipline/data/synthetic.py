@@ -0,0 +1,735 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Seeded synthetic equity data, generated with array operations and written
+straight to the on-disk formats read by a DataPortal.
+"""
+from collections import namedtuple
+from multiprocessing import Pool
+import os
+from string import ascii_uppercase
+from timeit import default_timer
+
+import logbook
+import numpy as np
+import pandas as pd
+
+from zipline.assets import AssetDBWriter
+from zipline.data.minute_bars import (
+    BcolzMinuteBarWriter,
+    MinuteBarIngestionSummary,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+    SQLiteAdjustmentWriter,
+)
+from zipline.gens.sim_engine import NANOS_IN_MINUTE
+from zipline.utils import tradingcalendar
+from zipline.utils.cli import maybe_show_progress
+
+logger = logbook.Logger('SyntheticData')
+
+OHLCV = ('open', 'high', 'low', 'close', 'volume')
+
+#: The split ratios drawn from, with their probabilities. A ratio of 0.5 is
+#: a 2-for-1 split and a ratio of 2.0 a 1-for-2 reverse split.
+SPLIT_RATIOS = np.array([1 / 2.0, 1 / 3.0, 2 / 3.0, 2.0])
+SPLIT_RATIO_WEIGHTS = np.array([0.6, 0.1, 0.2, 0.1])
+
+#: The fewest trading days an asset is listed for.
+MIN_LIFETIME = 20
+
+#: The trading days between two dividends of a dividend paying asset.
+DIVIDEND_INTERVAL = 63
+
+#: Bounds of the prices before splits, which keep split-adjusted prices
+#: well within the range that the bar writers can store.
+MIN_PRICE = 1.0
+MAX_PRICE = 5000.0
+
+#: The smallest daily volume of a day with trades. It is more than the number
+#: of minutes in a day, so that every traded minute has some volume.
+MIN_DAILY_VOLUME = 1000
+
+TRADING_DAYS_PER_YEAR = 252
+
+# Keys mixed into the seed of each asset, so that every kind of draw has its
+# own random stream.
+_EVENTS = 0
+_DAILY = 1
+_MINUTE = 2
+
+
+class SyntheticDatasetPaths(namedtuple('SyntheticDatasetPaths',
+                                       'assets daily_bars adjustments '
+                                       'minute_bars')):
+    """
+    The paths written by ``SyntheticEquityData.write``.
+
+    Parameters
+    ----------
+    assets : str
+        The asset db, for an ``AssetFinder``.
+    daily_bars : str
+        The daily bars, for a ``BcolzDailyBarReader``.
+    adjustments : str
+        The splits and dividends, for a ``SQLiteAdjustmentReader``.
+    minute_bars : str or None
+        The minute bars, for a ``BcolzMinuteBarReader``, or None if they were
+        not written.
+    """
+
+
+def _symbol(n):
+    """
+    The ``n``th of the symbols 'A', 'B', ..., 'Z', 'AA', 'AB', ...
+    """
+    letters = []
+    n += 1
+    while n:
+        n, remainder = divmod(n - 1, len(ascii_uppercase))
+        letters.append(ascii_uppercase[remainder])
+    return ''.join(reversed(letters))
+
+
+# The dataset used by the worker processes of ``SyntheticEquityData``, set
+# once per process by ``_init_synthetic_worker``.
+_worker_data = None
+_worker_minute_writer = None
+
+
+def _init_synthetic_worker(data, minute_writer=None):
+    global _worker_data, _worker_minute_writer
+    _worker_data = data
+    _worker_minute_writer = minute_writer
+
+
+def _generate_daily_sid(sid):
+    return _worker_data._generate_daily(sid)
+
+
+def _write_minute_sid(sid):
+    return _worker_data._write_minute_bars(_worker_minute_writer, sid)
+
+
+class SyntheticEquityData(object):
+    """
+    A seeded generator of realistic synthetic equity data.
+
+    Prices follow a random walk per asset. Assets may be listed after the
+    first day and delisted before the last, have splits and quarterly cash
+    dividends, and be halted for runs of days. Minute bars are consistent
+    with the daily bars: each day's minutes open at the daily open, close at
+    the daily close, stay within the daily high and low, reach both, and
+    their volume sums to the daily volume. Days that close early only have
+    minutes until the close, and a fraction of each asset's minutes have no
+    trades.
+
+    Every draw for an asset comes from a random state seeded with ``seed``
+    and its sid. An asset's data therefore does not depend on the other
+    assets, on the order assets are generated in, or on the number of
+    processes they are generated by.
+
+    Parameters
+    ----------
+    num_assets : int
+        The number of assets.
+    start_date, end_date : pd.Timestamp
+        The first and last days of data.
+    seed : int, optional
+        The seed of all random draws.
+    first_sid : int, optional
+        The sid of the first asset. Sids are consecutive.
+    listing_fraction : float, optional
+        The fraction of assets that are listed after ``start_date``.
+    delisting_fraction : float, optional
+        The fraction of assets that are delisted before ``end_date``.
+    splits_per_year : float, optional
+        The expected number of splits of an asset per year.
+    dividend_payer_fraction : float, optional
+        The fraction of assets that pay quarterly dividends.
+    dividend_yield : float, optional
+        The annual yield of the dividends.
+    halts_per_year : float, optional
+        The expected number of trading halts of an asset per year.
+    mean_halt_days : float, optional
+        The mean length of a halt in trading days.
+    volume_sparsity : float, optional
+        Each asset has no trades in a fraction of its minutes drawn uniformly
+        between 0 and ``volume_sparsity``.
+    minute_chunk_days : int, optional
+        The number of days of minute bars generated and written at once.
+    calendar : module, optional
+        The trading calendar, with ``trading_days`` and ``open_and_closes``.
+    """
+    def __init__(self,
+                 num_assets,
+                 start_date,
+                 end_date,
+                 seed=0,
+                 first_sid=1,
+                 listing_fraction=0.2,
+                 delisting_fraction=0.2,
+                 splits_per_year=0.05,
+                 dividend_payer_fraction=0.3,
+                 dividend_yield=0.02,
+                 halts_per_year=0.2,
+                 mean_halt_days=2.0,
+                 volume_sparsity=0.5,
+                 minute_chunk_days=TRADING_DAYS_PER_YEAR,
+                 calendar=tradingcalendar):
+        if num_assets < 1:
+            raise ValueError('num_assets must be positive, got %r' % (
+                num_assets,
+            ))
+
+        trading_days = calendar.trading_days
+        self.days = days = trading_days[
+            trading_days.slice_indexer(start_date, end_date)
+        ]
+        if len(days) < MIN_LIFETIME:
+            raise ValueError(
+                'need at least %d trading days between %s and %s, got %d' % (
+                    MIN_LIFETIME,
+                    start_date,
+                    end_date,
+                    len(days),
+                ),
+            )
+        self.open_and_closes = calendar.open_and_closes.loc[days]
+
+        self.seed = seed
+        self.first_sid = first_sid
+        self.sids = np.arange(first_sid, first_sid + num_assets)
+        self.dividend_yield = dividend_yield
+        self.splits_per_year = splits_per_year
+        self.halts_per_year = halts_per_year
+        self.mean_halt_days = mean_halt_days
+        self.minute_chunk_days = minute_chunk_days
+
+        # The properties of each asset are drawn together.
+        state = np.random.RandomState(seed)
+        num_days = len(days)
+
+        self._start_locs = start_locs = np.zeros(num_assets, dtype=np.int64)
+        listed = state.random_sample(num_assets) < listing_fraction
+        start_locs[listed] = state.randint(
+            0,
+            num_days - MIN_LIFETIME + 1,
+            listed.sum(),
+        )
+
+        self._end_locs = end_locs = np.full(
+            num_assets,
+            num_days - 1,
+            dtype=np.int64,
+        )
+        delisted = state.random_sample(num_assets) < delisting_fraction
+        room = num_days - MIN_LIFETIME - start_locs[delisted]
+        end_locs[delisted] = (
+            start_locs[delisted] + MIN_LIFETIME - 1 +
+            (state.random_sample(delisted.sum()) * (room + 1)).astype(np.int64)
+        )
+
+        self._start_prices = np.exp(
+            state.uniform(np.log(5.0), np.log(200.0), num_assets),
+        )
+        self._volatilities = state.uniform(0.15, 0.6, num_assets) / np.sqrt(
+            TRADING_DAYS_PER_YEAR,
+        )
+        self._base_volumes = np.exp(
+            state.uniform(np.log(1e4), np.log(5e6), num_assets),
+        )
+        self._sparsities = state.uniform(0.0, volume_sparsity, num_assets)
+        self._dividend_payers = (
+            state.random_sample(num_assets) < dividend_payer_fraction
+        )
+        self._exchanges = state.choice(['NYSE', 'NASDAQ'], num_assets)
+
+    def _loc(self, sid):
+        loc = sid - self.first_sid
+        if not 0 <= loc < len(self.sids):
+            raise ValueError('unknown sid %r' % (sid,))
+        return loc
+
+    def _state(self, sid, *keys):
+        return np.random.RandomState([self.seed, int(sid)] + list(keys))
+
+    def equity_info(self):
+        """
+        The metadata of the assets, for ``AssetDBWriter.write``.
+        """
+        return pd.DataFrame(
+            {
+                'symbol': [_symbol(i) for i in range(len(self.sids))],
+                'asset_name': ['SYNTHETIC %d' % sid for sid in self.sids],
+                'start_date': self.days[self._start_locs],
+                'end_date': self.days[self._end_locs],
+                'exchange': self._exchanges,
+            },
+            index=self.sids,
+        )
+
+    def _events(self, sid, life):
+        """
+        The locations of the halted days, splits and dividends of ``sid`` in
+        its ``life`` trading days.
+        """
+        state = self._state(sid, _EVENTS)
+        years = life / float(TRADING_DAYS_PER_YEAR)
+
+        # Halts start on uniformly drawn days and last a geometrically
+        # distributed number of days.
+        num_halts = state.poisson(self.halts_per_year * years)
+        halt_starts = state.randint(0, life, num_halts)
+        halt_lengths = state.geometric(1.0 / self.mean_halt_days, num_halts)
+        halt_ends = np.minimum(halt_starts + halt_lengths, life)
+        halted = np.zeros(life + 1, dtype=np.int64)
+        np.add.at(halted, halt_starts, 1)
+        np.add.at(halted, halt_ends, -1)
+        halted = halted.cumsum()[:life] > 0
+
+        num_splits = state.poisson(self.splits_per_year * years)
+        split_locs = np.unique(state.randint(1, life, num_splits))
+        split_ratios = state.choice(
+            SPLIT_RATIOS,
+            len(split_locs),
+            p=SPLIT_RATIO_WEIGHTS,
+        )
+
+        if self._dividend_payers[self._loc(sid)]:
+            dividend_locs = np.arange(
+                state.randint(1, DIVIDEND_INTERVAL + 1),
+                life,
+                DIVIDEND_INTERVAL,
+            )
+        else:
+            dividend_locs = np.array([], dtype=np.int64)
+
+        return halted, split_locs, split_ratios, dividend_locs
+
+    def _generate_daily(self, sid):
+        """
+        Generate the daily bars and adjustments of ``sid``.
+
+        Returns
+        -------
+        sid : int
+        bars : pd.DataFrame
+        splits : dict[str -> np.ndarray]
+        dividends : dict[str -> np.ndarray]
+        """
+        loc = self._loc(sid)
+        start, end = self._start_locs[loc], self._end_locs[loc]
+        life = end - start + 1
+        days = self.days[start:end + 1]
+        halted, split_locs, split_ratios, dividend_locs = self._events(
+            sid,
+            life,
+        )
+
+        state = self._state(sid, _DAILY)
+        volatility = self._volatilities[loc]
+        log_bounds = np.log(MIN_PRICE), np.log(MAX_PRICE)
+
+        returns = state.normal(0.0, volatility, life)
+        returns[0] = 0.0
+        log_close = np.clip(
+            np.log(self._start_prices[loc]) + returns.cumsum(),
+            *log_bounds
+        )
+        log_open = np.empty(life)
+        log_open[0] = log_close[0]
+        log_open[1:] = log_close[:-1]
+        log_open = np.clip(
+            log_open + state.normal(0.0, volatility / 3.0, life),
+            *log_bounds
+        )
+        spread = np.abs(state.normal(0.0, volatility / 2.0, (2, life)))
+        log_high = np.maximum(log_open, log_close) + spread[0]
+        log_low = np.minimum(log_open, log_close) - spread[1]
+        volume = self._base_volumes[loc] * np.exp(state.normal(0.0, 0.5, life))
+
+        # Prices and volumes as traded: each split scales all later prices
+        # by its ratio and all later volumes by the inverse.
+        factor = np.ones(life)
+        factor[split_locs] = split_ratios
+        factor = factor.cumprod()
+
+        traded = ~halted
+        bars = pd.DataFrame(
+            {
+                'open': np.exp(log_open) * factor * traded,
+                'high': np.exp(log_high) * factor * traded,
+                'low': np.exp(log_low) * factor * traded,
+                'close': np.exp(log_close) * factor * traded,
+                'volume': np.maximum(
+                    np.round(volume / factor),
+                    MIN_DAILY_VOLUME,
+                ) * traded,
+            },
+            index=days,
+            columns=OHLCV,
+        )
+
+        splits = {
+            'sid': np.full(len(split_locs), sid, dtype=np.int64),
+            'effective_date': days[split_locs].asi8 // 10 ** 9,
+            'ratio': split_ratios,
+        }
+
+        # Dividends are a quarter of the annual yield on the close of the day
+        # before the ex date. SQLiteAdjustmentWriter computes the dividend
+        # ratio from that day's close, which a halt would leave at zero, so
+        # dividends whose ex date follows a halted day are dropped.
+        close = bars['close'].values
+        dividend_locs = dividend_locs[traded[dividend_locs - 1]]
+        amounts = np.round(
+            close[dividend_locs - 1] * self.dividend_yield / 4,
+            2,
+        )
+        dividend_locs = dividend_locs[amounts > 0]
+        amounts = amounts[amounts > 0]
+        ex_dates = days[dividend_locs].values
+        dividends = {
+            'sid': np.full(len(dividend_locs), sid, dtype=np.int64),
+            'amount': amounts,
+            'ex_date': ex_dates,
+            'declared_date': ex_dates - np.timedelta64(14, 'D'),
+            'record_date': ex_dates + np.timedelta64(2, 'D'),
+            'pay_date': ex_dates + np.timedelta64(21, 'D'),
+        }
+        return sid, bars, splits, dividends
+
+    def daily_bars(self, sid):
+        """
+        The daily bars of ``sid`` over its lifetime, as traded.
+
+        Halted days have bars of zeros.
+        """
+        return self._generate_daily(sid)[1]
+
+    def adjustments(self, sid):
+        """
+        The splits and dividends of ``sid``.
+
+        Returns
+        -------
+        splits, dividends : pd.DataFrame
+            Frames in the formats accepted by ``SQLiteAdjustmentWriter``.
+        """
+        _, _, splits, dividends = self._generate_daily(sid)
+        return pd.DataFrame(splits), pd.DataFrame(dividends)
+
+    def minute_bars(self, sid):
+        """
+        The minute bars of ``sid``, in chunks of ``minute_chunk_days`` days.
+
+        Yields
+        ------
+        bars : pd.DataFrame
+            The bars of every minute of the trading sessions of the chunk,
+            with zeros for minutes without trades. Halted days are left out.
+        """
+        loc = self._loc(sid)
+        start = self._start_locs[loc]
+        _, daily, _, _ = self._generate_daily(sid)
+        for chunk, chunk_start in enumerate(
+                range(0, len(daily), self.minute_chunk_days)):
+            bars = self._minute_chunk(
+                sid,
+                chunk,
+                daily.iloc[chunk_start:chunk_start + self.minute_chunk_days],
+                start + chunk_start,
+            )
+            if len(bars):
+                yield bars
+
+    def _minute_chunk(self, sid, chunk, daily, day_loc):
+        state = self._state(sid, _MINUTE, chunk)
+        loc = self._loc(sid)
+        num_days = len(daily)
+        width = US_EQUITIES_MINUTES_PER_DAY
+        rows = np.arange(num_days)
+        minutes = np.arange(width)
+
+        open_and_closes = self.open_and_closes.iloc[
+            day_loc:day_loc + num_days
+        ]
+        opens, closes = (
+            open_and_closes[name].values.astype('datetime64[ns]')
+            for name in ('market_open', 'market_close')
+        )
+        session_lengths = (
+            (closes - opens).view(np.int64) // NANOS_IN_MINUTE + 1
+        )
+        last = session_lengths - 1
+        in_session = minutes < session_lengths[:, None]
+
+        volume = daily['volume'].values
+        traded_day = volume > 0
+        # Halted days are generated as if they had prices of 1, and dropped.
+        o, h, l, c = (
+            np.where(traded_day, daily[name].values, 1.0)[:, None]
+            for name in ('open', 'high', 'low', 'close')
+        )
+
+        # A random walk bridged from the open at the first minute to the close
+        # at the last minute of the session, bounded by the low and high.
+        noise = state.standard_normal((num_days, width)) * (
+            self._volatilities[loc] / np.sqrt(width)
+        )
+        noise[:, 0] = 0.0
+        noise[~in_session] = 0.0
+        walk = noise.cumsum(axis=1)
+        progress = np.minimum(minutes / last[:, None].astype(np.float64), 1.0)
+        log_close = (
+            np.log(o) +
+            progress * (np.log(c) - np.log(o)) +
+            walk -
+            progress * walk[rows, last][:, None]
+        )
+        close = np.exp(np.clip(log_close, np.log(l), np.log(h)))
+        open_ = np.empty_like(close)
+        open_[:, 0] = o[:, 0]
+        open_[:, 1:] = close[:, :-1]
+        wick = np.exp(np.abs(noise))
+        high = np.minimum(np.maximum(open_, close) * wick, h)
+        low = np.maximum(np.minimum(open_, close) / wick, l)
+
+        traded = in_session & (
+            state.random_sample((num_days, width)) >= self._sparsities[loc]
+        )
+        traded[:, 0] = True
+        traded[rows, last] = True
+        traded &= traded_day[:, None]
+
+        # The day's high and low are reached at a random traded minute.
+        picks = state.random_sample((2, num_days, width)) * traded
+        high[rows, picks[0].argmax(axis=1)] = h[:, 0]
+        low[rows, picks[1].argmax(axis=1)] = l[:, 0]
+
+        # Every traded minute has some volume, and the rest of the day's
+        # volume is spread over them at random.
+        weights = state.exponential(size=(num_days, width)) * traded
+        counts = traded.sum(axis=1)
+        totals = weights.sum(axis=1)
+        totals[totals == 0] = 1.0
+        minute_volume = traded + np.floor(
+            weights * (np.maximum(volume - counts, 0) / totals)[:, None]
+        )
+        minute_volume[rows, last] += (
+            volume - minute_volume.sum(axis=1)
+        ) * traded_day
+
+        keep = in_session & traded_day[:, None]
+        dts = opens[:, None] + minutes.astype('timedelta64[m]')
+        return pd.DataFrame(
+            {
+                'open': (open_ * traded)[keep],
+                'high': (high * traded)[keep],
+                'low': (low * traded)[keep],
+                'close': (close * traded)[keep],
+                'volume': minute_volume[keep],
+            },
+            index=pd.to_datetime(dts[keep], utc=True),
+            columns=OHLCV,
+        )
+
+    def _write_minute_bars(self, writer, sid):
+        bars = 0
+        for chunk in self.minute_bars(sid):
+            writer.write(sid, chunk)
+            bars += len(chunk)
+        return sid, bars
+
+    def _map(self, func, processes, *initargs):
+        """
+        Apply ``func`` to every sid, in ``processes`` worker processes if
+        given. Results are yielded as they complete.
+        """
+        if not processes:
+            _init_synthetic_worker(self, *initargs)
+            for sid in self.sids:
+                yield func(sid)
+            return
+
+        pool = Pool(
+            processes,
+            initializer=_init_synthetic_worker,
+            initargs=(self,) + initargs,
+        )
+        try:
+            for result in pool.imap_unordered(func, self.sids, chunksize=4):
+                yield result
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def write_assets(self, path):
+        """
+        Write the asset db to ``path``.
+        """
+        AssetDBWriter(path).write(equities=self.equity_info())
+
+    def write_daily_bars(self,
+                         path,
+                         adjustments_path,
+                         processes=None,
+                         show_progress=False):
+        """
+        Write the daily bars to ``path`` and the splits and dividends to the
+        sqlite file ``adjustments_path``.
+
+        Parameters
+        ----------
+        path : str
+            The directory of the daily bar table.
+        adjustments_path : str
+            The adjustments db, which is replaced if it exists.
+        processes : int, optional
+            The number of worker processes to generate the bars with.
+        show_progress : bool, optional
+            Whether to show a progress bar.
+        """
+        splits = []
+        dividends = []
+
+        def bars():
+            for sid, frame, sid_splits, sid_dividends in self._map(
+                    _generate_daily_sid,
+                    processes):
+                splits.append(sid_splits)
+                dividends.append(sid_dividends)
+                yield sid, frame
+
+        BcolzDailyBarWriter(path, self.days).write(
+            bars(),
+            assets=self.sids,
+            show_progress=show_progress,
+        )
+
+        def concat(parts):
+            return pd.DataFrame({
+                name: np.concatenate([part[name] for part in parts])
+                for name in parts[0]
+            })
+
+        SQLiteAdjustmentWriter(
+            adjustments_path,
+            BcolzDailyBarReader(path),
+            self.days,
+            overwrite=True,
+        ).write(splits=concat(splits), dividends=concat(dividends))
+
+    def write_minute_bars(self, path, processes=None, show_progress=False):
+        """
+        Write the minute bars to the directory ``path``.
+
+        Parameters
+        ----------
+        path : str
+            The root directory of the minute bars.
+        processes : int, optional
+            The number of worker processes to generate and write the bars
+            with. Each writes whole sids, one chunk of days at a time.
+        show_progress : bool, optional
+            Whether to show a progress bar.
+
+        Returns
+        -------
+        summary : MinuteBarIngestionSummary
+            The number of sids and bars written, and how long it took.
+        """
+        start = default_timer()
+        writer = BcolzMinuteBarWriter(
+            self.days[0],
+            path,
+            self.open_and_closes['market_open'],
+            self.open_and_closes['market_close'],
+            US_EQUITIES_MINUTES_PER_DAY,
+        )
+        sids = bars = 0
+        with maybe_show_progress(
+                self._map(_write_minute_sid, processes, writer),
+                show_progress,
+                length=len(self.sids),
+                label='Writing synthetic minute bars:') as it:
+            for _, count in it:
+                sids += 1
+                bars += count
+
+        summary = MinuteBarIngestionSummary(
+            sids,
+            bars,
+            default_timer() - start,
+        )
+        logger.info(
+            'Wrote {0.bars} synthetic minute bars for {0.sids} sids in '
+            '{0.seconds:.2f} seconds ({1:.0f} bars per second).',
+            summary,
+            summary.bars_per_second,
+        )
+        return summary
+
+    def write(self, root, minute=True, processes=None, show_progress=False):
+        """
+        Write the asset db, daily bars, adjustments and, optionally, minute
+        bars to the directory ``root``.
+
+        Parameters
+        ----------
+        root : str
+            The directory to write to. It is created if it does not exist.
+        minute : bool, optional
+            Whether to write minute bars.
+        processes : int, optional
+            The number of worker processes to generate the bars with.
+        show_progress : bool, optional
+            Whether to show progress bars.
+
+        Returns
+        -------
+        paths : SyntheticDatasetPaths
+            The paths of the written data.
+        """
+        if not os.path.isdir(root):
+            os.makedirs(root)
+
+        paths = SyntheticDatasetPaths(
+            assets=os.path.join(root, 'assets.sqlite'),
+            daily_bars=os.path.join(root, 'daily_equities.bcolz'),
+            adjustments=os.path.join(root, 'adjustments.sqlite'),
+            minute_bars=(
+                os.path.join(root, 'minute_equities') if minute else None
+            ),
+        )
+        self.write_assets(paths.assets)
+        self.write_daily_bars(
+            paths.daily_bars,
+            paths.adjustments,
+            processes=processes,
+            show_progress=show_progress,
+        )
+        if minute:
+            self.write_minute_bars(
+                paths.minute_bars,
+                processes=processes,
+                show_progress=show_progress,
+            )
+        return paths
@@ -17,6 +17,7 @@ from abc import (
     abstractmethod,
     abstractproperty,
 )
+from timeit import default_timer
 
 from cachetools import LRUCache
 from numpy import dtype, around, hstack
@@ -28,6 +29,7 @@ from zipline.pipeline.data.equity_pricing import USEquityPricing
 from zipline.lib._float64window import AdjustedArrayWindow as Float64Window
 from zipline.lib.adjustment import Float64Multiply
 from zipline.utils.cache import ExpiringCache
+from zipline.utils.instrumentation import DataAccessStats
 from zipline.utils.memoize import lazyval
 
 
@@ -79,6 +81,12 @@ class USEquityHistoryLoader(with_metaclass(ABCMeta)):
         Reader for pricing bars.
     adjustment_reader : SQLiteAdjustmentReader
         Reader for adjustment data.
+
+    Attributes
+    ----------
+    stats : zipline.utils.instrumentation.DataAccessStats
+        Counters for sliding window cache hits, misses, expirations and
+        rebuilds, and timers for history requests and window prefetches.
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume')
 
@@ -86,8 +94,10 @@ class USEquityHistoryLoader(with_metaclass(ABCMeta)):
         self.env = env
         self._reader = reader
         self._adjustments_reader = adjustment_reader
+        self.stats = DataAccessStats()
         self._window_blocks = {
-            field: ExpiringCache(LRUCache(maxsize=sid_cache_size))
+            field: ExpiringCache(LRUCache(maxsize=sid_cache_size),
+                                 stats=self.stats)
             for field in self.FIELDS
         }
 
@@ -226,6 +236,8 @@ class USEquityHistoryLoader(with_metaclass(ABCMeta)):
                 needed_assets.append(asset)
 
         if needed_assets:
+            self.stats.incr('window_rebuilds', len(needed_assets))
+            prefetch_start = default_timer()
             start = dts[0]
 
             offset = 0
@@ -260,6 +272,8 @@ class USEquityHistoryLoader(with_metaclass(ABCMeta)):
                 self._window_blocks[field].set((asset, size),
                                                sliding_window,
                                                prefetch_end)
+            self.stats.add_time('window_prefetches',
+                                default_timer() - prefetch_start)
 
         return [asset_windows[asset] for asset in assets]
 
@@ -284,9 +298,10 @@ class USEquityHistoryLoader(with_metaclass(ABCMeta)):
         -------
         out : np.ndarray with shape(len(days between start, end), len(assets))
         """
-        block = self._ensure_sliding_windows(assets, dts, field)
-        end_ix = self._calendar.get_loc(dts[-1])
-        return hstack([window.get(end_ix) for window in block])
+        with self.stats.timer('history_windows'):
+            block = self._ensure_sliding_windows(assets, dts, field)
+            end_ix = self._calendar.get_loc(dts[-1])
+            return hstack([window.get(end_ix) for window in block])
 
 
 class USEquityDailyHistoryLoader(USEquityHistoryLoader):
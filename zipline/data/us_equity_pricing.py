@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+from contextlib import contextmanager
 from errno import ENOENT
 from functools import partial
+from multiprocessing import Pool
+import os
 from os import remove
-from os.path import exists
+from os.path import basename, exists, isdir, join
+import shutil
 import sqlite3
+from tempfile import mkdtemp
+from threading import Lock
 import warnings
 
 from bcolz import (
@@ -37,6 +43,7 @@ from numpy import (
     issubdtype,
     nan,
     uint32,
+    where,
     zeros,
 )
 from pandas import (
@@ -50,18 +57,27 @@ from pandas import (
 from pandas.tslib import iNaT
 from six import (
     iteritems,
+    string_types,
     with_metaclass,
     viewkeys,
 )
 
+from zipline.utils.atomic_write import atomic_write_file
 from zipline.utils.functional import apply
+from zipline.utils.instrumentation import DataAccessStats
 from zipline.utils.input_validation import (
     coerce_string,
     preprocess,
     expect_element,
 )
-from zipline.utils.sqlite_utils import group_into_chunks
+from zipline.utils.sqlite_utils import (
+    DEFAULT_MMAP_SIZE,
+    SQLITE_MODES,
+    connect_sqlite,
+    group_into_chunks,
+)
 from zipline.utils.memoize import lazyval
+from zipline.utils.pool import imap_bounded
 from zipline.utils.cli import maybe_show_progress
 from ._equities import _compute_row_slices, _read_bcolz_data
 from ._adjustments import load_adjustments_from_sqlite
@@ -100,6 +116,53 @@ SQLITE_STOCK_DIVIDEND_PAYOUT_COLUMN_DTYPES = {
 }
 UINT32_MAX = iinfo(uint32).max
 
+#: The file naming the current version of an appended daily bar table.
+CURRENT_VERSION_FILE = '__current__'
+
+#: The prefix of the directory names of the versions of an appended table.
+VERSION_PREFIX = 'version-'
+
+
+def _current_version(path):
+    """
+    Return the name of the current version of the daily bar table at
+    ``path``, or None if the table has never been appended to.
+    """
+    try:
+        with open(join(path, CURRENT_VERSION_FILE)) as f:
+            return f.read()
+    except IOError as e:
+        if e.errno != ENOENT:
+            raise
+        return None
+
+
+def open_daily_bar_table(path, mode='r'):
+    """
+    Open the daily bar table at ``path``.
+
+    ``BcolzDailyBarWriter.write`` stores the table at ``path`` itself. Once
+    it has been appended to, ``path`` holds versions of the table in
+    subdirectories and a ``CURRENT_VERSION_FILE`` naming the current one.
+    The version before the current one is kept until the next append.
+
+    Parameters
+    ----------
+    path : str
+        The path the table was written to.
+    mode : str, optional
+        The mode to open the table in. Default is 'r'.
+
+    Returns
+    -------
+    table : bcolz.ctable
+        The current version of the table.
+    """
+    version = _current_version(path)
+    if version is None:
+        return open_ctable(path, mode=mode)
+    return open_ctable(join(path, version), mode=mode)
+
 
 class NoDataOnDate(Exception):
     """
@@ -179,6 +242,77 @@ def to_ctable(raw_data, invalid_data_behavior):
     return ctable.fromdataframe(processed)
 
 
+@expect_element(invalid_data_behavior={'warn', 'raise', 'ignore'})
+def to_uint32_columns(raw_data, invalid_data_behavior):
+    """
+    Convert a DataFrame of daily OHLCV bars to the uint32 columns stored by
+    ``BcolzDailyBarWriter``.
+
+    Unlike ``to_ctable`` this makes one array per column and no intermediate
+    DataFrame or ctable.
+
+    Parameters
+    ----------
+    raw_data : pd.DataFrame or bcolz.ctable
+        The bars for one asset, indexed by day. ctables are returned as is.
+    invalid_data_behavior : {'warn', 'raise', 'ignore'}
+        What to do when data is encountered that is outside the range of a
+        uint32.
+
+    Returns
+    -------
+    columns : dict[str -> np.ndarray[uint32]] or bcolz.ctable
+        The open, high, low, close, volume and day columns.
+    """
+    if isinstance(raw_data, ctable):
+        return raw_data
+
+    winsorise_uint32(raw_data, invalid_data_behavior, 'volume', *OHLC)
+    columns = {
+        name: (raw_data[name].values * 1000).astype(uint32)
+        for name in OHLC
+    }
+    dates = raw_data.index.values.astype('datetime64[s]')
+    if len(dates):
+        check_uint32_safe(dates.max().view(np.int64), 'day')
+    columns['day'] = dates.astype(uint32)
+    columns['volume'] = raw_data['volume'].values.astype(uint32)
+    return columns
+
+
+def _convert_frame(args):
+    sid, raw_data, invalid_data_behavior = args
+    return sid, to_uint32_columns(raw_data, invalid_data_behavior)
+
+
+def _convert_frames(data, invalid_data_behavior, processes=None):
+    """
+    Lazily apply ``to_uint32_columns`` to each (sid, frame) pair of ``data``,
+    optionally in a pool of ``processes`` worker processes.
+    """
+    tasks = (
+        (sid, raw_data, invalid_data_behavior) for sid, raw_data in data
+    )
+    if not processes:
+        for task in tasks:
+            yield _convert_frame(task)
+        return
+
+    # Convert one batch while the previous one is being written.
+    pool = Pool(processes)
+    try:
+        for converted in imap_bounded(
+                pool,
+                _convert_frame,
+                tasks,
+                batch_size=4 * processes):
+            yield converted
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 class BcolzDailyBarWriter(object):
     """
     Class capable of writing daily OHLCV data to disk in a format that can be
@@ -218,13 +352,17 @@ class BcolzDailyBarWriter(object):
               data,
               assets=None,
               show_progress=False,
-              invalid_data_behavior='warn'):
+              invalid_data_behavior='warn',
+              processes=None):
         """
         Parameters
         ----------
         data : iterable[tuple[int, pandas.DataFrame or bcolz.ctable]]
             The data chunks to write. Each chunk should be a tuple of sid
-            and the data for that asset.
+            and the data for that asset. ``data`` is consumed lazily and each
+            chunk is appended to the table on disk as soon as it is
+            converted, so ``data`` may be a generator over any number of
+            assets.
         assets : set[int], optional
             The assets that should be in ``data``. If this is provided
             we will check ``data`` against the assets and provide better
@@ -234,6 +372,10 @@ class BcolzDailyBarWriter(object):
         invalid_data_behavior : {'warn', 'raise', 'ignore'}
             What to do when data is encountered that is outside the range of
             a uint32.
+        processes : int, optional
+            If given, convert and validate DataFrames in a pool of this many
+            worker processes. At most two batches of ``4 * processes`` chunks
+            are held in memory at once.
 
         Returns
         -------
@@ -241,7 +383,7 @@ class BcolzDailyBarWriter(object):
             The newly-written table.
         """
         ctx = maybe_show_progress(
-            ((sid, to_ctable(df, invalid_data_behavior)) for sid, df in data),
+            _convert_frames(data, invalid_data_behavior, processes),
             show_progress=show_progress,
             item_show_func=self.progress_bar_item_show_func,
             label=self.progress_bar_message,
@@ -284,18 +426,25 @@ class BcolzDailyBarWriter(object):
         """
         Internal implementation of write.
 
-        `iterator` should be an iterator yielding pairs of (asset, ctable).
+        `iterator` should be an iterator yielding pairs of (asset, table),
+        where table is a ctable or a dict of uint32 arrays as returned by
+        ``to_uint32_columns``. Each table is appended to the on-disk columns
+        as it arrives, so only one asset's data is held in memory at a time.
         """
         total_rows = 0
         first_row = {}
         last_row = {}
         calendar_offset = {}
 
-        # Maps column name -> output carray.
-        columns = {
-            k: carray(array([], dtype=uint32))
-            for k in US_EQUITY_PRICING_BCOLZ_COLUMNS
-        }
+        full_table = ctable(
+            columns=[
+                carray(array([], dtype=uint32))
+                for _ in US_EQUITY_PRICING_BCOLZ_COLUMNS
+            ],
+            names=US_EQUITY_PRICING_BCOLZ_COLUMNS,
+            rootdir=self._filename,
+            mode='w',
+        )
 
         earliest_date = None
         calendar = self._calendar
@@ -309,22 +458,24 @@ class BcolzDailyBarWriter(object):
                     yield asset_id, table
 
         for asset_id, table in iterator:
-            nrows = len(table)
-            for column_name in columns:
-                if column_name == 'id':
-                    # We know what the content of this column is, so don't
-                    # bother reading it.
-                    columns['id'].append(
-                        full((nrows,), asset_id, dtype='uint32'),
-                    )
-                    continue
+            days = table['day'][:]
+            nrows = len(days)
+            if not nrows:
+                continue
 
-                columns[column_name].append(table[column_name])
+            full_table.append([
+                # We know what the content of the id column is, so don't
+                # bother reading it.
+                full((nrows,), asset_id, dtype=uint32)
+                if column_name == 'id' else
+                table[column_name][:]
+                for column_name in US_EQUITY_PRICING_BCOLZ_COLUMNS
+            ])
 
             if earliest_date is None:
-                earliest_date = table["day"][0]
+                earliest_date = days[0]
             else:
-                earliest_date = min(earliest_date, table["day"][0])
+                earliest_date = min(earliest_date, days[0])
 
             # Bcolz doesn't support ints as keys in `attrs`, so convert
             # assets to strings for use as attr keys.
@@ -340,22 +491,11 @@ class BcolzDailyBarWriter(object):
             # Calculate the number of trading days between the first date
             # in the stored data and the first date of **this** asset. This
             # offset used for output alignment by the reader.
-            asset_first_day = table['day'][0]
             calendar_offset[asset_key] = calendar.get_loc(
-                Timestamp(asset_first_day, unit='s', tz='UTC'),
+                Timestamp(days[0], unit='s', tz='UTC'),
             )
 
-        # This writes the table to disk.
-        full_table = ctable(
-            columns=[
-                columns[colname]
-                for colname in US_EQUITY_PRICING_BCOLZ_COLUMNS
-            ],
-            names=US_EQUITY_PRICING_BCOLZ_COLUMNS,
-            rootdir=self._filename,
-            mode='w',
-        )
-
+        full_table.flush()
         full_table.attrs['first_trading_day'] = (
             earliest_date // 1e6
             if earliest_date is not None else
@@ -367,6 +507,369 @@ class BcolzDailyBarWriter(object):
         full_table.attrs['calendar'] = calendar.asi8.tolist()
         return full_table
 
+    #: The number of existing rows copied at a time by ``append``.
+    APPEND_BATCH_ROWS = 2 ** 20
+
+    def append(self,
+               data,
+               show_progress=False,
+               invalid_data_behavior='warn',
+               processes=None):
+        """
+        Add days to the end of an existing table.
+
+        This rewrites the whole table, so it takes time and disk space
+        proportional to the size of the table, not of ``data``. The rows of
+        each sid are stored as one block, so the new rows are inserted after
+        each sid's block while the existing rows are copied in batches. Only
+        ``data`` is converted and validated; the existing rows are copied as
+        they are, and the ``first_row``, ``last_row`` and ``calendar_offset``
+        attributes are shifted by the number of rows inserted before each
+        block rather than recomputed.
+
+        The new table is written as a new version inside ``filename``, and a
+        pointer file naming the current version is then atomically replaced,
+        so readers which open ``filename`` with ``open_daily_bar_table`` or
+        ``BcolzDailyBarReader`` see either the old or the new table, never a
+        partial or missing one. The previous version is kept, so readers
+        opened before the append keep working; it is removed by the next
+        append, so they should be reopened before then.
+
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame or bcolz.ctable]]
+            The new data of each sid, in the format accepted by ``write``.
+            The data of a sid already in the table must start on the trading
+            day after its last row; new sids may start on any day.
+        show_progress : bool
+            Whether or not to show a progress bar while converting ``data``.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}
+            What to do when data is encountered that is outside the range of
+            a uint32.
+        processes : int, optional
+            If given, convert and validate DataFrames in a pool of this many
+            worker processes.
+
+        Returns
+        -------
+        table : bcolz.ctable
+            The updated table.
+
+        Raises
+        ------
+        ValueError
+            If the writer's calendar doesn't extend the table's calendar, or
+            if the data of a sid is not on consecutive trading days directly
+            after its existing rows.
+        """
+        ctx = maybe_show_progress(
+            _convert_frames(data, invalid_data_behavior, processes),
+            show_progress=show_progress,
+            item_show_func=self.progress_bar_item_show_func,
+            label=self.progress_bar_message,
+        )
+        new_rows = {}
+        with ctx as it:
+            for asset_id, table in it:
+                if asset_id in new_rows:
+                    raise ValueError('duplicate asset id %r' % asset_id)
+                if not len(table['day']):
+                    continue
+                new_rows[asset_id] = {
+                    name: table[name][:]
+                    for name in US_EQUITY_PRICING_BCOLZ_COLUMNS
+                    if name != 'id'
+                }
+        return self._append_internal(new_rows)
+
+    def _append_internal(self, new_rows):
+        """
+        Internal implementation of append.
+
+        ``new_rows`` maps each sid to the dict of uint32 columns to add.
+        """
+        current = _current_version(self._filename)
+        self._remove_old_versions(current)
+        existing = open_daily_bar_table(self._filename)
+        attrs = existing.attrs
+        calendar = self._calendar
+        calendar_values = calendar.asi8
+
+        old_calendar = np.asarray(attrs['calendar'], dtype=int64)
+        if len(old_calendar) > len(calendar_values) or (
+                calendar_values[:len(old_calendar)] != old_calendar).any():
+            raise ValueError(
+                'the calendar of %s is not a prefix of the writer calendar' %
+                self._filename,
+            )
+
+        first_row = {int(k): v for k, v in iteritems(attrs['first_row'])}
+        last_row = {int(k): v for k, v in iteritems(attrs['last_row'])}
+        calendar_offset = {
+            int(k): v for k, v in iteritems(attrs['calendar_offset'])
+        }
+        total_rows = len(existing)
+        if sum(last_row[sid] - first_row[sid] + 1 for sid in first_row) != \
+                total_rows:
+            raise ValueError(
+                'the row attributes of %s do not cover its %d rows' % (
+                    self._filename,
+                    total_rows,
+                ),
+            )
+
+        # Check that every sid's new rows fall on consecutive trading days
+        # directly after its existing rows, so the readers' offset arithmetic
+        # stays valid.
+        for asset_id, columns in iteritems(new_rows):
+            days = columns['day'].astype(int64) * int(1e9)
+            locs = calendar_values.searchsorted(days)
+            if (locs == len(calendar_values)).any() or \
+                    (calendar_values[locs.clip(0, len(calendar_values) - 1)]
+                     != days).any():
+                raise ValueError(
+                    'data for asset id %r has days outside of the calendar' %
+                    asset_id,
+                )
+            if (np.diff(locs) != 1).any():
+                raise ValueError(
+                    'data for asset id %r is not on consecutive trading days' %
+                    asset_id,
+                )
+            if asset_id in first_row:
+                next_loc = calendar_offset[asset_id] + (
+                    last_row[asset_id] - first_row[asset_id] + 1
+                )
+                if locs[0] != next_loc:
+                    raise ValueError(
+                        'data for asset id %r starts on %s, but its existing'
+                        ' data ends on %s' % (
+                            asset_id,
+                            calendar[locs[0]].date(),
+                            calendar[next_loc - 1].date(),
+                        ),
+                    )
+            else:
+                calendar_offset[asset_id] = int(locs[0])
+
+        version = mkdtemp(prefix=VERSION_PREFIX, dir=self._filename)
+        full_table = ctable(
+            columns=[
+                carray(array([], dtype=uint32))
+                for _ in US_EQUITY_PRICING_BCOLZ_COLUMNS
+            ],
+            names=US_EQUITY_PRICING_BCOLZ_COLUMNS,
+            rootdir=version,
+            mode='w',
+        )
+
+        try:
+            new_first_row, new_last_row = self._copy_with_appended_rows(
+                existing,
+                full_table,
+                first_row,
+                last_row,
+                new_rows,
+            )
+            full_table.flush()
+
+            expected_rows = total_rows + sum(
+                len(columns['day']) for columns in new_rows.values()
+            )
+            if len(full_table) != expected_rows:
+                raise ValueError(
+                    'appended table has %d rows, expected %d' % (
+                        len(full_table),
+                        expected_rows,
+                    ),
+                )
+
+            earliest_date = attrs['first_trading_day']
+            if earliest_date == iNaT and new_rows:
+                earliest_date = min(
+                    columns['day'][0] for columns in new_rows.values()
+                ) // 1e6
+            full_table.attrs['first_trading_day'] = earliest_date
+            full_table.attrs['first_row'] = {
+                str(k): v for k, v in iteritems(new_first_row)
+            }
+            full_table.attrs['last_row'] = {
+                str(k): v for k, v in iteritems(new_last_row)
+            }
+            full_table.attrs['calendar_offset'] = {
+                str(k): v for k, v in iteritems(calendar_offset)
+            }
+            full_table.attrs['calendar'] = calendar_values.tolist()
+        except Exception:
+            shutil.rmtree(version, ignore_errors=True)
+            raise
+
+        # Point readers at the new version. Replacing the pointer file is a
+        # single rename, so there is no moment at which neither version is
+        # current. The old version is left in place for readers which already
+        # opened it, or which read the old pointer just before the switch,
+        # and is removed by the next append.
+        with atomic_write_file(
+                join(self._filename, CURRENT_VERSION_FILE)) as tmp:
+            with open(tmp, 'w') as f:
+                f.write(basename(version))
+        return open_ctable(version, mode='r')
+
+    def _remove_old_versions(self, current):
+        """
+        Remove everything in the table directory except the ``current``
+        version and the file naming it. This includes the files of a table
+        stored at the top level by ``write``, once it is no longer current,
+        and anything left over by an append which failed before its new
+        version became current.
+        """
+        for name in os.listdir(self._filename):
+            if current is None:
+                # The table stored at the top level is current, so only
+                # leftover versions are removed.
+                if not name.startswith(VERSION_PREFIX):
+                    continue
+            elif name in (CURRENT_VERSION_FILE, current):
+                continue
+            path = join(self._filename, name)
+            if isdir(path):
+                shutil.rmtree(path)
+            else:
+                remove(path)
+
+    def _copy_with_appended_rows(self,
+                                 existing,
+                                 full_table,
+                                 first_row,
+                                 last_row,
+                                 new_rows):
+        """
+        Copy the rows of ``existing`` into ``full_table`` in batches of whole
+        sid blocks, inserting each sid's new rows after its block. Sids which
+        are not yet in the table are added at the end.
+
+        Returns the new first_row and last_row of every sid.
+        """
+        new_first_row = {}
+        new_last_row = {}
+        shift = 0
+
+        blocks = sorted(first_row, key=first_row.__getitem__)
+        batch_size = self.APPEND_BATCH_ROWS
+        i = 0
+        while i < len(blocks):
+            # Take whole blocks until the batch is full.
+            start = first_row[blocks[i]]
+            j = i
+            while j < len(blocks) and (
+                    j == i or last_row[blocks[j]] - start < batch_size):
+                j += 1
+            batch = blocks[i:j]
+            stop = last_row[batch[-1]] + 1
+
+            positions = []
+            values = {name: [] for name in US_EQUITY_PRICING_BCOLZ_COLUMNS}
+            for asset_id in batch:
+                count = 0
+                if asset_id in new_rows:
+                    columns = new_rows[asset_id]
+                    count = len(columns['day'])
+                    positions.append(full(
+                        count,
+                        last_row[asset_id] + 1 - start,
+                        dtype=int64,
+                    ))
+                    for name, column in iteritems(columns):
+                        values[name].append(column)
+                    values['id'].append(full(count, asset_id, dtype=uint32))
+
+                new_first_row[asset_id] = first_row[asset_id] + shift
+                shift += count
+                new_last_row[asset_id] = last_row[asset_id] + shift
+
+            if positions:
+                positions = np.concatenate(positions)
+                full_table.append([
+                    np.insert(
+                        existing[name][start:stop],
+                        positions,
+                        np.concatenate(values[name]),
+                    )
+                    for name in US_EQUITY_PRICING_BCOLZ_COLUMNS
+                ])
+            else:
+                full_table.append([
+                    existing[name][start:stop]
+                    for name in US_EQUITY_PRICING_BCOLZ_COLUMNS
+                ])
+            i = j
+
+        total_rows = len(existing) + shift
+        for asset_id in sorted(set(new_rows) - set(first_row)):
+            columns = new_rows[asset_id]
+            nrows = len(columns['day'])
+            full_table.append([
+                full((nrows,), asset_id, dtype=uint32)
+                if name == 'id' else
+                columns[name]
+                for name in US_EQUITY_PRICING_BCOLZ_COLUMNS
+            ])
+            new_first_row[asset_id] = total_rows
+            new_last_row[asset_id] = total_rows + nrows - 1
+            total_rows += nrows
+
+        return new_first_row, new_last_row
+
+
+def day_locs(calendar, days):
+    """
+    The positions of ``days`` in ``calendar``, or -1 for days which are not
+    in it.
+
+    Parameters
+    ----------
+    calendar : pd.DatetimeIndex
+        The sorted calendar.
+    days : array-like of datetime64
+        UTC midnights.
+
+    Returns
+    -------
+    locs : np.ndarray[int64]
+    """
+    values = calendar.asi8
+    days = np.asarray(days, dtype='datetime64[ns]').view(int64)
+    locs = values.searchsorted(days)
+    found = locs < len(values)
+    found[found] = values[locs[found]] == days[found]
+    return np.where(found, locs, -1)
+
+
+def raw_to_spot_prices(raw, colname):
+    """
+    Convert stored uint32 values to the values returned by ``spot_price``:
+    prices are scaled, and 0 becomes -1.
+    """
+    prices = raw.astype(float64)
+    if colname != 'volume':
+        prices *= 0.001
+    prices[raw == 0] = -1
+    return prices
+
+
+def spot_prices_by_row(reader, sids, days, colname):
+    """
+    ``DailyBarReader.spot_prices`` implemented with one ``spot_price`` call
+    per row. This works with any object that has a ``spot_price`` method.
+    """
+    out = full(len(sids), nan)
+    for i, (sid, day) in enumerate(zip(sids, days)):
+        try:
+            out[i] = reader.spot_price(sid, Timestamp(day, tz='UTC'), colname)
+        except NoDataOnDate:
+            pass
+    return out
+
 
 class DailyBarReader(with_metaclass(ABCMeta)):
     """
@@ -380,6 +883,27 @@ class DailyBarReader(with_metaclass(ABCMeta)):
     def spot_price(self, sid, day, colname):
         pass
 
+    def spot_prices(self, sids, days, colname):
+        """
+        ``spot_price`` for many (sid, day) pairs at once.
+
+        Parameters
+        ----------
+        sids : array-like of int
+            The asset identifiers.
+        days : array-like of datetime64
+            The UTC midnight of the day to read for each sid.
+        colname : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        prices : np.ndarray[float64]
+            The value ``spot_price`` returns for each pair, or NaN where it
+            would raise NoDataOnDate.
+        """
+        return spot_prices_by_row(self, sids, days, colname)
+
     @abstractproperty
     def last_available_dt(self):
         pass
@@ -436,11 +960,27 @@ class BcolzDailyBarReader(DailyBarReader):
 
     We use calendar_offset and calendar to orient loaded blocks within a
     range of queried dates.
+
+    The reader records its activity in ``stats``, a
+    ``zipline.utils.instrumentation.DataAccessStats`` with the following
+    entries:
+
+    spot_reads : count
+        Number of calls to ``spot_price``.
+    column_reads : count
+        Number of full columns read into memory for spot lookups.
+    raw_array_reads : count and timer
+        Number of calls to ``load_raw_arrays`` and the time spent in them.
+    raw_array_cells : count
+        Number of (day, asset, column) values returned by ``load_raw_arrays``.
+    bytes_decompressed : count
+        Number of bytes read out of compressed bcolz columns.
     """
-    @preprocess(table=coerce_string(open_ctable, mode='r'))
+    @preprocess(table=coerce_string(open_daily_bar_table))
     def __init__(self, table):
 
         self._table = table
+        self.stats = DataAccessStats()
         # Cache of fully read np.array for the carrays in the daily bar table.
         # raw_array does not use the same cache, but it could.
         # Need to test keeping the entire array in memory for the course of a
@@ -537,22 +1077,31 @@ class BcolzDailyBarReader(DailyBarReader):
         )
 
     def load_raw_arrays(self, columns, start_date, end_date, assets):
-        # Assumes that the given dates are actually in calendar.
-        start_idx = self._calendar.get_loc(start_date)
-        end_idx = self._calendar.get_loc(end_date)
-        first_rows, last_rows, offsets = self._compute_slices(
-            start_idx,
-            end_idx,
-            assets,
-        )
-        return _read_bcolz_data(
-            self._table,
-            (end_idx - start_idx + 1, len(assets)),
-            [column.name for column in columns],
-            first_rows,
-            last_rows,
-            offsets,
-        )
+        stats = self.stats
+        with stats.timer('raw_array_reads'):
+            # Assumes that the given dates are actually in calendar.
+            start_idx = self._calendar.get_loc(start_date)
+            end_idx = self._calendar.get_loc(end_date)
+            first_rows, last_rows, offsets = self._compute_slices(
+                start_idx,
+                end_idx,
+                assets,
+            )
+            shape = (end_idx - start_idx + 1, len(assets))
+            stats.incr('raw_array_cells', shape[0] * shape[1] * len(columns))
+            stats.incr(
+                'bytes_decompressed',
+                int((last_rows - first_rows + 1).clip(0).sum()) *
+                uint32().itemsize * len(columns),
+            )
+            return _read_bcolz_data(
+                self._table,
+                shape,
+                [column.name for column in columns],
+                first_rows,
+                last_rows,
+                offsets,
+            )
 
     def _spot_col(self, colname):
         """
@@ -574,8 +1123,28 @@ class BcolzDailyBarReader(DailyBarReader):
             col = self._spot_cols[colname]
         except KeyError:
             col = self._spot_cols[colname] = self._table[colname]
+            self.stats.incr('column_reads')
+            self.stats.incr('bytes_decompressed', col.nbytes)
         return col
 
+    def preload(self, columns=('open', 'high', 'low', 'close', 'volume')):
+        """
+        Read ``columns`` into memory, so that spot prices are read from them
+        without decompressing the table.
+
+        Processes forked after preloading share the columns copy-on-write.
+        ``load_raw_arrays``, which serves history windows and pipeline
+        loaders, does not use them and still decompresses the table on each
+        call.
+
+        Parameters
+        ----------
+        columns : iterable[str], optional
+            The names of the columns to load.
+        """
+        for column in columns:
+            self._spot_col(column)
+
     def get_last_traded_dt(self, asset, day):
         volumes = self._spot_col('volume')
 
@@ -653,6 +1222,7 @@ class BcolzDailyBarReader(DailyBarReader):
             Returns -1 if the day is within the date range, but the price is
             0.
         """
+        self.stats.incr('spot_reads')
         ix = self.sid_day_index(sid, day)
         price = self._spot_col(colname)[ix]
         if price == 0:
@@ -662,6 +1232,26 @@ class BcolzDailyBarReader(DailyBarReader):
         else:
             return price
 
+    def spot_prices(self, sids, days, colname):
+        self.stats.incr('spot_reads', len(sids))
+        sids = np.asarray(sids, dtype=int64).tolist()
+        locs = day_locs(self._calendar, days)
+        offsets = array([self._calendar_offsets[sid] for sid in sids],
+                        dtype=int64)
+        first_rows = array([self._first_rows[sid] for sid in sids],
+                           dtype=int64)
+        last_rows = array([self._last_rows[sid] for sid in sids],
+                          dtype=int64)
+
+        ixs = first_rows + locs - offsets
+        valid = (locs != -1) & (locs >= offsets) & (ixs <= last_rows)
+        out = full(len(sids), nan)
+        out[valid] = raw_to_spot_prices(
+            self._spot_col(colname)[ixs[valid]],
+            colname,
+        )
+        return out
+
 
 class PanelDailyBarReader(DailyBarReader):
     """
@@ -800,6 +1390,104 @@ class SQLiteAdjustmentWriter(object):
         self._calendar = calendar
 
     def _write(self, tablename, expected_dtypes, frame):
+        self._write_frames([
+            (tablename, self._check_frame(expected_dtypes, frame)),
+        ])
+
+    def _write_frames(self, frames):
+        """
+        Insert the rows of (tablename, frame) pairs with ``executemany``, all
+        in one transaction, creating any missing tables first.
+
+        Tables are laid out as ``DataFrame.to_sql`` would: an "index" column
+        holding the frame's index, then the frame's columns in order.
+        """
+        conn = self.conn
+        for tablename, frame in frames:
+            # Python's sqlite3 commits before DDL statements, so tables are
+            # created outside of the transaction.
+            conn.execute('CREATE TABLE IF NOT EXISTS %s (%s)' % (
+                tablename,
+                ', '.join(
+                    '"%s" %s' % (name, sqlite_type)
+                    for name, sqlite_type in [('index', 'INTEGER')] + [
+                        (name, _sqlite_type(frame[name].dtype))
+                        for name in frame.columns
+                    ]
+                ),
+            ))
+
+        with conn:
+            for tablename, frame in frames:
+                if frame.empty:
+                    continue
+                columns = ['index'] + list(frame.columns)
+                conn.executemany(
+                    'INSERT INTO %s (%s) VALUES (%s)' % (
+                        tablename,
+                        ', '.join('"%s"' % name for name in columns),
+                        ', '.join('?' * len(columns)),
+                    ),
+                    # Convert each column with tolist so that the rows hold
+                    # Python ints and floats rather than numpy scalars.
+                    zip(
+                        frame.index.values.tolist(),
+                        *[frame[name].values.tolist()
+                          for name in frame.columns]
+                    ),
+                )
+
+    @contextmanager
+    def _write_ahead_log(self):
+        """
+        Context manager which puts the database in WAL mode while writing.
+
+        When it exits, the log is checkpointed into the database file and the
+        previous journal mode and synchronous setting are restored, so that
+        the file is complete on its own for readers that open it immutable or
+        copy it into memory.
+
+        Raises
+        ------
+        ValueError
+            If the previous journal mode could not be restored. SQLite
+            doesn't leave WAL mode while other connections to the database
+            are open, and reports this only by returning the unchanged mode.
+        """
+        conn = self.conn
+        if not any(row[2] for row in conn.execute('PRAGMA database_list')):
+            # In-memory databases have no log.
+            yield
+            return
+
+        old_mode, = conn.execute('PRAGMA journal_mode').fetchone()
+        old_synchronous, = conn.execute('PRAGMA synchronous').fetchone()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            yield
+        finally:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            mode, = conn.execute(
+                'PRAGMA journal_mode=%s' % old_mode,
+            ).fetchone()
+            conn.execute('PRAGMA synchronous=%d' % old_synchronous)
+
+        if mode.lower() != old_mode.lower():
+            raise ValueError(
+                'could not restore journal_mode=%s, the database is still in'
+                ' %s mode; close other connections to it and retry' % (
+                    old_mode,
+                    mode,
+                ),
+            )
+
+    @staticmethod
+    def _check_frame(expected_dtypes, frame):
+        """
+        Check the columns and dtypes of a frame to write, replacing a missing
+        frame with an empty one.
+        """
         if frame is None or frame.empty:
             # keeping the dtypes correct for empty frames is not easy
             frame = DataFrame(
@@ -828,13 +1516,7 @@ class SQLiteAdjustmentWriter(object):
                             actual=actual,
                         ),
                     )
-
-        frame.to_sql(
-            tablename,
-            self.conn,
-            if_exists='append',
-            chunksize=50000,
-        )
+        return frame
 
     def write_frame(self, tablename, frame):
         if tablename not in SQLITE_ADJUSTMENT_TABLENAMES:
@@ -890,37 +1572,42 @@ class SQLiteAdjustmentWriter(object):
                     ('ratio',  float64),
                 ],
             ))
-        ex_dates = dividends.ex_date.values
+        ex_dates = dividends.ex_date.values.astype('datetime64[ns]')
 
         sids = dividends.sid.values
         amounts = dividends.amount.values
 
-        ratios = full(len(amounts), nan)
+        # The close of the trading day before each ex_date, or of the day
+        # before the first trading day after it, read in one batch.
+        calendar = self._calendar
+        calendar_values = calendar.values
+        prev_close_locs = calendar_values.searchsorted(ex_dates) - 1
+        has_prev_day = prev_close_locs >= 0
+        prev_closes = full(len(amounts), nan)
+        if has_prev_day.any():
+            daily_bar_reader = self._daily_bar_reader
+            if isinstance(daily_bar_reader, DailyBarReader):
+                spot_prices = daily_bar_reader.spot_prices
+            else:
+                spot_prices = partial(spot_prices_by_row, daily_bar_reader)
+            prev_closes[has_prev_day] = spot_prices(
+                sids[has_prev_day],
+                calendar_values[prev_close_locs[has_prev_day]],
+                'close',
+            )
 
-        daily_bar_reader = self._daily_bar_reader
+        for i in np.flatnonzero(isnull(prev_closes)):
+            logger.warn("Couldn't compute ratio for dividend %s" % {
+                'sid': sids[i],
+                'ex_date': ex_dates[i],
+                'amount': amounts[i],
+            })
 
-        effective_dates = full(len(amounts), -1, dtype=int64)
-        calendar = self._calendar
-        for i, amount in enumerate(amounts):
-            sid = sids[i]
-            ex_date = ex_dates[i]
-            day_loc = calendar.get_loc(ex_date, method='bfill')
-            prev_close_date = calendar[day_loc - 1]
-            try:
-                prev_close = daily_bar_reader.spot_price(
-                    sid, prev_close_date, 'close')
-                if prev_close != 0.0:
-                    ratio = 1.0 - amount / prev_close
-                    ratios[i] = ratio
-                    # only assign effective_date when data is found
-                    effective_dates[i] = ex_date
-            except NoDataOnDate:
-                logger.warn("Couldn't compute ratio for dividend %s" % {
-                    'sid': sid,
-                    'ex_date': ex_date,
-                    'amount': amount,
-                })
-                continue
+        # only assign effective_date when data is found
+        found = ~isnull(prev_closes) & (prev_closes != 0.0)
+        ratios = full(len(amounts), nan)
+        ratios[found] = 1.0 - amounts[found] / prev_closes[found]
+        effective_dates = where(found, ex_dates.view(int64), -1)
 
         # Create a mask to filter out indices in the effective_date, sid, and
         # ratio vectors for which a ratio was not calculable.
@@ -938,6 +1625,10 @@ class SQLiteAdjustmentWriter(object):
         })
 
     def _write_dividends(self, dividends):
+        self.write_dividend_payouts(self._dividend_payouts_frame(dividends))
+
+    @staticmethod
+    def _dividend_payouts_frame(dividends):
         if dividends is None:
             dividend_payouts = None
         else:
@@ -953,10 +1644,15 @@ class SQLiteAdjustmentWriter(object):
             dividend_payouts['pay_date'] = \
                 dividend_payouts['pay_date'].values.astype('datetime64[s]').\
                 astype(integer)
-
-        self.write_dividend_payouts(dividend_payouts)
+        return dividend_payouts
 
     def _write_stock_dividends(self, stock_dividends):
+        self.write_stock_dividend_payouts(
+            self._stock_dividend_payouts_frame(stock_dividends),
+        )
+
+    @staticmethod
+    def _stock_dividend_payouts_frame(stock_dividends):
         if stock_dividends is None:
             stock_dividend_payouts = None
         else:
@@ -973,7 +1669,7 @@ class SQLiteAdjustmentWriter(object):
             stock_dividend_payouts['pay_date'] = \
                 stock_dividend_payouts['pay_date'].\
                 values.astype('datetime64[s]').astype(integer)
-        self.write_stock_dividend_payouts(stock_dividend_payouts)
+        return stock_dividend_payouts
 
     def write_dividend_data(self, dividends, stock_dividends=None):
         """
@@ -1075,54 +1771,219 @@ class SQLiteAdjustmentWriter(object):
         --------
         SQLiteAdjustmentReader : Consumer for the data written by this class
         """
-        self.write_frame('splits', splits)
-        self.write_frame('mergers', mergers)
-        self.write_dividend_data(dividends, stock_dividends)
-        self.conn.execute(
-            "CREATE INDEX splits_sids "
-            "ON splits(sid)"
-        )
-        self.conn.execute(
-            "CREATE INDEX splits_effective_date "
-            "ON splits(effective_date)"
-        )
-        self.conn.execute(
-            "CREATE INDEX mergers_sids "
-            "ON mergers(sid)"
-        )
-        self.conn.execute(
-            "CREATE INDEX mergers_effective_date "
-            "ON mergers(effective_date)"
-        )
-        self.conn.execute(
-            "CREATE INDEX dividends_sid "
-            "ON dividends(sid)"
-        )
-        self.conn.execute(
-            "CREATE INDEX dividends_effective_date "
-            "ON dividends(effective_date)"
-        )
-        self.conn.execute(
-            "CREATE INDEX dividend_payouts_sid "
-            "ON dividend_payouts(sid)"
-        )
-        self.conn.execute(
-            "CREATE INDEX dividends_payouts_ex_date "
-            "ON dividend_payouts(ex_date)"
-        )
-        self.conn.execute(
-            "CREATE INDEX stock_dividend_payouts_sid "
-            "ON stock_dividend_payouts(sid)"
-        )
-        self.conn.execute(
-            "CREATE INDEX stock_dividends_payouts_ex_date "
-            "ON stock_dividend_payouts(ex_date)"
+        # All of the tables are written in one transaction, and the indexes
+        # are only built once every row is in.
+        with self._write_ahead_log():
+            self._write_frames(self._adjustment_frames(
+                splits,
+                mergers,
+                dividends,
+                stock_dividends,
+            ))
+            ensure_adjustment_indexes(self.conn)
+
+    def _adjustment_frames(self,
+                           splits,
+                           mergers,
+                           dividends,
+                           stock_dividends):
+        """
+        The checked (tablename, frame) pairs to write for ``write`` and
+        ``append``.
+        """
+        return [
+            (
+                'splits',
+                self._check_frame(SQLITE_ADJUSTMENT_COLUMN_DTYPES, splits),
+            ),
+            (
+                'mergers',
+                self._check_frame(SQLITE_ADJUSTMENT_COLUMN_DTYPES, mergers),
+            ),
+            (
+                'dividend_payouts',
+                self._check_frame(
+                    SQLITE_DIVIDEND_PAYOUT_COLUMN_DTYPES,
+                    self._dividend_payouts_frame(dividends),
+                ),
+            ),
+            (
+                'stock_dividend_payouts',
+                self._check_frame(
+                    SQLITE_STOCK_DIVIDEND_PAYOUT_COLUMN_DTYPES,
+                    self._stock_dividend_payouts_frame(stock_dividends),
+                ),
+            ),
+            (
+                'dividends',
+                self._check_frame(
+                    SQLITE_ADJUSTMENT_COLUMN_DTYPES,
+                    self.calc_dividend_ratios(dividends),
+                ),
+            ),
+        ]
+
+    def append(self,
+               splits=None,
+               mergers=None,
+               dividends=None,
+               stock_dividends=None):
+        """
+        Add adjustments to a database written by ``write``.
+
+        All of the new rows are inserted in one transaction, so readers see
+        either none or all of them. The daily bars must already include the
+        day before the ex_date of each new dividend, see
+        ``BcolzDailyBarWriter.append``.
+
+        Parameters
+        ----------
+        splits, mergers, dividends, stock_dividends : pandas.DataFrame
+            The new adjustments, in the format accepted by ``write``.
+
+        Raises
+        ------
+        ValueError
+            If the database has not been written yet, or if any of the new
+            rows has the same key as an existing row, see
+            ``SQLITE_ADJUSTMENT_KEYS``. Nothing is inserted in that case.
+        """
+        frames = self._adjustment_frames(
+            splits,
+            mergers,
+            dividends,
+            stock_dividends,
         )
 
+        existing_tables = {
+            name for (name,) in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'",
+            )
+        }
+        for tablename, frame in frames:
+            if tablename not in existing_tables:
+                raise ValueError(
+                    'cannot append to missing adjustments table %r' %
+                    tablename,
+                )
+            self._check_new_keys(tablename, frame)
+
+        with self._write_ahead_log():
+            self._write_frames(frames)
+
+    def _check_new_keys(self, tablename, frame):
+        """
+        Raise a ValueError if any row of ``frame`` has the same key as a row
+        already in ``tablename``.
+        """
+        if frame.empty:
+            return
+
+        key_columns = SQLITE_ADJUSTMENT_KEYS[tablename]
+        new_keys = list(zip(*[frame[column].values.tolist()
+                              for column in key_columns]))
+        if len(set(new_keys)) != len(new_keys):
+            raise ValueError(
+                'duplicate rows in new %s adjustments' % tablename,
+            )
+
+        sids = sorted(set(frame['sid'].values.tolist()))
+        existing = set()
+        for chunk in group_into_chunks(sids):
+            existing.update(self.conn.execute(
+                'SELECT %s FROM %s WHERE sid IN (%s)' % (
+                    ', '.join(key_columns),
+                    tablename,
+                    ', '.join('?' * len(chunk)),
+                ),
+                chunk,
+            ))
+
+        conflicts = existing.intersection(new_keys)
+        if conflicts:
+            raise ValueError(
+                '%d new %s adjustments are already in the database, e.g. %r' %
+                (len(conflicts), tablename, min(conflicts)),
+            )
+
     def close(self):
         self.conn.close()
 
 
+#: The columns whose values identify an adjustment in each adjustments table.
+#: ``SQLiteAdjustmentWriter.append`` refuses rows whose keys already exist.
+SQLITE_ADJUSTMENT_KEYS = {
+    'splits': ('sid', 'effective_date'),
+    'mergers': ('sid', 'effective_date'),
+    'dividends': ('sid', 'effective_date'),
+    'dividend_payouts': ('sid', 'ex_date'),
+    'stock_dividend_payouts': ('sid', 'ex_date', 'payment_sid'),
+}
+
+
+#: (name, table, columns) of the indexes on an adjustments database.
+#:
+#: The composite (sid, effective_date) indexes serve the per-sid date range
+#: queries of ``load_adjustments_from_sqlite``; the rest serve the spot
+#: lookups made by the DataPortal.
+ADJUSTMENT_INDEXES = (
+    ('splits_sids', 'splits', ('sid',)),
+    ('splits_effective_date', 'splits', ('effective_date',)),
+    ('splits_sid_effective_date', 'splits', ('sid', 'effective_date')),
+    ('mergers_sids', 'mergers', ('sid',)),
+    ('mergers_effective_date', 'mergers', ('effective_date',)),
+    ('mergers_sid_effective_date', 'mergers', ('sid', 'effective_date')),
+    ('dividends_sid', 'dividends', ('sid',)),
+    ('dividends_effective_date', 'dividends', ('effective_date',)),
+    ('dividends_sid_effective_date', 'dividends', ('sid', 'effective_date')),
+    ('dividend_payouts_sid', 'dividend_payouts', ('sid',)),
+    ('dividends_payouts_ex_date', 'dividend_payouts', ('ex_date',)),
+    ('stock_dividend_payouts_sid', 'stock_dividend_payouts', ('sid',)),
+    (
+        'stock_dividends_payouts_ex_date',
+        'stock_dividend_payouts',
+        ('ex_date',),
+    ),
+)
+
+
+def _sqlite_type(dtype):
+    """
+    The SQLite column type that ``DataFrame.to_sql`` uses for ``dtype``.
+    """
+    if dtype.kind in 'iub':
+        return 'INTEGER'
+    if dtype.kind == 'f':
+        return 'REAL'
+    return 'TEXT'
+
+
+def ensure_adjustment_indexes(conn):
+    """
+    Create any of ``ADJUSTMENT_INDEXES`` missing from an adjustments
+    database.
+
+    ``SQLiteAdjustmentWriter`` calls this after writing. Databases written by
+    older versions of zipline can be migrated by calling it once. Readers
+    never write to the database file; a reader opened with ``mode='memory'``
+    calls this on its in-memory snapshot instead.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        A writable connection to the database.
+    """
+    for name, table, columns in ADJUSTMENT_INDEXES:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS %s ON %s(%s)" % (
+                name,
+                table,
+                ', '.join(columns),
+            )
+        )
+    conn.commit()
+
+
 UNPAID_QUERY_TEMPLATE = """
 SELECT sid, amount, pay_date from dividend_payouts
 WHERE ex_date=? AND sid IN ({0})
@@ -1140,6 +2001,42 @@ StockDividend = namedtuple(
     ['asset', 'payment_asset', 'ratio', 'pay_date'])
 
 
+class _CountingCursor(object):
+    """
+    A cursor which counts the statements it executes.
+    """
+    def __init__(self, cursor, stats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def execute(self, *args):
+        self._stats.incr('sql_queries')
+        self._cursor.execute(*args)
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _CountingConnection(object):
+    """
+    A connection which counts the statements executed through it and its
+    cursors in ``stats.counts['sql_queries']``.
+    """
+    def __init__(self, conn, stats):
+        self._conn = conn
+        self._stats = stats
+
+    def cursor(self):
+        return _CountingCursor(self._conn.cursor(), self._stats)
+
+    def execute(self, *args):
+        return self.cursor().execute(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
 class SQLiteAdjustmentReader(object):
     """
     Loads adjustments based on corporate actions from a SQLite database.
@@ -1149,36 +2046,104 @@ class SQLiteAdjustmentReader(object):
     Parameters
     ----------
     conn : str or sqlite3.Connection
-        Connection from which to load data.
-    """
+        Connection from which to load data. The reader may be used from
+        several threads, e.g. by a pipeline prefetched in the background,
+        only if a connection passed in was created with
+        ``check_same_thread=False``. Connections opened from a path always
+        are.
+    mode : {'file', 'memory', 'immutable'}, optional
+        How to open ``conn`` when it is a path. 'memory' reads the whole
+        database into memory once per process with SQLite's backup API, and
+        shares that snapshot with the other readers of the file in the
+        process. ``ADJUSTMENT_INDEXES`` are created on the snapshot if the
+        file lacks them; the file itself is not modified.
+        'immutable' opens it read-only without locking and memory-maps up to
+        ``mmap_size`` bytes of it. See
+        :func:`zipline.utils.sqlite_utils.connect_sqlite`.
+    mmap_size : int, optional
+        The number of bytes to memory-map in 'immutable' mode.
 
-    @preprocess(conn=coerce_string(sqlite3.connect))
-    def __init__(self, conn):
+    Attributes
+    ----------
+    stats : zipline.utils.instrumentation.DataAccessStats
+        ``sql_queries`` counts the statements issued against ``conn`` and
+        ``sql`` times them.
+    """
+    @expect_element(mode=SQLITE_MODES)
+    def __init__(self, conn, mode='file', mmap_size=DEFAULT_MMAP_SIZE):
+        if isinstance(conn, string_types):
+            conn = connect_sqlite(
+                conn,
+                mode,
+                mmap_size,
+                prepare=ensure_adjustment_indexes,
+            )
         self.conn = conn
+        self.stats = DataAccessStats()
+        # Pipelines may be prefetched on a background thread while the
+        # simulation reads adjustments, so queries are serialized.
+        self._lock = Lock()
+
+    def _fetchall(self, statement, args):
+        """
+        Execute ``statement`` and return all of its rows.
+        """
+        self.stats.incr('sql_queries')
+        with self._lock, self.stats.timer('sql'):
+            c = self.conn.cursor()
+            try:
+                return c.execute(statement, args).fetchall()
+            finally:
+                c.close()
 
     def load_adjustments(self, columns, dates, assets):
-        return load_adjustments_from_sqlite(
-            self.conn,
-            [column.name for column in columns],
-            dates,
-            assets,
-        )
+        with self._lock, self.stats.timer('sql'):
+            return load_adjustments_from_sqlite(
+                _CountingConnection(self.conn, self.stats),
+                [column.name for column in columns],
+                dates,
+                assets,
+            )
 
     def get_adjustments_for_sid(self, table_name, sid):
-        t = (sid,)
-        c = self.conn.cursor()
-        adjustments_for_sid = c.execute(
-            "SELECT effective_date, ratio FROM %s WHERE sid = ?" %
-            table_name, t).fetchall()
-        c.close()
-
+        adjustments_for_sid = self._fetchall(
+            "SELECT effective_date, ratio FROM %s WHERE sid = ?" % table_name,
+            (sid,),
+        )
         return [[Timestamp(adjustment[0], unit='s', tz='UTC'), adjustment[1]]
                 for adjustment in
                 adjustments_for_sid]
 
+    def get_splits_with_effective_date(self, sids, date):
+        """
+        The splits of ``sids`` which take effect on ``date``.
+
+        Returns
+        -------
+        splits : list[tuple[int, float]]
+            A (sid, ratio) pair for each split.
+        """
+        seconds = int(date.value / 1e9)
+        rows = self._fetchall(
+            "SELECT sid, ratio FROM SPLITS WHERE effective_date = ?",
+            (seconds,),
+        )
+        return [row for row in rows if row[0] in sids]
+
+    def get_stock_dividend_payouts(self, sid, start_date, end_date):
+        """
+        The rows of the stock_dividend_payouts table for ``sid`` whose
+        ex_date is after ``start_date`` and whose pay_date is before
+        ``end_date``.
+        """
+        return self._fetchall(
+            "SELECT * FROM stock_dividend_payouts WHERE sid = ? AND "
+            "ex_date > ? AND pay_date < ?",
+            (int(sid), start_date.value / 1e9, end_date.value / 1e9),
+        )
+
     def get_dividends_with_ex_date(self, assets, date, asset_finder):
         seconds = date.value / int(1e9)
-        c = self.conn.cursor()
 
         divs = []
         for chunk in group_into_chunks(assets):
@@ -1186,21 +2151,16 @@ class SQLiteAdjustmentReader(object):
                 ",".join(['?' for _ in chunk]))
             t = (seconds,) + tuple(map(lambda x: int(x), chunk))
 
-            c.execute(query, t)
-
-            rows = c.fetchall()
-            for row in rows:
+            for row in self._fetchall(query, t):
                 div = Dividend(
                     asset_finder.retrieve_asset(row[0]),
                     row[1], Timestamp(row[2], unit='s', tz='UTC'))
                 divs.append(div)
-        c.close()
 
         return divs
 
     def get_stock_dividends_with_ex_date(self, assets, date, asset_finder):
         seconds = date.value / int(1e9)
-        c = self.conn.cursor()
 
         stock_divs = []
         for chunk in group_into_chunks(assets):
@@ -1208,17 +2168,12 @@ class SQLiteAdjustmentReader(object):
                 ",".join(['?' for _ in chunk]))
             t = (seconds,) + tuple(map(lambda x: int(x), chunk))
 
-            c.execute(query, t)
-
-            rows = c.fetchall()
-
-            for row in rows:
+            for row in self._fetchall(query, t):
                 stock_div = StockDividend(
                     asset_finder.retrieve_asset(row[0]),    # asset
                     asset_finder.retrieve_asset(row[1]),    # payment_asset
                     row[2],
                     Timestamp(row[3], unit='s', tz='UTC'))
                 stock_divs.append(stock_div)
-        c.close()
 
         return stock_divs
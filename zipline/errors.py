@@ -600,3 +600,14 @@ class HistoryWindowStartsBeforeData(ZiplineError):
         "History window extends before {first_trading_day}. To use this "
         "history window, start the backtest on or after {suggested_start_day}."
         )
+
+
+class MarketDataNotFound(ZiplineError):
+    """
+    Raised when a local market data loader has no cached benchmark or
+    treasury data to read.
+    """
+    msg = (
+        "No {kind} data for {symbol!r} found at {path}. Run once with network "
+        "access to download it, or copy it into that directory."
+    )
@@ -20,7 +20,6 @@ import datetime
 import pandas as pd
 import numpy as np
 from six import string_types
-from sqlalchemy import create_engine
 
 from zipline.assets import AssetDBWriter, AssetFinder
 from zipline.data.loader import load_market_data
@@ -29,6 +28,8 @@ from zipline.errors import (
     NoFurtherDataError
 )
 from zipline.utils.memoize import remember_last, lazyval
+from zipline.utils.minute_index import MinuteIndex, NANOS_IN_MINUTE
+from zipline.utils.sqlite_utils import sqlite_engine
 
 log = logbook.Logger('Trading')
 
@@ -74,6 +75,11 @@ class TradingEnvironment(object):
     asset_db_path : str or sa.engine.Engine, optional
         The path to the assets db or sqlalchemy Engine object to use to
         construct an AssetFinder.
+    asset_db_mode : {'file', 'memory', 'immutable'}, optional
+        How to open ``asset_db_path`` when it is a path. 'memory' copies the
+        database into memory once per process and 'immutable' opens it
+        read-only with memory-mapped I/O. See
+        :func:`zipline.utils.sqlite_utils.connect_sqlite`.
     """
 
     # Token used as a substitute for pickling objects that contain a
@@ -87,7 +93,8 @@ class TradingEnvironment(object):
                  min_date=None,
                  max_date=None,
                  env_trading_calendar=tradingcalendar,
-                 asset_db_path=':memory:'):
+                 asset_db_path=':memory:',
+                 asset_db_mode='file'):
         self.trading_day = env_trading_calendar.trading_day.copy()
 
         # `tc_td` is short for "trading calendar trading days"
@@ -117,13 +124,16 @@ class TradingEnvironment(object):
             # In the case of live trading, the last date in the treasury
             # curves would be the day before the date considered to be
             # 'today'.
-            self.treasury_curves = tr_c[tr_c.index <= max_date]
+            self.treasury_curves = tr_c[
+                tr_c.index.slice_indexer(None, max_date)
+            ]
 
         self.exchange_tz = exchange_tz
 
         if isinstance(asset_db_path, string_types):
-            asset_db_path = 'sqlite:///%s' % asset_db_path
-            self.engine = engine = create_engine(asset_db_path)
+            if asset_db_path == ':memory:':
+                asset_db_mode = 'file'
+            self.engine = engine = sqlite_engine(asset_db_path, asset_db_mode)
         else:
             self.engine = engine = asset_db_path
 
@@ -133,10 +143,16 @@ class TradingEnvironment(object):
         else:
             self.asset_finder = None
 
+    @lazyval
+    def minute_index(self):
+        """
+        A MinuteIndex over the market minutes of ``self.trading_days``.
+        """
+        return MinuteIndex.from_open_and_closes(self.open_and_closes)
+
     @lazyval
     def market_minutes(self):
-        return self.minutes_for_days_in_range(self.first_trading_day,
-                                              self.last_trading_day)
+        return self.minute_index.box(self.minute_index.values)
 
     def write_data(self, **kwargs):
         """Write data into the asset_db.
@@ -147,6 +163,8 @@ class TradingEnvironment(object):
             Forwarded to AssetDBWriter.write
         """
         AssetDBWriter(self.engine).write(**kwargs)
+        # Make the new assets visible to lookups served from the asset table.
+        self.asset_finder._reset_caches()
 
     def normalize_date(self, test_date):
         test_date = pd.Timestamp(test_date, tz='UTC')
@@ -234,33 +252,21 @@ class TradingEnvironment(object):
     def closes_in_range(self, start, end):
         return self.open_and_closes.market_close.loc[start:end]
 
-    def minutes_for_days_in_range(self, start, end):
+    def minutes_for_days_in_range(self, start, end, box=True):
         """
         Get all market minutes for the days between start and end, inclusive.
+
+        If ``box`` is False, return an array of datetime64[ns] instead of a
+        DatetimeIndex.
         """
         start_date = self.normalize_date(start)
         end_date = self.normalize_date(end)
 
-        o_and_c = self.open_and_closes[
-            self.open_and_closes.index.slice_indexer(start_date, end_date)]
-
-        opens = o_and_c.market_open
-        closes = o_and_c.market_close
-
-        one_min = pd.Timedelta(1, unit='m')
-
-        all_minutes = []
-        for i in range(0, len(o_and_c.index)):
-            market_open = opens[i]
-            market_close = closes[i]
-            day_minutes = np.arange(market_open, market_close + one_min,
-                                    dtype='datetime64[m]')
-            all_minutes.append(day_minutes)
-
-        # Concatenate all minutes and truncate minutes before start/after end.
-        return pd.DatetimeIndex(
-            np.concatenate(all_minutes), copy=False, tz='UTC',
-        )
+        start_loc, stop_loc = self.trading_days.slice_locs(start_date,
+                                                           end_date)
+        index = self.minute_index
+        minutes = index.minutes(*index.day_positions(start_loc, stop_loc))
+        return index.box(minutes) if box else index.to_datetime64(minutes)
 
     def next_open_and_close(self, start_date):
         """
@@ -297,17 +303,16 @@ class TradingEnvironment(object):
         next minute, the open of the same day if @start is before the market
         open on a trading day, or the open of the next market day after @start.
         """
-        if self.is_trading_day(start):
-            market_open, market_close = self.get_open_and_close(start)
-            # If start before market open on a trading day, return market open.
-            if start < market_open:
-                return market_open
-            # If start is during trading hours, then get the next minute.
-            elif start < market_close:
-                return start + datetime.timedelta(minutes=1)
-        # If start is not in a trading day, or is after the market close
-        # then return the open of the *next* trading day.
-        return self.next_open_and_close(start)[0]
+        start = pd.Timestamp(start, tz='UTC')
+        minute = self.minute_index.next_minute(
+            start.value // NANOS_IN_MINUTE,
+        )
+        if minute is None:
+            raise NoFurtherDataError(
+                msg=("Attempt to backtest beyond available history. "
+                     "Last known date: %s" % self.last_trading_day)
+            )
+        return pd.Timestamp(minute * NANOS_IN_MINUTE, tz='UTC')
 
     @remember_last
     def previous_market_minute(self, start):
@@ -316,17 +321,17 @@ class TradingEnvironment(object):
         previous minute, the close of the same day if @start is after the close
         on a trading day, or the close of the market day before @start.
         """
-        if self.is_trading_day(start):
-            market_open, market_close = self.get_open_and_close(start)
-            # If start after the market close, return market close.
-            if start > market_close:
-                return market_close
-            # If start is during trading hours, then get previous minute.
-            if start > market_open:
-                return start - datetime.timedelta(minutes=1)
-        # If start is not a trading day, or is before the market open
-        # then return the close of the *previous* trading day.
-        return self.previous_open_and_close(start)[1]
+        start = pd.Timestamp(start, tz='UTC')
+        # Round up so that the result is strictly before start.
+        minute = self.minute_index.previous_minute(
+            -(-start.value // NANOS_IN_MINUTE),
+        )
+        if minute is None:
+            raise NoFurtherDataError(
+                msg=("Attempt to backtest beyond available history. "
+                     "First known date: %s" % self.first_trading_day)
+            )
+        return pd.Timestamp(minute * NANOS_IN_MINUTE, tz='UTC')
 
     def get_open_and_close(self, day):
         index = self.open_and_closes.index.get_loc(day.date())
@@ -351,15 +356,48 @@ class TradingEnvironment(object):
 
         return self.open_and_closes.iloc[index]
 
-    def market_minute_window(self, start, count, step=1):
+    def market_minute_window(self, start, count, step=1, box=True):
         """
         Return a DatetimeIndex containing `count` market minutes, starting with
         `start` and continuing `step` minutes at a time.
+
+        When `step` is not 1 or -1, each day's minutes are stepped through
+        starting from that day's open (or close, when stepping backwards).
+
+        If `box` is False, return an array of datetime64[ns] instead of a
+        DatetimeIndex.
         """
         if not self.is_market_hours(start):
             raise ValueError("market_minute_window starting at "
                              "non-market time {minute}".format(minute=start))
 
+        if step not in (1, -1):
+            minutes = self._stepped_market_minute_window(start, count, step)
+            return minutes if box else minutes.values
+
+        index = self.minute_index
+        # Round up to match the first market minute at or after start.
+        position = index.position(
+            -(-pd.Timestamp(start).value // NANOS_IN_MINUTE),
+        )
+        if step > 0:
+            stop = position + count
+            if stop > len(index):
+                raise NoFurtherDataError(
+                    msg=("Attempt to backtest beyond available history. "
+                         "Last known date: %s" % self.last_trading_day)
+                )
+        else:
+            stop = position - count
+            if stop < -1:
+                raise NoFurtherDataError(
+                    msg=("Attempt to backtest beyond available history. "
+                         "First known date: %s" % self.first_trading_day)
+                )
+        minutes = index.minutes(position, stop, step)
+        return index.box(minutes) if box else index.to_datetime64(minutes)
+
+    def _stepped_market_minute_window(self, start, count, step):
         all_minutes = []
 
         current_day_minutes = self.market_minutes_for_day(start)
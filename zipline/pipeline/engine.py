@@ -5,8 +5,11 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from timeit import default_timer
 from uuid import uuid4
+from weakref import WeakKeyDictionary
 
+from cachetools import LRUCache
 from six import (
     iteritems,
     with_metaclass,
@@ -22,9 +25,10 @@ from toolz.curried.operator import getitem
 
 from zipline.lib.adjusted_array import ensure_ndarray
 from zipline.errors import NoFurtherDataError
-from zipline.utils.numpy_utils import repeat_first_axis, repeat_last_axis
 from zipline.utils.pandas_utils import explode
 
+from .profiling import PipelineProfile
+from .results import PipelineChunk
 from .term import AssetExists, LoadableTerm
 
 
@@ -62,6 +66,40 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_pipeline")
 
+    def run_pipeline_chunk(self, pipeline, start_date, end_date):
+        """
+        Compute values for `pipeline` between `start_date` and `end_date`.
+
+        Returns the same results as ``run_pipeline``, stored as a
+        ``zipline.pipeline.results.PipelineChunk``, which supports cheap
+        access to the results for a single date.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+
+        Returns
+        -------
+        result : zipline.pipeline.results.PipelineChunk
+            The computed results.
+
+        Notes
+        -----
+        The default implementation converts the frame returned by
+        ``run_pipeline``. Subclasses should override this method when they
+        can build the chunk without materializing the frame first.
+        """
+        return PipelineChunk.from_frame(
+            self.run_pipeline(pipeline, start_date, end_date),
+            start_date,
+            end_date,
+        )
+
 
 class NoOpPipelineEngine(PipelineEngine):
     """
@@ -75,6 +113,12 @@ class NoOpPipelineEngine(PipelineEngine):
             columns=sorted(pipeline.columns.keys()),
         )
 
+    def run_pipeline_chunk(self, pipeline, start_date, end_date):
+        return PipelineChunk.empty(
+            date_range(start=start_date, end=end_date, freq='D'),
+            pipeline.columns.keys(),
+        )
+
 
 class SimplePipelineEngine(object):
     """
@@ -91,20 +135,59 @@ class SimplePipelineEngine(object):
     asset_finder : zipline.assets.AssetFinder
         An AssetFinder instance.  We depend on the AssetFinder to determine
         which assets are in the top-level universe at any point in time.
+    profile : bool, optional
+        Whether to record per-term load and compute times and output sizes.
+        When True, the report for the most recent call to ``run_pipeline`` is
+        available as ``last_profile``.  Default is False.
+    graph_cache_size : int, optional
+        Number of compiled TermGraphs to keep. Running a pipeline with the
+        same columns and screen as a previously run pipeline reuses its
+        graph and execution order.  Default is 32.
+    cache_loaders : bool, optional
+        Whether to also reuse the loaders chosen for a cached graph.  When
+        True, ``get_loader`` is called for a term only the first time a graph
+        containing it is run, so it must return the same loader for a term
+        every time.  When False, ``get_loader`` is called for every loadable
+        term on every run, as by engines which don't cache graphs.  Default is
+        False.
     """
     __slots__ = (
         '_get_loader',
         '_calendar',
         '_finder',
         '_root_mask_term',
+        '_profile',
+        '_last_profile',
+        '_graph_cache',
+        '_loader_groups',
+        '_cache_loaders',
         '__weakref__',
     )
 
-    def __init__(self, get_loader, calendar, asset_finder):
+    def __init__(self,
+                 get_loader,
+                 calendar,
+                 asset_finder,
+                 profile=False,
+                 graph_cache_size=32,
+                 cache_loaders=False):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
         self._root_mask_term = AssetExists()
+        self._profile = profile
+        self._last_profile = None
+        self._graph_cache = LRUCache(maxsize=graph_cache_size)
+        self._loader_groups = WeakKeyDictionary()
+        self._cache_loaders = cache_loaders
+
+    @property
+    def last_profile(self):
+        """
+        The ``zipline.pipeline.profiling.PipelineProfile`` for the most recent
+        call to ``run_pipeline``, or None if profiling is disabled.
+        """
+        return self._last_profile
 
     def run_pipeline(self, pipeline, start_date, end_date):
         """
@@ -147,40 +230,141 @@ class SimplePipelineEngine(object):
         Step 0 is performed by ``Pipeline.to_graph``.
         Step 1 is performed in ``SimplePipelineEngine._compute_root_mask``.
         Step 2 is performed in ``SimplePipelineEngine.compute_chunk``.
-        Steps 3, 4, and 5 are performed in ``SimplePiplineEngine._to_narrow``.
+        Steps 3 and 4 are performed in ``SimplePiplineEngine._to_narrow``.
+        Step 5 is performed in ``PipelineChunk.to_frame``.
 
         See Also
         --------
         PipelineEngine.run_pipeline
         """
+        return self.run_pipeline_chunk(
+            pipeline, start_date, end_date,
+        ).to_frame()
+
+    def run_pipeline_chunk(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline, storing the results as a PipelineChunk.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+
+        Returns
+        -------
+        result : zipline.pipeline.results.PipelineChunk
+            The computed results.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        PipelineEngine.run_pipeline_chunk
+        """
         if end_date < start_date:
             raise ValueError(
                 "start_date must be before or equal to end_date \n"
                 "start_date=%s, end_date=%s" % (start_date, end_date)
             )
 
-        screen_name = uuid4().hex
-        graph = pipeline.to_graph(screen_name, self._root_mask_term)
+        stage_start = default_timer()
+        screen_name, graph = self._graph_for_pipeline(pipeline)
+        if self._profile:
+            profile = PipelineProfile(graph)
+            profile.record_stage('graph', stage_start)
+            stage_start = default_timer()
+        else:
+            profile = None
+
         extra_rows = graph.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
         dates, assets, root_mask_values = explode(root_mask)
+        if profile is not None:
+            profile.shape = root_mask_values.shape
+            profile.record_stage('root_mask', stage_start)
+            stage_start = default_timer()
 
         outputs = self.compute_chunk(
             graph,
             dates,
             assets,
             initial_workspace={self._root_mask_term: root_mask_values},
+            profile=profile,
         )
+        if profile is not None:
+            profile.record_stage('compute_chunk', stage_start)
+            stage_start = default_timer()
 
         out_dates = dates[extra_rows:]
         screen_values = outputs.pop(screen_name)
 
-        return self._to_narrow(outputs, screen_values, out_dates, assets)
+        result = self._to_narrow(outputs, screen_values, out_dates, assets)
+        if profile is not None:
+            profile.record_stage('to_narrow', stage_start)
+            self._last_profile = profile
+        return result
+
+    def _graph_for_pipeline(self, pipeline):
+        """
+        Compile `pipeline` into a TermGraph, reusing the graph compiled for
+        any previous pipeline with the same columns and screen.
+
+        Returns
+        -------
+        (screen_name, graph) : tuple (str, zipline.pipeline.graph.TermGraph)
+            The graph to execute, and the name of its screen output.
+        """
+        key = frozenset(iteritems(pipeline.columns)), pipeline.screen
+        try:
+            return self._graph_cache[key]
+        except KeyError:
+            pass
+
+        screen_name = uuid4().hex
+        graph = pipeline.to_graph(screen_name, self._root_mask_term)
+        self._graph_cache[key] = screen_name, graph
+        return screen_name, graph
+
+    def _loader_groups_for_graph(self, graph):
+        """
+        Group the loadable terms in `graph` by loader and extra rows.
+
+        The groups are only reused for later runs of `graph` if the engine
+        was created with ``cache_loaders=True``.
+
+        Returns
+        -------
+        groups : dict[LoadableTerm -> (PipelineLoader, list[LoadableTerm])]
+            Map from each loadable term to its loader and the terms which
+            should be loaded along with it.
+        """
+        try:
+            return self._loader_groups[graph]
+        except KeyError:
+            pass
+
+        get_loader = self.get_loader
+        groups = {}
+        # If loadable terms share the same loader and extra_rows, load them all
+        # together.
+        for (loader, _), terms in iteritems(groupby(
+                juxt(get_loader, getitem(graph.extra_rows)),
+                graph.loadable_terms)):
+            to_load = sorted(terms, key=lambda t: t.dataset)
+            for term in terms:
+                groups[term] = loader, to_load
+
+        if self._cache_loaders:
+            self._loader_groups[graph] = groups
+        return groups
 
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
-        Compute a lifetimes matrix from our AssetFinder, then drop columns that
-        didn't exist at all during the query dates.
+        Compute a lifetimes matrix from our AssetFinder for the assets that
+        existed at some point during the query dates.
 
         Parameters
         ----------
@@ -216,23 +400,21 @@ class SimplePipelineEngine(object):
             )
 
         # Build lifetimes matrix reaching back to `extra_rows` days before
-        # `start_date.`
-        lifetimes = finder.lifetimes(
+        # `start_date`, with columns only for assets that existed between the
+        # requested start and end dates.
+        ret = finder.lifetimes_in_window(
             calendar[start_idx - extra_rows:end_idx],
-            include_start_date=False
+            include_start_date=False,
+            window_start=extra_rows,
         )
 
-        assert lifetimes.index[extra_rows] == start_date
-        assert lifetimes.index[-1] == end_date
-        if not lifetimes.columns.unique:
-            columns = lifetimes.columns
+        assert ret.index[extra_rows] == start_date
+        assert ret.index[-1] == end_date
+        if not ret.columns.unique:
+            columns = ret.columns
             duplicated = columns[columns.duplicated()].unique()
             raise AssertionError("Duplicated sids: %d" % duplicated)
 
-        # Filter out columns that didn't exist between the requested start and
-        # end dates.
-        existed = lifetimes.iloc[extra_rows:].any()
-        ret = lifetimes.loc[:, existed]
         shape = ret.shape
         assert shape[0] * shape[1] != 0, 'root mask cannot be empty'
         return ret
@@ -289,7 +471,12 @@ class SimplePipelineEngine(object):
     def get_loader(self, term):
         return self._get_loader(term)
 
-    def compute_chunk(self, graph, dates, assets, initial_workspace):
+    def compute_chunk(self,
+                      graph,
+                      dates,
+                      assets,
+                      initial_workspace,
+                      profile=None):
         """
         Compute the Pipeline terms in the graph for the requested start and end
         dates.
@@ -306,6 +493,9 @@ class SimplePipelineEngine(object):
             Must contain at least entry for `self._root_mask_term` whose shape
             is `(len(dates), len(assets))`, but may contain additional
             pre-computed terms for testing or optimization purposes.
+        profile : zipline.pipeline.profiling.PipelineProfile, optional
+            If supplied, the time taken and memory used by each loaded and
+            computed term are recorded into ``profile``.
 
         Returns
         -------
@@ -313,16 +503,11 @@ class SimplePipelineEngine(object):
             Dictionary mapping requested results to outputs.
         """
         self._validate_compute_chunk_params(dates, assets, initial_workspace)
-        get_loader = self.get_loader
+        loader_groups = self._loader_groups_for_graph(graph)
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = initial_workspace.copy()
 
-        # If loadable terms share the same loader and extra_rows, load them all
-        # together.
-        loader_group_key = juxt(get_loader, getitem(graph.extra_rows))
-        loader_groups = groupby(loader_group_key, graph.loadable_terms)
-
         for term in graph.ordered():
             # `term` may have been supplied in `initial_workspace`, and in the
             # future we may pre-compute loadable terms coming from the same
@@ -338,22 +523,34 @@ class SimplePipelineEngine(object):
             )
 
             if isinstance(term, LoadableTerm):
-                to_load = sorted(
-                    loader_groups[loader_group_key(term)],
-                    key=lambda t: t.dataset
-                )
-                loader = get_loader(term)
+                loader, to_load = loader_groups[term]
+                start = default_timer()
                 loaded = loader.load_adjusted_array(
                     to_load, mask_dates, assets, mask,
                 )
+                if profile is not None:
+                    profile.record_load(
+                        loader,
+                        graph.extra_rows[term],
+                        loaded,
+                        default_timer() - start,
+                    )
                 workspace.update(loaded)
             else:
+                start = default_timer()
                 workspace[term] = term._compute(
                     self._inputs_for_term(term, workspace, graph),
                     mask_dates,
                     assets,
                     mask,
                 )
+                if profile is not None:
+                    profile.record_compute(
+                        term,
+                        graph.extra_rows[term],
+                        workspace[term],
+                        default_timer() - start,
+                    )
                 assert(workspace[term].shape == mask.shape)
 
         out = {}
@@ -365,7 +562,7 @@ class SimplePipelineEngine(object):
 
     def _to_narrow(self, data, mask, dates, assets):
         """
-        Convert raw computed pipeline results into a DataFrame for public APIs.
+        Convert raw computed pipeline results into a PipelineChunk.
 
         Parameters
         ----------
@@ -373,49 +570,39 @@ class SimplePipelineEngine(object):
             Dict mapping column names to computed results.
         mask : ndarray[bool, ndim=2]
             Mask array of values to keep.
-        dates : ndarray[datetime64, ndim=1]
+        dates : pd.DatetimeIndex
             Row index for arrays `data` and `mask`
         assets : ndarray[int64, ndim=2]
             Column index for arrays `data` and `mask`
 
         Returns
         -------
-        results : pd.DataFrame
-            The indices of `results` are as follows:
-
-            index : two-tiered MultiIndex of (date, asset).
-                Contains an entry for each (date, asset) pair corresponding to
-                a `True` value in `mask`.
-            columns : Index of str
-                One column per entry in `data`.
+        results : zipline.pipeline.results.PipelineChunk
+            Contains an entry for each (date, asset) pair corresponding to a
+            `True` value in `mask`.
 
-        If mask[date, asset] is True, then result.loc[(date, asset), colname]
-        will contain the value of data[colname][date, asset].
+        If mask[date, asset] is True, then the row for `asset` in
+        ``results.for_date(date)`` will contain the value of
+        data[colname][date, asset].
         """
         if not mask.any():
-            # Manually handle the empty DataFrame case. This is a workaround
-            # to pandas failing to tz_localize an empty dataframe with a
-            # MultiIndex. It also saves us the work of applying a known-empty
-            # mask to each array.
-            #
-            # Slicing `dates` here to preserve pandas metadata.
-            empty_dates = dates[:0]
-            empty_assets = array([], dtype=object)
-            return DataFrame(
+            # Skip resolving assets and applying a known-empty mask to each
+            # array.
+            return PipelineChunk.from_mask(
                 data={
-                    name: array([], dtype=arr.dtype)
-                    for name, arr in iteritems(data)
+                    name: arr[:, :0] for name, arr in iteritems(data)
                 },
-                index=MultiIndex.from_arrays([empty_dates, empty_assets]),
+                mask=mask[:, :0],
+                dates=dates,
+                assets=array([], dtype=object),
             )
 
-        resolved_assets = array(self._finder.retrieve_all(assets))
-        dates_kept = repeat_last_axis(dates.values, len(assets))[mask]
-        assets_kept = repeat_first_axis(resolved_assets, len(dates))[mask]
-        return DataFrame(
-            data={name: arr[mask] for name, arr in iteritems(data)},
-            index=MultiIndex.from_arrays([dates_kept, assets_kept]),
-        ).tz_localize('UTC', level=0)
+        return PipelineChunk.from_mask(
+            data=data,
+            mask=mask,
+            dates=dates,
+            assets=array(self._finder.retrieve_all(assets)),
+        )
 
     def _validate_compute_chunk_params(self, dates, assets, initial_workspace):
         """
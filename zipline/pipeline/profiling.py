@@ -0,0 +1,211 @@
+"""
+Per-term timing and memory reports for pipeline executions.
+"""
+from collections import OrderedDict, namedtuple
+from timeit import default_timer
+
+from six import iteritems, itervalues
+
+from zipline.lib.adjusted_array import ensure_ndarray
+
+
+class TermProfile(namedtuple('TermProfile', [
+        'term',
+        'kind',
+        'seconds',
+        'nbytes',
+        'loader_group',
+        'extra_rows'])):
+    """
+    Execution statistics for a single term.
+
+    Attributes
+    ----------
+    term : zipline.pipeline.term.Term
+        The term which was loaded or computed.
+    kind : {'load', 'compute'}
+        Whether the term was produced by a PipelineLoader or computed from
+        its inputs.
+    seconds : float
+        Wall time spent producing the term. Terms that are loaded together
+        share the load time of their loader group evenly.
+    nbytes : int
+        Size of the term's output, including extra rows.
+    loader_group : str or None
+        Label of the group of terms which were loaded together with this
+        term, or None for computed terms.
+    extra_rows : int
+        Number of extra rows computed for the term.
+    """
+    __slots__ = ()
+
+
+def _term_name(term):
+    if hasattr(term, 'short_repr'):
+        return term.short_repr()
+    return type(term).__name__
+
+
+def _loader_group_label(loader, extra_rows):
+    return '%s[extra_rows=%d]' % (type(loader).__name__, extra_rows)
+
+
+class PipelineProfile(object):
+    """
+    Summary of where time and memory went during a single call to
+    ``SimplePipelineEngine.run_pipeline``.
+
+    Parameters
+    ----------
+    graph : zipline.pipeline.graph.TermGraph
+        The graph that was executed.
+
+    Attributes
+    ----------
+    graph : zipline.pipeline.graph.TermGraph
+        The graph that was executed.
+    terms : OrderedDict[Term -> TermProfile]
+        Stats for each term, in the order in which terms were executed.
+    stages : OrderedDict[str -> float]
+        Wall time spent in each stage of ``run_pipeline``.
+    shape : tuple[int, int]
+        The (dates, assets) shape of the root mask.
+    """
+    def __init__(self, graph):
+        self.graph = graph
+        self.terms = OrderedDict()
+        self.stages = OrderedDict()
+        self.shape = None
+
+    def record_stage(self, name, start):
+        """Record a pipeline stage which started at ``start``.
+        """
+        self.stages[name] = default_timer() - start
+
+    def record_load(self, loader, extra_rows, loaded, seconds):
+        """
+        Record the terms produced by a single call to
+        ``PipelineLoader.load_adjusted_array``.
+        """
+        group = _loader_group_label(loader, extra_rows)
+        per_term = seconds / max(len(loaded), 1)
+        for term, data in iteritems(loaded):
+            self.terms[term] = TermProfile(
+                term=term,
+                kind='load',
+                seconds=per_term,
+                nbytes=ensure_ndarray(data).nbytes,
+                loader_group=group,
+                extra_rows=extra_rows,
+            )
+
+    def record_compute(self, term, extra_rows, result, seconds):
+        """
+        Record the result of a single call to ``Term._compute``.
+        """
+        self.terms[term] = TermProfile(
+            term=term,
+            kind='compute',
+            seconds=seconds,
+            nbytes=ensure_ndarray(result).nbytes,
+            loader_group=None,
+            extra_rows=extra_rows,
+        )
+
+    @property
+    def load_seconds(self):
+        """Total time spent loading terms.
+        """
+        return sum(p.seconds for p in itervalues(self.terms)
+                   if p.kind == 'load')
+
+    @property
+    def compute_seconds(self):
+        """Total time spent computing terms.
+        """
+        return sum(p.seconds for p in itervalues(self.terms)
+                   if p.kind == 'compute')
+
+    @property
+    def nbytes(self):
+        """Total size of all term outputs.
+        """
+        return sum(p.nbytes for p in itervalues(self.terms))
+
+    def slowest(self, n=10):
+        """
+        The ``n`` terms that took the longest to produce.
+
+        Returns
+        -------
+        profiles : list[TermProfile]
+        """
+        return sorted(
+            itervalues(self.terms),
+            key=lambda p: p.seconds,
+            reverse=True,
+        )[:n]
+
+    def to_frame(self):
+        """
+        Per-term stats as a DataFrame, sorted by descending time.
+
+        Returns
+        -------
+        frame : pd.DataFrame
+            A frame indexed by term name with columns ``kind``, ``seconds``,
+            ``nbytes``, ``loader_group``, and ``extra_rows``.
+        """
+        import pandas as pd
+
+        profiles = self.slowest(len(self.terms))
+        return pd.DataFrame(
+            {
+                'kind': [p.kind for p in profiles],
+                'seconds': [p.seconds for p in profiles],
+                'nbytes': [p.nbytes for p in profiles],
+                'loader_group': [p.loader_group for p in profiles],
+                'extra_rows': [p.extra_rows for p in profiles],
+            },
+            index=[_term_name(p.term) for p in profiles],
+            columns=[
+                'kind', 'seconds', 'nbytes', 'loader_group', 'extra_rows',
+            ],
+        )
+
+    def node_label(self, term):
+        """
+        Text to display under ``term`` when rendering the profiled graph, or
+        None if ``term`` was not executed.
+        """
+        try:
+            p = self.terms[term]
+        except KeyError:
+            return None
+        return '%s %.1fms, %.1fKB' % (p.kind, p.seconds * 1e3, p.nbytes / 1e3)
+
+    def show_graph(self, format='svg'):
+        """
+        Render the executed TermGraph with each node annotated with its
+        timing and memory usage.
+
+        Parameters
+        ----------
+        format : {'svg', 'png', 'jpeg'}
+            Image format to render with.  Default is 'svg'.
+        """
+        from zipline.pipeline.visualize import display_graph
+        return display_graph(self.graph, format, profile=self)
+
+    def __repr__(self):
+        return (
+            '<{name}: {nterms} terms, shape={shape}, load={load:.3f}s, '
+            'compute={compute:.3f}s, nbytes={nbytes}>'.format(
+                name=type(self).__name__,
+                nterms=len(self.terms),
+                shape=self.shape,
+                load=self.load_seconds,
+                compute=self.compute_seconds,
+                nbytes=self.nbytes,
+            )
+        )
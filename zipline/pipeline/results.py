@@ -0,0 +1,198 @@
+"""
+Compact storage for computed pipeline results.
+"""
+from numpy import append, array, cumsum, int64, zeros
+from pandas import DataFrame, MultiIndex, date_range
+from six import iteritems
+
+from zipline.utils.numpy_utils import repeat_first_axis
+
+
+class PipelineChunk(object):
+    """
+    Pipeline results for a contiguous range of dates.
+
+    Results are stored as one flat array per output column, with the rows for
+    each date stored contiguously and in date order. ``offsets[i]`` is the
+    index of the first row for ``dates[i]``, and ``offsets[i + 1]`` is one past
+    its last row, so the results for a single date can be sliced out without
+    searching an index.
+
+    Parameters
+    ----------
+    dates : pd.DatetimeIndex
+        The dates covered by these results.
+    assets : np.ndarray[object]
+        The asset for each row.
+    offsets : np.ndarray[int64]
+        Row offsets for each date. Length is ``len(dates) + 1``.
+    columns : dict[str -> np.ndarray]
+        Map from column name to values for each row.
+    """
+    __slots__ = ('dates', 'assets', 'offsets', 'columns', '_names')
+
+    def __init__(self, dates, assets, offsets, columns):
+        if dates.tz is None:
+            dates = dates.tz_localize('UTC')
+        self.dates = dates
+        self.assets = assets
+        self.offsets = offsets
+        self.columns = columns
+        self._names = sorted(columns)
+
+    @classmethod
+    def from_mask(cls, data, mask, dates, assets):
+        """
+        Build a PipelineChunk from the dense arrays computed by an engine.
+
+        Parameters
+        ----------
+        data : dict[str -> ndarray[ndim=2]]
+            Dict mapping column names to computed results.
+        mask : ndarray[bool, ndim=2]
+            Mask array of values to keep.
+        dates : pd.DatetimeIndex
+            Row index for arrays `data` and `mask`.
+        assets : ndarray[object, ndim=1]
+            Column index for arrays `data` and `mask`.
+
+        Returns
+        -------
+        chunk : PipelineChunk
+            A chunk containing an entry for each (date, asset) pair
+            corresponding to a `True` value in `mask`.
+        """
+        offsets = zeros(len(dates) + 1, dtype=int64)
+        cumsum(mask.sum(axis=1), out=offsets[1:])
+        return cls(
+            dates=dates,
+            assets=repeat_first_axis(assets, len(dates))[mask],
+            offsets=offsets,
+            columns={name: arr[mask] for name, arr in iteritems(data)},
+        )
+
+    @classmethod
+    def from_frame(cls, frame, start_date, end_date):
+        """
+        Build a PipelineChunk from the frame returned by
+        ``PipelineEngine.run_pipeline``.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            A frame with a two-tiered MultiIndex of (date, asset), with its
+            rows sorted by date.
+        start_date : pd.Timestamp
+            The first date the frame was computed for.
+        end_date : pd.Timestamp
+            The last date the frame was computed for.
+
+        Returns
+        -------
+        chunk : PipelineChunk
+            A chunk covering every day from ``start_date`` to ``end_date``
+            and containing one entry per row of `frame`. Days without rows,
+            e.g. days on which the screen filtered out every asset, have
+            empty results.
+        """
+        dates = date_range(start_date, end_date, freq='D')
+        index = frame.index
+        offsets = append(
+            index.get_level_values(0).values.searchsorted(dates.values),
+            len(frame),
+        ).astype(int64)
+        return cls(
+            dates=dates,
+            assets=index.get_level_values(1).values,
+            offsets=offsets,
+            columns={name: frame[name].values for name in frame.columns},
+        )
+
+    @classmethod
+    def empty(cls, dates, names):
+        """
+        Build a PipelineChunk with no rows.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            The dates covered by the chunk.
+        names : iterable[str]
+            The names of the output columns.
+        """
+        return cls(
+            dates=dates,
+            assets=array([], dtype=object),
+            offsets=zeros(len(dates) + 1, dtype=int64),
+            columns={name: array([], dtype=object) for name in names},
+        )
+
+    def __len__(self):
+        return len(self.assets)
+
+    def for_date(self, dt):
+        """
+        Get the results for a single date.
+
+        Parameters
+        ----------
+        dt : pd.Timestamp
+            The date for which to get results.
+
+        Returns
+        -------
+        results : pd.DataFrame
+            A frame indexed by asset with one column per pipeline output.
+
+        Raises
+        ------
+        KeyError
+            Raised when `dt` is not in ``self.dates``.
+        """
+        loc = self.dates.get_loc(dt)
+        rows = slice(self.offsets[loc], self.offsets[loc + 1])
+        columns = self.columns
+        return DataFrame(
+            data={name: columns[name][rows] for name in self._names},
+            index=self.assets[rows],
+            columns=self._names,
+        )
+
+    def to_frame(self):
+        """
+        Get all results as a single frame.
+
+        Returns
+        -------
+        results : pd.DataFrame
+            A frame with a two-tiered MultiIndex of (date, asset) and one
+            column per pipeline output.
+        """
+        if not len(self):
+            # Manually handle the empty DataFrame case. This is a workaround
+            # to pandas failing to tz_localize an empty dataframe with a
+            # MultiIndex.
+            #
+            # Slicing `dates` here to preserve pandas metadata.
+            return DataFrame(
+                data=self.columns,
+                index=MultiIndex.from_arrays([self.dates[:0], self.assets]),
+                columns=self._names,
+            )
+
+        dates_kept = self.dates.values.repeat(
+            self.offsets[1:] - self.offsets[:-1],
+        )
+        return DataFrame(
+            data=self.columns,
+            index=MultiIndex.from_arrays([dates_kept, self.assets]),
+            columns=self._names,
+        ).tz_localize('UTC', level=0)
+
+    def __repr__(self):
+        return '<{name}: {ndates} dates, {nrows} rows, {columns}>'.format(
+            name=type(self).__name__,
+            ndates=len(self.dates),
+            nrows=len(self),
+            columns=self._names,
+        )
@@ -81,7 +81,7 @@ def filter_nodes(include_asset_exists, nodes):
     return filter(lambda n: n is not AssetExists(), nodes)
 
 
-def _render(g, out, format_, include_asset_exists=False):
+def _render(g, out, format_, include_asset_exists=False, profile=None):
     """
     Draw `g` as a graph to `out`, in format `format`.
 
@@ -94,6 +94,9 @@ def _render(g, out, format_, include_asset_exists=False):
         Output format.
     include_asset_exists : bool
         Whether to filter out `AssetExists()` nodes.
+    profile : zipline.pipeline.profiling.PipelineProfile, optional
+        If supplied, annotate each node with the time and memory recorded for
+        it in `profile`.
     """
     graph_attrs = {'rankdir': 'TB', 'splines': 'ortho'}
     cluster_attrs = {'style': 'filled', 'color': 'lightgoldenrod1'}
@@ -107,18 +110,18 @@ def _render(g, out, format_, include_asset_exists=False):
         # Write outputs cluster.
         with cluster(f, 'Output', labelloc='b', **cluster_attrs):
             for term in filter_nodes(include_asset_exists, out_nodes):
-                add_term_node(f, term)
+                add_term_node(f, term, profile)
 
         # Write inputs cluster.
         with cluster(f, 'Input', **cluster_attrs):
             for term in filter_nodes(include_asset_exists, in_nodes):
-                add_term_node(f, term)
+                add_term_node(f, term, profile)
 
         # Write intermediate results.
         for term in filter_nodes(include_asset_exists, topological_sort(g)):
             if term in in_nodes or term in out_nodes:
                 continue
-            add_term_node(f, term)
+            add_term_node(f, term, profile)
 
         # Write edges
         for source, dest in g.edges():
@@ -148,9 +151,12 @@ def _render(g, out, format_, include_asset_exists=False):
     out.write(proc_stdout)
 
 
-def display_graph(g, format='svg', include_asset_exists=False):
+def display_graph(g, format='svg', include_asset_exists=False, profile=None):
     """
     Display a TermGraph interactively from within IPython.
+
+    If `profile` is supplied, each node is annotated with the time and memory
+    recorded for it by a profiling SimplePipelineEngine.
     """
     try:
         import IPython.display as display
@@ -163,7 +169,13 @@ def display_graph(g, format='svg', include_asset_exists=False):
         display_cls = partial(display.Image, format=format, embed=True)
 
     out = BytesIO()
-    _render(g, out, format, include_asset_exists=include_asset_exists)
+    _render(
+        g,
+        out,
+        format,
+        include_asset_exists=include_asset_exists,
+        profile=profile,
+    )
     return display_cls(data=out.getvalue())
 
 
@@ -171,7 +183,7 @@ def writeln(f, s):
     f.write((s + '\n').encode('utf-8'))
 
 
-def fmt(obj):
+def fmt(obj, note=None):
     if isinstance(obj, Term):
         if hasattr(obj, 'short_repr'):
             r = obj.short_repr()
@@ -179,11 +191,21 @@ def fmt(obj):
             r = type(obj).__name__
     else:
         r = obj
+    if note is not None:
+        # Graphviz interprets a literal backslash-n as a line break.
+        r = '%s\\n%s' % (r, note)
     return '"%s"' % r
 
 
-def add_term_node(f, term):
-    declare_node(f, id(term), attrs_for_node(term))
+def add_term_node(f, term, profile=None):
+    if profile is None:
+        declare_node(f, id(term), attrs_for_node(term))
+    else:
+        declare_node(
+            f,
+            id(term),
+            attrs_for_node(term, label=fmt(term, profile.node_label(term))),
+        )
 
 
 def declare_node(f, name, attributes):
@@ -1,7 +1,12 @@
-from six import StringIO, iteritems
+from six import iteritems, string_types
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 import hashlib
+import io
+import json
+import os
+from os.path import exists, join
+from tempfile import mkstemp
 from textwrap import dedent
 import pandas as pd
 from pandas import read_csv
@@ -21,9 +26,102 @@ from zipline.protocol import (
     Event
 )
 from zipline.assets import Equity
+from zipline.data.paths import cache_root
+from zipline.utils.atomic_write import atomic_write_file
 
 logger = Logger('Requests Source Logger')
 
+#: Bump this whenever the parsing done by ``PandasCSV.load_df`` changes, so
+#: that frames cached by older versions are not used.
+FETCHER_CACHE_VERSION = 1
+
+#: The number of parsed frames kept in the fetcher cache. The least recently
+#: used frames are removed whenever a new one is written.
+FETCHER_CACHE_SIZE = 32
+
+#: The number of rows parsed at a time when no ``pre_func`` is given.
+FETCHER_CHUNK_SIZE = 100000
+
+
+def fetcher_cache_root(environ=None):
+    """
+    The directory in which parsed fetcher frames are cached.
+
+    Parameters
+    ----------
+    environ : dict, optional
+        An environment dict to forward to zipline_root.
+
+    Returns
+    -------
+    path : str
+    """
+    return join(cache_root(environ=environ), 'fetcher')
+
+
+def read_fetcher_cache(path):
+    """
+    Read a frame written by ``write_fetcher_cache``, or return None if there
+    is no readable frame at ``path``.
+    """
+    if not exists(path):
+        return None
+    try:
+        df = pd.read_pickle(path)
+    except Exception:
+        # The cache is an optimization: treat a corrupt cache as missing.
+        logger.warn('Ignoring unreadable fetcher cache {}'.format(path))
+        return None
+
+    # Mark the frame as recently used for ``prune_fetcher_cache``.
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+    return df
+
+
+def write_fetcher_cache(path, df):
+    """
+    Write ``df`` to ``path`` with ``atomic_write_file``.
+    """
+    with atomic_write_file(path) as tmp:
+        df.to_pickle(tmp)
+
+
+def prune_fetcher_cache(root=None, size=FETCHER_CACHE_SIZE):
+    """
+    Remove all but the ``size`` most recently used frames from the fetcher
+    cache.
+
+    Parameters
+    ----------
+    root : str, optional
+        The cache directory. Defaults to ``fetcher_cache_root()``.
+    size : int, optional
+        The number of frames to keep.
+    """
+    if root is None:
+        root = fetcher_cache_root()
+
+    def last_used(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            # Removed by another process.
+            return 0
+
+    paths = [
+        join(root, name) for name in os.listdir(root)
+        if name.endswith('.pickle')
+    ]
+    paths.sort(key=last_used, reverse=True)
+    for path in paths[size:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 
 def roll_dts_to_midnight(dts, env):
     if len(dts) == 0:
@@ -154,6 +252,7 @@ class PandasCSV(object):
                  mask,
                  symbol_column,
                  data_frequency,
+                 cache=True,
                  **kwargs):
 
         self.start_date = start_date
@@ -181,6 +280,11 @@ class PandasCSV(object):
         self.pre_func = pre_func
         self.post_func = post_func
 
+        self.cache = cache
+        # Map from each symbol seen so far to its sid, 0 if it must be
+        # resolved by date, or NaN if it is unknown.
+        self._symbol_sids = {}
+
     @property
     def fields(self):
         return self.df.columns.tolist()
@@ -192,6 +296,54 @@ class PandasCSV(object):
     def fetch_data(self):
         return
 
+    def fetch_data_chunks(self):
+        """
+        The fetched data as an iterator of DataFrames. Subclasses which can
+        parse their data incrementally should override this.
+        """
+        yield self.fetch_data()
+
+    def content_hash(self):
+        """
+        A hash of the raw fetched data, or None if it is not known. Parsed
+        frames are only cached when this is known.
+        """
+        return None
+
+    def cache_path(self):
+        """
+        The path at which the parsed frame for the fetched data is cached, or
+        None if it should not be cached.
+
+        The key covers the fetched content, everything that changes how it is
+        parsed and the asset database the symbols are mapped with. Frames are
+        not cached when a ``pre_func`` is given, because its behavior can't be
+        keyed.
+        """
+        if not self.cache or self.pre_func is not None:
+            return None
+        content_hash = self.content_hash()
+        if content_hash is None:
+            return None
+
+        key = json.dumps([
+            FETCHER_CACHE_VERSION,
+            content_hash,
+            repr(sorted(iteritems(self.pandas_kwargs))),
+            self.date_column,
+            self.date_format,
+            str(self.timezone),
+            repr(self.symbol),
+            self.symbol_column,
+            self.data_frequency,
+            repr(self.env.trading_day),
+            self.finder.asset_table.fingerprint if self.finder else None,
+        ])
+        return join(
+            fetcher_cache_root(),
+            hashlib.md5(key.encode('utf-8')).hexdigest() + '.pickle',
+        )
+
     @staticmethod
     def parse_date_str_series(format_str, tz, date_str_series, data_frequency,
                               env):
@@ -254,6 +406,21 @@ class PandasCSV(object):
 
         return pandas_kwargs
 
+    def _lookup_unconflicted_symbols(self, symbols):
+        """
+        ``_lookup_unconflicted_symbol`` for each of ``symbols``, memoized
+        across the chunks of a load.
+        """
+        cache = self._symbol_sids
+        result = []
+        for symbol in symbols:
+            try:
+                sid = cache[symbol]
+            except KeyError:
+                sid = cache[symbol] = self._lookup_unconflicted_symbol(symbol)
+            result.append(sid)
+        return result
+
     def _lookup_unconflicted_symbol(self, symbol):
         """
         Attempt to find a unique asset whose symbol is the given string.
@@ -279,10 +446,60 @@ class PandasCSV(object):
             return numpy.nan
 
     def load_df(self):
-        df = self.fetch_data()
+        cache_path = self.cache_path()
+        df = read_fetcher_cache(cache_path) if cache_path else None
+
+        if df is None:
+            if self.pre_func:
+                chunks = [self.pre_func(self.fetch_data())]
+            else:
+                chunks = self.fetch_data_chunks()
+
+            parsed = []
+            no_sid_count = 0
+            for chunk in chunks:
+                chunk, dropped = self._parse_chunk(chunk)
+                parsed.append(chunk)
+                no_sid_count += dropped
+
+            if no_sid_count:
+                logger.warn(
+                    "Dropped {} rows from fetched csv.".format(no_sid_count),
+                    no_sid_count,
+                    extra={'syslog': True},
+                )
+
+            df = self._finalize(
+                pd.concat(parsed) if len(parsed) > 1 else parsed[0],
+            )
+            if cache_path:
+                try:
+                    write_fetcher_cache(cache_path, df)
+                    prune_fetcher_cache(os.path.dirname(cache_path))
+                except (OSError, IOError) as e:
+                    logger.warn(
+                        'Could not cache fetched csv: {}'.format(e),
+                    )
+
+        if self.post_func:
+            df = self.post_func(df)
 
-        if self.pre_func:
-            df = self.pre_func(df)
+        return df
+
+    def _parse_chunk(self, df):
+        """
+        Parse the dates of a chunk of fetched rows and map their symbols to
+        sids.
+
+        Returns
+        -------
+        df : pd.DataFrame
+            The rows with a 'dt' column and, when mapping symbols, a 'sid'
+            column.
+        no_sid_count : int
+            The number of rows dropped because their symbol wasn't found.
+        """
+        no_sid_count = 0
 
         # Batch-convert the user-specifed date column into timestamps.
         df['dt'] = self.parse_date_str_series(
@@ -323,47 +540,44 @@ class PandasCSV(object):
             # exists are replaced with NaNs.
             unique_symbols = df[self.symbol_column].unique()
             sid_series = pd.Series(
-                data=map(self._lookup_unconflicted_symbol, unique_symbols),
+                data=self._lookup_unconflicted_symbols(unique_symbols),
                 index=unique_symbols,
                 name='sid',
             )
             df = df.join(sid_series, on=self.symbol_column)
 
-            # Fill any zero entries left in our sid column by doing a lookup
-            # using both symbol and the row date.
-            conflict_rows = df[df['sid'] == 0]
-            for row_idx, row in conflict_rows.iterrows():
-                try:
-                    asset = self.finder.lookup_symbol(
-                        row[self.symbol_column],
-                        # Replacing tzinfo here is necessary because of the
-                        # timezone metadata bug described below.
-                        row['dt'].replace(tzinfo=pytz.utc),
-
-                        # It's possible that no asset comes back here if our
-                        # lookup date is from before any asset held the
-                        # requested symbol.  Mark such cases as NaN so that
-                        # they get dropped in the next step.
-                    ) or numpy.nan
-                except SymbolNotFound:
-                    asset = numpy.nan
-
-                # Assign the resolved asset to the cell
-                df.ix[row_idx, 'sid'] = asset
+            # Fill any zero entries left in our sid column by looking up each
+            # of their symbols on the row's date, all in one pass.
+            conflicts = (df['sid'] == 0).values
+            if conflicts.any():
+                conflict_rows = df[conflicts]
+                assets = self.finder.lookup_symbols(
+                    conflict_rows[self.symbol_column].tolist(),
+                    # 'dt' holds naive datetimes in UTC.
+                    pd.DatetimeIndex(conflict_rows['dt']),
+                    default_none=True,
+                )
+                # It's possible that no asset comes back here if our lookup
+                # date is from before any asset held the requested symbol.
+                # Mark such cases as NaN so that they get dropped in the next
+                # step.
+                df.loc[conflicts, 'sid'] = [
+                    numpy.nan if asset is None else asset for asset in assets
+                ]
 
             # Filter out rows containing symbols that we failed to find.
             length_before_drop = len(df)
             df = df[df['sid'].notnull()]
             no_sid_count = length_before_drop - len(df)
-            if no_sid_count:
-                logger.warn(
-                    "Dropped {} rows from fetched csv.".format(no_sid_count),
-                    no_sid_count,
-                    extra={'syslog': True},
-                )
         else:
             df['sid'] = df['symbol']
 
+        return df, no_sid_count
+
+    def _finalize(self, df):
+        """
+        Index the parsed rows by date and drop the date and symbol columns.
+        """
         # Dates are localized to UTC when they come out of
         # parse_date_str_series, but we need to re-localize them here because
         # of a bug that wasn't fixed until
@@ -382,12 +596,7 @@ class PandasCSV(object):
         cols_to_drop = [self.date_column]
         if self.symbol is None:
             cols_to_drop.append(self.symbol_column)
-        df = df[df.columns.drop(cols_to_drop)]
-
-        if self.post_func:
-            df = self.post_func(df)
-
-        return df
+        return df[df.columns.drop(cols_to_drop)]
 
     def __iter__(self):
         asset_cache = {}
@@ -503,6 +712,7 @@ class PandasRequestsCSV(PandasCSV):
 
         self.fetch_size = None
         self.fetch_hash = None
+        self._fetch_path = None
 
         self.df = self.load_df()
 
@@ -554,32 +764,77 @@ class PandasRequestsCSV(PandasCSV):
 
         return
 
-    def fetch_data(self):
-        # create a data frame directly from the full text of
-        # the response from the returned file-descriptor.
+    def _download(self):
+        """
+        Download ``self.url`` to a temporary file, recording the size and md5
+        of its content.
+        """
         data = self.fetch_url(self.url)
-        fd = StringIO()
-
-        if isinstance(data, str):
-            fd.write(data)
-        else:
-            for chunk in data:
-                fd.write(chunk)
+        if isinstance(data, string_types):
+            data = [data]
 
-        self.fetch_size = fd.tell()
+        fd, self._fetch_path = mkstemp(suffix='.csv')
+        os.close(fd)
 
-        fd.seek(0)
+        size = 0
+        md5 = hashlib.md5()
+        with io.open(self._fetch_path, 'w', encoding='utf-8') as f:
+            for chunk in data:
+                if isinstance(chunk, bytes):
+                    chunk = chunk.decode('utf-8')
+                f.write(chunk)
+                size += len(chunk)
+                md5.update(chunk.encode('utf-8'))
+
+        self.fetch_size = size
+        self.fetch_hash = md5.hexdigest()
+
+    def _cleanup_download(self):
+        path, self._fetch_path = self._fetch_path, None
+        if path is not None:
+            os.remove(path)
+
+    def _read_csv(self, **kwargs):
+        if self._fetch_path is None:
+            self._download()
+        kwargs.update(self.pandas_kwargs)
+        kwargs.setdefault('encoding', 'utf-8')
+        return read_csv(self._fetch_path, **kwargs)
+
+    def content_hash(self):
+        if self.fetch_hash is None:
+            self._download()
+        return self.fetch_hash
 
+    def fetch_data(self):
         try:
             # see if pandas can parse csv data
-            frames = read_csv(fd, **self.pandas_kwargs)
+            return self._read_csv()
+        except pd.parser.CParserError:
+            # could not parse the data, raise exception
+            raise Exception('Error parsing remote CSV data.')
+
+    def fetch_data_chunks(self):
+        if 'chunksize' in self.pandas_kwargs:
+            chunksize = self.pandas_kwargs['chunksize']
+        else:
+            chunksize = FETCHER_CHUNK_SIZE
 
-            frames_hash = hashlib.md5(str(fd.getvalue()).encode('utf-8'))
-            self.fetch_hash = frames_hash.hexdigest()
+        empty = True
+        try:
+            for chunk in self._read_csv(chunksize=chunksize):
+                empty = False
+                yield chunk
         except pd.parser.CParserError:
             # could not parse the data, raise exception
             raise Exception('Error parsing remote CSV data.')
-        finally:
-            fd.close()
 
-        return frames
+        if empty:
+            # A document with no rows still has columns to report.
+            yield self.fetch_data()
+
+    def load_df(self):
+        try:
+            return super(PandasRequestsCSV, self).load_df()
+        finally:
+            self._cleanup_download()
@@ -820,7 +820,8 @@ class WithAdjustmentReader(WithBcolzDailyBarReader):
     @classmethod
     def init_class_fixtures(cls):
         super(WithAdjustmentReader, cls).init_class_fixtures()
-        conn = sqlite3.connect(':memory:')
+        # The reader may be used from a thread prefetching a pipeline.
+        conn = sqlite3.connect(':memory:', check_same_thread=False)
         cls.make_adjustment_writer(conn).write(
             splits=cls.make_splits_data(),
             mergers=cls.make_mergers_data(),
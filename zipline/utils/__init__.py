@@ -13,6 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .cli import run_pipeline, parse_args, parse_cell_magic
+from .lazy_module import install_lazy_imports
 
 __all__ = ['run_pipeline', 'parse_args', 'parse_cell_magic']
+
+# The cli module imports most of zipline, so only import it when needed.
+install_lazy_imports(__name__, {
+    name: '.cli:' + name for name in __all__
+})
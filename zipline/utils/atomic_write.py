@@ -0,0 +1,94 @@
+"""
+Writing files and directories so that readers never see partial results.
+
+Each helper writes to a temporary path next to the destination, on the same
+filesystem, and renames it into place once it is complete. A rename within a
+filesystem is atomic, so concurrent readers see either the old contents or
+the new ones, and a crash while writing leaves the destination untouched.
+"""
+from contextlib import contextmanager
+import errno
+import os
+from os.path import abspath, dirname, exists
+import shutil
+from tempfile import mkdtemp, mkstemp
+
+
+def ensure_directory(path):
+    """
+    Create ``path`` and any missing parents, if it doesn't already exist.
+    """
+    try:
+        os.makedirs(path)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+
+
+@contextmanager
+def atomic_write_file(path):
+    """
+    Context manager yielding a temporary path to write instead of ``path``.
+
+    If the block exits without an error, the temporary file replaces
+    ``path``. Otherwise it is removed, and ``path`` is left as it was.
+
+    Parameters
+    ----------
+    path : str
+        The file to write.
+    """
+    parent = dirname(abspath(path))
+    ensure_directory(parent)
+    fd, tmp = mkstemp(dir=parent)
+    os.close(fd)
+    try:
+        yield tmp
+        os.rename(tmp, path)
+    except BaseException:
+        if exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+@contextmanager
+def atomic_write_directory(path, overwrite=True):
+    """
+    Context manager yielding a temporary directory to fill instead of
+    ``path``.
+
+    If the block exits without an error, the temporary directory is renamed
+    to ``path``. Otherwise it is removed, and ``path`` is left as it was.
+
+    Parameters
+    ----------
+    path : str
+        The directory to write.
+    overwrite : bool, optional
+        Whether to replace ``path`` if it already exists. If False, an
+        existing ``path``, e.g. one written concurrently by another process,
+        is kept and the new directory is discarded. Default is True.
+
+    Notes
+    -----
+    Replacing an existing directory takes two steps, because a directory
+    can't be renamed over a non-empty one, so readers may briefly find
+    ``path`` missing.
+    """
+    parent = dirname(abspath(path))
+    ensure_directory(parent)
+    tmp = mkdtemp(dir=parent)
+    try:
+        yield tmp
+        if overwrite and exists(path):
+            shutil.rmtree(path)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            if overwrite or not exists(path):
+                raise
+            # Another writer won the race.
+            shutil.rmtree(tmp, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
@@ -0,0 +1,68 @@
+"""
+Utilities for running work off of the simulation thread.
+"""
+import sys
+from threading import Thread
+
+from six import reraise
+
+
+class BackgroundCall(object):
+    """
+    Call a function on a daemon thread and hold on to its result.
+
+    Any exception raised by the function is stored and re-raised, with its
+    original traceback, when ``result`` is called.
+
+    Parameters
+    ----------
+    func : callable
+        The function to call.
+    *args, **kwargs
+        Arguments to pass to ``func``.
+
+    Usage
+    -----
+    >>> call = BackgroundCall(sum, [1, 2, 3])
+    >>> call.result()
+    6
+    >>> call = BackgroundCall(int, 'not an int')
+    >>> call.result()
+    Traceback (most recent call last):
+        ...
+    ValueError: invalid literal for int() with base 10: 'not an int'
+    """
+    def __init__(self, func, *args, **kwargs):
+        self._value = None
+        self._exc_info = None
+        self._thread = Thread(
+            target=self._run,
+            args=(func, args, kwargs),
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, func, args, kwargs):
+        try:
+            self._value = func(*args, **kwargs)
+        except BaseException:
+            self._exc_info = sys.exc_info()
+
+    def done(self):
+        """Has the call finished?
+        """
+        return not self._thread.is_alive()
+
+    def result(self):
+        """
+        Block until the call finishes and return its result.
+
+        Raises
+        ------
+        Exception
+            Any exception raised by the wrapped function.
+        """
+        self._thread.join()
+        if self._exc_info is not None:
+            reraise(*self._exc_info)
+        return self._value
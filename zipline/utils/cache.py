@@ -70,6 +70,10 @@ class ExpiringCache(object):
         An instance of a dict-like object which needs to support at least:
         `__del__`, `__getitem__`, `__setitem__`
         If `None`, than a dict is used as a default.
+    stats : zipline.utils.instrumentation.DataAccessStats, optional
+        If provided, the ``cache_hits``, ``cache_misses`` and
+        ``cache_expirations`` counters of ``stats`` are incremented on each
+        call to ``get``.
 
     Methods
     -------
@@ -97,18 +101,29 @@ class ExpiringCache(object):
     KeyError: 'foo'
     """
 
-    def __init__(self, cache=None):
+    def __init__(self, cache=None, stats=None):
         if cache is not None:
             self._cache = cache
         else:
             self._cache = {}
+        self._stats = stats
 
     def get(self, key, dt):
+        stats = self._stats
         try:
-            return self._cache[key].unwrap(dt)
+            value = self._cache[key].unwrap(dt)
+        except KeyError:
+            if stats is not None:
+                stats.incr('cache_misses')
+            raise
         except Expired:
             del self._cache[key]
+            if stats is not None:
+                stats.incr('cache_expirations')
             raise KeyError(key)
+        if stats is not None:
+            stats.incr('cache_hits')
+        return value
 
     def set(self, key, value, expiration_dt):
         self._cache[key] = CachedObject(value, expiration_dt)
@@ -0,0 +1,318 @@
+"""
+Lazily computed trading calendars backed by an on-disk cache.
+
+Computing a trading calendar from its rrules, and building the per-day
+``open_and_closes`` frame, is expensive enough to dominate the startup time of
+short-lived processes. The calendar modules in ``zipline.utils`` therefore
+only compute their calendars the first time one of the calendar attributes is
+accessed, and persist the result as int64 arrays under the zipline data root
+so that later processes can memory-map them instead of recomputing them.
+
+Calendars are computed through the end of the year containing the module's
+``end`` and truncated on load, so a cache entry stays valid for a whole year
+instead of changing with today's date. Entries are keyed by a hash of the
+calendar module's source, and stale entries for the same calendar are removed
+whenever a new one is written.
+"""
+from hashlib import sha1
+import json
+import os
+from os.path import exists, join
+import shutil
+
+import numpy as np
+import pandas as pd
+from six import iteritems
+
+from .atomic_write import atomic_write_directory
+from .lazy_module import LazyModule
+
+#: Bump this whenever the calendar rules or the on-disk layout change so that
+#: stale caches are ignored.
+CALENDAR_CACHE_VERSION = 1
+
+_MANIFEST = 'manifest.json'
+
+
+def calendar_cache_root(environ=None):
+    """
+    The directory in which computed calendars are cached.
+
+    Parameters
+    ----------
+    environ : dict, optional
+        An environment dict to forward to zipline_root.
+
+    Returns
+    -------
+    root : str
+        The calendar cache directory.
+    """
+    from zipline.data.paths import data_root
+    return join(data_root(environ=environ), 'calendars')
+
+
+def _cache_dirname(name, rules, start, horizon):
+    return '{name}-v{version}-{rules}-{start:%Y%m%d}-{horizon:%Y%m%d}'.format(
+        name=name,
+        version=CALENDAR_CACHE_VERSION,
+        rules=rules,
+        start=start,
+        horizon=horizon,
+    )
+
+
+def calendar_horizon(end):
+    """
+    The date through which a calendar ending on ``end`` is computed and
+    cached: the last day of ``end``'s year.
+
+    Parameters
+    ----------
+    end : datetime
+        The last date the calendar must cover.
+
+    Returns
+    -------
+    horizon : pd.Timestamp
+        December 31st of ``end``'s year, in UTC.
+    """
+    return pd.Timestamp('%d-12-31' % end.year, tz='UTC')
+
+
+def _rules_token(module):
+    # The builders live in the calendar module itself, so any change to the
+    # rules changes the module's source.
+    path = module.__file__
+    if path.endswith(('.pyc', '.pyo')):
+        path = path[:-1]
+    with open(path, 'rb') as f:
+        return sha1(f.read()).hexdigest()[:12]
+
+
+def prune_calendar_cache(path):
+    """
+    Remove cached calendars with the same name as the one at ``path``.
+
+    Parameters
+    ----------
+    path : str
+        The cache entry to keep.
+    """
+    root, keep = os.path.split(path)
+    prefix = keep.split('-', 1)[0] + '-'
+    for entry in os.listdir(root):
+        if entry.startswith(prefix) and entry != keep:
+            shutil.rmtree(join(root, entry), ignore_errors=True)
+
+
+def truncate_calendar(calendar, end):
+    """
+    Drop the dates after ``end`` from each of a calendar's values.
+
+    Parameters
+    ----------
+    calendar : dict
+        The calendar values, without ``trading_day``.
+    end : datetime
+        The last date to keep.
+
+    Returns
+    -------
+    truncated : dict
+        The truncated values. Indexes and frames are sliced without
+        copying their data.
+    """
+    end = pd.Timestamp(end)
+    truncated = {}
+    for name, value in iteritems(calendar):
+        if isinstance(value, pd.DataFrame):
+            value = value.iloc[:value.index.searchsorted(end, side='right')]
+        elif isinstance(value, pd.DatetimeIndex):
+            value = value[:value.searchsorted(end, side='right')]
+        else:
+            value = [dt for dt in value if dt <= end]
+        truncated[name] = value
+    return truncated
+
+
+def write_calendar(path, calendar):
+    """
+    Write the computed values of a calendar to ``path``, with
+    ``atomic_write_directory``.
+
+    Parameters
+    ----------
+    path : str
+        The directory to write.
+    calendar : dict[str -> DatetimeIndex, DataFrame, or list[datetime]]
+        The computed calendar, as returned by a calendar's ``build``
+        function. ``trading_day`` is not written because it is rebuilt from
+        ``non_trading_days``. DataFrames must have a DatetimeIndex and only
+        datetime columns.
+    """
+    def save(name, values):
+        np.save(join(tmp, name + '.npy'), pd.DatetimeIndex(values).asi8)
+
+    # Another process may win the race to write the same calendar, in which
+    # case its copy is kept.
+    with atomic_write_directory(path, overwrite=False) as tmp:
+        manifest = {}
+        for name, value in iteritems(calendar):
+            if name == 'trading_day':
+                continue
+            elif isinstance(value, pd.DataFrame):
+                manifest[name] = ['frame', list(value.columns)]
+                save(name + '.index', value.index)
+                for column in value.columns:
+                    save(name + '.' + column, value[column])
+            elif isinstance(value, pd.DatetimeIndex):
+                manifest[name] = ['index']
+                save(name, value)
+            else:
+                manifest[name] = ['list']
+                save(name, value)
+
+        with open(join(tmp, _MANIFEST), 'w') as f:
+            json.dump(manifest, f)
+
+
+def read_calendar(path):
+    """
+    Read a calendar written by ``write_calendar``, memory-mapping its arrays.
+
+    Parameters
+    ----------
+    path : str
+        The directory to read.
+
+    Returns
+    -------
+    calendar : dict
+        The calendar values, without ``trading_day``.
+    """
+    def load(name):
+        arr = np.load(join(path, name + '.npy'), mmap_mode='r')
+        # Localizing naive values to UTC leaves them unchanged, so the index
+        # is built directly on top of the mapped buffer.
+        return pd.DatetimeIndex(arr.view('M8[ns]'), tz='UTC', copy=False)
+
+    with open(join(path, _MANIFEST)) as f:
+        manifest = json.load(f)
+
+    calendar = {}
+    for name, spec in iteritems(manifest):
+        kind = spec[0]
+        if kind == 'frame':
+            frame = pd.DataFrame(
+                index=load(name + '.index'),
+                columns=spec[1],
+            )
+            # Assign tuples of Timestamps to match the dtypes produced by
+            # ``tradingcalendar.get_open_and_closes``.
+            for column in spec[1]:
+                frame[column] = tuple(load(name + '.' + column))
+            calendar[name] = frame
+        elif kind == 'index':
+            calendar[name] = load(name)
+        else:
+            calendar[name] = list(load(name).to_pydatetime())
+    return calendar
+
+
+class LazyCalendarModule(LazyModule):
+    """
+    A calendar module whose calendar attributes are computed, or read from
+    the calendar cache, on first access.
+
+    Parameters
+    ----------
+    module : module
+        The calendar module being replaced.
+    cache_name : str
+        Name of the calendar in the on-disk cache.
+    build : callable[(start, end) -> dict]
+        Function decorated with ``calendar_builder`` computing the calendar's
+        attributes from its rules between ``start`` and ``end``.
+    """
+    def __init__(self, module, cache_name, build):
+        super(LazyCalendarModule, self).__init__(module)
+        self._cache_name = cache_name
+        self._build = build
+        self._lazy_names = build.names
+
+    def _cache_path(self):
+        return join(
+            calendar_cache_root(),
+            _cache_dirname(
+                self._cache_name,
+                _rules_token(self._wrapped_module),
+                self.start,
+                calendar_horizon(self.end),
+            ),
+        )
+
+    def _load(self, name):
+        # All of the calendar's attributes are loaded together.
+        names = self._lazy_names
+        path = calendar = None
+        try:
+            path = self._cache_path()
+            if exists(path):
+                calendar = read_calendar(path)
+        except Exception:
+            # The cache is an optimization: fall back to recomputing the
+            # calendar if it is missing, unreadable or corrupt.
+            calendar = None
+
+        if calendar is None or set(calendar) != names - {'trading_day'}:
+            calendar = self._build(self.start, calendar_horizon(self.end))
+            calendar.pop('trading_day', None)
+            if path is not None:
+                try:
+                    write_calendar(path, calendar)
+                    prune_calendar_cache(path)
+                except Exception:
+                    pass
+
+        calendar = truncate_calendar(calendar, self.end)
+        if 'trading_day' in names and 'trading_day' not in calendar:
+            calendar['trading_day'] = pd.tseries.offsets.CDay(
+                holidays=calendar['non_trading_days'],
+            )
+
+        for attr in names:
+            setattr(self._wrapped_module, attr, calendar[attr])
+            self.__dict__[attr] = calendar[attr]
+
+
+def calendar_builder(*names):
+    """
+    Decorator marking a function as the builder for a lazy calendar module.
+
+    Parameters
+    ----------
+    *names : str
+        The module attributes computed by the decorated function.
+    """
+    def decorator(f):
+        f.names = frozenset(names)
+        return f
+    return decorator
+
+
+def install_lazy_calendar(module_name, cache_name, build):
+    """
+    Replace the module named ``module_name`` with a LazyCalendarModule.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the calendar module, usually ``__name__``.
+    cache_name : str
+        Name of the calendar in the on-disk cache.
+    build : callable[(start, end) -> dict]
+        Function decorated with ``calendar_builder`` computing the calendar
+        between ``start`` and ``end``.
+    """
+    LazyCalendarModule.install(module_name, cache_name, build)
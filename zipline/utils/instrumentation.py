@@ -0,0 +1,158 @@
+"""
+Lightweight counters and timers for instrumenting data access.
+"""
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+from timeit import default_timer
+
+from six import iteritems
+
+
+class StatsSnapshot(namedtuple('_StatsSnapshot', 'counts timings')):
+    """
+    An immutable view of the state of a ``DataAccessStats`` at a point in
+    time.
+
+    Parameters
+    ----------
+    counts : dict[str -> int]
+        Map from counter name to the number of events (or bytes) recorded.
+    timings : dict[str -> float]
+        Map from timer name to the total number of seconds recorded.
+
+    Snapshots support ``+`` to merge the stats of several components and
+    ``-`` to compute the activity that happened between two snapshots.
+
+    Usage
+    -----
+    >>> before = StatsSnapshot({'spot_reads': 2}, {'window_reads': 0.5})
+    >>> after = StatsSnapshot({'spot_reads': 7}, {'window_reads': 0.75})
+    >>> delta = after - before
+    >>> delta.counts
+    {'spot_reads': 5}
+    >>> delta.timings
+    {'window_reads': 0.25}
+    """
+    def __add__(self, other):
+        return StatsSnapshot(
+            _combine(self.counts, other.counts, 1),
+            _combine(self.timings, other.timings, 1),
+        )
+
+    def __sub__(self, other):
+        return StatsSnapshot(
+            _combine(self.counts, other.counts, -1),
+            _combine(self.timings, other.timings, -1),
+        )
+
+    def prefixed(self, prefix):
+        """
+        Return a copy of this snapshot with ``prefix`` prepended to every
+        counter and timer name.
+        """
+        return StatsSnapshot(
+            {prefix + k: v for k, v in iteritems(self.counts)},
+            {prefix + k: v for k, v in iteritems(self.timings)},
+        )
+
+    def to_series(self):
+        """
+        Return the counters and timers as a single ``pd.Series``.
+
+        Timer entries are suffixed with ``_seconds``.
+        """
+        import pandas as pd
+
+        data = dict(self.counts)
+        data.update(
+            (k + '_seconds', v) for k, v in iteritems(self.timings)
+        )
+        return pd.Series(data).sort_index()
+
+
+EMPTY_SNAPSHOT = StatsSnapshot({}, {})
+
+
+def _combine(left, right, sign):
+    out = dict(left)
+    for k, v in iteritems(right):
+        out[k] = out.get(k, 0) + sign * v
+    return out
+
+
+class DataAccessStats(object):
+    """
+    A mutable collection of named counters and timers.
+
+    Instances are cheap to update and are meant to be owned by a single
+    reader or loader. Use ``snapshot`` to capture the current values, and
+    ``reset`` to zero all counters and timers.
+
+    Usage
+    -----
+    >>> stats = DataAccessStats()
+    >>> stats.incr('carray_opens')
+    >>> stats.incr('bytes_decompressed', 4096)
+    >>> with stats.timer('window_reads'):
+    ...     pass
+    >>> snap = stats.snapshot()
+    >>> snap.counts['bytes_decompressed'], snap.counts['window_reads']
+    (4096, 1)
+    >>> stats.reset()
+    >>> stats.snapshot().counts
+    {}
+    """
+    __slots__ = ('_counts', '_timings')
+
+    def __init__(self):
+        self._counts = defaultdict(int)
+        self._timings = defaultdict(float)
+
+    def incr(self, name, n=1):
+        """
+        Increment the counter ``name`` by ``n``.
+        """
+        self._counts[name] += n
+
+    def add_time(self, name, seconds):
+        """
+        Add ``seconds`` to the timer ``name``.
+        """
+        self._timings[name] += seconds
+
+    @contextmanager
+    def timer(self, name):
+        """
+        Context manager that increments the counter ``name`` and adds the
+        elapsed wall time of the block to the timer ``name``.
+        """
+        start = default_timer()
+        try:
+            yield
+        finally:
+            self._timings[name] += default_timer() - start
+            self._counts[name] += 1
+
+    def snapshot(self):
+        """
+        Capture the current values of all counters and timers.
+
+        Returns
+        -------
+        snapshot : StatsSnapshot
+        """
+        return StatsSnapshot(dict(self._counts), dict(self._timings))
+
+    def reset(self):
+        """
+        Zero all counters and timers.
+        """
+        self._counts.clear()
+        self._timings.clear()
+
+    def __repr__(self):
+        return '<{0}: counts={1}, timings={2}>'.format(
+            type(self).__name__,
+            dict(self._counts),
+            dict(self._timings),
+        )
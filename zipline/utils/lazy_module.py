@@ -0,0 +1,105 @@
+"""
+Modules whose attributes are computed or imported on first access.
+"""
+from importlib import import_module
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """
+    Base class for modules which defer computing some of their attributes
+    until they are first accessed.
+
+    A LazyModule replaces an already-executed module in ``sys.modules``.  All
+    of the original module's attributes are copied onto the LazyModule, and
+    the original module is kept alive because its functions still refer to
+    its globals.
+
+    Subclasses must set ``_lazy_names`` and implement ``_load(name)``, which
+    must store a value for ``name`` in ``self.__dict__``.
+
+    Parameters
+    ----------
+    module : module
+        The module being replaced.
+    """
+    _lazy_names = frozenset()
+
+    def __init__(self, module):
+        super(LazyModule, self).__init__(module.__name__)
+        self.__dict__.update(module.__dict__)
+        self._wrapped_module = module
+
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails.
+        if name not in self._lazy_names:
+            raise AttributeError(
+                "module %r has no attribute %r" % (self.__name__, name),
+            )
+        self._load(name)
+        return self.__dict__[name]
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | self._lazy_names)
+
+    def _load(self, name):
+        raise NotImplementedError('_load')
+
+    @classmethod
+    def install(cls, module_name, *args, **kwargs):
+        """
+        Replace the module named ``module_name`` with an instance of ``cls``.
+
+        Parameters
+        ----------
+        module_name : str
+            The name of the module to replace, usually ``__name__``.
+        *args, **kwargs
+            Forwarded to ``cls`` after the module being replaced.
+        """
+        module = sys.modules[module_name]
+        sys.modules[module_name] = cls(module, *args, **kwargs)
+
+
+class LazyImportModule(LazyModule):
+    """
+    A module whose attributes are imported from other modules on first
+    access.
+
+    Parameters
+    ----------
+    module : module
+        The module being replaced.
+    imports : dict[str -> str]
+        Map from attribute name to what to import for it. Values are either a
+        module name, in which case the attribute is the module itself, or
+        ``'module:name'``, in which case the attribute is ``name`` in
+        ``module``.  Relative module names are resolved against the package
+        containing ``module``.
+    """
+    def __init__(self, module, imports):
+        super(LazyImportModule, self).__init__(module)
+        self._imports = imports
+        self._lazy_names = frozenset(imports)
+
+    def _load(self, name):
+        module_name, _, attr = self._imports[name].partition(':')
+        package = self.__name__ if hasattr(self, '__path__') else \
+            self.__name__.rpartition('.')[0]
+        value = import_module(module_name, package)
+        if attr:
+            value = getattr(value, attr)
+        self.__dict__[name] = value
+
+
+def install_lazy_imports(module_name, imports):
+    """
+    Import the attributes in ``imports`` into the module named
+    ``module_name`` when they are first accessed.
+
+    See Also
+    --------
+    LazyImportModule
+    """
+    LazyImportModule.install(module_name, imports)
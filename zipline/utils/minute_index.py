@@ -0,0 +1,156 @@
+"""
+Integer index of the market minutes in a trading calendar.
+"""
+from numpy import arange, cumsum, int64, searchsorted, zeros
+import pandas as pd
+
+from zipline.utils.memoize import lazyval
+
+NANOS_IN_MINUTE = 60000000000
+
+
+class MinuteIndex(object):
+    """
+    The market minutes of a sequence of trading days, stored as per-day open
+    and close minutes plus cumulative per-day offsets.
+
+    Every market minute has a position: the number of market minutes before
+    it in the calendar.  Converting between positions and minutes, and
+    computing windows of minutes, is arithmetic on the per-day arrays plus at
+    most one ``searchsorted``.
+
+    Minutes are represented as int64 minutes since the epoch, UTC.
+
+    Parameters
+    ----------
+    opens : np.ndarray[int64]
+        The market open for each day, in nanoseconds since the epoch.
+    closes : np.ndarray[int64]
+        The market close for each day, in nanoseconds since the epoch.
+
+    Attributes
+    ----------
+    opens : np.ndarray[int64]
+        The first market minute of each day.
+    closes : np.ndarray[int64]
+        The last market minute of each day.
+    offsets : np.ndarray[int64]
+        The position of the first minute of each day.  Has one more entry
+        than there are days, the last of which is ``len(self)``.
+
+    Usage
+    -----
+    >>> from numpy import array
+    >>> opens = array([0, 1440]) * NANOS_IN_MINUTE
+    >>> closes = array([2, 1441]) * NANOS_IN_MINUTE
+    >>> index = MinuteIndex(opens, closes)
+    >>> index.offsets
+    array([0, 3, 5])
+    >>> index.minutes(1, 5)
+    array([   1,    2, 1440, 1441])
+    >>> index.position(1440)
+    3
+    """
+    def __init__(self, opens, closes):
+        self.opens = opens // NANOS_IN_MINUTE
+        self.closes = closes // NANOS_IN_MINUTE
+        self.offsets = offsets = zeros(len(opens) + 1, dtype=int64)
+        cumsum(self.closes - self.opens + 1, out=offsets[1:])
+
+    @classmethod
+    def from_open_and_closes(cls, open_and_closes):
+        """
+        Build a MinuteIndex from a frame with ``market_open`` and
+        ``market_close`` columns, like ``TradingEnvironment.open_and_closes``.
+        """
+        return cls(
+            pd.DatetimeIndex(open_and_closes.market_open).asi8,
+            pd.DatetimeIndex(open_and_closes.market_close).asi8,
+        )
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    @lazyval
+    def values(self):
+        """
+        Every market minute in the calendar.
+        """
+        lengths = self.offsets[1:] - self.offsets[:-1]
+        return (self.opens - self.offsets[:-1]).repeat(lengths) + \
+            arange(len(self), dtype=int64)
+
+    def minutes(self, start, stop, step=1):
+        """
+        The market minutes at positions ``range(start, stop, step)``.
+
+        Returns
+        -------
+        minutes : np.ndarray[int64]
+        """
+        positions = arange(start, stop, step, dtype=int64)
+        days = searchsorted(self.offsets, positions, side='right') - 1
+        return self.opens[days] + (positions - self.offsets[days])
+
+    def day_positions(self, start_day, stop_day):
+        """
+        The positions of the first minute of ``start_day`` and one past the
+        last minute of ``stop_day - 1``, where both are indices of days.
+        """
+        return self.offsets[start_day], self.offsets[stop_day]
+
+    def position(self, minute):
+        """
+        The position of a market minute.
+
+        Raises
+        ------
+        KeyError
+            Raised when ``minute`` is not a market minute.
+        """
+        day = searchsorted(self.opens, minute, side='right') - 1
+        if day < 0 or minute > self.closes[day]:
+            raise KeyError(minute)
+        return int(self.offsets[day] + minute - self.opens[day])
+
+    def next_minute(self, minute):
+        """
+        The first market minute strictly after ``minute``, or None if there
+        is none.
+        """
+        day = searchsorted(self.opens, minute, side='right')
+        if day > 0 and minute < self.closes[day - 1]:
+            return minute + 1
+        if day == len(self.opens):
+            return None
+        return self.opens[day]
+
+    def previous_minute(self, minute):
+        """
+        The last market minute strictly before ``minute``, or None if there
+        is none.
+        """
+        day = searchsorted(self.opens, minute, side='left') - 1
+        if day < 0:
+            return None
+        if minute > self.closes[day]:
+            return self.closes[day]
+        return minute - 1
+
+    @staticmethod
+    def box(minutes):
+        """
+        Convert an array of minutes to a DatetimeIndex in UTC.
+        """
+        return pd.DatetimeIndex(
+            (minutes * NANOS_IN_MINUTE).view('M8[ns]'),
+            copy=False,
+            tz='UTC',
+        )
+
+    @staticmethod
+    def to_datetime64(minutes):
+        """
+        Convert an array of minutes to an array of datetime64[ns] in UTC.
+        """
+        return (minutes * NANOS_IN_MINUTE).view('M8[ns]')
@@ -0,0 +1,45 @@
+"""
+Helpers for feeding work to a multiprocessing pool.
+"""
+from itertools import islice
+
+
+def imap_bounded(pool, func, iterable, batch_size):
+    """
+    Lazily apply ``func`` to each item of ``iterable`` in ``pool``, yielding
+    the results in order.
+
+    ``Pool.imap`` and ``Pool.imap_unordered`` pull items out of their input
+    as fast as they can be pickled, so with a large or slow-to-consume input
+    every item ends up queued in memory at once. This instead submits
+    ``batch_size`` items at a time, and submits the next batch before
+    yielding the results of the previous one, so the workers stay busy while
+    never more than two batches are held at once.
+
+    Parameters
+    ----------
+    pool : multiprocessing.pool.Pool
+        The pool to run ``func`` in.
+    func : callable
+        The function to apply. Must be picklable.
+    iterable : iterable
+        The items to apply ``func`` to.
+    batch_size : int
+        The number of items to submit at a time.
+
+    Returns
+    -------
+    results : iterator
+        The result of ``func`` for each item of ``iterable``.
+    """
+    items = iter(iterable)
+    pending = None
+    while True:
+        batch = list(islice(items, batch_size))
+        submitted = pool.map_async(func, batch) if batch else None
+        if pending is not None:
+            for result in pending.get():
+                yield result
+        if submitted is None:
+            return
+        pending = submitted
@@ -11,9 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-
+from itertools import count
+import os
+import sqlite3
+from threading import Lock
 
 from six.moves import range
+import sqlalchemy as sa
+from six.moves.urllib.request import pathname2url
 
 SQLITE_MAX_VARIABLE_NUMBER = 998
 
@@ -22,3 +27,189 @@ def group_into_chunks(items, chunk_size=SQLITE_MAX_VARIABLE_NUMBER):
     items = list(items)
     return [items[x:x+chunk_size]
             for x in range(0, len(items), chunk_size)]
+
+
+#: The ways in which ``connect_sqlite`` can open a database.
+#:
+#: file
+#:     A normal connection to the file.
+#: memory
+#:     An in-memory snapshot of the file. The file is read once per process
+#:     with SQLite's backup API, and the snapshot is shared by every
+#:     connection to it in that process. Only the latest snapshot of a file
+#:     is kept; an older one is freed when its last connection is closed.
+#: immutable
+#:     A read-only connection which tells SQLite that the file will not
+#:     change, so that no locks are taken, and which memory-maps up to
+#:     ``mmap_size`` bytes of the file.
+SQLITE_MODES = frozenset({'file', 'memory', 'immutable'})
+
+#: Default number of bytes of the file to memory-map in 'immutable' mode.
+DEFAULT_MMAP_SIZE = 2 ** 30
+
+# Map from (pid, path) to the latest _MemorySnapshot of path made in that
+# process.  The pid is part of the key because SQLite connections must not be
+# used across a fork.
+_memory_snapshots = {}
+_memory_snapshots_lock = Lock()
+_memory_snapshot_ids = count()
+
+
+def _copy_database(source, dest):
+    if hasattr(source, 'backup'):
+        source.backup(dest)
+    else:
+        # The backup API is only exposed by Python 3.7 and later.
+        dest.executescript('\n'.join(source.iterdump()))
+
+
+class _MemorySnapshot(object):
+    """
+    An in-memory copy of a database file.
+
+    The copy is a named, shared-cache in-memory database, so every connection
+    from ``connect`` reads the same data, and the data lives until the last
+    of those connections and ``holder`` are closed.
+    """
+    def __init__(self, path, stat):
+        self.stamp = (stat.st_size, stat.st_mtime)
+        self.uri = 'file:zipline-snapshot-%d-%d?mode=memory&cache=shared' % (
+            os.getpid(),
+            next(_memory_snapshot_ids),
+        )
+        try:
+            self.holder = self._connect_uri()
+        except TypeError:
+            # The uri argument is only accepted by Python 3.4 and later, so
+            # each connection gets its own copy of an unnamed database.
+            self.uri = None
+            self.holder = sqlite3.connect(':memory:', check_same_thread=False)
+
+        source = sqlite3.connect(path)
+        try:
+            _copy_database(source, self.holder)
+        finally:
+            source.close()
+
+        # The ``prepare`` callables already applied to this snapshot.
+        self.prepared = set()
+
+    def _connect_uri(self):
+        return sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+
+    def prepare(self, func):
+        if func not in self.prepared:
+            func(self.holder)
+            self.prepared.add(func)
+
+    def connect(self):
+        if self.uri is not None:
+            return self._connect_uri()
+        conn = sqlite3.connect(':memory:', check_same_thread=False)
+        _copy_database(self.holder, conn)
+        return conn
+
+    def close(self):
+        self.holder.close()
+
+
+def _memory_connection(path, prepare):
+    stat = os.stat(path)
+    key = (os.getpid(), path)
+    with _memory_snapshots_lock:
+        snapshot = _memory_snapshots.get(key)
+        if snapshot is None or snapshot.stamp != (stat.st_size,
+                                                  stat.st_mtime):
+            if snapshot is not None:
+                # Connections to the old snapshot keep it alive until they
+                # are closed.
+                snapshot.close()
+            snapshot = _memory_snapshots[key] = _MemorySnapshot(path, stat)
+        if prepare is not None:
+            snapshot.prepare(prepare)
+        return snapshot.connect()
+
+
+def _immutable_connection(path, mmap_size):
+    uri = 'file:%s?mode=ro&immutable=1' % pathname2url(path)
+    try:
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    except TypeError:
+        # The uri argument is only accepted by Python 3.4 and later.
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute('PRAGMA query_only = 1')
+    conn.execute('PRAGMA mmap_size = %d' % int(mmap_size))
+    return conn
+
+
+def connect_sqlite(path,
+                   mode='file',
+                   mmap_size=DEFAULT_MMAP_SIZE,
+                   prepare=None):
+    """
+    Open a SQLite database file.
+
+    Parameters
+    ----------
+    path : str
+        The database file.
+    mode : {'file', 'memory', 'immutable'}, optional
+        How to open the file. See ``SQLITE_MODES``.  'memory' and 'immutable'
+        make query latency independent of the storage holding ``path``,
+        which helps when many processes share a file on network storage.
+    mmap_size : int, optional
+        The number of bytes of the file to memory-map in 'immutable' mode.
+    prepare : callable, optional
+        In 'memory' mode, called with a writable connection to the snapshot
+        the first time it is passed for that snapshot, before the new
+        connection is returned, e.g. to index the in-memory copy without
+        touching the file. Ignored in the other modes.
+
+    Returns
+    -------
+    conn : sqlite3.Connection
+        A new connection to the database, which may be used from any thread
+        as long as it is not used by two at once. In 'memory' mode, the file
+        is only read again when it changes, and connections share one copy
+        of the data.
+    """
+    if mode not in SQLITE_MODES:
+        raise ValueError(
+            "mode must be one of %s, got %r" % (sorted(SQLITE_MODES), mode),
+        )
+    if mode == 'file':
+        return sqlite3.connect(path, check_same_thread=False)
+
+    path = os.path.abspath(path)
+    if mode == 'memory':
+        return _memory_connection(path, prepare)
+    return _immutable_connection(path, mmap_size)
+
+
+def sqlite_engine(path, mode='file', mmap_size=DEFAULT_MMAP_SIZE):
+    """
+    Create a SQLAlchemy engine for a SQLite database file, opened as by
+    ``connect_sqlite``.
+
+    Parameters
+    ----------
+    path : str
+        The database file.
+    mode : {'file', 'memory', 'immutable'}, optional
+        How to open the file.
+    mmap_size : int, optional
+        The number of bytes of the file to memory-map in 'immutable' mode.
+
+    Returns
+    -------
+    engine : sa.engine.Engine
+    """
+    if mode == 'file':
+        return sa.create_engine('sqlite:///' + path)
+
+    conn = connect_sqlite(path, mode, mmap_size)
+    return sa.create_engine(
+        'sqlite://',
+        creator=lambda: conn,
+        poolclass=sa.pool.StaticPool,
+    )
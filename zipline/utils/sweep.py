@@ -0,0 +1,627 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Run many variants of one algorithm over the same market data.
+
+The environment, asset metadata and bar readers are opened once, in the
+parent process, and the variants are run in worker processes forked from
+it. The workers inherit the readers, their in-memory columns and their
+memory maps copy-on-write, so no worker reopens or decompresses data that
+the parent has already loaded. Each worker sends back only a compact
+summary of every run instead of its whole performance frame.
+"""
+import argparse
+import ast
+from collections import namedtuple
+from functools import partial
+from itertools import product
+from multiprocessing import Pool
+import os
+from timeit import default_timer
+
+import logbook
+import pandas as pd
+from six import exec_, print_
+from six.moves import map
+
+from zipline.algorithm import TradingAlgorithm
+from zipline.data.data_portal import DataPortal
+from zipline.data.memmap_daily_bars import (
+    MemmapDailyBarReader,
+    convert_bcolz_daily_bars,
+)
+from zipline.data.minute_bars import BcolzMinuteBarReader
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    SQLiteAdjustmentReader,
+)
+from zipline.finance.trading import SimulationParameters, TradingEnvironment
+from zipline.utils.cli import maybe_show_progress
+
+logger = logbook.Logger('Sweep')
+
+# The performance fields whose last values are sent back for each run by
+# ``summarize_performance``.
+SUMMARY_FIELDS = (
+    'algorithm_period_return',
+    'algo_volatility',
+    'sharpe',
+    'sortino',
+    'max_drawdown',
+    'portfolio_value',
+)
+
+
+class SweepResult(namedtuple('SweepResult',
+                             'params summary returns seconds')):
+    """
+    The outcome of one run of a sweep.
+
+    Attributes
+    ----------
+    params : dict
+        The keyword arguments the run's ``initialize`` was called with.
+    summary : object
+        What the sweep's ``summarize`` function returned for the run.
+    returns : pd.Series
+        The run's daily returns.
+    seconds : float
+        How long the run took, including constructing the algorithm.
+    """
+
+
+def summarize_performance(perf):
+    """
+    The last value of each of ``SUMMARY_FIELDS`` in a performance frame.
+
+    Parameters
+    ----------
+    perf : pd.DataFrame
+        The frame returned by ``TradingAlgorithm.run``.
+
+    Returns
+    -------
+    summary : dict[str -> float]
+    """
+    last = perf.iloc[-1]
+    return {field: float(last[field]) for field in SUMMARY_FIELDS}
+
+
+def parameter_grid(**axes):
+    """
+    The cartesian product of lists of parameter values.
+
+    Parameters
+    ----------
+    **axes : iterable
+        The values to try for each parameter.
+
+    Returns
+    -------
+    params : list[dict]
+        One dict of keyword arguments per combination of values.
+
+    Examples
+    --------
+    >>> parameter_grid(window=[10, 20])
+    [{'window': 10}, {'window': 20}]
+    """
+    names = sorted(axes)
+    return [
+        dict(zip(names, values))
+        for values in product(*(axes[name] for name in names))
+    ]
+
+
+class SweepData(object):
+    """
+    The environment and readers shared by every run of a sweep.
+
+    Parameters
+    ----------
+    env : TradingEnvironment
+        The environment, whose asset finder knows every asset traded.
+    daily_bar_reader : DailyBarReader, optional
+        The daily bars.
+    minute_bar_reader : BcolzMinuteBarReader, optional
+        The minute bars.
+    adjustments_path : str, optional
+        The path of the adjustments db. Every process opens its own
+        connection to it, since sqlite connections can not be used across a
+        fork.
+
+    Notes
+    -----
+    Everything loaded before the sweep starts, e.g. by ``preload``, is
+    shared by the workers. Anything loaded during a run is loaded by each
+    worker separately, so readers whose data is memory-mapped, like
+    ``MemmapDailyBarReader``, share the most.
+
+    Preloading a ``BcolzDailyBarReader`` only loads the columns it reads
+    spot prices from. History windows are read with ``load_raw_arrays``,
+    which decompresses the table again in every run, so sweeps of
+    algorithms that call ``data.history`` should use memory-mapped daily
+    bars instead, e.g. with ``from_paths(memmap_daily_bars=...)``.
+    """
+    def __init__(self,
+                 env,
+                 daily_bar_reader=None,
+                 minute_bar_reader=None,
+                 adjustments_path=None):
+        self.env = env
+        self.daily_bar_reader = daily_bar_reader
+        self.minute_bar_reader = minute_bar_reader
+        self.adjustments_path = adjustments_path
+
+    @classmethod
+    def from_paths(cls,
+                   assets,
+                   daily_bars=None,
+                   minute_bars=None,
+                   adjustments=None,
+                   memmap_daily_bars=None,
+                   load=None):
+        """
+        Open the data written to the given paths.
+
+        Parameters
+        ----------
+        assets : str
+            The path of the asset db.
+        daily_bars : str, optional
+            The path of a bcolz daily bar table.
+        minute_bars : str, optional
+            The root directory of bcolz minute bars.
+        adjustments : str, optional
+            The path of the adjustments db.
+        memmap_daily_bars : str, optional
+            A directory of memory-mapped daily bars to read instead of
+            ``daily_bars``. If it does not exist it is converted from
+            ``daily_bars`` first, so later sweeps can reuse it.
+        load : callable, optional
+            The ``load`` function of the ``TradingEnvironment``.
+
+        Returns
+        -------
+        data : SweepData
+        """
+        env = TradingEnvironment(load=load, asset_db_path=assets)
+
+        if memmap_daily_bars is not None:
+            if os.path.exists(memmap_daily_bars):
+                daily_bar_reader = MemmapDailyBarReader(memmap_daily_bars)
+            elif daily_bars is None:
+                raise ValueError(
+                    'no daily bars to convert to %r' % memmap_daily_bars,
+                )
+            else:
+                daily_bar_reader = convert_bcolz_daily_bars(
+                    daily_bars,
+                    memmap_daily_bars,
+                )
+        elif daily_bars is not None:
+            daily_bar_reader = BcolzDailyBarReader(daily_bars)
+        else:
+            daily_bar_reader = None
+
+        return cls(
+            env,
+            daily_bar_reader=daily_bar_reader,
+            minute_bar_reader=(
+                BcolzMinuteBarReader(minute_bars)
+                if minute_bars is not None else
+                None
+            ),
+            adjustments_path=adjustments,
+        )
+
+    def preload(self, sids=None):
+        """
+        Load the data that does not change between runs into memory, so
+        that workers forked afterwards inherit it.
+
+        Bcolz daily bars are only preloaded for spot prices, not for
+        history windows; see the notes of ``SweepData``.
+
+        Parameters
+        ----------
+        sids : iterable[int], optional
+            The sids the algorithm trades. Minute bars are only preloaded for
+            these sids, since all of them may not fit in memory. By default
+            only the assets and daily bars are preloaded.
+        """
+        finder = self.env.asset_finder
+        finder.retrieve_all(finder.sids if sids is None else sids)
+
+        if isinstance(self.daily_bar_reader, BcolzDailyBarReader):
+            self.daily_bar_reader.preload()
+        if self.minute_bar_reader is not None and sids is not None:
+            self.minute_bar_reader.preload(sids)
+
+    def data_portal(self):
+        """
+        A new DataPortal over the shared readers, with its own connection to
+        the adjustments db.
+        """
+        return DataPortal(
+            self.env,
+            equity_daily_reader=self.daily_bar_reader,
+            equity_minute_reader=self.minute_bar_reader,
+            adjustment_reader=(
+                SQLiteAdjustmentReader(self.adjustments_path)
+                if self.adjustments_path is not None else
+                None
+            ),
+        )
+
+
+def _noop_handle_data(context, data):
+    pass
+
+
+class _Sweep(namedtuple('_Sweep',
+                        'data sim_params algorithm_functions summarize')):
+    """
+    The state shared by every run of a sweep.
+    """
+    def run(self, data_portal, params):
+        start = default_timer()
+        functions = self.algorithm_functions()
+        perf = TradingAlgorithm(
+            initialize=partial(functions['initialize'], **params),
+            handle_data=functions['handle_data'],
+            before_trading_start=functions['before_trading_start'],
+            analyze=functions['analyze'],
+            sim_params=self.sim_params,
+            env=self.data.env,
+        ).run(data_portal)
+        return SweepResult(
+            params,
+            self.summarize(perf),
+            perf['returns'],
+            default_timer() - start,
+        )
+
+
+# The sweep being run, set in the parent before the workers are forked so
+# that they inherit it rather than receiving a pickled copy, and the data
+# portal of the current process, which is created by ``_init_sweep_worker``.
+_sweep = None
+_data_portal = None
+
+
+def _init_sweep_worker(forked=True):
+    global _data_portal
+    if forked:
+        # The parent's pooled connections can not be used in the child.
+        _sweep.data.env.asset_finder.engine.dispose()
+    _data_portal = _sweep.data.data_portal()
+
+
+def _run_variant(item):
+    index, params = item
+    return index, _sweep.run(_data_portal, params)
+
+
+def _script_functions(code, before_trading_start, analyze):
+    """
+    Execute ``code`` in a new namespace and return the functions it defines.
+    """
+    namespace = {}
+    exec_(code, namespace)
+    initialize = namespace.get('initialize')
+    if initialize is None:
+        raise ValueError('the script does not define initialize')
+
+    return {
+        'initialize': initialize,
+        'handle_data': namespace.get('handle_data') or _noop_handle_data,
+        'before_trading_start': (
+            before_trading_start or namespace.get('before_trading_start')
+        ),
+        'analyze': analyze or namespace.get('analyze'),
+    }
+
+
+def _algorithm_functions(initialize,
+                         handle_data,
+                         before_trading_start,
+                         analyze,
+                         script,
+                         algo_filename):
+    """
+    A function returning the algorithm's functions for a run.
+
+    A script is compiled once and executed again for every run, so that
+    runs don't share the script's globals.
+    """
+    if script is None:
+        if initialize is None:
+            raise ValueError('either script or initialize must be given')
+        functions = {
+            'initialize': initialize,
+            'handle_data': handle_data or _noop_handle_data,
+            'before_trading_start': before_trading_start,
+            'analyze': analyze,
+        }
+        return lambda: functions
+
+    if initialize is not None or handle_data is not None:
+        raise ValueError(
+            'script can not be given with initialize or handle_data',
+        )
+    algorithm_functions = partial(
+        _script_functions,
+        compile(script, algo_filename or '<string>', 'exec'),
+        before_trading_start,
+        analyze,
+    )
+    # Check the script before any worker is started.
+    algorithm_functions()
+    return algorithm_functions
+
+
+def run_sweep(data,
+              variants,
+              start,
+              end,
+              initialize=None,
+              handle_data=None,
+              before_trading_start=None,
+              analyze=None,
+              script=None,
+              algo_filename=None,
+              capital_base=10e6,
+              data_frequency='daily',
+              processes=None,
+              summarize=summarize_performance,
+              show_progress=False):
+    """
+    Run an algorithm once for each set of parameters.
+
+    Parameters
+    ----------
+    data : SweepData
+        The market data to run with. Preload it first to share as much of
+        it as possible between the workers.
+    variants : iterable[dict]
+        The keyword arguments to call ``initialize`` with in each run, e.g.
+        as returned by ``parameter_grid``.
+    start, end : pd.Timestamp
+        The first and last days of the simulations.
+    initialize : callable, optional
+        ``initialize(context, **params)``.
+    handle_data, before_trading_start, analyze : callable, optional
+        The algorithm's other functions.
+    script : str, optional
+        The source of an algorithm defining the functions, instead of
+        passing them. It is executed anew for each run, so module-level
+        state in the script is not shared between runs.
+    algo_filename : str, optional
+        The file name to report in tracebacks from ``script``.
+    capital_base : float, optional
+        The starting capital of each run.
+    data_frequency : {'daily', 'minute'}, optional
+        The frequency of the simulations.
+    processes : int, optional
+        The number of worker processes to run the variants in. By default
+        they are run one after another in this process.
+    summarize : callable, optional
+        ``summarize(perf)``, called in the worker with each run's
+        performance frame. Its result is sent back to the parent, so it
+        should be small and picklable.
+    show_progress : bool, optional
+        Whether to show a progress bar.
+
+    Returns
+    -------
+    results : list[SweepResult]
+        The result of each variant, in the order of ``variants``.
+    """
+    global _sweep, _data_portal
+
+    if processes and not hasattr(os, 'fork'):
+        raise ValueError(
+            'running a sweep in worker processes requires os.fork',
+        )
+
+    variants = list(variants)
+    algorithm_functions = _algorithm_functions(
+        initialize,
+        handle_data,
+        before_trading_start,
+        analyze,
+        script,
+        algo_filename,
+    )
+    sim_params = SimulationParameters(
+        period_start=start,
+        period_end=end,
+        capital_base=capital_base,
+        data_frequency=data_frequency,
+        env=data.env,
+    )
+
+    results = [None] * len(variants)
+    begin = default_timer()
+    _sweep = _Sweep(data, sim_params, algorithm_functions, summarize)
+    pool = None
+    try:
+        if processes:
+            pool = Pool(processes, initializer=_init_sweep_worker)
+            runs = pool.imap_unordered(_run_variant, enumerate(variants))
+        else:
+            _init_sweep_worker(forked=False)
+            runs = map(_run_variant, enumerate(variants))
+
+        with maybe_show_progress(
+                runs,
+                show_progress,
+                length=len(variants),
+                label='Running variants:') as it:
+            for index, result in it:
+                results[index] = result
+
+        if pool is not None:
+            pool.close()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        _sweep = _data_portal = None
+
+    logger.info(
+        'Ran {0} variants in {1:.2f} seconds ({2:.2f} seconds per run).',
+        len(variants),
+        default_timer() - begin,
+        sum(result.seconds for result in results) / max(len(results), 1),
+    )
+    return results
+
+
+def results_frame(results):
+    """
+    Tabulate the results of a sweep.
+
+    Parameters
+    ----------
+    results : list[SweepResult]
+        The results of ``run_sweep`` with a summary function returning
+        dicts, like ``summarize_performance``.
+
+    Returns
+    -------
+    frame : pd.DataFrame
+        One row per result, with a column per parameter, per summary field
+        and for the seconds the run took.
+    """
+    rows = []
+    for result in results:
+        row = dict(result.params)
+        row.update(result.summary)
+        row['seconds'] = result.seconds
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _parse_param(text):
+    """
+    Parse ``name=value,value,...`` into the name and list of values. Values
+    are read as python literals where possible, and as strings otherwise.
+    """
+    name, sep, values = text.partition('=')
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(
+            'expected name=value[,value...], got %r' % text,
+        )
+
+    def literal(value):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+
+    return name, [literal(value) for value in values.split(',')]
+
+
+def parse_sweep_args(argv):
+    """
+    Parse the arguments of ``run_sweep.py``.
+
+    Parameters
+    ----------
+    argv : list[str]
+        The command line arguments, e.g. ``sys.argv[1:]``.
+
+    Returns
+    -------
+    args : dict
+        The parsed arguments, with the ``--param`` values expanded into the
+        list of ``variants`` to run.
+    """
+    parser = argparse.ArgumentParser(
+        description='Run an algorithm once for each combination of '
+                    'parameters, sharing the market data between the runs.',
+    )
+    parser.add_argument('--algofile', '-f', required=True)
+    parser.add_argument('--start', '-s', required=True)
+    parser.add_argument('--end', '-e', required=True)
+    parser.add_argument('--capital-base', type=float, default=10e6)
+    parser.add_argument('--data-frequency',
+                        choices=('daily', 'minute'),
+                        default='daily')
+    parser.add_argument('--param', '-P',
+                        dest='params',
+                        action='append',
+                        type=_parse_param,
+                        default=[],
+                        help='A keyword argument of initialize and the '
+                             'values to try, e.g. window=10,20,30.')
+    parser.add_argument('--assets', required=True)
+    parser.add_argument('--daily-bars')
+    parser.add_argument('--minute-bars')
+    parser.add_argument('--adjustments')
+    parser.add_argument('--memmap-daily-bars',
+                        help='A directory of memory-mapped daily bars to '
+                             'read instead of --daily-bars, converted from '
+                             'them if it does not exist.')
+    parser.add_argument('--preload-sids',
+                        type=lambda s: [int(sid) for sid in s.split(',')],
+                        help='The sids whose minute bars to load before '
+                             'starting the workers.')
+    parser.add_argument('--processes', '-j', type=int)
+    parser.add_argument('--output', '-o',
+                        help='Where to pickle the table of results.')
+
+    args = vars(parser.parse_args(argv))
+    args['variants'] = parameter_grid(**dict(args.pop('params')))
+    return args
+
+
+def main(argv):
+    """
+    Run a sweep from the command line and print or pickle its results.
+    """
+    args = parse_sweep_args(argv)
+    data = SweepData.from_paths(
+        args['assets'],
+        daily_bars=args['daily_bars'],
+        minute_bars=args['minute_bars'],
+        adjustments=args['adjustments'],
+        memmap_daily_bars=args['memmap_daily_bars'],
+    )
+    data.preload(args['preload_sids'])
+
+    with open(args['algofile'], 'r') as f:
+        script = f.read()
+
+    results = run_sweep(
+        data,
+        args['variants'],
+        pd.Timestamp(args['start'], tz='UTC'),
+        pd.Timestamp(args['end'], tz='UTC'),
+        script=script,
+        algo_filename=args['algofile'],
+        capital_base=args['capital_base'],
+        data_frequency=args['data_frequency'],
+        processes=args['processes'],
+        show_progress=True,
+    )
+    frame = results_frame(results)
+    if args['output'] is not None:
+        frame.to_pickle(args['output'])
+    else:
+        print_(frame.to_string())
+    return 0
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
+
 import pandas as pd
 import pytz
 
@@ -19,6 +21,11 @@ from datetime import datetime
 from dateutil import rrule
 from functools import partial
 
+from zipline.utils.calendar_cache import (
+    calendar_builder,
+    install_lazy_calendar,
+)
+
 start = pd.Timestamp('1990-01-01', tz='UTC')
 end_base = pd.Timestamp('today', tz='UTC')
 # Give an aggressive buffer for logic that needs to use the next trading
@@ -247,17 +254,14 @@ def get_non_trading_days(start, end):
     non_trading_days.sort()
     return pd.DatetimeIndex(non_trading_days)
 
-non_trading_days = get_non_trading_days(start, end)
-trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
-
 
-def get_trading_days(start, end, trading_day=trading_day):
+def get_trading_days(start, end, trading_day=None):
+    if trading_day is None:
+        trading_day = sys.modules[__name__].trading_day
     return pd.date_range(start=start.date(),
                          end=end.date(),
                          freq=trading_day).tz_localize('UTC')
 
-trading_days = get_trading_days(start, end)
-
 
 def get_early_closes(start, end):
     # 1:00 PM close rules based on
@@ -365,8 +369,6 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
-
 
 def get_open_and_close(day, early_closes):
     market_open = pd.Timestamp(
@@ -401,5 +403,31 @@ def get_open_and_closes(trading_days, early_closes, get_open_and_close):
 
     return open_and_closes
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+
+@calendar_builder(
+    'non_trading_days',
+    'trading_day',
+    'trading_days',
+    'early_closes',
+    'open_and_closes',
+)
+def _build_calendar(start, end):
+    non_trading_days = get_non_trading_days(start, end)
+    trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
+    trading_days = get_trading_days(start, end, trading_day)
+    early_closes = get_early_closes(start, end)
+    return {
+        'non_trading_days': non_trading_days,
+        'trading_day': trading_day,
+        'trading_days': trading_days,
+        'early_closes': early_closes,
+        'open_and_closes': get_open_and_closes(
+            trading_days, early_closes, get_open_and_close,
+        ),
+    }
+
+
+# `non_trading_days`, `trading_day`, `trading_days`, `early_closes` and
+# `open_and_closes` are computed, or read from the calendar cache, the first
+# time one of them is accessed.
+install_lazy_calendar(__name__, 'nyse', _build_calendar)
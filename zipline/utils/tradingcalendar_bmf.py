@@ -13,11 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
 import pandas as pd
 import pytz
 
 from datetime import datetime
 from dateutil import rrule
+from zipline.utils.calendar_cache import (
+    calendar_builder,
+    install_lazy_calendar,
+)
 from zipline.utils.tradingcalendar import end, canonicalize_datetime, \
     get_open_and_closes
 
@@ -245,17 +251,14 @@ def get_non_trading_days(start, end):
     non_trading_days.sort()
     return pd.DatetimeIndex(non_trading_days)
 
-non_trading_days = get_non_trading_days(start, end)
-trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
 
-
-def get_trading_days(start, end, trading_day=trading_day):
+def get_trading_days(start, end, trading_day=None):
+    if trading_day is None:
+        trading_day = sys.modules[__name__].trading_day
     return pd.date_range(start=start.date(),
                          end=end.date(),
                          freq=trading_day).tz_localize('UTC')
 
-trading_days = get_trading_days(start, end)
-
 
 # Ash Wednesday
 quarta_cinzas = rrule.rrule(
@@ -286,8 +289,6 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
-
 
 def get_open_and_close(day, early_closes):
     # only "early close" event in Bovespa actually is a late start
@@ -311,5 +312,31 @@ def get_open_and_close(day, early_closes):
 
     return market_open, market_close
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+
+@calendar_builder(
+    'non_trading_days',
+    'trading_day',
+    'trading_days',
+    'early_closes',
+    'open_and_closes',
+)
+def _build_calendar(start, end):
+    non_trading_days = get_non_trading_days(start, end)
+    trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
+    trading_days = get_trading_days(start, end, trading_day)
+    early_closes = get_early_closes(start, end)
+    return {
+        'non_trading_days': non_trading_days,
+        'trading_day': trading_day,
+        'trading_days': trading_days,
+        'early_closes': early_closes,
+        'open_and_closes': get_open_and_closes(
+            trading_days, early_closes, get_open_and_close,
+        ),
+    }
+
+
+# `non_trading_days`, `trading_day`, `trading_days`, `early_closes` and
+# `open_and_closes` are computed, or read from the calendar cache, the first
+# time one of them is accessed.
+install_lazy_calendar(__name__, 'bmf', _build_calendar)
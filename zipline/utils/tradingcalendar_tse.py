@@ -14,15 +14,24 @@
 # limitations under the License.
 
 
+import sys
+
 import pandas as pd
 import pytz
 
 from datetime import datetime
 from dateutil import rrule
-from zipline.utils.tradingcalendar import end, canonicalize_datetime, \
+from zipline.utils.calendar_cache import (
+    calendar_builder,
+    install_lazy_calendar,
+)
+from zipline.utils import tradingcalendar
+from zipline.utils.tradingcalendar import canonicalize_datetime, \
     get_open_and_closes
 
 start = pd.Timestamp('1994-01-01', tz='UTC')
+# The calendar is computed through the same end as the NYSE calendar.
+end = tradingcalendar.end
 
 
 def get_non_trading_days(start, end):
@@ -261,17 +270,14 @@ def get_non_trading_days(start, end):
     non_trading_days.sort()
     return pd.DatetimeIndex(non_trading_days)
 
-non_trading_days = get_non_trading_days(start, end)
-trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
-
 
-def get_trading_days(start, end, trading_day=trading_day):
+def get_trading_days(start, end, trading_day=None):
+    if trading_day is None:
+        trading_day = sys.modules[__name__].trading_day
     return pd.date_range(start=start.date(),
                          end=end.date(),
                          freq=trading_day).tz_localize('UTC')
 
-trading_days = get_trading_days(start, end)
-
 # Days in Environment but not in Calendar (using ^GSPTSE as bm_symbol):
 # --------------------------------------------------------------------
 # Used http://web.tmxmoney.com/pricehistory.php?qm_page=61468&qm_symbol=^TSX
@@ -336,8 +342,6 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
-
 
 def get_open_and_close(day, early_closes):
     market_open = pd.Timestamp(
@@ -360,5 +364,31 @@ def get_open_and_close(day, early_closes):
 
     return market_open, market_close
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+
+@calendar_builder(
+    'non_trading_days',
+    'trading_day',
+    'trading_days',
+    'early_closes',
+    'open_and_closes',
+)
+def _build_calendar(start, end):
+    non_trading_days = get_non_trading_days(start, end)
+    trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
+    trading_days = get_trading_days(start, end, trading_day)
+    early_closes = get_early_closes(start, end)
+    return {
+        'non_trading_days': non_trading_days,
+        'trading_day': trading_day,
+        'trading_days': trading_days,
+        'early_closes': early_closes,
+        'open_and_closes': get_open_and_closes(
+            trading_days, early_closes, get_open_and_close,
+        ),
+    }
+
+
+# `non_trading_days`, `trading_day`, `trading_days`, `early_closes` and
+# `open_and_closes` are computed, or read from the calendar cache, the first
+# time one of them is accessed.
+install_lazy_calendar(__name__, 'tse', _build_calendar)